@@ -0,0 +1,118 @@
+import argparse
+import os
+import timeit
+
+from src.adapters.outbound.repositories.memory.database import MemoryDatabase
+from src.adapters.outbound.repositories.memory.item import (
+    MemoryItemRepository,
+)
+from src.adapters.outbound.repositories.mongo.connection import (
+    MongoConnection,
+    MongoMockConnection,
+)
+from src.adapters.outbound.repositories.mongo.item import MongoItemRepository
+from src.adapters.outbound.repositories.pymongo.item import (
+    PyMongoItemRepository,
+)
+from src.adapters.outbound.repositories.sqlite.connection import (
+    SQLiteConnection,
+)
+from src.adapters.outbound.repositories.sqlite.item import (
+    SQLiteItemRepository,
+)
+from src.domain.entities.item import Item
+from src.domain.ports.outbound.repositories.item import (
+    ItemRepositoryInterface,
+)
+
+REPOSITORY_CLASSES = [MongoItemRepository, PyMongoItemRepository]
+
+
+def print_timings(
+    repository: ItemRepositoryInterface, items_names: list[str], repeat: int
+) -> None:
+    get_all_seconds = min(
+        timeit.repeat(repository.get_all, number=1, repeat=repeat)
+    )
+    find_items_seconds = min(
+        timeit.repeat(
+            lambda: repository.find_items_by_names(items_names),
+            number=1,
+            repeat=repeat,
+        )
+    )
+    print(
+        f"{type(repository).__name__:<24}"
+        f"{get_all_seconds * 1000:>10.1f}ms"
+        f"{find_items_seconds * 1000:>20.1f}ms"
+    )
+
+
+def run_benchmark(
+    connection: MongoConnection | MongoMockConnection,
+    catalog_size: int,
+    lookup_size: int,
+    repeat: int,
+) -> None:
+    items_collection = connection.get_database()["items"]
+    items_collection.delete_many({})
+    items = [
+        Item(name=f"marmita {index}", inventory_quantity=index)
+        for index in range(catalog_size)
+    ]
+    items_collection.insert_many(
+        [
+            {
+                "_id": item.id,
+                "name": item.name,
+                "inventory_quantity": item.inventory_quantity,
+            }
+            for item in items
+        ]
+    )
+    items_names = [item.name for item in items[:lookup_size]]
+
+    print(f"{'repository':<24}{'get_all':>12}{'find_items_by_names':>22}")
+    for repository_class in REPOSITORY_CLASSES:
+        print_timings(repository_class(connection), items_names, repeat)
+
+    memory_repository = MemoryItemRepository(MemoryDatabase())
+    memory_repository.save_all(items)
+    print_timings(memory_repository, items_names, repeat)
+
+    sqlite_connection = SQLiteConnection(":memory:")
+    sqlite_repository = SQLiteItemRepository(sqlite_connection)
+    sqlite_repository.save_all(items)
+    print_timings(sqlite_repository, items_names, repeat)
+    sqlite_connection.close()
+
+    items_collection.delete_many({})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare the item repository adapters on a large catalog."
+    )
+    parser.add_argument("--catalog-size", type=int, default=10_000)
+    parser.add_argument("--lookup-size", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--mock",
+        action="store_true",
+        help="Run against mongomock instead of a real mongod.",
+    )
+    args = parser.parse_args()
+
+    # The catalog is wiped before and after the run, so never point this at
+    # the bot's database.
+    connection_string = os.getenv(
+        "BENCHMARK_MONGO_CONNECTION_STRING",
+        "mongodb://localhost:27017/inventory_manager_benchmark",
+    )
+    connection = (
+        MongoMockConnection(connection_string)
+        if args.mock
+        else MongoConnection(connection_string)
+    )
+    run_benchmark(connection, args.catalog_size, args.lookup_size, args.repeat)
+    connection.close()
@@ -0,0 +1,67 @@
+import csv
+import json
+from collections.abc import Iterable, Iterator
+from enum import StrEnum
+from pathlib import Path
+from typing import Any, TextIO
+
+from src.domain.ports.inbound.items.dtos import CatalogItemOutputDTO
+
+CATALOG_FIELDS = ["item_name", "inventory_quantity", "low_stock_threshold"]
+
+
+class CatalogFormat(StrEnum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+def detect_catalog_format(path: str) -> CatalogFormat:
+    if Path(path).suffix.lower() in (".ndjson", ".jsonl"):
+        return CatalogFormat.NDJSON
+    return CatalogFormat.CSV
+
+
+def read_catalog_rows(
+    file: TextIO, catalog_format: CatalogFormat
+) -> Iterator[tuple[int, Any]]:
+    # Yields (line number, fields) one line at a time and leaves the
+    # validation to the import, so rows can be checked a chunk at a time.
+    if catalog_format == CatalogFormat.NDJSON:
+        yield from _read_ndjson_rows(file)
+    else:
+        reader = csv.DictReader(file)
+        for row in reader:
+            yield reader.line_num, row
+
+
+def _read_ndjson_rows(file: TextIO) -> Iterator[tuple[int, Any]]:
+    for line_number, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except json.JSONDecodeError:
+            # Not a mapping, so the import reports the line as invalid.
+            yield line_number, None
+
+
+def write_catalog(
+    items: Iterable[CatalogItemOutputDTO],
+    file: TextIO,
+    catalog_format: CatalogFormat,
+) -> int:
+    written_count = 0
+    if catalog_format == CatalogFormat.NDJSON:
+        for item in items:
+            file.write(
+                f"{json.dumps(item.model_dump(), ensure_ascii=False)}\n"
+            )
+            written_count += 1
+        return written_count
+
+    writer = csv.DictWriter(file, fieldnames=CATALOG_FIELDS)
+    writer.writeheader()
+    for item in items:
+        writer.writerow(item.model_dump())
+        written_count += 1
+    return written_count
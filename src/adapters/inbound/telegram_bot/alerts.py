@@ -0,0 +1,57 @@
+# mypy: ignore-errors
+import asyncio
+
+from telegram import Bot
+from telegram.ext import Application
+
+from src.adapters.inbound.telegram_bot.presenter import TelegramBotPresenter
+from src.domain.ports.inbound.items.dtos import ListLowStockItemsOutputDTO
+from src.domain.ports.inbound.items.ports import ListLowStockItemsPort
+
+
+class LowStockAlerter:
+    def __init__(
+        self,
+        list_low_stock_items_use_case: ListLowStockItemsPort,
+        chat_id: int | str,
+        delay_seconds: float = 60,
+    ):
+        self.list_low_stock_items_use_case = list_low_stock_items_use_case
+        self.chat_id = chat_id
+        self.delay_seconds = delay_seconds
+        self.alerted_items_names: set[str] = set()
+        self._is_digest_pending = False
+
+    def schedule(self, application: Application) -> None:
+        # Orders taken while a digest is pending are covered by it, so a
+        # burst of orders reads the low stock items once.
+        if self._is_digest_pending:
+            return
+        self._is_digest_pending = True
+        application.create_task(self.send_digest(application.bot))
+
+    async def send_digest(self, bot: Bot) -> None:
+        await asyncio.sleep(self.delay_seconds)
+        self._is_digest_pending = False
+        output_dto = await asyncio.to_thread(
+            self.list_low_stock_items_use_case.execute
+        )
+        new_items = [
+            item
+            for item in output_dto.items
+            if item.item_name not in self.alerted_items_names
+        ]
+        # An item restocked above its threshold is alerted again the next
+        # time it falls to it.
+        self.alerted_items_names = {
+            item.item_name for item in output_dto.items
+        }
+        if not new_items:
+            return
+        await bot.send_message(
+            self.chat_id,
+            TelegramBotPresenter.format_low_stock_digest_message(
+                ListLowStockItemsOutputDTO(items=new_items)
+            ),
+            parse_mode="MarkdownV2",
+        )
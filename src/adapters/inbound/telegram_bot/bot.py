@@ -1,4 +1,6 @@
 # mypy: ignore-errors
+import asyncio
+from collections.abc import Callable
 from enum import Enum
 
 from telegram import (
@@ -17,20 +19,38 @@ from telegram.ext import (
     filters,
 )
 
-from src.adapters.inbound.telegram_bot.controller import TelegramBotController
+from src.adapters.inbound.telegram_bot.alerts import LowStockAlerter
+from src.adapters.inbound.telegram_bot.controller import (
+    OrderHistoryPage,
+    TelegramBotController,
+)
 from src.domain.ports.outbound.repositories.client import (
     ClientRepositoryInterface,
 )
+from src.domain.ports.outbound.repositories.inventory import (
+    InventoryLedgerRepositoryInterface,
+)
 from src.domain.ports.outbound.repositories.item import ItemRepositoryInterface
 from src.domain.ports.outbound.repositories.order import (
     OrderRepositoryInterface,
 )
+from src.domain.ports.outbound.repositories.sales import (
+    SalesRepositoryInterface,
+)
+from src.domain.ports.outbound.unit_of_work import UnitOfWorkInterface
+from src.domain.unit_of_work import UnitOfWork
 from src.domain.use_cases.add_item import AddItemUseCase
 from src.domain.use_cases.cancel_order import CancelOrderUseCase
+from src.domain.use_cases.cancel_orders import CancelOrdersUseCase
 from src.domain.use_cases.create_goomer_order import CreateGoomerOrderUseCase
 from src.domain.use_cases.create_manual_order import CreateManualOrderUseCase
 from src.domain.use_cases.list_items import ListItemsUseCase
+from src.domain.use_cases.list_low_stock_items import (
+    ListLowStockItemsUseCase,
+)
+from src.domain.use_cases.list_orders import ListOrdersUseCase
 from src.domain.use_cases.remove_item import RemoveItemUseCase
+from src.domain.use_cases.sales_report import SalesReportUseCase
 from src.domain.use_cases.set_inventory_quantities import (
     SetInventoryQuantitiesUseCase,
 )
@@ -44,6 +64,9 @@ class ConversationState(int, Enum):
     WAITING_CREATE_GOOMER_ORDER = 4
     WAITING_CANCEL_ORDER = 5
     WAITING_CREATE_MANUAL_ORDER = 6
+    WAITING_LIST_ORDERS = 7
+    WAITING_SALES_REPORT = 8
+    WAITING_CANCEL_ORDERS = 9
 
 
 class TelegramBotCommandHandler:
@@ -52,10 +75,51 @@ class TelegramBotCommandHandler:
         item_repository: ItemRepositoryInterface,
         order_repository: OrderRepositoryInterface,
         client_repository: ClientRepositoryInterface,
+        sales_repository: SalesRepositoryInterface,
+        ledger_repository: InventoryLedgerRepositoryInterface | None = None,
+        read_only_item_repository: ItemRepositoryInterface | None = None,
+        read_only_order_repository: OrderRepositoryInterface | None = None,
+        read_only_sales_repository: SalesRepositoryInterface | None = None,
+        unit_of_work_factory: Callable[[], UnitOfWorkInterface] | None = None,
+        strict_stock: bool = False,
+        low_stock_alert_chat_id: int | str | None = None,
+        low_stock_alert_delay_seconds: float = 60,
     ):
         self.item_repository = item_repository
         self.order_repository = order_repository
         self.client_repository = client_repository
+        self.sales_repository = sales_repository
+        self.ledger_repository = ledger_repository
+        self.read_only_item_repository = (
+            read_only_item_repository or item_repository
+        )
+        self.read_only_order_repository = (
+            read_only_order_repository or order_repository
+        )
+        self.read_only_sales_repository = (
+            read_only_sales_repository or sales_repository
+        )
+        # Each use case gets a fresh unit of work, since handlers run
+        # concurrently on worker threads.
+        self.unit_of_work_factory = unit_of_work_factory or (
+            lambda: UnitOfWork(
+                self.item_repository,
+                self.order_repository,
+                sales_repository=self.sales_repository,
+                ledger_repository=self.ledger_repository,
+            )
+        )
+        self.strict_stock = strict_stock
+        # Reads the primary, so a digest sees the orders that triggered it.
+        self.low_stock_alerter = (
+            LowStockAlerter(
+                ListLowStockItemsUseCase(self.item_repository),
+                low_stock_alert_chat_id,
+                low_stock_alert_delay_seconds,
+            )
+            if low_stock_alert_chat_id is not None
+            else None
+        )
         self.telegram_bot_controller = TelegramBotController()
 
     async def start_command(
@@ -100,6 +164,21 @@ class TelegramBotCommandHandler:
                     "Cancelar Pedido", callback_data="cancel_order"
                 )
             ],
+            [
+                InlineKeyboardButton(
+                    "Cancelar Pedidos em Lote", callback_data="cancel_orders"
+                )
+            ],
+            [
+                InlineKeyboardButton(
+                    "Histórico de Pedidos", callback_data="list_orders"
+                )
+            ],
+            [
+                InlineKeyboardButton(
+                    "Relatório de Vendas", callback_data="sales_report"
+                )
+            ],
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
         await update.message.reply_text(
@@ -163,6 +242,36 @@ class TelegramBotCommandHandler:
                 reply_markup=ForceReply(selective=True),
             )
             return ConversationState.WAITING_CANCEL_ORDER
+        elif query.data == "cancel_orders":
+            await query.message.reply_text(
+                "Você escolheu cancelar vários pedidos. Envie os IDs dos "
+                "pedidos ou os números dos pedidos Goomer, um por linha, "
+                "e a marca dos pedidos Goomer."
+                "\n\nExemplo:\n662b23f05e0fe3996cc41e6c\n#1234\n#1235"
+                "\nmarca Marmitas da Maria",
+                reply_markup=ForceReply(selective=True),
+            )
+            return ConversationState.WAITING_CANCEL_ORDERS
+        elif query.data == "list_orders":
+            await query.message.reply_text(
+                "Você escolheu ver o histórico de pedidos. "
+                "Envie os filtros, um por linha, ou todos."
+                "\n\nExemplo:\nde 01/06/2024\nate 30/06/2024"
+                "\ncliente Maria Joaquina\ncancelados nao",
+                reply_markup=ForceReply(selective=True),
+            )
+            return ConversationState.WAITING_LIST_ORDERS
+        elif query.data == "sales_report":
+            await query.message.reply_text(
+                "Você escolheu ver o relatório de vendas. Envie o período: "
+                "hoje, semana, mes ou as datas, uma por linha."
+                "\n\nExemplo:\nde 01/06/2024\nate 30/06/2024",
+                reply_markup=ForceReply(selective=True),
+            )
+            return ConversationState.WAITING_SALES_REPORT
+        elif query.data in ("list_orders_next", "list_orders_previous"):
+            await self.handle_list_orders_page(query, context)
+            return ConversationHandler.END
         else:
             await query.message.reply_text("Opção desconhecida.")
             return ConversationHandler.END
@@ -173,9 +282,11 @@ class TelegramBotCommandHandler:
         raw_input = update.message.text
         print(f"Raw input: {raw_input}")
 
-        add_item_use_case = AddItemUseCase(self.item_repository)
-        output_message = self.telegram_bot_controller.add_item(
-            raw_input, add_item_use_case
+        add_item_use_case = AddItemUseCase(
+            self.item_repository, self.unit_of_work_factory()
+        )
+        output_message = await asyncio.to_thread(
+            self.telegram_bot_controller.add_item, raw_input, add_item_use_case
         )
 
         await update.message.reply_text(
@@ -188,9 +299,9 @@ class TelegramBotCommandHandler:
     async def handle_list_items(
         self, message: MaybeInaccessibleMessage
     ) -> int:
-        list_items_use_case = ListItemsUseCase(self.item_repository)
-        output_message = self.telegram_bot_controller.list_items(
-            list_items_use_case
+        list_items_use_case = ListItemsUseCase(self.read_only_item_repository)
+        output_message = await asyncio.to_thread(
+            self.telegram_bot_controller.list_items, list_items_use_case
         )
 
         await message.reply_text(
@@ -206,9 +317,13 @@ class TelegramBotCommandHandler:
         raw_input = update.message.text
         print(f"Raw input: {raw_input}")
 
-        remove_item_use_case = RemoveItemUseCase(self.item_repository)
-        output_message = self.telegram_bot_controller.remove_item(
-            raw_input, remove_item_use_case
+        remove_item_use_case = RemoveItemUseCase(
+            self.item_repository, self.unit_of_work_factory()
+        )
+        output_message = await asyncio.to_thread(
+            self.telegram_bot_controller.remove_item,
+            raw_input,
+            remove_item_use_case,
         )
 
         await update.message.reply_text(
@@ -224,10 +339,12 @@ class TelegramBotCommandHandler:
         print(f"Raw input: {raw_input}")
 
         set_inventory_quantities_use_case = SetInventoryQuantitiesUseCase(
-            self.item_repository
+            self.item_repository, self.unit_of_work_factory()
         )
-        output_message = self.telegram_bot_controller.set_inventory_quantities(
-            raw_input, set_inventory_quantities_use_case
+        output_message = await asyncio.to_thread(
+            self.telegram_bot_controller.set_inventory_quantities,
+            raw_input,
+            set_inventory_quantities_use_case,
         )
 
         await update.message.reply_text(
@@ -236,6 +353,12 @@ class TelegramBotCommandHandler:
         )
         return ConversationHandler.END
 
+    def _schedule_low_stock_alert(
+        self, context: ContextTypes.DEFAULT_TYPE
+    ) -> None:
+        if self.low_stock_alerter is not None:
+            self.low_stock_alerter.schedule(context.application)
+
     async def handle_create_goomer_order(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> int:
@@ -243,16 +366,23 @@ class TelegramBotCommandHandler:
         print(f"Raw input: {raw_input}")
 
         create_goomer_order_use_case = CreateGoomerOrderUseCase(
-            self.client_repository, self.item_repository, self.order_repository
+            self.client_repository,
+            self.item_repository,
+            self.order_repository,
+            self.unit_of_work_factory(),
+            strict_stock=self.strict_stock,
         )
-        output_message = self.telegram_bot_controller.create_goomer_order(
-            raw_input, create_goomer_order_use_case
+        output_message = await asyncio.to_thread(
+            self.telegram_bot_controller.create_goomer_order,
+            raw_input,
+            create_goomer_order_use_case,
         )
 
         await update.message.reply_text(
             output_message,
             parse_mode="MarkdownV2",
         )
+        self._schedule_low_stock_alert(context)
         return ConversationHandler.END
 
     async def handle_create_manual_order(
@@ -262,16 +392,22 @@ class TelegramBotCommandHandler:
         print(f"Raw input: {raw_input}")
 
         create_manual_order_use_case = CreateManualOrderUseCase(
-            self.item_repository, self.order_repository
+            self.item_repository,
+            self.order_repository,
+            self.unit_of_work_factory(),
+            strict_stock=self.strict_stock,
         )
-        output_message = self.telegram_bot_controller.create_manual_order(
-            raw_input, create_manual_order_use_case
+        output_message = await asyncio.to_thread(
+            self.telegram_bot_controller.create_manual_order,
+            raw_input,
+            create_manual_order_use_case,
         )
 
         await update.message.reply_text(
             output_message,
             parse_mode="MarkdownV2",
         )
+        self._schedule_low_stock_alert(context)
         return ConversationHandler.END
 
     async def handle_cancel_order(
@@ -281,10 +417,138 @@ class TelegramBotCommandHandler:
         print(f"Raw input: {raw_input}")
 
         cancel_order_use_case = CancelOrderUseCase(
-            self.order_repository, self.item_repository
+            self.order_repository,
+            self.item_repository,
+            self.unit_of_work_factory(),
+        )
+        output_message = await asyncio.to_thread(
+            self.telegram_bot_controller.cancel_order,
+            raw_input,
+            cancel_order_use_case,
+        )
+
+        await update.message.reply_text(
+            output_message,
+            parse_mode="MarkdownV2",
+        )
+        return ConversationHandler.END
+
+    async def handle_cancel_orders(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE
+    ) -> int:
+        raw_input = update.message.text
+        print(f"Raw input: {raw_input}")
+
+        cancel_orders_use_case = CancelOrdersUseCase(
+            self.order_repository,
+            self.item_repository,
+            self.unit_of_work_factory(),
+        )
+        output_message = await asyncio.to_thread(
+            self.telegram_bot_controller.cancel_orders,
+            raw_input,
+            cancel_orders_use_case,
+        )
+
+        await update.message.reply_text(
+            output_message,
+            parse_mode="MarkdownV2",
+        )
+        return ConversationHandler.END
+
+    @staticmethod
+    def _build_order_history_keyboard(
+        page: OrderHistoryPage,
+    ) -> InlineKeyboardMarkup | None:
+        buttons = []
+        if page.previous_cursor:
+            buttons.append(
+                InlineKeyboardButton(
+                    "« Anteriores", callback_data="list_orders_previous"
+                )
+            )
+        if page.next_cursor:
+            buttons.append(
+                InlineKeyboardButton(
+                    "Próximos »", callback_data="list_orders_next"
+                )
+            )
+        return InlineKeyboardMarkup([buttons]) if buttons else None
+
+    async def _get_order_history_page(
+        self, context: ContextTypes.DEFAULT_TYPE, **cursors
+    ) -> OrderHistoryPage:
+        list_orders_use_case = ListOrdersUseCase(
+            self.read_only_order_repository, self.client_repository
         )
-        output_message = self.telegram_bot_controller.cancel_order(
-            raw_input, cancel_order_use_case
+        page = await asyncio.to_thread(
+            self.telegram_bot_controller.list_orders,
+            context.user_data["order_history_filters"],
+            list_orders_use_case,
+            **cursors,
+        )
+        # Errors come back as the message alone.
+        if isinstance(page, str):
+            page = OrderHistoryPage(message=page)
+        # The filters and cursors stay in user_data, since callback data is
+        # limited to 64 bytes.
+        context.user_data["order_history_page"] = page
+        return page
+
+    async def handle_list_orders(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE
+    ) -> int:
+        raw_input = update.message.text
+        print(f"Raw input: {raw_input}")
+
+        context.user_data["order_history_filters"] = raw_input
+        page = await self._get_order_history_page(context)
+
+        await update.message.reply_text(
+            page.message,
+            parse_mode="MarkdownV2",
+            reply_markup=self._build_order_history_keyboard(page),
+        )
+        return ConversationHandler.END
+
+    async def handle_list_orders_page(
+        self, query, context: ContextTypes.DEFAULT_TYPE
+    ) -> None:
+        current_page = context.user_data.get("order_history_page")
+        if current_page is None:
+            await query.message.reply_text(
+                "Histórico expirado. Use /start para consultar novamente."
+            )
+            return
+
+        if query.data == "list_orders_next":
+            page = await self._get_order_history_page(
+                context, after=current_page.next_cursor
+            )
+        else:
+            page = await self._get_order_history_page(
+                context, before=current_page.previous_cursor
+            )
+
+        await query.edit_message_text(
+            page.message,
+            parse_mode="MarkdownV2",
+            reply_markup=self._build_order_history_keyboard(page),
+        )
+
+    async def handle_sales_report(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE
+    ) -> int:
+        raw_input = update.message.text
+        print(f"Raw input: {raw_input}")
+
+        sales_report_use_case = SalesReportUseCase(
+            self.read_only_sales_repository
+        )
+        output_message = await asyncio.to_thread(
+            self.telegram_bot_controller.sales_report,
+            raw_input,
+            sales_report_use_case,
         )
 
         await update.message.reply_text(
@@ -335,6 +599,24 @@ class TelegramBotCommandHandler:
                         self.handle_cancel_order,
                     )
                 ],
+                ConversationState.WAITING_CANCEL_ORDERS: [
+                    MessageHandler(
+                        filters.TEXT & ~filters.COMMAND,
+                        self.handle_cancel_orders,
+                    )
+                ],
+                ConversationState.WAITING_LIST_ORDERS: [
+                    MessageHandler(
+                        filters.TEXT & ~filters.COMMAND,
+                        self.handle_list_orders,
+                    )
+                ],
+                ConversationState.WAITING_SALES_REPORT: [
+                    MessageHandler(
+                        filters.TEXT & ~filters.COMMAND,
+                        self.handle_sales_report,
+                    )
+                ],
             },
             fallbacks=[CommandHandler("start", self.start_command)],
         )
@@ -1,10 +1,15 @@
 import functools
 import re
-import unicodedata
+from datetime import date, datetime, timedelta
+from typing import NamedTuple
 
 from pydantic_mongo import ObjectIdField
 
-from src.adapters.inbound.telegram_bot.presenter import TelegramBotPresenter
+from src.adapters.inbound.telegram_bot.presenter import (
+    ORDER_HISTORY_TIMEZONE,
+    TelegramBotPresenter,
+)
+from src.domain.entities.sales import SALES_TIMEZONE
 from src.domain.ports.inbound.items.dtos import (
     AddItemInputDTO,
     RemoveItemInputDTO,
@@ -19,19 +24,33 @@ from src.domain.ports.inbound.items.ports import (
 )
 from src.domain.ports.inbound.orders.dtos import (
     CancelOrderInputDTO,
+    CancelOrdersInputDTO,
     CreateGoomerOrderInputDTO,
     CreateManualOrderInputDTO,
+    ListOrdersInputDTO,
     OrderItemInputDTO,
 )
 from src.domain.ports.inbound.orders.ports import (
     CancelOrderPort,
+    CancelOrdersPort,
     CreateGoomerOrderPort,
     CreateManualOrderPort,
+    ListOrdersPort,
 )
+from src.domain.ports.inbound.sales.dtos import SalesReportInputDTO
+from src.domain.ports.inbound.sales.ports import SalesReportPort
+from src.domain.ports.outbound.repositories.order import OrderCursor
+from src.domain.text import clean_text
 
 ORDER_SECTIONS_DELIMITER = "---------------------------------------"
 
 
+class OrderHistoryPage(NamedTuple):
+    message: str
+    next_cursor: OrderCursor | None = None
+    previous_cursor: OrderCursor | None = None
+
+
 class TelegramBotController:
     def __init__(self):
         self._decorate_public_methods_with_error_catch()
@@ -77,7 +96,7 @@ class TelegramBotController:
         raw_input: str, remove_item_use_case: RemoveItemPort
     ) -> str:
         raw_item_name = raw_input
-        item_name = TelegramBotController._clean_text(raw_item_name)
+        item_name = clean_text(raw_item_name)
 
         input_dto = RemoveItemInputDTO(item_name=item_name)
         output_dto = remove_item_use_case.execute(input_dto)
@@ -113,7 +132,7 @@ class TelegramBotController:
             inventory_quantity, raw_item_name = (
                 raw_item_name_and_inventory_quantity.split(" ", 1)
             )
-            item_name = TelegramBotController._clean_text(raw_item_name)
+            item_name = clean_text(raw_item_name)
             items_input_dto.append(
                 SetInventoryQuantityItemInputDTO(
                     item_name=item_name,
@@ -128,7 +147,7 @@ class TelegramBotController:
         raw_input: str,
     ) -> AddItemInputDTO:
         inventory_quantity, raw_item_name = raw_input.split(" ", 1)
-        item_name = TelegramBotController._clean_text(raw_item_name)
+        item_name = clean_text(raw_item_name)
         return AddItemInputDTO(
             item_name=item_name,
             inventory_quantity=int(inventory_quantity),
@@ -159,7 +178,7 @@ class TelegramBotController:
             quantity, order_item = raw_quantity_and_order_item.split(" ", 1)
             order_items.append(
                 OrderItemInputDTO(
-                    item_name=TelegramBotController._clean_text(order_item),
+                    item_name=clean_text(order_item),
                     quantity=int(quantity.strip()),
                 )
             )
@@ -178,6 +197,7 @@ class TelegramBotController:
         external_order_id = TelegramBotController._extract_external_order_id(
             raw_input_list[1]
         )
+        brand = TelegramBotController._extract_brand(raw_input_list[1])
         order_items = TelegramBotController._extract_goomer_order_items(
             raw_input_list[2]
         )
@@ -189,6 +209,7 @@ class TelegramBotController:
         input_dto = CreateGoomerOrderInputDTO(
             client_name=client_name,
             external_order_id=external_order_id,
+            brand=brand,
             external_created_at=created_at,
             items=order_items,
         )
@@ -208,6 +229,15 @@ class TelegramBotController:
             raise ValueError("External Order ID not found")
         return int(external_order_id_match.group(1))
 
+    @staticmethod
+    def _extract_brand(order_metadata: str) -> str | None:
+        brand_match = re.search(
+            r"Pedido Goomer Delivery #\d+\*\s*-\s*_(.+?)_", order_metadata
+        )
+        if not brand_match:
+            return None
+        return clean_text(brand_match.group(1))
+
     @staticmethod
     def _extract_goomer_order_items(raw_order_items_section: str) -> list:
         raw_order_items = raw_order_items_section.split("\n")
@@ -230,7 +260,7 @@ class TelegramBotController:
 
         order_items = [
             OrderItemInputDTO(
-                item_name=TelegramBotController._clean_text(item_name),
+                item_name=clean_text(item_name),
                 quantity=quantity,
             )
             for item_name, quantity in order_items_to_quantity_map.items()
@@ -243,7 +273,7 @@ class TelegramBotController:
         if not client_name_match:
             raise ValueError("Client Name not found")
         client_name = client_name_match.group(1).strip()
-        return TelegramBotController._clean_text(client_name)
+        return clean_text(client_name)
 
     @staticmethod
     def _extract_created_at(raw_input: str) -> str:
@@ -265,35 +295,131 @@ class TelegramBotController:
         return output_message
 
     @staticmethod
-    def _remove_accents(input_str: str) -> str:
-        # Normaliza a string para 'NFKD' que separará letras de seus acentos
-        # Filtra para manter apenas caracteres que não são acentos
-        nfkd_form = unicodedata.normalize("NFKD", input_str)
-        return "".join([c for c in nfkd_form if not unicodedata.combining(c)])
+    def cancel_orders(
+        raw_input: str, cancel_orders_use_case: CancelOrdersPort
+    ) -> str:
+        input_dto = TelegramBotController._extract_orders_to_cancel(raw_input)
+        output_dto = cancel_orders_use_case.execute(input_dto)
+        output_message = TelegramBotPresenter.format_cancel_orders_message(
+            output_dto
+        )
+        return output_message
 
     @staticmethod
-    def _adjust_commas(input_str: str) -> str:
-        # Substitui vírgula seguida de espaço por vírgula sem espaço
-        return re.sub(r",\s+", ",", input_str)
+    def _extract_orders_to_cancel(raw_input: str) -> CancelOrdersInputDTO:
+        input_dto = CancelOrdersInputDTO()
+        for raw_line in raw_input.split("\n"):
+            line = clean_text(raw_line)
+            if line.startswith("marca "):
+                input_dto.brand = line.removeprefix("marca ")
+                continue
+            for raw_id in re.split(r"[,\s]+", line):
+                if raw_id.startswith("#"):
+                    input_dto.external_order_ids.append(int(raw_id[1:]))
+                elif raw_id:
+                    input_dto.order_ids.append(ObjectIdField(raw_id))
+        if not input_dto.order_ids and not input_dto.external_order_ids:
+            raise ValueError("Order IDs not found")
+        return input_dto
 
     @staticmethod
-    def _remove_asterisks(input_str: str) -> str:
-        # Remove asteriscos
-        return input_str.replace("*", "")
+    def list_orders(
+        raw_input: str,
+        list_orders_use_case: ListOrdersPort,
+        after: OrderCursor | None = None,
+        before: OrderCursor | None = None,
+    ) -> OrderHistoryPage:
+        input_dto = TelegramBotController._extract_order_history_filters(
+            raw_input
+        )
+        input_dto.after = after
+        input_dto.before = before
+        output_dto = list_orders_use_case.execute(input_dto)
+        return OrderHistoryPage(
+            message=TelegramBotPresenter.format_list_orders_message(
+                output_dto
+            ),
+            next_cursor=output_dto.next_cursor,
+            previous_cursor=output_dto.previous_cursor,
+        )
 
     @staticmethod
-    def _remove_multiple_spaces(input_str: str) -> str:
-        # Substitui qualquer sequência de espaços em branco por um único espaço
-        return re.sub(r"\s+", " ", input_str).strip()
+    def _extract_order_history_filters(raw_input: str) -> ListOrdersInputDTO:
+        input_dto = ListOrdersInputDTO()
+        for raw_filter in raw_input.split("\n"):
+            raw_filter = clean_text(raw_filter)
+            if not raw_filter or raw_filter == "todos":
+                continue
+            keyword, _, value = raw_filter.partition(" ")
+            match keyword:
+                case "de":
+                    input_dto.created_from = TelegramBotController._parse_date(
+                        value
+                    )
+                case "ate":
+                    input_dto.created_until = (
+                        TelegramBotController._parse_date(value)
+                        + timedelta(days=1)
+                    )
+                case "cliente":
+                    input_dto.client_name = value
+                case "cancelados" if value in ("sim", "nao"):
+                    input_dto.is_cancelled = value == "sim"
+                case _:
+                    raise ValueError(f"Unknown order history filter {keyword}")
+        return input_dto
 
     @staticmethod
-    def _clean_text(input_str: str) -> str:
-        return TelegramBotController._adjust_commas(
-            TelegramBotController._remove_accents(
-                TelegramBotController._remove_asterisks(
-                    TelegramBotController._remove_multiple_spaces(
-                        input_str.strip()
-                    )
+    def sales_report(
+        raw_input: str, sales_report_use_case: SalesReportPort
+    ) -> str:
+        input_dto = TelegramBotController._extract_sales_report_period(
+            raw_input
+        )
+        output_dto = sales_report_use_case.execute(input_dto)
+        output_message = TelegramBotPresenter.format_sales_report_message(
+            output_dto
+        )
+        return output_message
+
+    @staticmethod
+    def _extract_sales_report_period(raw_input: str) -> SalesReportInputDTO:
+        today = datetime.now(SALES_TIMEZONE).date()
+        match clean_text(raw_input):
+            case "hoje":
+                return SalesReportInputDTO(first_day=today, last_day=today)
+            case "semana":
+                return SalesReportInputDTO(
+                    first_day=today - timedelta(days=6), last_day=today
                 )
-            )
-        ).lower()
+            case "mes":
+                return SalesReportInputDTO(
+                    first_day=today.replace(day=1), last_day=today
+                )
+        return TelegramBotController._extract_sales_report_days(
+            raw_input, today
+        )
+
+    @staticmethod
+    def _extract_sales_report_days(
+        raw_input: str, today: date
+    ) -> SalesReportInputDTO:
+        days_by_keyword = {"de": today, "ate": today}
+        for raw_day in raw_input.split("\n"):
+            keyword, _, value = clean_text(raw_day).partition(" ")
+            if not keyword:
+                continue
+            if keyword not in days_by_keyword:
+                raise ValueError(f"Unknown sales report period {keyword}")
+            days_by_keyword[keyword] = TelegramBotController._parse_date(
+                value
+            ).date()
+        return SalesReportInputDTO(
+            first_day=days_by_keyword["de"], last_day=days_by_keyword["ate"]
+        )
+
+    @staticmethod
+    def _parse_date(raw_date: str) -> datetime:
+        return datetime.strptime(raw_date, "%d/%m/%Y").replace(
+            tzinfo=ORDER_HISTORY_TIMEZONE
+        )
@@ -1,23 +1,36 @@
+from datetime import UTC, date, datetime
+from zoneinfo import ZoneInfo
+
 from src.domain.exceptions import (
+    InsufficientInventoryError,
     ItemAlreadyExistsError,
     ItemNotFoundByNameError,
     ItemsNotFoundByNameError,
+    OrderAlreadyExistsError,
     OrderNotFoundError,
+    OrdersAlreadyCancelledError,
 )
 from src.domain.ports.inbound.items.dtos import (
     AddItemOutputDTO,
     ItemOutputDTO,
     ListItemsOutputDTO,
+    ListLowStockItemsOutputDTO,
     RemoveItemOutputDTO,
     SetInventoryQuantityOutputDTO,
 )
 from src.domain.ports.inbound.orders.dtos import (
     CancelOrderItemOutputDTO,
     CancelOrderOutputDTO,
+    CancelOrdersOutputDTO,
     CreateGoomerOrderOutputDTO,
     CreateManualOrderOutputDTO,
     CreateOrderItemOutputDTO,
+    ListOrdersOrderOutputDTO,
+    ListOrdersOutputDTO,
 )
+from src.domain.ports.inbound.sales.dtos import SalesReportOutputDTO
+
+ORDER_HISTORY_TIMEZONE = ZoneInfo("America/Sao_Paulo")
 
 CATEGORY_ITEM_NAME_MAP: dict[str, str] = {
     "Carne": "Marmitas de Carne",
@@ -45,13 +58,29 @@ class TelegramBotPresenter:
                     error_message += (
                         f"Marmitas {', '.join(names)} não encontradas\\."
                     )
+            case InsufficientInventoryError() as e:
+                names = [name.capitalize() for name in e.items_names]
+                error_message += (
+                    f"Estoque insuficiente de {', '.join(names)}\\. "
+                    "Nenhum item foi baixado\\."
+                )
             case ItemAlreadyExistsError() as e:
                 error_message += (
                     f"Marmita {e.item_name.capitalize()} "
                     "já está cadastrada\\."
                 )
+            case OrderAlreadyExistsError() as e:
+                error_message += (
+                    f"Pedido \\#{e.external_order_id} já está registrado\\."
+                )
             case OrderNotFoundError() as e:
                 error_message += f"Pedido {e.order_id} não encontrado\\."
+            case OrdersAlreadyCancelledError() as e:
+                order_ids = ", ".join(map(str, e.order_ids))
+                error_message += (
+                    f"Pedidos {order_ids} já foram cancelados\\. "
+                    "Nenhum pedido foi cancelado\\."
+                )
             case _:
                 error_message += "Ocorreu um erro inesperado\\."
 
@@ -99,6 +128,21 @@ class TelegramBotPresenter:
             output_message += f"*Estoque:* {inventory_quantity}\n"
         return output_message
 
+    @staticmethod
+    def format_low_stock_digest_message(
+        output_dto: ListLowStockItemsOutputDTO,
+    ) -> str:
+        output_message = "Marmitas com estoque baixo:\n\n"
+        for item in output_dto.items:
+            inventory_quantity = str(item.inventory_quantity).replace(
+                "-", "\\-"
+            )
+            output_message += (
+                f"  \\- {item.item_name.capitalize()}: {inventory_quantity} "
+                f"\\(mínimo {item.low_stock_threshold}\\)\n"
+            )
+        return output_message
+
     @staticmethod
     def format_remove_item_message(output_dto: RemoveItemOutputDTO) -> str:
         output_message = "Marmita removida com sucesso\\!\n\n"
@@ -156,7 +200,10 @@ class TelegramBotPresenter:
             )
         )
 
-        output_message = "Pedido registrado com sucesso\\!\n\n"
+        if output_dto.is_duplicate:
+            output_message = "Pedido já registrado anteriormente\\!\n\n"
+        else:
+            output_message = "Pedido registrado com sucesso\\!\n\n"
         output_message += f"*ID do Pedido:* {output_dto.order_id}\n"
         output_message += f"*Cliente:* {output_dto.client_name.capitalize()}\n"
         output_message += "*Marmitas:*\n\n"
@@ -221,6 +268,110 @@ class TelegramBotPresenter:
         )
         return output_message
 
+    @staticmethod
+    def format_list_orders_message(output_dto: ListOrdersOutputDTO) -> str:
+        if not output_dto.orders:
+            return "Nenhum pedido encontrado\\."
+
+        output_message = "Histórico de Pedidos:\n\n"
+        for order in output_dto.orders:
+            output_message += TelegramBotPresenter._format_order_for_history(
+                order
+            )
+        return output_message
+
+    @staticmethod
+    def _format_order_for_history(order: ListOrdersOrderOutputDTO) -> str:
+        created_at = TelegramBotPresenter._format_order_datetime(
+            order.created_at
+        )
+        output_message = f"*ID do Pedido:* {order.order_id}\n"
+        output_message += f"*Data:* {created_at}\n"
+        if order.external_order_id is not None:
+            output_message += (
+                f"*Pedido Goomer:* \\#{order.external_order_id}\n"
+            )
+        if order.client_name:
+            output_message += f"*Cliente:* {order.client_name.capitalize()}\n"
+        if order.is_cancelled:
+            output_message += "*Status:* Cancelado\n"
+        output_message += "*Marmitas:*\n"
+        for order_item in order.order_items:
+            output_message += (
+                f"  \\- {order_item.quantity}x "
+                f"{order_item.item_name.capitalize()}\n"
+            )
+        return output_message + "\n"
+
+    @staticmethod
+    def _format_order_datetime(created_at: datetime) -> str:
+        # Repositories return UTC datetimes without a timezone.
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=UTC)
+        return created_at.astimezone(ORDER_HISTORY_TIMEZONE).strftime(
+            "%d/%m/%Y às %H:%M"
+        )
+
+    @staticmethod
+    def format_sales_report_message(output_dto: SalesReportOutputDTO) -> str:
+        period = TelegramBotPresenter._format_sales_report_period(
+            output_dto.first_day, output_dto.last_day
+        )
+        if not output_dto.items:
+            return f"Nenhuma venda {period}\\."
+
+        output_message = f"Vendas {period}:\n\n"
+        for item in output_dto.items:
+            output_message += (
+                f"  \\- {item.quantity}x {item.item_name.capitalize()}\n"
+            )
+        output_message += f"\n*Total:* {output_dto.total_quantity} marmitas"
+        return output_message
+
+    @staticmethod
+    def _format_sales_report_period(first_day: date, last_day: date) -> str:
+        if first_day == last_day:
+            return f"em {first_day:%d/%m/%Y}"
+        return f"de {first_day:%d/%m/%Y} a {last_day:%d/%m/%Y}"
+
+    @staticmethod
+    def format_cancel_orders_message(
+        output_dto: CancelOrdersOutputDTO,
+    ) -> str:
+        output_message = (
+            f"{len(output_dto.cancelled_orders)} pedido\\(s\\) "
+            "cancelado\\(s\\) com sucesso\\!\n"
+        )
+        for order in output_dto.cancelled_orders:
+            output_message += f"\n*ID do Pedido:* {order.order_id}\n"
+            if order.external_order_id is not None:
+                output_message += (
+                    f"*Pedido Goomer:* \\#{order.external_order_id}\n"
+                )
+            for item in order.order_items:
+                output_message += (
+                    f"{item.quantity}x {item.item_name.capitalize()} "
+                    f"\\(estoque: {item.inventory_quantity}\\)\n"
+                )
+        if output_dto.already_cancelled_order_ids:
+            order_ids = ", ".join(
+                map(str, output_dto.already_cancelled_order_ids)
+            )
+            output_message += f"\n*Já cancelados:* {order_ids}\n"
+        external_order_ids = output_dto.not_found_external_order_ids
+        not_found_ids = [
+            *map(str, output_dto.not_found_order_ids),
+            *(
+                f"\\#{external_order_id}"
+                for external_order_id in external_order_ids
+            ),
+        ]
+        if not_found_ids:
+            output_message += (
+                f"\n*Não encontrados:* {', '.join(not_found_ids)}\n"
+            )
+        return output_message
+
     @staticmethod
     def _format_category_for_order_items(
         items: list[CreateOrderItemOutputDTO] | list[CancelOrderItemOutputDTO],
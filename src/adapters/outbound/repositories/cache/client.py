@@ -0,0 +1,67 @@
+import threading
+import time
+from collections.abc import Callable
+
+from src.adapters.outbound.repositories.cache.lru import (
+    CacheStatistics,
+    TTLLRUCache,
+)
+from src.domain.entities.client import Client
+from src.domain.ports.outbound.repositories.client import (
+    ClientRepositoryInterface,
+)
+
+
+class CachedClientRepository:
+    def __init__(
+        self,
+        client_repository: ClientRepositoryInterface,
+        max_size: int = 1000,
+        ttl_seconds: float = 3600,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.client_repository = client_repository
+        self.hits = 0
+        self.misses = 0
+        self._clients_by_name: TTLLRUCache[str, Client] = TTLLRUCache(
+            max_size, ttl_seconds, clock
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        with self._lock:
+            return CacheStatistics(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self._clients_by_name.evictions,
+                size=len(self._clients_by_name),
+            )
+
+    def _get_cached_client(self, client_name: str) -> Client | None:
+        client = self._clients_by_name.get(client_name)
+        with self._lock:
+            if client is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return client.model_copy()
+
+    def find_client_by_name(self, client_name: str) -> Client | None:
+        client = self._get_cached_client(client_name)
+        if client is None:
+            client = self.client_repository.find_client_by_name(client_name)
+            if client is not None:
+                self._clients_by_name.put(client.name, client.model_copy())
+        return client
+
+    def save(self, client: Client) -> None:
+        self.client_repository.save(client)
+        self._clients_by_name.put(client.name, client.model_copy())
+
+    def get_or_create_by_name(self, client_name: str) -> Client:
+        client = self._get_cached_client(client_name)
+        if client is None:
+            client = self.client_repository.get_or_create_by_name(client_name)
+            self._clients_by_name.put(client.name, client.model_copy())
+        return client
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+
+from bson import ObjectId
+
+from src.adapters.outbound.repositories.cache.lru import (
+    CacheStatistics,
+    TTLLRUCache,
+)
+from src.domain.entities.item import Item
+from src.domain.ports.outbound.repositories.item import (
+    ItemRepositoryInterface,
+    SaveAllItemsResult,
+)
+
+
+class CachedItemRepository:
+    def __init__(
+        self,
+        item_repository: ItemRepositoryInterface,
+        max_size: int = 1000,
+        ttl_seconds: float = 300,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.item_repository = item_repository
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._items_by_name: TTLLRUCache[str, Item] = TTLLRUCache(
+            max_size, ttl_seconds, clock
+        )
+        self._item_names_by_id: dict[ObjectId, str] = {}
+        self._catalog_expires_at: float | None = None
+        self._catalog_evictions = 0
+        # Bumped on every write, so a read that raced with a write does
+        # not put what it read into the cache.
+        self._generation = 0
+        self._lock = threading.RLock()
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        with self._lock:
+            return CacheStatistics(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self._items_by_name.evictions,
+                size=len(self._items_by_name),
+            )
+
+    def _is_catalog_loaded(self) -> bool:
+        # Once every item fits in the cache, a name missing from it is a
+        # name missing from the repository. Any eviction breaks that.
+        return (
+            self._catalog_expires_at is not None
+            and self._catalog_expires_at > self._clock()
+            and self._catalog_evictions == self._items_by_name.evictions
+        )
+
+    def _cache_item(self, item: Item) -> None:
+        self._items_by_name.put(item.name, item.model_copy())
+        self._item_names_by_id[item.id] = item.name
+
+    def _find_cached_item_by_id(self, item_id: ObjectId) -> Item | None:
+        item_name = self._item_names_by_id.get(item_id)
+        if item_name is None:
+            return None
+        item = self._items_by_name.get(item_name)
+        if item is None or item.id != item_id:
+            del self._item_names_by_id[item_id]
+            return None
+        return item
+
+    def find_item_by_name(self, item_name: str) -> Item | None:
+        items = self.find_items_by_names([item_name])
+        return items[0] if items else None
+
+    def find_items_by_names(self, items_names: list[str]) -> list[Item]:
+        unique_names = list(dict.fromkeys(items_names))
+        with self._lock:
+            items_by_name = {
+                item.name: item
+                for item in map(self._items_by_name.get, unique_names)
+                if item is not None
+            }
+            missing_names = [
+                name for name in unique_names if name not in items_by_name
+            ]
+            if not missing_names or self._is_catalog_loaded():
+                self.hits += 1
+                return [
+                    items_by_name[name].model_copy()
+                    for name in unique_names
+                    if name in items_by_name
+                ]
+            self.misses += 1
+            generation = self._generation
+
+        found_items = self.item_repository.find_items_by_names(missing_names)
+
+        with self._lock:
+            if generation == self._generation:
+                for item in found_items:
+                    self._cache_item(item)
+            items_by_name = {
+                name: item.model_copy() for name, item in items_by_name.items()
+            }
+            items_by_name.update({item.name: item for item in found_items})
+        return [
+            items_by_name[name]
+            for name in unique_names
+            if name in items_by_name
+        ]
+
+    def get_all(self) -> list[Item]:
+        with self._lock:
+            if self._is_catalog_loaded():
+                self.hits += 1
+                items = self._items_by_name.values()
+                return sorted(
+                    (item.model_copy() for item in items),
+                    key=lambda item: item.id,
+                )
+            self.misses += 1
+            generation = self._generation
+
+        items = self.item_repository.get_all()
+
+        with self._lock:
+            if (
+                generation == self._generation
+                and len(items) <= self._items_by_name.max_size
+            ):
+                self._items_by_name.clear()
+                self._item_names_by_id.clear()
+                for item in items:
+                    self._cache_item(item)
+                self._catalog_expires_at = (
+                    self._clock() + self._items_by_name.ttl_seconds
+                )
+                self._catalog_evictions = self._items_by_name.evictions
+        return items
+
+    def iter_items(self, batch_size: int) -> Iterator[Item]:
+        # Streamed exports read past the cache, so they neither evict the
+        # hot items nor load a catalog larger than it.
+        return self.item_repository.iter_items(batch_size)
+
+    def find_low_stock_items(self) -> list[Item]:
+        # The repository reads only the low stock items off its index; the
+        # cache would have to look at every item to find them.
+        return self.item_repository.find_low_stock_items()
+
+    def remove_item_by_name(self, item_name: str) -> None:
+        self.item_repository.remove_item_by_name(item_name)
+        with self._lock:
+            self._generation += 1
+            item = self._items_by_name.pop(item_name)
+            if item is not None:
+                self._item_names_by_id.pop(item.id, None)
+
+    def save(self, item: Item) -> None:
+        self.item_repository.save(item)
+        with self._lock:
+            self._generation += 1
+            self._cache_item(item)
+
+    def save_all(self, items: list[Item]) -> SaveAllItemsResult:
+        result = self.item_repository.save_all(items)
+        with self._lock:
+            self._generation += 1
+            is_catalog_loaded = self._is_catalog_loaded()
+            for item in items:
+                # save_all upserts by name, so a cached item keeps its id.
+                cached_item = self._items_by_name.get(item.name)
+                if cached_item is not None:
+                    cached_item.set_inventory_quantity(item.inventory_quantity)
+                    cached_item.set_low_stock_threshold(
+                        item.low_stock_threshold
+                    )
+                elif is_catalog_loaded:
+                    self._cache_item(item)
+        return result
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._items_by_name.clear()
+            self._item_names_by_id.clear()
+            self._catalog_expires_at = None
+
+    def _set_cached_inventory_quantities(
+        self, inventory_quantities_by_item_id: dict[ObjectId, int]
+    ) -> None:
+        with self._lock:
+            self._generation += 1
+            for (
+                item_id,
+                inventory_quantity,
+            ) in inventory_quantities_by_item_id.items():
+                cached_item = self._find_cached_item_by_id(item_id)
+                if cached_item is not None:
+                    cached_item.set_inventory_quantity(inventory_quantity)
+
+    def increment_inventory_quantities(
+        self, quantity_deltas_by_item_id: dict[ObjectId, int]
+    ) -> dict[ObjectId, int]:
+        inventory_quantities_by_item_id = (
+            self.item_repository.increment_inventory_quantities(
+                quantity_deltas_by_item_id
+            )
+        )
+        self._set_cached_inventory_quantities(inventory_quantities_by_item_id)
+        return inventory_quantities_by_item_id
+
+    def decrement_inventory_quantities(
+        self, quantities_by_item_id: dict[ObjectId, int]
+    ) -> dict[ObjectId, int]:
+        # A short item leaves the stock as it was, so the cache stays valid.
+        inventory_quantities_by_item_id = (
+            self.item_repository.decrement_inventory_quantities(
+                quantities_by_item_id
+            )
+        )
+        self._set_cached_inventory_quantities(inventory_quantities_by_item_id)
+        return inventory_quantities_by_item_id
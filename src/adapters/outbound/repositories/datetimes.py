@@ -0,0 +1,9 @@
+from datetime import UTC, datetime
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    # Mongo stores dates as UTC and reads them back without a timezone;
+    # the other backends do the same so that orders sort and compare alike.
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
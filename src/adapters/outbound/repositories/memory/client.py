@@ -0,0 +1,39 @@
+from src.adapters.outbound.repositories.memory.database import MemoryDatabase
+from src.domain.entities.client import Client
+
+
+class MemoryClientRepository:
+    def __init__(self, memory_database: MemoryDatabase):
+        self.database = memory_database
+
+    def _find_client_by_name(self, client_name: str) -> Client | None:
+        client_id = self.database.client_ids_by_name.get(client_name)
+        if client_id is None:
+            return None
+        return self.database.clients_by_id[client_id]
+
+    def find_client_by_name(self, client_name: str) -> Client | None:
+        with self.database.lock:
+            client = self._find_client_by_name(client_name)
+            return client.model_copy() if client else None
+
+    def save(self, client: Client) -> None:
+        with self.database.lock:
+            client_id_with_name = self.database.client_ids_by_name.get(
+                client.name
+            )
+            if client_id_with_name not in (None, client.id):
+                raise ValueError(f"Client {client.name} already exists")
+            previous_client = self.database.clients_by_id.get(client.id)
+            if previous_client is not None:
+                del self.database.client_ids_by_name[previous_client.name]
+            self.database.clients_by_id[client.id] = client.model_copy()
+            self.database.client_ids_by_name[client.name] = client.id
+
+    def get_or_create_by_name(self, client_name: str) -> Client:
+        with self.database.lock:
+            client = self._find_client_by_name(client_name)
+            if client is None:
+                client = Client(name=client_name)
+                self.save(client)
+            return client.model_copy()
@@ -0,0 +1,46 @@
+import threading
+from datetime import date
+
+from bson import ObjectId
+
+from src.domain.entities.client import Client
+from src.domain.entities.inventory import InventoryMovement, InventorySnapshot
+from src.domain.entities.item import Item
+from src.domain.entities.order import Order
+from src.domain.entities.sales import DailyItemSales
+
+
+class MemoryDatabase:
+    def __init__(self):
+        # One re-entrant lock guards every table and index, so each
+        # repository call is atomic with respect to all the others.
+        self.lock = threading.RLock()
+        self.items_by_id: dict[ObjectId, Item] = {}
+        self.item_ids_by_name: dict[str, ObjectId] = {}
+        # Kept up to date on every stock or threshold write, like the
+        # partial low stock index of the Mongo adapters.
+        self.low_stock_item_ids: set[ObjectId] = set()
+        self.clients_by_id: dict[ObjectId, Client] = {}
+        self.client_ids_by_name: dict[str, ObjectId] = {}
+        self.orders_by_id: dict[ObjectId, Order] = {}
+        self.order_ids_by_external_id: dict[tuple[str, int], ObjectId] = {}
+        self.archived_orders_by_id: dict[ObjectId, Order] = {}
+        self.daily_sales_by_key: dict[
+            tuple[date, ObjectId], DailyItemSales
+        ] = {}
+        self.inventory_movements: list[InventoryMovement] = []
+        self.inventory_snapshots: list[InventorySnapshot] = []
+
+    def clear(self) -> None:
+        with self.lock:
+            self.items_by_id.clear()
+            self.item_ids_by_name.clear()
+            self.low_stock_item_ids.clear()
+            self.clients_by_id.clear()
+            self.client_ids_by_name.clear()
+            self.orders_by_id.clear()
+            self.order_ids_by_external_id.clear()
+            self.archived_orders_by_id.clear()
+            self.daily_sales_by_key.clear()
+            self.inventory_movements.clear()
+            self.inventory_snapshots.clear()
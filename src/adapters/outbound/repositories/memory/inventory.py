@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from src.adapters.outbound.repositories.datetimes import to_naive_utc
+from src.adapters.outbound.repositories.memory.database import MemoryDatabase
+from src.domain.entities.inventory import InventoryMovement, InventorySnapshot
+
+
+class MemoryInventoryLedgerRepository:
+    def __init__(self, memory_database: MemoryDatabase):
+        self.database = memory_database
+
+    def append_movements(self, movements: list[InventoryMovement]) -> None:
+        with self.database.lock:
+            self.database.inventory_movements.extend(
+                movement.model_copy(
+                    update={"created_at": to_naive_utc(movement.created_at)}
+                )
+                for movement in movements
+            )
+
+    def find_movements(
+        self, created_after: datetime | None, created_until: datetime
+    ) -> list[InventoryMovement]:
+        created_until = to_naive_utc(created_until)
+        with self.database.lock:
+            movements = [
+                movement.model_copy()
+                for movement in self.database.inventory_movements
+                if movement.created_at <= created_until
+                and (
+                    created_after is None
+                    or movement.created_at > to_naive_utc(created_after)
+                )
+            ]
+        return sorted(
+            movements, key=lambda movement: (movement.created_at, movement.id)
+        )
+
+    def save_snapshot(self, snapshot: InventorySnapshot) -> None:
+        with self.database.lock:
+            self.database.inventory_snapshots.append(
+                snapshot.model_copy(
+                    update={"taken_at": to_naive_utc(snapshot.taken_at)},
+                    deep=True,
+                )
+            )
+
+    def find_latest_snapshot(
+        self, taken_until: datetime
+    ) -> InventorySnapshot | None:
+        taken_until = to_naive_utc(taken_until)
+        with self.database.lock:
+            snapshot = max(
+                (
+                    snapshot
+                    for snapshot in self.database.inventory_snapshots
+                    if snapshot.taken_at <= taken_until
+                ),
+                key=lambda snapshot: snapshot.taken_at,
+                default=None,
+            )
+            return snapshot.model_copy(deep=True) if snapshot else None
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+from bson import ObjectId
+
+from src.adapters.outbound.repositories.memory.database import MemoryDatabase
+from src.domain.entities.item import Item
+from src.domain.exceptions import (
+    InsufficientInventoryError,
+    ItemAlreadyExistsError,
+)
+from src.domain.ports.outbound.repositories.item import SaveAllItemsResult
+
+
+class MemoryItemRepository:
+    def __init__(self, memory_database: MemoryDatabase):
+        self.database = memory_database
+
+    def _find_item_by_name(self, item_name: str) -> Item | None:
+        item_id = self.database.item_ids_by_name.get(item_name)
+        if item_id is None:
+            return None
+        return self.database.items_by_id[item_id]
+
+    def _index_low_stock(self, item: Item) -> None:
+        if item.is_low_on_stock():
+            self.database.low_stock_item_ids.add(item.id)
+        else:
+            self.database.low_stock_item_ids.discard(item.id)
+
+    def find_item_by_name(self, item_name: str) -> Item | None:
+        with self.database.lock:
+            item = self._find_item_by_name(item_name)
+            return item.model_copy() if item else None
+
+    def find_items_by_names(self, items_names: list[str]) -> list[Item]:
+        with self.database.lock:
+            return [
+                item.model_copy()
+                for item in map(
+                    self._find_item_by_name, dict.fromkeys(items_names)
+                )
+                if item is not None
+            ]
+
+    def get_all(self) -> list[Item]:
+        with self.database.lock:
+            return [
+                item.model_copy()
+                for item in self.database.items_by_id.values()
+            ]
+
+    def iter_items(self, batch_size: int) -> Iterator[Item]:
+        # The catalog already lives in memory, so there is nothing to
+        # stream from; the copies are taken under the lock.
+        yield from sorted(self.get_all(), key=lambda item: item.name)
+
+    def find_low_stock_items(self) -> list[Item]:
+        with self.database.lock:
+            items = [
+                self.database.items_by_id[item_id].model_copy()
+                for item_id in self.database.low_stock_item_ids
+            ]
+        return sorted(items, key=lambda item: item.name)
+
+    def remove_item_by_name(self, item_name: str) -> None:
+        with self.database.lock:
+            item_id = self.database.item_ids_by_name.pop(item_name, None)
+            if item_id is not None:
+                del self.database.items_by_id[item_id]
+                self.database.low_stock_item_ids.discard(item_id)
+
+    def save(self, item: Item) -> None:
+        with self.database.lock:
+            item_id_with_name = self.database.item_ids_by_name.get(item.name)
+            if item_id_with_name not in (None, item.id):
+                raise ItemAlreadyExistsError(item.name)
+            previous_item = self.database.items_by_id.get(item.id)
+            if previous_item is not None:
+                del self.database.item_ids_by_name[previous_item.name]
+            self.database.items_by_id[item.id] = item.model_copy()
+            self.database.item_ids_by_name[item.name] = item.id
+            self._index_low_stock(item)
+
+    def save_all(self, items: list[Item]) -> SaveAllItemsResult:
+        inserted_count = 0
+        modified_count = 0
+        with self.database.lock:
+            for item in items:
+                # Same upsert-by-name semantics as the Mongo adapters.
+                existing_item = self._find_item_by_name(item.name)
+                if existing_item is None:
+                    self.save(item)
+                    inserted_count += 1
+                elif (
+                    existing_item.inventory_quantity,
+                    existing_item.low_stock_threshold,
+                ) != (item.inventory_quantity, item.low_stock_threshold):
+                    existing_item.set_inventory_quantity(
+                        item.inventory_quantity
+                    )
+                    existing_item.set_low_stock_threshold(
+                        item.low_stock_threshold
+                    )
+                    self._index_low_stock(existing_item)
+                    modified_count += 1
+        return SaveAllItemsResult(
+            inserted_count=inserted_count, modified_count=modified_count
+        )
+
+    def increment_inventory_quantities(
+        self, quantity_deltas_by_item_id: dict[ObjectId, int]
+    ) -> dict[ObjectId, int]:
+        inventory_quantities_by_item_id = {}
+        with self.database.lock:
+            for item_id, quantity_delta in quantity_deltas_by_item_id.items():
+                item = self.database.items_by_id.get(item_id)
+                if item is None:
+                    continue
+                item.increase_inventory_quantity(quantity_delta)
+                self._index_low_stock(item)
+                inventory_quantities_by_item_id[item_id] = (
+                    item.inventory_quantity
+                )
+        return inventory_quantities_by_item_id
+
+    def decrement_inventory_quantities(
+        self, quantities_by_item_id: dict[ObjectId, int]
+    ) -> dict[ObjectId, int]:
+        with self.database.lock:
+            items_by_id = {
+                item_id: self.database.items_by_id.get(item_id)
+                for item_id in quantities_by_item_id
+            }
+            short_items_names = [
+                str(item_id) if item is None else item.name
+                for item_id, item in items_by_id.items()
+                if item is None
+                or item.inventory_quantity < quantities_by_item_id[item_id]
+            ]
+            if short_items_names:
+                raise InsufficientInventoryError(short_items_names)
+            for item_id, item in items_by_id.items():
+                item.decrease_inventory_quantity(  # type: ignore
+                    quantities_by_item_id[item_id]
+                )
+                self._index_low_stock(item)  # type: ignore
+            return {
+                item_id: item.inventory_quantity  # type: ignore
+                for item_id, item in items_by_id.items()
+            }
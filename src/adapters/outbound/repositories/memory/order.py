@@ -0,0 +1,235 @@
+import heapq
+from datetime import datetime
+
+from bson import ObjectId
+
+from src.adapters.outbound.repositories.datetimes import to_naive_utc
+from src.adapters.outbound.repositories.memory.database import MemoryDatabase
+from src.domain.entities.order import Order, OrderItem
+from src.domain.exceptions import (
+    OrderAlreadyExistsError,
+    OrdersAlreadyCancelledError,
+)
+from src.domain.ports.outbound.repositories.order import (
+    OrderCursor,
+    OrderFilter,
+)
+
+
+def _get_order_key(order: Order) -> tuple:
+    return order.created_at, order.id
+
+
+def _get_cursor_key(cursor: OrderCursor) -> tuple:
+    return to_naive_utc(cursor.created_at), cursor.order_id
+
+
+class MemoryOrderRepository:
+    def __init__(self, memory_database: MemoryDatabase):
+        self.database = memory_database
+
+    def _hydrate_order(self, order: Order) -> Order:
+        # Like the Mongo lookups: the client and items are read as they are
+        # now, and lines of items removed from the catalog are skipped.
+        client = (
+            self.database.clients_by_id.get(order.client.id)
+            if order.client
+            else None
+        )
+        order_items = []
+        for order_item in order.order_items:
+            item = self.database.items_by_id.get(order_item.item.id)
+            if item is not None:
+                order_items.append(
+                    OrderItem(
+                        quantity=order_item.quantity, item=item.model_copy()
+                    )
+                )
+        return order.model_copy(
+            update={
+                "client": client.model_copy() if client else None,
+                "order_items": order_items,
+            }
+        )
+
+    def find_order_by_id(self, order_id: ObjectId) -> None | Order:
+        with self.database.lock:
+            order = self.database.orders_by_id.get(
+                order_id
+            ) or self.database.archived_orders_by_id.get(order_id)
+            return self._hydrate_order(order) if order else None
+
+    def find_order_by_external_id(
+        self, brand: str, external_id: int
+    ) -> None | Order:
+        with self.database.lock:
+            order_id = self.database.order_ids_by_external_id.get(
+                (brand, external_id)
+            )
+            if order_id is None:
+                return None
+            return self._hydrate_order(self.database.orders_by_id[order_id])
+
+    def find_orders_by_ids(self, order_ids: list[ObjectId]) -> list[Order]:
+        with self.database.lock:
+            return [
+                self._hydrate_order(self.database.orders_by_id[order_id])
+                for order_id in dict.fromkeys(order_ids)
+                if order_id in self.database.orders_by_id
+            ]
+
+    def find_orders_by_external_ids(
+        self, brand: str | None, external_ids: list[int]
+    ) -> list[Order]:
+        with self.database.lock:
+            if brand is None:
+                # Only branded orders are indexed by their external id.
+                external_id_set = set(external_ids)
+                return [
+                    self._hydrate_order(order)
+                    for order in self.database.orders_by_id.values()
+                    if order.brand is None
+                    and order.external_id in external_id_set
+                ]
+            order_ids = (
+                self.database.order_ids_by_external_id.get(
+                    (brand, external_id)
+                )
+                for external_id in dict.fromkeys(external_ids)
+            )
+            return [
+                self._hydrate_order(self.database.orders_by_id[order_id])
+                for order_id in order_ids
+                if order_id is not None
+            ]
+
+    def cancel_orders(
+        self, order_ids: list[ObjectId], cancelled_at: datetime
+    ) -> None:
+        with self.database.lock:
+            orders = [
+                self.database.orders_by_id.get(order_id)
+                for order_id in order_ids
+            ]
+            not_cancellable_order_ids = [
+                order_id
+                for order_id, order in zip(order_ids, orders, strict=True)
+                if order is None or order.is_cancelled
+            ]
+            if not_cancellable_order_ids:
+                raise OrdersAlreadyCancelledError(not_cancellable_order_ids)
+            for order in orders:
+                order.is_cancelled = True  # type: ignore
+                order.updated_at = to_naive_utc(cancelled_at)  # type: ignore
+
+    @staticmethod
+    def _is_match(order: Order, order_filter: OrderFilter) -> bool:
+        return (
+            (
+                order_filter.created_from is None
+                or order.created_at >= to_naive_utc(order_filter.created_from)
+            )
+            and (
+                order_filter.created_until is None
+                or order.created_at < to_naive_utc(order_filter.created_until)
+            )
+            and (
+                order_filter.client_id is None
+                or (
+                    order.client is not None
+                    and order.client.id == order_filter.client_id
+                )
+            )
+            and (
+                order_filter.is_cancelled is None
+                or order.is_cancelled == order_filter.is_cancelled
+            )
+        )
+
+    def find_orders(
+        self,
+        order_filter: OrderFilter,
+        limit: int,
+        after: OrderCursor | None = None,
+        before: OrderCursor | None = None,
+    ) -> list[Order]:
+        with self.database.lock:
+            orders = [
+                order
+                for order in self.database.orders_by_id.values()
+                if self._is_match(order, order_filter)
+            ]
+            # A bounded heap keeps a page at O(n log limit) without an
+            # ordered index to seek on.
+            if after is not None:
+                page = heapq.nlargest(
+                    limit,
+                    (
+                        order
+                        for order in orders
+                        if _get_order_key(order) < _get_cursor_key(after)
+                    ),
+                    key=_get_order_key,
+                )
+            elif before is not None:
+                page = heapq.nsmallest(
+                    limit,
+                    (
+                        order
+                        for order in orders
+                        if _get_order_key(order) > _get_cursor_key(before)
+                    ),
+                    key=_get_order_key,
+                )[::-1]
+            else:
+                page = heapq.nlargest(limit, orders, key=_get_order_key)
+            return [self._hydrate_order(order) for order in page]
+
+    def save(self, order: Order) -> None:
+        with self.database.lock:
+            external_key = None
+            if order.brand is not None and order.external_id is not None:
+                external_key = (order.brand, order.external_id)
+                order_id_with_key = self.database.order_ids_by_external_id.get(
+                    external_key
+                )
+                if order_id_with_key not in (None, order.id):
+                    raise OrderAlreadyExistsError(
+                        order.brand, order.external_id
+                    )
+            previous_order = self.database.orders_by_id.get(order.id)
+            if previous_order is not None and previous_order.brand is not None:
+                self.database.order_ids_by_external_id.pop(
+                    (previous_order.brand, previous_order.external_id),  # type: ignore
+                    None,
+                )
+            self.database.orders_by_id[order.id] = order.model_copy(
+                deep=True,
+                update={
+                    "created_at": to_naive_utc(order.created_at),
+                    "updated_at": to_naive_utc(order.updated_at),
+                },
+            )
+            if external_key is not None:
+                self.database.order_ids_by_external_id[external_key] = order.id
+
+    def archive_orders(self, order_filter: OrderFilter, limit: int) -> int:
+        with self.database.lock:
+            orders = heapq.nsmallest(
+                limit,
+                (
+                    order
+                    for order in self.database.orders_by_id.values()
+                    if self._is_match(order, order_filter)
+                ),
+                key=_get_order_key,
+            )
+            for order in orders:
+                del self.database.orders_by_id[order.id]
+                if order.brand is not None:
+                    self.database.order_ids_by_external_id.pop(
+                        (order.brand, order.external_id),  # type: ignore
+                        None,
+                    )
+                self.database.archived_orders_by_id[order.id] = order
+            return len(orders)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from datetime import date
+
+from src.adapters.outbound.repositories.memory.database import MemoryDatabase
+from src.domain.entities.sales import DailyItemSales
+
+
+class MemorySalesRepository:
+    def __init__(self, memory_database: MemoryDatabase):
+        self.database = memory_database
+
+    def increment_daily_sales(
+        self, daily_sales_deltas: list[DailyItemSales]
+    ) -> None:
+        with self.database.lock:
+            for daily_sales_delta in daily_sales_deltas:
+                key = (daily_sales_delta.day, daily_sales_delta.item_id)
+                daily_sales = self.database.daily_sales_by_key.get(key)
+                if daily_sales is None:
+                    self.database.daily_sales_by_key[key] = (
+                        daily_sales_delta.model_copy()
+                    )
+                    continue
+                daily_sales.item_name = daily_sales_delta.item_name
+                daily_sales.quantity += daily_sales_delta.quantity
+
+    def find_daily_sales(
+        self, first_day: date, last_day: date
+    ) -> list[DailyItemSales]:
+        with self.database.lock:
+            daily_sales = [
+                daily_sales.model_copy()
+                for daily_sales in self.database.daily_sales_by_key.values()
+                if first_day <= daily_sales.day <= last_day
+            ]
+        return sorted(
+            daily_sales,
+            key=lambda daily_sales: (daily_sales.day, daily_sales.item_name),
+        )
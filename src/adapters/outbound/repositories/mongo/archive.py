@@ -0,0 +1,42 @@
+from typing import Any
+
+from pymongo import DeleteOne, ReplaceOne
+
+from src.adapters.outbound.repositories.mongo.documents.order import (
+    ORDER_SCHEMA_VERSION,
+)
+from src.adapters.outbound.repositories.mongo.pagination import (
+    build_order_filter_query,
+)
+from src.domain.ports.outbound.repositories.order import OrderFilter
+
+ORDERS_ARCHIVE_COLLECTION_NAME = "orders_archive"
+
+
+def build_orders_to_archive_query(order_filter: OrderFilter) -> dict[str, Any]:
+    # Version 1 orders still point at order_items documents, which the
+    # migration deletes; they stay hot until they are migrated.
+    return {
+        **build_order_filter_query(order_filter),
+        "schema_version": ORDER_SCHEMA_VERSION,
+    }
+
+
+def build_archive_writes(
+    documents: list[dict[str, Any]],
+) -> tuple[list[ReplaceOne], list[DeleteOne]]:
+    # Copying replaces any earlier copy, so a batch interrupted between the
+    # two writes is finished by the next run. Deleting only what is still
+    # unchanged keeps an order that was updated (e.g. cancelled) in the
+    # meantime hot; its stale copy is replaced when it is archived again.
+    replacements = [
+        ReplaceOne({"_id": document["_id"]}, document, upsert=True)
+        for document in documents
+    ]
+    deletions = [
+        DeleteOne(
+            {"_id": document["_id"], "updated_at": document["updated_at"]}
+        )
+        for document in documents
+    ]
+    return replacements, deletions
@@ -0,0 +1,46 @@
+from datetime import datetime
+from typing import Any
+
+from bson import ObjectId
+
+# Marks the orders a bulk cancel has set, so that only those are set back
+# when another of its orders turns out to be cancelled already.
+CANCELLATION_ID_FIELD = "last_cancellation_id"
+
+
+def build_cancel_orders_update(
+    order_ids: list[ObjectId],
+    cancelled_at: datetime,
+    cancellation_id: ObjectId,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    return (
+        {"_id": {"$in": order_ids}, "is_cancelled": False},
+        {
+            "$set": {
+                "is_cancelled": True,
+                "updated_at": cancelled_at,
+                CANCELLATION_ID_FIELD: cancellation_id,
+            }
+        },
+    )
+
+
+def build_undo_cancel_orders_update(
+    order_ids: list[ObjectId], cancellation_id: ObjectId
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    return (
+        {"_id": {"$in": order_ids}, CANCELLATION_ID_FIELD: cancellation_id},
+        {
+            "$set": {"is_cancelled": False},
+            "$unset": {CANCELLATION_ID_FIELD: ""},
+        },
+    )
+
+
+def build_not_cancelled_query(
+    order_ids: list[ObjectId], cancellation_id: ObjectId
+) -> dict[str, Any]:
+    return {
+        "_id": {"$in": order_ids},
+        CANCELLATION_ID_FIELD: {"$ne": cancellation_id},
+    }
@@ -1,16 +1,36 @@
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
 from src.adapters.outbound.repositories.mongo.connection import MongoConnection
 from src.adapters.outbound.repositories.mongo.documents.client import (
     ClientDocument,
 )
+from src.adapters.outbound.repositories.mongo.metrics import (
+    instrument_repository,
+)
+from src.adapters.outbound.repositories.mongo.settings import (
+    MongoReadOptions,
+)
 from src.domain.entities.client import Client
 
 
+@instrument_repository
 class MongoClientRepository:
-    def __init__(self, mongo_connection: MongoConnection):
+    def __init__(
+        self,
+        mongo_connection: MongoConnection,
+        read_options: MongoReadOptions | None = None,
+    ):
         mongo_connection.connect()
+        self.read_options = read_options
 
     def find_client_by_name(self, client_name: str) -> Client | None:
-        document = ClientDocument.objects(name=client_name).first()
+        queryset = ClientDocument.objects(name=client_name)
+        if self.read_options:
+            queryset = queryset.read_preference(
+                self.read_options.build_read_preference()
+            ).read_concern(self.read_options.build_read_concern().document)
+        document = queryset.first()
         if document:
             return Client(name=document.name, id=document.id)
         return None
@@ -18,3 +38,17 @@ class MongoClientRepository:
     def save(self, client: Client) -> None:
         client_doc = ClientDocument(id=client.id, name=client.name)
         client_doc.save()
+
+    def get_or_create_by_name(self, client_name: str) -> Client:
+        collection = ClientDocument._get_collection()
+        try:
+            document = collection.find_one_and_update(
+                {"name": client_name},
+                {"$setOnInsert": {"name": client_name}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            # A concurrent upsert inserted the same name first.
+            document = collection.find_one({"name": client_name})
+        return Client(name=document["name"], id=document["_id"])
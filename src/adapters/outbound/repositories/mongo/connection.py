@@ -1,9 +1,30 @@
 from __future__ import annotations
 
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import ClassVar
 
 import mongomock
 from mongoengine import connect, disconnect  # type: ignore
+from mongoengine.connection import get_connection, get_db  # type: ignore
+from pymongo.client_session import ClientSession
+from pymongo.database import Database
+
+from src.adapters.outbound.repositories.mongo.indexes import (
+    ensure_collections,
+    ensure_indexes,
+    ensure_low_stock_margins,
+)
+from src.adapters.outbound.repositories.mongo.metrics import (
+    CommandMetrics,
+    CommandMetricsListener,
+)
+from src.adapters.outbound.repositories.mongo.settings import (
+    MongoConnectionSettings,
+    PoolStatistics,
+    PoolStatisticsListener,
+)
 
 
 class MongoConnection:
@@ -17,17 +38,63 @@ class MongoConnection:
     def __init__(
         self,
         connection_string: str,
+        settings: MongoConnectionSettings | None = None,
     ):
         if not hasattr(self, "_is_initialized"):
             self.connection_string = connection_string
+            self.settings = settings or MongoConnectionSettings()
+            self.pool_statistics_listener = PoolStatisticsListener()
+            self.command_metrics_listener = CommandMetricsListener()
+            self._local_session = threading.local()
             self._is_initialized = True
             self._is_connected = False
 
     def connect(self):
         if not self._is_connected:
-            connect(host=self.connection_string)
+            connect(
+                host=self.connection_string,
+                event_listeners=[
+                    self.pool_statistics_listener,
+                    self.command_metrics_listener,
+                ],
+                **self.settings.to_client_options(),
+            )
+            ensure_collections(get_db())
+            ensure_indexes(get_db())
+            ensure_low_stock_margins(get_db())
             self._is_connected = True
 
+    def get_pool_statistics(self) -> PoolStatistics:
+        return self.pool_statistics_listener.statistics
+
+    def get_command_metrics(self) -> list[CommandMetrics]:
+        return self.command_metrics_listener.registry.collect()
+
+    def get_current_session(self) -> ClientSession | None:
+        return getattr(self._local_session, "session", None)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        # Repositories pick the session up through get_current_session, so
+        # the writes of one unit of work commit or abort together.
+        if not self.settings.use_transactions or self.get_current_session():
+            yield
+            return
+        self.connect()
+        with (
+            get_connection().start_session() as session,
+            session.start_transaction(),
+        ):
+            self._local_session.session = session
+            try:
+                yield
+            finally:
+                self._local_session.session = None
+
+    def get_database(self) -> Database:
+        self.connect()
+        return get_db()
+
     def close(self):
         if self._is_connected:
             disconnect()
@@ -35,8 +102,15 @@ class MongoConnection:
 
 
 class MongoMockConnection:
-    def __init__(self, connection_string: str):
+    def __init__(
+        self,
+        connection_string: str,
+        settings: MongoConnectionSettings | None = None,
+    ):
         self.connection_string = connection_string
+        self.settings = settings or MongoConnectionSettings()
+        self.pool_statistics_listener = PoolStatisticsListener()
+        self.command_metrics_listener = CommandMetricsListener()
         self._is_connected = False
 
     def connect(self):
@@ -44,9 +118,34 @@ class MongoMockConnection:
             connect(
                 host=self.connection_string,
                 mongo_client_class=mongomock.MongoClient,
+                **self.settings.to_client_options(),
             )
+            # mongomock does not take storage options, so the collections
+            # are created on first write with the defaults.
+            ensure_indexes(get_db())
+            ensure_low_stock_margins(get_db())
             self._is_connected = True
 
+    def get_pool_statistics(self) -> PoolStatistics:
+        # mongomock has no connection pool, so nothing is ever recorded.
+        return self.pool_statistics_listener.statistics
+
+    def get_command_metrics(self) -> list[CommandMetrics]:
+        # mongomock publishes no command events either.
+        return self.command_metrics_listener.registry.collect()
+
+    def get_current_session(self) -> ClientSession | None:
+        return None
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        # mongomock has no sessions, so writes are applied one by one.
+        yield
+
+    def get_database(self) -> Database:
+        self.connect()
+        return get_db()
+
     def close(self):
         if self._is_connected:
             disconnect()
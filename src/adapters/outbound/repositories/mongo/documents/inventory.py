@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import ClassVar
+
+from bson import ObjectId
+from mongoengine import (  # type: ignore
+    DateTimeField,
+    Document,
+    EmbeddedDocument,
+    EmbeddedDocumentListField,
+    IntField,
+    ObjectIdField,
+    StringField,
+)
+
+
+class InventoryMovementDocument(Document):
+    meta: ClassVar[dict] = {"collection": "inventory_movements"}
+    id = ObjectIdField(primary_key=True, default=lambda: ObjectId())
+    item = ObjectIdField(required=True)
+    item_name = StringField(required=True)
+    reason = StringField(required=True)
+    quantity_delta = IntField(required=True)
+    inventory_quantity = IntField(required=False)
+    order = ObjectIdField(required=False)
+    created_at = DateTimeField(default=datetime.now)
+
+
+class InventorySnapshotItemDocument(EmbeddedDocument):
+    item_id = ObjectIdField(required=True)
+    item_name = StringField(required=True)
+    inventory_quantity = IntField(required=True)
+
+
+class InventorySnapshotDocument(Document):
+    meta: ClassVar[dict] = {"collection": "inventory_snapshots"}
+    id = ObjectIdField(primary_key=True, default=lambda: ObjectId())
+    taken_at = DateTimeField(required=True)
+    items = EmbeddedDocumentListField(InventorySnapshotItemDocument)
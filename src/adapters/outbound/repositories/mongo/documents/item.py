@@ -4,6 +4,7 @@ from bson import ObjectId
 from mongoengine import (  # type: ignore
     Document,
     IntField,
+    ListField,
     ObjectIdField,
     StringField,
 )
@@ -14,3 +15,6 @@ class ItemDocument(Document):
     id = ObjectIdField(primary_key=True, default=lambda: ObjectId())
     name = StringField(required=True)
     inventory_quantity = IntField(required=True)
+    low_stock_threshold = IntField(default=0)
+    low_stock_margin = IntField()
+    pending_decrement_ids = ListField(ObjectIdField())
@@ -7,6 +7,7 @@ from mongoengine import (
     BooleanField,
     DateTimeField,
     Document,
+    EmbeddedDocumentListField,
     IntField,
     ListField,
     ObjectIdField,
@@ -20,17 +21,28 @@ from src.adapters.outbound.repositories.mongo.documents.client import (
 from src.adapters.outbound.repositories.mongo.documents.order_item import (
     OrderItemDocument,
 )
+from src.adapters.outbound.repositories.mongo.documents.order_line import (
+    OrderLineDocument,
+)
+
+# Version 1 orders reference documents in the order_items collection and have
+# no schema_version. Version 2 orders embed their lines.
+ORDER_SCHEMA_VERSION = 2
 
 
 class OrderDocument(Document):
     meta: ClassVar[dict] = {"collection": "orders"}
     id = ObjectIdField(primary_key=True, default=lambda: ObjectId())
     external_id = IntField(required=False)
+    brand = StringField(required=False)
     external_created_at = StringField(required=False)
     created_at = DateTimeField(default=datetime.now)
     updated_at = DateTimeField(default=datetime.now)
     is_cancelled = BooleanField(default=False)
     client = ReferenceField(ClientDocument, required=False)
+    schema_version = IntField(required=False)
+    lines = EmbeddedDocumentListField(OrderLineDocument)
+    last_cancellation_id = ObjectIdField(required=False)
     order_items = ListField(
         ReferenceField(OrderItemDocument, reverse_delete_rule=mongoengine.PULL)
     )
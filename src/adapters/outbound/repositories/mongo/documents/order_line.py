@@ -0,0 +1,12 @@
+from mongoengine import (  # type: ignore
+    EmbeddedDocument,
+    IntField,
+    ObjectIdField,
+    StringField,
+)
+
+
+class OrderLineDocument(EmbeddedDocument):
+    item_id = ObjectIdField(required=True)
+    item_name = StringField(required=True)
+    quantity = IntField(required=True)
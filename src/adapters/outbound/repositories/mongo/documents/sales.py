@@ -0,0 +1,20 @@
+from typing import ClassVar
+
+from bson import ObjectId
+from mongoengine import (  # type: ignore
+    DateTimeField,
+    Document,
+    IntField,
+    ObjectIdField,
+    StringField,
+)
+
+
+class DailyItemSalesDocument(Document):
+    meta: ClassVar[dict] = {"collection": "daily_item_sales"}
+    id = ObjectIdField(primary_key=True, default=lambda: ObjectId())
+    # BSON has no date type, so days are stored as midnight datetimes.
+    day = DateTimeField(required=True)
+    item = ObjectIdField(required=True)
+    item_name = StringField(required=True)
+    quantity = IntField(required=True)
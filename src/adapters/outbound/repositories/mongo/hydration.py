@@ -0,0 +1,125 @@
+from typing import Any
+
+from src.adapters.outbound.repositories.mongo.documents.order import (
+    ORDER_SCHEMA_VERSION,
+)
+from src.domain.entities.client import Client
+from src.domain.entities.item import Item
+from src.domain.entities.order import Order, OrderItem
+
+
+def build_order_hydration_pipeline(
+    match_filter: dict[str, Any],
+    sort: dict[str, int] | None = None,
+    limit: int | None = None,
+) -> list[dict[str, Any]]:
+    # Joins the client, the version 1 order items and the items of either
+    # schema version, so a whole order is read in a single round trip.
+    # Sorting and limiting come before the joins, so only the orders of
+    # the page are joined.
+    stages: list[dict[str, Any]] = [{"$match": match_filter}]
+    if sort:
+        stages.append({"$sort": sort})
+    if limit:
+        stages.append({"$limit": limit})
+    return [
+        *stages,
+        {
+            "$lookup": {
+                "from": "clients",
+                "localField": "client",
+                "foreignField": "_id",
+                "as": "client_documents",
+            }
+        },
+        {
+            "$lookup": {
+                "from": "order_items",
+                "localField": "order_items",
+                "foreignField": "_id",
+                "as": "order_item_documents",
+            }
+        },
+        {
+            "$addFields": {
+                "item_ids": {
+                    "$concatArrays": [
+                        {
+                            "$map": {
+                                "input": {"$ifNull": ["$lines", []]},
+                                "as": "line",
+                                "in": "$$line.item_id",
+                            }
+                        },
+                        {
+                            "$map": {
+                                "input": "$order_item_documents",
+                                "as": "order_item",
+                                "in": "$$order_item.item",
+                            }
+                        },
+                    ]
+                }
+            }
+        },
+        {
+            "$lookup": {
+                "from": "items",
+                "localField": "item_ids",
+                "foreignField": "_id",
+                "as": "item_documents",
+            }
+        },
+    ]
+
+
+def build_order_from_hydrated_document(document: dict[str, Any]) -> Order:
+    client = None
+    if document["client_documents"]:
+        client_document = document["client_documents"][0]
+        client = Client(
+            id=client_document["_id"], name=client_document["name"]
+        )
+    items_by_id = {
+        item_document["_id"]: Item(
+            id=item_document["_id"],
+            name=item_document["name"],
+            inventory_quantity=item_document["inventory_quantity"],
+        )
+        for item_document in document["item_documents"]
+    }
+    if document.get("schema_version") == ORDER_SCHEMA_VERSION:
+        quantities_and_item_ids = [
+            (line["quantity"], line["item_id"]) for line in document["lines"]
+        ]
+    else:
+        order_items_by_id = {
+            order_item["_id"]: order_item
+            for order_item in document["order_item_documents"]
+        }
+        quantities_and_item_ids = [
+            (
+                order_items_by_id[order_item_id]["quantity"],
+                order_items_by_id[order_item_id]["item"],
+            )
+            for order_item_id in document.get("order_items", [])
+            if order_item_id in order_items_by_id
+        ]
+
+    return Order(
+        id=document["_id"],
+        external_id=document.get("external_id"),
+        brand=document.get("brand"),
+        client=client,
+        external_created_at=document.get("external_created_at"),
+        created_at=document["created_at"],
+        updated_at=document["updated_at"],
+        is_cancelled=document.get("is_cancelled", False),
+        # Lines of items removed from the catalog are skipped, as the CASCADE
+        # rule does for version 1 orders.
+        order_items=[
+            OrderItem(quantity=quantity, item=items_by_id[item_id])
+            for quantity, item_id in quantities_and_item_ids
+            if item_id in items_by_id
+        ],
+    )
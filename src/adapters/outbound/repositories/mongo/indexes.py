@@ -0,0 +1,265 @@
+import os
+import sys
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Any
+
+from bson import ObjectId
+from mongoengine import connect  # type: ignore
+from mongoengine.connection import get_db  # type: ignore
+from pymongo import ASCENDING, DESCENDING, IndexModel, UpdateOne
+from pymongo.collection import Collection
+from pymongo.database import Database
+from pymongo.errors import DuplicateKeyError
+
+# Archived orders are rarely read, so their collection trades some CPU on
+# reads for zstd's smaller footprint on disk and in the cache.
+COLLECTION_OPTIONS: dict[str, dict[str, Any]] = {
+    "orders_archive": {
+        "storageEngine": {
+            "wiredTiger": {"configString": "block_compressor=zstd"}
+        }
+    },
+}
+
+INDEXES: dict[str, list[IndexModel]] = {
+    "items": [
+        IndexModel([("name", ASCENDING)], name="name_unique", unique=True),
+        # Only the items at or below their threshold are indexed, so listing
+        # them reads those documents and not the catalog.
+        IndexModel(
+            [("low_stock_margin", ASCENDING)],
+            name="low_stock_margin",
+            partialFilterExpression={"low_stock_margin": {"$lte": 0}},
+        ),
+    ],
+    "clients": [
+        IndexModel([("name", ASCENDING)], name="name_unique", unique=True),
+    ],
+    "orders": [
+        IndexModel([("external_id", ASCENDING)], name="external_id"),
+        # Goomer numbers orders per brand; manual and legacy orders have no
+        # brand and are left out of the index.
+        IndexModel(
+            [("brand", ASCENDING), ("external_id", ASCENDING)],
+            name="brand_external_id_unique",
+            unique=True,
+            partialFilterExpression={"brand": {"$exists": True}},
+        ),
+        # Order history pages seek on (created_at, _id); the _id tie-break
+        # keeps the keyset stable for orders created in the same instant.
+        IndexModel(
+            [("created_at", DESCENDING), ("_id", DESCENDING)],
+            name="created_at_id",
+        ),
+        IndexModel(
+            [
+                ("client", ASCENDING),
+                ("created_at", DESCENDING),
+                ("_id", DESCENDING),
+            ],
+            name="client_created_at_id",
+        ),
+    ],
+    "order_items": [
+        IndexModel([("item", ASCENDING)], name="item"),
+    ],
+    # One rollup document per (day, item); reports read a range of days.
+    "daily_item_sales": [
+        IndexModel(
+            [("day", ASCENDING), ("item", ASCENDING)],
+            name="day_item_unique",
+            unique=True,
+        ),
+    ],
+    # Stock is rebuilt from the latest snapshot plus the movements after
+    # it, read in (created_at, _id) order.
+    "inventory_movements": [
+        IndexModel(
+            [("created_at", ASCENDING), ("_id", ASCENDING)],
+            name="created_at_id",
+        ),
+    ],
+    "inventory_snapshots": [
+        IndexModel([("taken_at", DESCENDING)], name="taken_at"),
+    ],
+}
+
+# One sample filter per repository query shape. ItemRepository.get_all is
+# left out on purpose: reading the whole catalog is a collection scan.
+REPOSITORY_QUERIES: list[tuple[str, dict[str, Any]]] = [
+    ("items", {"name": "marmita"}),
+    ("items", {"name": {"$in": ["marmita de carne", "marmita de frango"]}}),
+    ("items", {"_id": {"$in": [ObjectId(), ObjectId()]}}),
+    ("items", {"low_stock_margin": {"$lte": 0}}),
+    ("clients", {"name": "cliente"}),
+    ("orders", {"_id": ObjectId()}),
+    ("orders", {"_id": {"$in": [ObjectId(), ObjectId()]}}),
+    ("orders", {"external_id": 1}),
+    ("orders", {"brand": "marca", "external_id": 1}),
+    ("orders", {"brand": "marca", "external_id": {"$in": [1, 2]}}),
+    ("orders", {"created_at": {"$lt": datetime(2024, 1, 1)}}),
+    (
+        "orders",
+        {"client": ObjectId(), "created_at": {"$lt": datetime(2024, 1, 1)}},
+    ),
+    ("order_items", {"item": ObjectId()}),
+    (
+        "daily_item_sales",
+        {"day": {"$gte": datetime(2024, 1, 1), "$lte": datetime(2024, 1, 7)}},
+    ),
+    (
+        "inventory_movements",
+        {
+            "created_at": {
+                "$gt": datetime(2024, 1, 1),
+                "$lte": datetime(2024, 1, 7),
+            }
+        },
+    ),
+    ("inventory_snapshots", {"taken_at": {"$lte": datetime(2024, 1, 7)}}),
+]
+
+
+def ensure_collections(database: Database) -> None:
+    # Storage options can only be set when a collection is created.
+    existing_collection_names = set(database.list_collection_names())
+    for collection_name, options in COLLECTION_OPTIONS.items():
+        if collection_name not in existing_collection_names:
+            database.create_collection(collection_name, **options)
+
+
+# A unique index cannot be built over documents that already break it;
+# these commands merge the duplicates of a collection first.
+DEDUPE_COMMANDS = {"clients": "make dedupe-clients"}
+
+
+class DuplicateIndexKeysError(Exception):
+    def __init__(self, collection_name: str):
+        self.collection_name = collection_name
+        dedupe_command = DEDUPE_COMMANDS.get(
+            collection_name, "removing the duplicates by hand"
+        )
+        super().__init__(
+            f"Cannot build the unique indexes of {collection_name}: some "
+            f"documents share a unique key. Fix them with {dedupe_command} "
+            "and start again."
+        )
+
+
+# Indexes an earlier version built and INDEXES replaced. They are dropped
+# before the new ones are built, since one on the same keys would clash.
+SUPERSEDED_INDEXES: dict[str, list[str]] = {
+    "clients": ["name"],
+    "orders": ["created_at"],
+}
+
+
+def drop_superseded_indexes(database: Database) -> None:
+    for collection_name, index_names in SUPERSEDED_INDEXES.items():
+        collection = database[collection_name]
+        existing_index_names = set(collection.index_information())
+        for index_name in index_names:
+            if index_name in existing_index_names:
+                collection.drop_index(index_name)
+
+
+def ensure_indexes(database: Database) -> None:
+    drop_superseded_indexes(database)
+    for collection_name, index_models in INDEXES.items():
+        try:
+            database[collection_name].create_indexes(index_models)
+        except DuplicateKeyError as error:
+            raise DuplicateIndexKeysError(collection_name) from error
+
+
+LOW_STOCK_MARGIN_PASSES = 5
+
+
+def build_low_stock_margin_write(item: dict[str, Any]) -> UpdateOne | None:
+    low_stock_threshold = item.get("low_stock_threshold", 0)
+    low_stock_margin = item["inventory_quantity"] - low_stock_threshold
+    if item.get("low_stock_margin") == low_stock_margin:
+        return None
+    # Only applies if no order changed the quantity since it was read.
+    return UpdateOne(
+        {"_id": item["_id"], "inventory_quantity": item["inventory_quantity"]},
+        {
+            "$set": {
+                "low_stock_threshold": low_stock_threshold,
+                "low_stock_margin": low_stock_margin,
+            }
+        },
+    )
+
+
+def backfill_low_stock_margins(
+    collection: Collection, query: dict[str, Any]
+) -> int:
+    # An item an order changed meanwhile is read again on the next pass.
+    updated_count = 0
+    for _ in range(LOW_STOCK_MARGIN_PASSES):
+        writes = [
+            write
+            for write in map(
+                build_low_stock_margin_write,
+                collection.find(
+                    query,
+                    {
+                        "inventory_quantity": True,
+                        "low_stock_threshold": True,
+                        "low_stock_margin": True,
+                    },
+                ),
+            )
+            if write is not None
+        ]
+        if not writes:
+            break
+        updated_count += collection.bulk_write(
+            writes, ordered=False
+        ).modified_count
+    return updated_count
+
+
+def ensure_low_stock_margins(database: Database) -> None:
+    # Items written before the low stock threshold existed have no margin,
+    # and the first $inc of their quantity would create it as just the
+    # delta, listing them as low on stock. They get theirs on connect,
+    # before any repository writes.
+    backfill_low_stock_margins(
+        database["items"], {"low_stock_margin": {"$exists": False}}
+    )
+
+
+def find_collection_scans(database: Database) -> list[str]:
+    collection_scans = []
+    for collection_name, query in REPOSITORY_QUERIES:
+        explain_output = database[collection_name].find(query).explain()
+        winning_plan = explain_output["queryPlanner"]["winningPlan"]
+        if "COLLSCAN" in _iter_plan_stages(winning_plan):
+            collection_scans.append(f"{collection_name}: {query}")
+    return collection_scans
+
+
+def _iter_plan_stages(plan: Any) -> Iterator[str]:
+    # Plans nest their stages under inputStage/inputStages (or queryPlan on
+    # the slot based engine), so walk every nested dict and list.
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            yield plan["stage"]
+        for value in plan.values():
+            yield from _iter_plan_stages(value)
+    elif isinstance(plan, list):
+        for value in plan:
+            yield from _iter_plan_stages(value)
+
+
+if __name__ == "__main__":
+    connect(
+        host=os.getenv("MONGO_CONNECTION_STRING", "mongodb://localhost:27017")
+    )
+    collection_scans = find_collection_scans(get_db())
+    for collection_scan in collection_scans:
+        print(f"COLLSCAN on {collection_scan}")
+    sys.exit(1 if collection_scans else 0)
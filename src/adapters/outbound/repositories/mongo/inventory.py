@@ -0,0 +1,109 @@
+from datetime import datetime
+
+from pymongo.collection import Collection
+
+from src.adapters.outbound.repositories.mongo.connection import MongoConnection
+from src.adapters.outbound.repositories.mongo.documents.inventory import (
+    InventoryMovementDocument,
+    InventorySnapshotDocument,
+    InventorySnapshotItemDocument,
+)
+from src.adapters.outbound.repositories.mongo.metrics import (
+    instrument_repository,
+)
+from src.adapters.outbound.repositories.mongo.settings import (
+    MongoReadOptions,
+)
+from src.adapters.outbound.repositories.pymongo.inventory import (
+    LATEST_SNAPSHOT_SORT,
+    MOVEMENTS_SORT,
+    build_movement,
+    build_movements_query,
+    build_snapshot,
+)
+from src.domain.entities.inventory import InventoryMovement, InventorySnapshot
+
+
+@instrument_repository
+class MongoInventoryLedgerRepository:
+    def __init__(
+        self,
+        mongo_connection: MongoConnection,
+        read_options: MongoReadOptions | None = None,
+    ):
+        mongo_connection.connect()
+        self.mongo_connection = mongo_connection
+        self.read_options = read_options
+
+    def _get_read_collection(self, document_class) -> Collection:
+        collection = document_class._get_collection()
+        if self.read_options:
+            collection = collection.with_options(
+                **self.read_options.to_collection_options()
+            )
+        return collection
+
+    def append_movements(self, movements: list[InventoryMovement]) -> None:
+        if not movements:
+            return
+
+        movement_documents = [
+            InventoryMovementDocument(
+                id=movement.id,
+                item=movement.item_id,
+                item_name=movement.item_name,
+                reason=movement.reason.value,
+                quantity_delta=movement.quantity_delta,
+                inventory_quantity=movement.inventory_quantity,
+                order=movement.order_id,
+                created_at=movement.created_at,
+            )
+            for movement in movements
+        ]
+        for movement_document in movement_documents:
+            movement_document.validate()
+        # The ledger is append only, so the documents are inserted in one
+        # batch instead of being saved one by one.
+        InventoryMovementDocument._get_collection().insert_many(
+            [
+                movement_document.to_mongo()
+                for movement_document in movement_documents
+            ],
+            session=self.mongo_connection.get_current_session(),
+        )
+
+    def find_movements(
+        self, created_after: datetime | None, created_until: datetime
+    ) -> list[InventoryMovement]:
+        documents = (
+            self._get_read_collection(InventoryMovementDocument)
+            .find(build_movements_query(created_after, created_until))
+            .sort(MOVEMENTS_SORT)
+        )
+        return [build_movement(document) for document in documents]
+
+    def save_snapshot(self, snapshot: InventorySnapshot) -> None:
+        InventorySnapshotDocument(
+            id=snapshot.id,
+            taken_at=snapshot.taken_at,
+            items=[
+                InventorySnapshotItemDocument(
+                    item_id=item.item_id,
+                    item_name=item.item_name,
+                    inventory_quantity=item.inventory_quantity,
+                )
+                for item in snapshot.items
+            ],
+        ).save(force_insert=True)
+
+    def find_latest_snapshot(
+        self, taken_until: datetime
+    ) -> InventorySnapshot | None:
+        document = next(
+            self._get_read_collection(InventorySnapshotDocument)
+            .find({"taken_at": {"$lte": taken_until}})
+            .sort(LATEST_SNAPSHOT_SORT)
+            .limit(1),
+            None,
+        )
+        return build_snapshot(document) if document else None
@@ -1,78 +1,179 @@
 from __future__ import annotations
 
-from pymongo import InsertOne, UpdateOne
+from collections.abc import Iterator
+
+from bson import ObjectId
+from mongoengine import QuerySet  # type: ignore
 
 from src.adapters.outbound.repositories.mongo.connection import MongoConnection
 from src.adapters.outbound.repositories.mongo.documents.item import (
     ItemDocument,
 )
+from src.adapters.outbound.repositories.mongo.metrics import (
+    instrument_repository,
+)
+from src.adapters.outbound.repositories.mongo.settings import (
+    MongoReadOptions,
+)
+from src.adapters.outbound.repositories.pymongo.item import (
+    DECREMENT_PROJECTION,
+    LOW_STOCK_QUERY,
+    build_decrement_cleanup,
+    build_decrement_writes,
+    build_increment_writes,
+    build_release_writes,
+    build_save_all_writes,
+    build_stock_fields,
+    find_short_items_names,
+)
 from src.domain.entities.item import Item
+from src.domain.exceptions import InsufficientInventoryError
+from src.domain.ports.outbound.repositories.item import SaveAllItemsResult
 
 
+@instrument_repository
 class MongoItemRepository:
-    def __init__(self, mongo_connection: MongoConnection):
+    def __init__(
+        self,
+        mongo_connection: MongoConnection,
+        read_options: MongoReadOptions | None = None,
+    ):
         mongo_connection.connect()
+        self.mongo_connection = mongo_connection
+        self.read_options = read_options
+
+    def _read_objects(self, **query) -> QuerySet:
+        queryset = ItemDocument.objects(**query)
+        if self.read_options:
+            queryset = queryset.read_preference(
+                self.read_options.build_read_preference()
+            ).read_concern(self.read_options.build_read_concern().document)
+        return queryset
+
+    @staticmethod
+    def _build_item(document: ItemDocument) -> Item:
+        return Item(
+            id=document.id,
+            name=document.name,
+            inventory_quantity=document.inventory_quantity,
+            low_stock_threshold=document.low_stock_threshold or 0,
+        )
 
     def find_item_by_name(self, item_name: str) -> Item | None:
-        document = ItemDocument.objects(name=item_name).first()
+        document = self._read_objects(name=item_name).first()
         if document:
-            return Item(
-                id=document.id,
-                name=document.name,
-                inventory_quantity=document.inventory_quantity,
-            )
+            return self._build_item(document)
         return None
 
     def find_items_by_names(self, items_names: list[str]) -> list[Item]:
-        documents = ItemDocument.objects(name__in=items_names)
-        return [
-            Item(
-                id=doc.id,
-                name=doc.name,
-                inventory_quantity=doc.inventory_quantity,
-            )
-            for doc in documents
-        ]
+        documents = self._read_objects(name__in=items_names)
+        return [self._build_item(document) for document in documents]
 
     def get_all(self) -> list[Item]:
-        documents = ItemDocument.objects()
-        return [
-            Item(
-                id=doc.id,
-                name=doc.name,
-                inventory_quantity=doc.inventory_quantity,
-            )
-            for doc in documents
-        ]
+        documents = self._read_objects()
+        return [self._build_item(document) for document in documents]
+
+    def iter_items(self, batch_size: int) -> Iterator[Item]:
+        # A cached queryset would keep every document it has yielded.
+        documents = (
+            self._read_objects().order_by("name").batch_size(batch_size)
+        ).no_cache()
+        for document in documents:
+            yield self._build_item(document)
+
+    def find_low_stock_items(self) -> list[Item]:
+        documents = self._read_objects(__raw__=LOW_STOCK_QUERY).order_by(
+            "name"
+        )
+        return [self._build_item(document) for document in documents]
 
     def remove_item_by_name(self, item_name: str) -> None:
-        ItemDocument.objects(name=item_name).delete()
+        ItemDocument._get_collection().delete_many(
+            {"name": item_name},
+            session=self.mongo_connection.get_current_session(),
+        )
 
     def save(self, item: Item) -> None:
         item_doc = ItemDocument(
-            id=item.id,
-            name=item.name,
-            inventory_quantity=item.inventory_quantity,
+            id=item.id, name=item.name, **build_stock_fields(item)
+        )
+        item_doc.validate()
+        # Document.save() takes no session, so the item is written with the
+        # collection's upserting replace to join the current transaction.
+        ItemDocument._get_collection().replace_one(
+            {"_id": item.id},
+            item_doc.to_mongo(),
+            upsert=True,
+            session=self.mongo_connection.get_current_session(),
+        )
+
+    def save_all(self, items: list[Item]) -> SaveAllItemsResult:
+        if not items:
+            return SaveAllItemsResult(inserted_count=0, modified_count=0)
+
+        result = ItemDocument._get_collection().bulk_write(
+            build_save_all_writes(items),
+            ordered=False,
+            session=self.mongo_connection.get_current_session(),
+        )
+        return SaveAllItemsResult(
+            inserted_count=result.upserted_count,
+            modified_count=result.modified_count,
+        )
+
+    def increment_inventory_quantities(
+        self, quantity_deltas_by_item_id: dict[ObjectId, int]
+    ) -> dict[ObjectId, int]:
+        if not quantity_deltas_by_item_id:
+            return {}
+
+        collection = ItemDocument._get_collection()
+        collection.bulk_write(
+            build_increment_writes(quantity_deltas_by_item_id),
+            ordered=False,
+            session=self.mongo_connection.get_current_session(),
+        )
+
+        documents = collection.find(
+            {"_id": {"$in": list(quantity_deltas_by_item_id)}},
+            {"inventory_quantity": True},
+            session=self.mongo_connection.get_current_session(),
+        )
+        return {doc["_id"]: doc["inventory_quantity"] for doc in documents}
+
+    def decrement_inventory_quantities(
+        self, quantities_by_item_id: dict[ObjectId, int]
+    ) -> dict[ObjectId, int]:
+        if not quantities_by_item_id:
+            return {}
+
+        session = self.mongo_connection.get_current_session()
+        collection = ItemDocument._get_collection()
+        decrement_id = ObjectId()
+        collection.bulk_write(
+            build_decrement_writes(quantities_by_item_id, decrement_id),
+            ordered=False,
+            session=session,
+        )
+        documents = list(
+            collection.find(
+                {"_id": {"$in": list(quantities_by_item_id)}},
+                DECREMENT_PROJECTION,
+                session=session,
+            )
+        )
+        short_items_names = find_short_items_names(
+            quantities_by_item_id, documents, decrement_id
+        )
+        if short_items_names:
+            collection.bulk_write(
+                build_release_writes(quantities_by_item_id, decrement_id),
+                ordered=False,
+                session=session,
+            )
+            raise InsufficientInventoryError(short_items_names)
+        collection.update_many(
+            *build_decrement_cleanup(quantities_by_item_id, decrement_id),
+            session=session,
         )
-        item_doc.save()
-
-    def save_all(self, items: list[Item]) -> None:
-        bulk_operations: list[InsertOne | UpdateOne] = []
-        for item in items:
-            existing_item = ItemDocument.objects(name=item.name).first()
-            if existing_item:
-                update_operation = UpdateOne(
-                    {"_id": existing_item.id},
-                    {"$set": {"inventory_quantity": item.inventory_quantity}},
-                )
-                bulk_operations.append(update_operation)
-            else:
-                new_item = {
-                    "_id": item.id,
-                    "name": item.name,
-                    "inventory_quantity": item.inventory_quantity,
-                }
-                insert_operation = InsertOne(new_item)
-                bulk_operations.append(insert_operation)
-
-        ItemDocument._get_collection().bulk_write(bulk_operations)
+        return {doc["_id"]: doc["inventory_quantity"] for doc in documents}
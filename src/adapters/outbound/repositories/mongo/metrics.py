@@ -0,0 +1,202 @@
+import functools
+import inspect
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, Field
+from pymongo import monitoring
+
+# Upper bounds in milliseconds; the last bucket takes everything slower.
+DURATION_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+UNKNOWN_LABEL = "-"
+
+_EXHAUSTED = object()
+
+current_repository_method: ContextVar[str] = ContextVar(
+    "current_repository_method", default=UNKNOWN_LABEL
+)
+
+RepositoryClass = TypeVar("RepositoryClass", bound=type)
+
+
+class CommandMetrics(BaseModel):
+    collection: str
+    operation: str
+    repository_method: str
+    count: int = 0
+    failures: int = 0
+    total_duration_ms: float = 0.0
+    bucket_counts: list[int] = Field(
+        default_factory=lambda: [0] * (len(DURATION_BUCKETS_MS) + 1)
+    )
+
+    def observe(self, duration_ms: float, succeeded: bool) -> None:
+        self.count += 1
+        self.failures += not succeeded
+        self.total_duration_ms += duration_ms
+        bucket = next(
+            (
+                index
+                for index, upper_bound in enumerate(DURATION_BUCKETS_MS)
+                if duration_ms <= upper_bound
+            ),
+            len(DURATION_BUCKETS_MS),
+        )
+        self.bucket_counts[bucket] += 1
+
+
+class CommandMetricsRegistry:
+    def __init__(self):
+        self._metrics: dict[tuple[str, str, str], CommandMetrics] = {}
+        self._lock = threading.Lock()
+
+    def observe(
+        self,
+        labels: tuple[str, str, str],
+        duration_ms: float,
+        succeeded: bool,
+    ) -> None:
+        with self._lock:
+            metrics = self._metrics.get(labels)
+            if metrics is None:
+                collection, operation, repository_method = labels
+                metrics = self._metrics[labels] = CommandMetrics(
+                    collection=collection,
+                    operation=operation,
+                    repository_method=repository_method,
+                )
+            metrics.observe(duration_ms, succeeded)
+
+    def collect(self) -> list[CommandMetrics]:
+        with self._lock:
+            return [
+                metrics.model_copy(deep=True)
+                for _, metrics in sorted(self._metrics.items())
+            ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._metrics.clear()
+
+    def render(self) -> str:
+        # Prometheus text exposition format, so it can be scraped as is.
+        lines = [
+            "# TYPE mongo_command_duration_ms histogram",
+            "# TYPE mongo_command_failures_total counter",
+        ]
+        for metrics in self.collect():
+            labels = (
+                f'collection="{metrics.collection}",'
+                f'operation="{metrics.operation}",'
+                f'repository_method="{metrics.repository_method}"'
+            )
+            cumulative_count = 0
+            upper_bounds = [*map(str, DURATION_BUCKETS_MS), "+Inf"]
+            for upper_bound, bucket_count in zip(
+                upper_bounds, metrics.bucket_counts, strict=True
+            ):
+                cumulative_count += bucket_count
+                lines.append(
+                    f"mongo_command_duration_ms_bucket"
+                    f'{{{labels},le="{upper_bound}"}} {cumulative_count}'
+                )
+            lines += [
+                f"mongo_command_duration_ms_sum{{{labels}}} "
+                f"{metrics.total_duration_ms:.3f}",
+                f"mongo_command_duration_ms_count{{{labels}}} {metrics.count}",
+                f"mongo_command_failures_total{{{labels}}} {metrics.failures}",
+            ]
+        return "\n".join(lines) + "\n"
+
+
+COMMAND_METRICS_REGISTRY = CommandMetricsRegistry()
+
+
+class CommandMetricsListener(monitoring.CommandListener):
+    def __init__(self, registry: CommandMetricsRegistry | None = None):
+        self.registry = registry or COMMAND_METRICS_REGISTRY
+        self._pending: dict[tuple[Any, int], tuple[str, str, str]] = {}
+        self._lock = threading.Lock()
+
+    def started(self, event):
+        # Only the started event carries the command document and runs on
+        # the calling thread, so the labels are taken here.
+        collection = event.command.get(event.command_name)
+        if event.command_name == "getMore":
+            collection = event.command.get("collection")
+        labels = (
+            collection if isinstance(collection, str) else UNKNOWN_LABEL,
+            event.command_name,
+            current_repository_method.get(),
+        )
+        with self._lock:
+            self._pending[(event.connection_id, event.request_id)] = labels
+
+    def succeeded(self, event):
+        self._observe(event, succeeded=True)
+
+    def failed(self, event):
+        self._observe(event, succeeded=False)
+
+    def _observe(self, event, succeeded: bool) -> None:
+        with self._lock:
+            labels = self._pending.pop(
+                (event.connection_id, event.request_id), None
+            )
+        if labels is not None:
+            self.registry.observe(
+                labels, event.duration_micros / 1000, succeeded
+            )
+
+
+def instrument_repository(cls: RepositoryClass) -> RepositoryClass:
+    # Labels every command a public method issues with the method's name.
+    for name, method in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(method):
+            continue
+        setattr(cls, name, _label_method(method, f"{cls.__name__}.{name}"))
+    return cls
+
+
+def _label_method(method: Callable, label: str) -> Callable:
+    if inspect.isgeneratorfunction(method):
+        return _label_generator(method, label)
+    return _label_function(method, label)
+
+
+@contextmanager
+def _labelled(label: str) -> Iterator[None]:
+    token = current_repository_method.set(label)
+    try:
+        yield
+    finally:
+        current_repository_method.reset(token)
+
+
+def _label_function(method: Callable, label: str) -> Callable:
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with _labelled(label):
+            return method(*args, **kwargs)
+
+    return wrapper
+
+
+def _label_generator(method: Callable, label: str) -> Callable:
+    # A generator runs a step at a time in its consumer's context, so the
+    # label is set around each step rather than around the call.
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        generator = method(*args, **kwargs)
+        while True:
+            with _labelled(label):
+                value = next(generator, _EXHAUSTED)
+            if value is _EXHAUSTED:
+                return
+            yield value
+
+    return wrapper
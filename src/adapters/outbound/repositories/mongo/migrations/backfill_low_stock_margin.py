@@ -0,0 +1,26 @@
+import os
+
+from mongoengine import connect  # type: ignore
+
+from src.adapters.outbound.repositories.mongo.documents.item import (
+    ItemDocument,
+)
+from src.adapters.outbound.repositories.mongo.indexes import (
+    backfill_low_stock_margins,
+)
+
+
+def backfill_low_stock_margin() -> int:
+    # Connecting already gives a margin to the items missing one, but
+    # orders taken by a previous version still running moved their
+    # quantity without it, so the partial index would miss them.
+    # Recomputes every margin that is missing or stale.
+    return backfill_low_stock_margins(ItemDocument._get_collection(), {})
+
+
+if __name__ == "__main__":
+    connect(
+        host=os.getenv("MONGO_CONNECTION_STRING", "mongodb://localhost:27017")
+    )
+    updated_count = backfill_low_stock_margin()
+    print(f"Backfilled the low stock margin of {updated_count} items")
@@ -0,0 +1,57 @@
+import os
+
+from mongoengine import connect  # type: ignore
+from pymongo.errors import OperationFailure
+
+from src.adapters.outbound.repositories.mongo.documents.client import (
+    ClientDocument,
+)
+from src.adapters.outbound.repositories.mongo.documents.order import (
+    OrderDocument,
+)
+from src.adapters.outbound.repositories.mongo.indexes import INDEXES
+
+LEGACY_CLIENT_NAME_INDEX = "name"
+
+
+def dedupe_clients() -> int:
+    # clients.name becomes unique, so every duplicated name is merged into
+    # its oldest client and the orders of the others are moved over to it.
+    clients_collection = ClientDocument._get_collection()
+    duplicated_clients = clients_collection.aggregate(
+        [
+            {"$sort": {"_id": 1}},
+            {"$group": {"_id": "$name", "client_ids": {"$push": "$_id"}}},
+            {"$match": {"client_ids.1": {"$exists": True}}},
+        ]
+    )
+
+    removed_clients_count = 0
+    for duplicated_client in duplicated_clients:
+        kept_client_id, *duplicated_client_ids = duplicated_client[
+            "client_ids"
+        ]
+        OrderDocument._get_collection().update_many(
+            {"client": {"$in": duplicated_client_ids}},
+            {"$set": {"client": kept_client_id}},
+        )
+        result = clients_collection.delete_many(
+            {"_id": {"$in": duplicated_client_ids}}
+        )
+        removed_clients_count += result.deleted_count
+
+    try:
+        clients_collection.drop_index(LEGACY_CLIENT_NAME_INDEX)
+    except OperationFailure:
+        pass
+    clients_collection.create_indexes(INDEXES["clients"])
+
+    return removed_clients_count
+
+
+if __name__ == "__main__":
+    connect(
+        host=os.getenv("MONGO_CONNECTION_STRING", "mongodb://localhost:27017")
+    )
+    removed_clients_count = dedupe_clients()
+    print(f"Removed {removed_clients_count} duplicated clients")
@@ -0,0 +1,144 @@
+import argparse
+import os
+import time
+from typing import Any
+
+from bson import ObjectId
+from mongoengine import connect  # type: ignore
+from pymongo import UpdateOne
+
+from src.adapters.outbound.repositories.mongo.documents.item import (
+    ItemDocument,
+)
+from src.adapters.outbound.repositories.mongo.documents.order import (
+    ORDER_SCHEMA_VERSION,
+    OrderDocument,
+)
+from src.adapters.outbound.repositories.mongo.documents.order_item import (
+    OrderItemDocument,
+)
+
+LEGACY_ORDER_FILTER: dict[str, Any] = {"schema_version": {"$exists": False}}
+
+
+def migrate_orders(batch_size: int = 500, pause_seconds: float = 0) -> int:
+    # Orders are converted in _id order, one bounded batch at a time, so the
+    # bot keeps serving while this runs. The update filter only matches
+    # orders that are still version 1, so an order the bot rewrites in the
+    # meantime (e.g. a cancellation) is never overwritten.
+    orders_collection = OrderDocument._get_collection()
+    migrated_orders_count = 0
+    last_order_id: ObjectId | None = None
+    while True:
+        batch_filter: dict[str, Any] = dict(LEGACY_ORDER_FILTER)
+        if last_order_id:
+            batch_filter["_id"] = {"$gt": last_order_id}
+        legacy_orders = list(
+            orders_collection.find(batch_filter, {"order_items": True})
+            .sort("_id", 1)
+            .limit(batch_size)
+        )
+        if not legacy_orders:
+            break
+
+        migrated_orders_count += _migrate_batch(legacy_orders)
+        last_order_id = legacy_orders[-1]["_id"]
+        time.sleep(pause_seconds)
+
+    if not orders_collection.count_documents(LEGACY_ORDER_FILTER, limit=1):
+        # Version 1 orders rewritten by the bot leave their order items
+        # behind, so once none are left the collection only holds orphans.
+        OrderItemDocument._get_collection().delete_many({})
+
+    return migrated_orders_count
+
+
+def _migrate_batch(legacy_orders: list[dict]) -> int:
+    order_item_ids = [
+        order_item_id
+        for legacy_order in legacy_orders
+        for order_item_id in legacy_order.get("order_items", [])
+    ]
+    order_items_by_id = {
+        order_item["_id"]: order_item
+        for order_item in OrderItemDocument._get_collection().find(
+            {"_id": {"$in": order_item_ids}}
+        )
+    }
+    item_names_by_id = {
+        item["_id"]: item["name"]
+        for item in ItemDocument._get_collection().find(
+            {
+                "_id": {
+                    "$in": [
+                        order_item["item"]
+                        for order_item in order_items_by_id.values()
+                    ]
+                }
+            },
+            {"name": True},
+        )
+    }
+
+    result = OrderDocument._get_collection().bulk_write(
+        [
+            UpdateOne(
+                {"_id": legacy_order["_id"], **LEGACY_ORDER_FILTER},
+                {
+                    "$set": {
+                        "schema_version": ORDER_SCHEMA_VERSION,
+                        "lines": _build_lines(
+                            legacy_order.get("order_items", []),
+                            order_items_by_id,
+                            item_names_by_id,
+                        ),
+                    },
+                    "$unset": {"order_items": ""},
+                },
+            )
+            for legacy_order in legacy_orders
+        ],
+        ordered=False,
+    )
+    if order_item_ids:
+        OrderItemDocument._get_collection().delete_many(
+            {"_id": {"$in": order_item_ids}}
+        )
+    return result.modified_count
+
+
+def _build_lines(
+    order_item_ids: list[ObjectId],
+    order_items_by_id: dict[ObjectId, dict],
+    item_names_by_id: dict[ObjectId, str],
+) -> list[dict]:
+    lines = []
+    for order_item_id in order_item_ids:
+        order_item = order_items_by_id.get(order_item_id)
+        if not order_item or order_item["item"] not in item_names_by_id:
+            continue
+        lines.append(
+            {
+                "item_id": order_item["item"],
+                "item_name": item_names_by_id[order_item["item"]],
+                "quantity": order_item["quantity"],
+            }
+        )
+    return lines
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Embed order items into version 2 order documents."
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--pause-seconds", type=float, default=0.1)
+    args = parser.parse_args()
+
+    connect(
+        host=os.getenv("MONGO_CONNECTION_STRING", "mongodb://localhost:27017")
+    )
+    migrated_orders_count = migrate_orders(
+        batch_size=args.batch_size, pause_seconds=args.pause_seconds
+    )
+    print(f"Migrated {migrated_orders_count} orders")
@@ -0,0 +1,82 @@
+import argparse
+import itertools
+import os
+from collections import Counter
+from datetime import date
+
+from bson import ObjectId
+from mongoengine import connect  # type: ignore
+
+from src.adapters.outbound.repositories.mongo.archive import (
+    ORDERS_ARCHIVE_COLLECTION_NAME,
+)
+from src.adapters.outbound.repositories.mongo.documents.order import (
+    ORDER_SCHEMA_VERSION,
+    OrderDocument,
+)
+from src.adapters.outbound.repositories.mongo.documents.sales import (
+    DailyItemSalesDocument,
+)
+from src.adapters.outbound.repositories.pymongo.sales import to_day_datetime
+from src.domain.entities.sales import get_sales_day
+
+SOLD_ORDER_FILTER = {
+    "schema_version": ORDER_SCHEMA_VERSION,
+    "is_cancelled": False,
+}
+
+
+def rebuild_daily_sales(batch_size: int = 500) -> int:
+    # Recomputes every rollup from the orders, for data written before the
+    # rollups existed. Run it with the bot stopped: increments made while
+    # the collection is being replaced would be lost.
+    quantities_by_key: Counter[tuple[date, ObjectId]] = Counter()
+    item_names_by_id: dict[ObjectId, str] = {}
+    # Archived orders were sold as well.
+    orders = itertools.chain.from_iterable(
+        collection.find(SOLD_ORDER_FILTER, {"created_at": True, "lines": True})
+        .sort("_id", 1)
+        .batch_size(batch_size)
+        for collection in (
+            OrderDocument._get_collection(),
+            OrderDocument._get_db()[ORDERS_ARCHIVE_COLLECTION_NAME],
+        )
+    )
+    for order in orders:
+        sales_day = get_sales_day(order["created_at"])
+        for line in order.get("lines", []):
+            quantities_by_key[(sales_day, line["item_id"])] += line[
+                "quantity"
+            ]
+            item_names_by_id[line["item_id"]] = line["item_name"]
+
+    sales_collection = DailyItemSalesDocument._get_collection()
+    sales_collection.delete_many({})
+    if quantities_by_key:
+        sales_collection.insert_many(
+            [
+                {
+                    "day": to_day_datetime(sales_day),
+                    "item": item_id,
+                    "item_name": item_names_by_id[item_id],
+                    "quantity": quantity,
+                }
+                for (sales_day, item_id), quantity in quantities_by_key.items()
+            ],
+            ordered=False,
+        )
+    return len(quantities_by_key)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Rebuild the daily item sales rollups from the orders."
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    connect(
+        host=os.getenv("MONGO_CONNECTION_STRING", "mongodb://localhost:27017")
+    )
+    rollups_count = rebuild_daily_sales(batch_size=args.batch_size)
+    print(f"Rebuilt {rollups_count} daily item sales rollups")
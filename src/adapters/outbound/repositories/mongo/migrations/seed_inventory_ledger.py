@@ -0,0 +1,56 @@
+import os
+from datetime import UTC, datetime
+
+from mongoengine import connect  # type: ignore
+
+from src.adapters.outbound.repositories.mongo.documents.inventory import (
+    InventoryMovementDocument,
+)
+from src.adapters.outbound.repositories.mongo.documents.item import (
+    ItemDocument,
+)
+from src.adapters.outbound.repositories.pymongo.inventory import (
+    build_movement_document,
+)
+from src.domain.entities.inventory import (
+    InventoryMovement,
+    InventoryMovementReason,
+)
+
+
+def seed_inventory_ledger() -> int:
+    # Items created before the ledger existed have no movements, so a
+    # replay would not know about them. Records their current stock once,
+    # as set movements; a ledger that already has movements is left alone.
+    movements_collection = InventoryMovementDocument._get_collection()
+    if movements_collection.find_one({}, {"_id": True}) is not None:
+        return 0
+
+    created_at = datetime.now(UTC)
+    movements = [
+        InventoryMovement(
+            item_id=item["_id"],
+            item_name=item["name"],
+            reason=InventoryMovementReason.SET,
+            quantity_delta=item["inventory_quantity"],
+            inventory_quantity=item["inventory_quantity"],
+            created_at=created_at,
+        )
+        for item in ItemDocument._get_collection().find(
+            {}, {"name": True, "inventory_quantity": True}
+        )
+    ]
+    if movements:
+        movements_collection.insert_many(
+            [build_movement_document(movement) for movement in movements],
+            ordered=False,
+        )
+    return len(movements)
+
+
+if __name__ == "__main__":
+    connect(
+        host=os.getenv("MONGO_CONNECTION_STRING", "mongodb://localhost:27017")
+    )
+    movements_count = seed_inventory_ledger()
+    print(f"Seeded {movements_count} inventory movements")
@@ -1,80 +1,220 @@
+from datetime import datetime
+from typing import Any
+
 from bson import ObjectId
+from pymongo.collection import Collection
+from pymongo.errors import DuplicateKeyError
 
-from src.adapters.outbound.repositories.mongo.connection import MongoConnection
-from src.adapters.outbound.repositories.mongo.documents.client import (
-    ClientDocument,
+from src.adapters.outbound.repositories.mongo.archive import (
+    ORDERS_ARCHIVE_COLLECTION_NAME,
+    build_archive_writes,
+    build_orders_to_archive_query,
 )
-from src.adapters.outbound.repositories.mongo.documents.item import (
-    ItemDocument,
+from src.adapters.outbound.repositories.mongo.cancellation import (
+    build_cancel_orders_update,
+    build_not_cancelled_query,
+    build_undo_cancel_orders_update,
 )
+from src.adapters.outbound.repositories.mongo.connection import MongoConnection
 from src.adapters.outbound.repositories.mongo.documents.order import (
+    ORDER_SCHEMA_VERSION,
     OrderDocument,
 )
-from src.adapters.outbound.repositories.mongo.documents.order_item import (
-    OrderItemDocument,
+from src.adapters.outbound.repositories.mongo.documents.order_line import (
+    OrderLineDocument,
+)
+from src.adapters.outbound.repositories.mongo.hydration import (
+    build_order_from_hydrated_document,
+    build_order_hydration_pipeline,
+)
+from src.adapters.outbound.repositories.mongo.metrics import (
+    instrument_repository,
+)
+from src.adapters.outbound.repositories.mongo.pagination import (
+    OLDEST_FIRST,
+    build_order_page_query,
+)
+from src.adapters.outbound.repositories.mongo.settings import (
+    MongoReadOptions,
+)
+from src.domain.entities.order import Order
+from src.domain.exceptions import (
+    OrderAlreadyExistsError,
+    OrdersAlreadyCancelledError,
+)
+from src.domain.ports.outbound.repositories.order import (
+    OrderCursor,
+    OrderFilter,
 )
-from src.domain.entities.client import Client
-from src.domain.entities.item import Item
-from src.domain.entities.order import Order, OrderItem
 
 
+@instrument_repository
 class MongoOrderRepository:
-    def __init__(self, mongo_connection: MongoConnection):
+    def __init__(
+        self,
+        mongo_connection: MongoConnection,
+        read_options: MongoReadOptions | None = None,
+    ):
         mongo_connection.connect()
+        self.mongo_connection = mongo_connection
+        self.read_options = read_options
 
-    def find_order_by_id(self, order_id: ObjectId) -> None | Order:
-        document = OrderDocument.objects.with_id(order_id)
-        if document:
-            if document.client:
-                client = Client(
-                    id=document.client.id,
-                    name=document.client.name,
-                )
-            order_items = [
-                OrderItem(
-                    quantity=order_item.quantity,
-                    item=Item(
-                        id=order_item.item.id,
-                        name=order_item.item.name,
-                        inventory_quantity=order_item.item.inventory_quantity,
-                    ),
-                )
-                for order_item in document.order_items
-            ]
-            return Order(
-                id=document.id,
-                external_id=document.external_id,
-                client=client if document.client else None,
-                external_created_at=document.external_created_at,
-                created_at=document.created_at,
-                updated_at=document.updated_at,
-                is_cancelled=document.is_cancelled,
-                order_items=order_items,
+    @staticmethod
+    def _get_archive_collection() -> Collection:
+        return OrderDocument._get_db()[ORDERS_ARCHIVE_COLLECTION_NAME]
+
+    def _get_read_collection(
+        self, collection: Collection | None = None
+    ) -> Collection:
+        if collection is None:
+            collection = OrderDocument._get_collection()
+        if self.read_options:
+            collection = collection.with_options(
+                **self.read_options.to_collection_options()
             )
+        return collection
+
+    def _find_order(
+        self,
+        match_filter: dict[str, Any],
+        collection: Collection | None = None,
+    ) -> None | Order:
+        document = next(
+            self._get_read_collection(collection).aggregate(
+                build_order_hydration_pipeline(match_filter)
+            ),
+            None,
+        )
+        if document:
+            return build_order_from_hydrated_document(document)
         return None
 
-    def save(self, order: Order) -> None:
-        if order.client:
-            client_document = ClientDocument.objects.with_id(order.client.id)
+    def find_order_by_id(self, order_id: ObjectId) -> None | Order:
+        return self._find_order({"_id": order_id}) or self._find_order(
+            {"_id": order_id}, self._get_archive_collection()
+        )
+
+    def find_order_by_external_id(
+        self, brand: str, external_id: int
+    ) -> None | Order:
+        return self._find_order({"brand": brand, "external_id": external_id})
+
+    def _find_orders(self, match_filter: dict[str, Any]) -> list[Order]:
+        return [
+            build_order_from_hydrated_document(document)
+            for document in self._get_read_collection().aggregate(
+                build_order_hydration_pipeline(match_filter)
+            )
+        ]
 
-        order_item_documents = []
-        for order_item in order.order_items:
-            item_document = ItemDocument.objects.with_id(order_item.item.id)
+    def find_orders_by_ids(self, order_ids: list[ObjectId]) -> list[Order]:
+        return self._find_orders({"_id": {"$in": order_ids}})
 
-            order_item_document = OrderItemDocument(
-                quantity=order_item.quantity, item=item_document
-            ).save()
+    def find_orders_by_external_ids(
+        self, brand: str | None, external_ids: list[int]
+    ) -> list[Order]:
+        return self._find_orders(
+            {"brand": brand, "external_id": {"$in": external_ids}}
+        )
 
-            order_item_documents.append(order_item_document)
+    def find_orders(
+        self,
+        order_filter: OrderFilter,
+        limit: int,
+        after: OrderCursor | None = None,
+        before: OrderCursor | None = None,
+    ) -> list[Order]:
+        query, sort = build_order_page_query(order_filter, after, before)
+        orders = [
+            build_order_from_hydrated_document(document)
+            for document in self._get_read_collection().aggregate(
+                build_order_hydration_pipeline(query, sort, limit)
+            )
+        ]
+        if before is not None:
+            orders.reverse()
+        return orders
 
+    def save(self, order: Order) -> None:
         order_document = OrderDocument(
             id=order.id,
             external_id=order.external_id,
-            client=client_document if order.client else None,
+            brand=order.brand,
+            client=order.client.id if order.client else None,
             external_created_at=order.external_created_at,
             created_at=order.created_at,
             updated_at=order.updated_at,
             is_cancelled=order.is_cancelled,
-            order_items=order_item_documents,
+            schema_version=ORDER_SCHEMA_VERSION,
+            lines=[
+                OrderLineDocument(
+                    item_id=order_item.item.id,
+                    item_name=order_item.item.name,
+                    quantity=order_item.quantity,
+                )
+                for order_item in order.order_items
+            ],
+        )
+        order_document.validate()
+        # Document.save() looks the order up before inserting it; a single
+        # upserting replace writes new and cancelled orders alike.
+        try:
+            OrderDocument._get_collection().replace_one(
+                {"_id": order.id},
+                order_document.to_mongo(),
+                upsert=True,
+                session=self.mongo_connection.get_current_session(),
+            )
+        except DuplicateKeyError as error:
+            raise OrderAlreadyExistsError(
+                order.brand,  # type: ignore
+                order.external_id,  # type: ignore
+            ) from error
+
+    def cancel_orders(
+        self, order_ids: list[ObjectId], cancelled_at: datetime
+    ) -> None:
+        session = self.mongo_connection.get_current_session()
+        collection = OrderDocument._get_collection()
+        cancellation_id = ObjectId()
+        result = collection.update_many(
+            *build_cancel_orders_update(
+                order_ids, cancelled_at, cancellation_id
+            ),
+            session=session,
+        )
+        if result.modified_count == len(order_ids):
+            return
+        cancelled_order_ids = [
+            document["_id"]
+            for document in collection.find(
+                build_not_cancelled_query(order_ids, cancellation_id),
+                {"_id": True},
+                session=session,
+            )
+        ]
+        collection.update_many(
+            *build_undo_cancel_orders_update(order_ids, cancellation_id),
+            session=session,
+        )
+        raise OrdersAlreadyCancelledError(cancelled_order_ids)
+
+    def archive_orders(self, order_filter: OrderFilter, limit: int) -> int:
+        session = self.mongo_connection.get_current_session()
+        collection = OrderDocument._get_collection()
+        documents = list(
+            collection.find(
+                build_orders_to_archive_query(order_filter),
+                sort=list(OLDEST_FIRST.items()),
+                limit=limit,
+                session=session,
+            )
+        )
+        if not documents:
+            return 0
+        replacements, deletions = build_archive_writes(documents)
+        self._get_archive_collection().bulk_write(
+            replacements, ordered=False, session=session
         )
-        order_document.save()
+        collection.bulk_write(deletions, ordered=False, session=session)
+        return len(documents)
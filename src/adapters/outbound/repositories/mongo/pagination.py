@@ -0,0 +1,55 @@
+from typing import Any
+
+from pymongo import ASCENDING, DESCENDING
+
+from src.domain.ports.outbound.repositories.order import (
+    OrderCursor,
+    OrderFilter,
+)
+
+NEWEST_FIRST = {"created_at": DESCENDING, "_id": DESCENDING}
+OLDEST_FIRST = {"created_at": ASCENDING, "_id": ASCENDING}
+
+
+def build_order_filter_query(order_filter: OrderFilter) -> dict[str, Any]:
+    query: dict[str, Any] = {}
+    created_at_range = {}
+    if order_filter.created_from is not None:
+        created_at_range["$gte"] = order_filter.created_from
+    if order_filter.created_until is not None:
+        created_at_range["$lt"] = order_filter.created_until
+    if created_at_range:
+        query["created_at"] = created_at_range
+    if order_filter.client_id is not None:
+        query["client"] = order_filter.client_id
+    if order_filter.is_cancelled is not None:
+        query["is_cancelled"] = order_filter.is_cancelled
+    return query
+
+
+def _build_keyset_query(cursor: OrderCursor, operator: str) -> dict[str, Any]:
+    return {
+        "$or": [
+            {"created_at": {operator: cursor.created_at}},
+            {
+                "created_at": cursor.created_at,
+                "_id": {operator: cursor.order_id},
+            },
+        ]
+    }
+
+
+def build_order_page_query(
+    order_filter: OrderFilter,
+    after: OrderCursor | None = None,
+    before: OrderCursor | None = None,
+) -> tuple[dict[str, Any], dict[str, int]]:
+    # Keyset pagination: the cursor bounds the (created_at, _id) index
+    # range, so every page is an index seek plus `limit` documents. Pages
+    # before a cursor are read oldest first and reversed by the caller.
+    query = build_order_filter_query(order_filter)
+    if after is not None:
+        return {**query, **_build_keyset_query(after, "$lt")}, NEWEST_FIRST
+    if before is not None:
+        return {**query, **_build_keyset_query(before, "$gt")}, OLDEST_FIRST
+    return query, NEWEST_FIRST
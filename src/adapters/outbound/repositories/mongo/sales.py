@@ -0,0 +1,68 @@
+from datetime import date
+
+from mongoengine import QuerySet  # type: ignore
+
+from src.adapters.outbound.repositories.mongo.connection import MongoConnection
+from src.adapters.outbound.repositories.mongo.documents.sales import (
+    DailyItemSalesDocument,
+)
+from src.adapters.outbound.repositories.mongo.metrics import (
+    instrument_repository,
+)
+from src.adapters.outbound.repositories.mongo.settings import (
+    MongoReadOptions,
+)
+from src.adapters.outbound.repositories.pymongo.sales import (
+    build_increment_operations,
+    to_day_datetime,
+)
+from src.domain.entities.sales import DailyItemSales
+
+
+@instrument_repository
+class MongoSalesRepository:
+    def __init__(
+        self,
+        mongo_connection: MongoConnection,
+        read_options: MongoReadOptions | None = None,
+    ):
+        mongo_connection.connect()
+        self.mongo_connection = mongo_connection
+        self.read_options = read_options
+
+    def _read_objects(self, **query) -> QuerySet:
+        queryset = DailyItemSalesDocument.objects(**query)
+        if self.read_options:
+            queryset = queryset.read_preference(
+                self.read_options.build_read_preference()
+            ).read_concern(self.read_options.build_read_concern().document)
+        return queryset
+
+    def increment_daily_sales(
+        self, daily_sales_deltas: list[DailyItemSales]
+    ) -> None:
+        if not daily_sales_deltas:
+            return
+
+        DailyItemSalesDocument._get_collection().bulk_write(
+            build_increment_operations(daily_sales_deltas),
+            ordered=False,
+            session=self.mongo_connection.get_current_session(),
+        )
+
+    def find_daily_sales(
+        self, first_day: date, last_day: date
+    ) -> list[DailyItemSales]:
+        documents = self._read_objects(
+            day__gte=to_day_datetime(first_day),
+            day__lte=to_day_datetime(last_day),
+        ).order_by("day", "item_name")
+        return [
+            DailyItemSales(
+                day=document.day.date(),
+                item_id=document.item,
+                item_name=document.item_name,
+                quantity=document.quantity,
+            )
+            for document in documents
+        ]
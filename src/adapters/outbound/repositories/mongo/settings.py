@@ -0,0 +1,198 @@
+import os
+import threading
+from collections.abc import Mapping
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+from pymongo import monitoring
+from pymongo.read_concern import ReadConcern
+from pymongo.read_preferences import (
+    Primary,
+    _ServerMode,
+    make_read_preference,
+    read_pref_mode_from_name,
+)
+
+Compressor = Literal["zstd", "snappy", "zlib"]
+
+
+class MongoConnectionSettings(BaseModel):
+    max_pool_size: int = Field(default=100, ge=0)
+    min_pool_size: int = Field(default=0, ge=0)
+    max_idle_time_ms: int | None = None
+    wait_queue_timeout_ms: int | None = None
+    # zstd and snappy need the zstandard and python-snappy packages; the
+    # driver skips a compressor it cannot import.
+    compressors: list[Compressor] = Field(default_factory=list)
+    zlib_compression_level: int | None = Field(default=None, ge=-1, le=9)
+    server_selection_timeout_ms: int = 30000
+    connect_timeout_ms: int = 20000
+    socket_timeout_ms: int | None = None
+    retry_writes: bool = True
+    read_preference: str = "primary"
+    app_name: str = "inventory-manager"
+    # Unit of work commits run in a session transaction, which needs a
+    # replica set or a sharded cluster.
+    use_transactions: bool = False
+
+    @classmethod
+    def from_env(
+        cls, environ: Mapping[str, str] = os.environ
+    ) -> "MongoConnectionSettings":
+        fields = {
+            "max_pool_size": "MONGO_MAX_POOL_SIZE",
+            "min_pool_size": "MONGO_MIN_POOL_SIZE",
+            "max_idle_time_ms": "MONGO_MAX_IDLE_TIME_MS",
+            "wait_queue_timeout_ms": "MONGO_WAIT_QUEUE_TIMEOUT_MS",
+            "compressors": "MONGO_COMPRESSORS",
+            "zlib_compression_level": "MONGO_ZLIB_COMPRESSION_LEVEL",
+            "server_selection_timeout_ms": "MONGO_SERVER_SELECTION_TIMEOUT_MS",
+            "connect_timeout_ms": "MONGO_CONNECT_TIMEOUT_MS",
+            "socket_timeout_ms": "MONGO_SOCKET_TIMEOUT_MS",
+            "retry_writes": "MONGO_RETRY_WRITES",
+            "read_preference": "MONGO_READ_PREFERENCE",
+            "app_name": "MONGO_APP_NAME",
+            "use_transactions": "MONGO_USE_TRANSACTIONS",
+        }
+        values: dict[str, Any] = {
+            field: environ[variable]
+            for field, variable in fields.items()
+            if environ.get(variable)
+        }
+        if "compressors" in values:
+            values["compressors"] = [
+                compressor.strip()
+                for compressor in values["compressors"].split(",")
+                if compressor.strip()
+            ]
+        return cls.model_validate(values)
+
+    def to_client_options(self) -> dict[str, Any]:
+        options = {
+            "maxPoolSize": self.max_pool_size,
+            "minPoolSize": self.min_pool_size,
+            "maxIdleTimeMS": self.max_idle_time_ms,
+            "waitQueueTimeoutMS": self.wait_queue_timeout_ms,
+            "compressors": ",".join(self.compressors) or None,
+            "zlibCompressionLevel": self.zlib_compression_level,
+            "serverSelectionTimeoutMS": self.server_selection_timeout_ms,
+            "connectTimeoutMS": self.connect_timeout_ms,
+            "socketTimeoutMS": self.socket_timeout_ms,
+            "retryWrites": self.retry_writes,
+            "readPreference": self.read_preference,
+            "appname": self.app_name,
+        }
+        return {
+            option: value
+            for option, value in options.items()
+            if value is not None
+        }
+
+
+class MongoReadOptions(BaseModel):
+    read_preference: str = "secondaryPreferred"
+    # MongoDB rejects a maxStalenessSeconds under 90.
+    max_staleness_seconds: int | None = Field(default=90, ge=90)
+    read_concern_level: str | None = "local"
+
+    @classmethod
+    def from_env(
+        cls, environ: Mapping[str, str] = os.environ
+    ) -> "MongoReadOptions":
+        fields = {
+            "read_preference": "MONGO_READ_ONLY_READ_PREFERENCE",
+            "max_staleness_seconds": "MONGO_READ_ONLY_MAX_STALENESS_SECONDS",
+            "read_concern_level": "MONGO_READ_ONLY_READ_CONCERN",
+        }
+        return cls.model_validate(
+            {
+                field: environ[variable]
+                for field, variable in fields.items()
+                if environ.get(variable)
+            }
+        )
+
+    def build_read_preference(self) -> _ServerMode:
+        mode = read_pref_mode_from_name(self.read_preference)
+        if mode == Primary().mode or self.max_staleness_seconds is None:
+            return make_read_preference(mode, None)
+        return make_read_preference(mode, None, self.max_staleness_seconds)
+
+    def build_read_concern(self) -> ReadConcern:
+        return ReadConcern(self.read_concern_level)
+
+    def to_collection_options(self) -> dict[str, Any]:
+        return {
+            "read_preference": self.build_read_preference(),
+            "read_concern": self.build_read_concern(),
+        }
+
+
+class PoolStatistics(BaseModel):
+    connections_created: int = 0
+    connections_closed: int = 0
+    connections_checked_out: int = 0
+    max_connections_checked_out: int = 0
+    checkouts: int = 0
+    checkout_failures: int = 0
+    pools_cleared: int = 0
+
+    @property
+    def open_connections(self) -> int:
+        return self.connections_created - self.connections_closed
+
+
+class PoolStatisticsListener(monitoring.ConnectionPoolListener):
+    def __init__(self):
+        self._statistics = PoolStatistics()
+        self._lock = threading.Lock()
+
+    @property
+    def statistics(self) -> PoolStatistics:
+        with self._lock:
+            return self._statistics.model_copy()
+
+    def connection_created(self, event):
+        with self._lock:
+            self._statistics.connections_created += 1
+
+    def connection_closed(self, event):
+        with self._lock:
+            self._statistics.connections_closed += 1
+
+    def connection_checked_out(self, event):
+        with self._lock:
+            statistics = self._statistics
+            statistics.checkouts += 1
+            statistics.connections_checked_out += 1
+            statistics.max_connections_checked_out = max(
+                statistics.max_connections_checked_out,
+                statistics.connections_checked_out,
+            )
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            self._statistics.checkout_failures += 1
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            self._statistics.connections_checked_out -= 1
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self._statistics.pools_cleared += 1
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_check_out_started(self, event):
+        pass
@@ -0,0 +1,55 @@
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from src.adapters.outbound.repositories.mongo.connection import MongoConnection
+from src.adapters.outbound.repositories.mongo.metrics import (
+    instrument_repository,
+)
+from src.adapters.outbound.repositories.mongo.settings import (
+    MongoReadOptions,
+)
+from src.domain.entities.client import Client
+
+
+@instrument_repository
+class PyMongoClientRepository:
+    def __init__(
+        self,
+        mongo_connection: MongoConnection,
+        read_options: MongoReadOptions | None = None,
+    ):
+        database = mongo_connection.get_database()
+        self.collection = database["clients"]
+        self.read_collection = (
+            database.get_collection(
+                "clients", **read_options.to_collection_options()
+            )
+            if read_options
+            else self.collection
+        )
+
+    def find_client_by_name(self, client_name: str) -> Client | None:
+        document = self.read_collection.find_one({"name": client_name})
+        if document:
+            return Client(name=document["name"], id=document["_id"])
+        return None
+
+    def save(self, client: Client) -> None:
+        self.collection.replace_one(
+            {"_id": client.id},
+            {"_id": client.id, "name": client.name},
+            upsert=True,
+        )
+
+    def get_or_create_by_name(self, client_name: str) -> Client:
+        try:
+            document = self.collection.find_one_and_update(
+                {"name": client_name},
+                {"$setOnInsert": {"name": client_name}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            # A concurrent upsert inserted the same name first.
+            document = self.collection.find_one({"name": client_name})
+        return Client(name=document["name"], id=document["_id"])
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from pymongo import ASCENDING, DESCENDING
+
+from src.adapters.outbound.repositories.mongo.connection import MongoConnection
+from src.adapters.outbound.repositories.mongo.metrics import (
+    instrument_repository,
+)
+from src.adapters.outbound.repositories.mongo.settings import (
+    MongoReadOptions,
+)
+from src.domain.entities.inventory import (
+    InventoryMovement,
+    InventorySnapshot,
+    InventorySnapshotItem,
+)
+
+MOVEMENTS_SORT = [("created_at", ASCENDING), ("_id", ASCENDING)]
+LATEST_SNAPSHOT_SORT = [("taken_at", DESCENDING)]
+
+
+def build_movements_query(
+    created_after: datetime | None, created_until: datetime
+) -> dict[str, Any]:
+    created_at_range: dict[str, datetime] = {"$lte": created_until}
+    if created_after is not None:
+        created_at_range["$gt"] = created_after
+    return {"created_at": created_at_range}
+
+
+def build_movement_document(movement: InventoryMovement) -> dict[str, Any]:
+    return {
+        "_id": movement.id,
+        "item": movement.item_id,
+        "item_name": movement.item_name,
+        "reason": movement.reason.value,
+        "quantity_delta": movement.quantity_delta,
+        "inventory_quantity": movement.inventory_quantity,
+        "order": movement.order_id,
+        "created_at": movement.created_at,
+    }
+
+
+def build_movement(document: dict[str, Any]) -> InventoryMovement:
+    return InventoryMovement(
+        id=document["_id"],
+        item_id=document["item"],
+        item_name=document["item_name"],
+        reason=document["reason"],
+        quantity_delta=document["quantity_delta"],
+        inventory_quantity=document.get("inventory_quantity"),
+        order_id=document.get("order"),
+        created_at=document["created_at"],
+    )
+
+
+def build_snapshot_document(snapshot: InventorySnapshot) -> dict[str, Any]:
+    return {
+        "_id": snapshot.id,
+        "taken_at": snapshot.taken_at,
+        "items": [
+            {
+                "item_id": item.item_id,
+                "item_name": item.item_name,
+                "inventory_quantity": item.inventory_quantity,
+            }
+            for item in snapshot.items
+        ],
+    }
+
+
+def build_snapshot(document: dict[str, Any]) -> InventorySnapshot:
+    return InventorySnapshot(
+        id=document["_id"],
+        taken_at=document["taken_at"],
+        items=[
+            InventorySnapshotItem(
+                item_id=item["item_id"],
+                item_name=item["item_name"],
+                inventory_quantity=item["inventory_quantity"],
+            )
+            for item in document["items"]
+        ],
+    )
+
+
+@instrument_repository
+class PyMongoInventoryLedgerRepository:
+    def __init__(
+        self,
+        mongo_connection: MongoConnection,
+        read_options: MongoReadOptions | None = None,
+    ):
+        database = mongo_connection.get_database()
+        self.mongo_connection = mongo_connection
+        self.movements_collection = database["inventory_movements"]
+        self.snapshots_collection = database["inventory_snapshots"]
+        collection_options = (
+            read_options.to_collection_options() if read_options else {}
+        )
+        self.read_movements_collection = database.get_collection(
+            "inventory_movements", **collection_options
+        )
+        self.read_snapshots_collection = database.get_collection(
+            "inventory_snapshots", **collection_options
+        )
+
+    def append_movements(self, movements: list[InventoryMovement]) -> None:
+        if not movements:
+            return
+
+        self.movements_collection.insert_many(
+            [build_movement_document(movement) for movement in movements],
+            session=self.mongo_connection.get_current_session(),
+        )
+
+    def find_movements(
+        self, created_after: datetime | None, created_until: datetime
+    ) -> list[InventoryMovement]:
+        documents = self.read_movements_collection.find(
+            build_movements_query(created_after, created_until)
+        ).sort(MOVEMENTS_SORT)
+        return [build_movement(document) for document in documents]
+
+    def save_snapshot(self, snapshot: InventorySnapshot) -> None:
+        self.snapshots_collection.insert_one(build_snapshot_document(snapshot))
+
+    def find_latest_snapshot(
+        self, taken_until: datetime
+    ) -> InventorySnapshot | None:
+        document = next(
+            self.read_snapshots_collection.find(
+                {"taken_at": {"$lte": taken_until}}
+            )
+            .sort(LATEST_SNAPSHOT_SORT)
+            .limit(1),
+            None,
+        )
+        return build_snapshot(document) if document else None
@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+from bson import ObjectId
+from pymongo import ASCENDING, UpdateOne
+
+from src.adapters.outbound.repositories.mongo.connection import MongoConnection
+from src.adapters.outbound.repositories.mongo.metrics import (
+    instrument_repository,
+)
+from src.adapters.outbound.repositories.mongo.settings import (
+    MongoReadOptions,
+)
+from src.domain.entities.item import Item
+from src.domain.exceptions import InsufficientInventoryError
+from src.domain.ports.outbound.repositories.item import SaveAllItemsResult
+
+ITEM_PROJECTION = {
+    "name": True,
+    "inventory_quantity": True,
+    "low_stock_threshold": True,
+}
+
+# A partial index cannot compare two fields, so every write keeps the
+# quantity left above the threshold in its own field for the index to
+# filter on.
+LOW_STOCK_MARGIN_FIELD = "low_stock_margin"
+LOW_STOCK_QUERY = {LOW_STOCK_MARGIN_FIELD: {"$lte": 0}}
+
+# Every strict decrement adds its own id to the items it went through, so
+# the read after it tells them apart from the short ones and only they are
+# given back, even while other decrements of the same items are running.
+DECREMENT_IDS_FIELD = "pending_decrement_ids"
+DECREMENT_PROJECTION = {**ITEM_PROJECTION, DECREMENT_IDS_FIELD: True}
+
+
+def build_stock_fields(item: Item) -> dict[str, int]:
+    return {
+        "inventory_quantity": item.inventory_quantity,
+        "low_stock_threshold": item.low_stock_threshold,
+        LOW_STOCK_MARGIN_FIELD: (
+            item.inventory_quantity - item.low_stock_threshold
+        ),
+    }
+
+
+def build_quantity_increment(quantity_delta: int) -> dict[str, int]:
+    return {
+        "inventory_quantity": quantity_delta,
+        LOW_STOCK_MARGIN_FIELD: quantity_delta,
+    }
+
+
+def build_increment_writes(
+    quantity_deltas_by_item_id: dict[ObjectId, int],
+) -> list[UpdateOne]:
+    return [
+        UpdateOne(
+            {"_id": item_id},
+            {"$inc": build_quantity_increment(quantity_delta)},
+        )
+        for item_id, quantity_delta in quantity_deltas_by_item_id.items()
+    ]
+
+
+def build_save_all_writes(items: list[Item]) -> list[UpdateOne]:
+    return [
+        UpdateOne(
+            {"name": item.name},
+            {
+                "$set": build_stock_fields(item),
+                "$setOnInsert": {"_id": item.id},
+            },
+            upsert=True,
+        )
+        for item in items
+    ]
+
+
+def build_decrement_writes(
+    quantities_by_item_id: dict[ObjectId, int], decrement_id: ObjectId
+) -> list[UpdateOne]:
+    return [
+        UpdateOne(
+            {"_id": item_id, "inventory_quantity": {"$gte": quantity}},
+            {
+                "$inc": build_quantity_increment(-quantity),
+                "$push": {DECREMENT_IDS_FIELD: decrement_id},
+            },
+        )
+        for item_id, quantity in quantities_by_item_id.items()
+    ]
+
+
+def build_release_writes(
+    quantities_by_item_id: dict[ObjectId, int], decrement_id: ObjectId
+) -> list[UpdateOne]:
+    return [
+        UpdateOne(
+            {"_id": item_id, DECREMENT_IDS_FIELD: decrement_id},
+            {
+                "$inc": build_quantity_increment(quantity),
+                "$pull": {DECREMENT_IDS_FIELD: decrement_id},
+            },
+        )
+        for item_id, quantity in quantities_by_item_id.items()
+    ]
+
+
+def build_decrement_cleanup(
+    quantities_by_item_id: dict[ObjectId, int], decrement_id: ObjectId
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    return (
+        {"_id": {"$in": list(quantities_by_item_id)}},
+        {"$pull": {DECREMENT_IDS_FIELD: decrement_id}},
+    )
+
+
+def find_short_items_names(
+    quantities_by_item_id: dict[ObjectId, int],
+    documents: list[dict[str, Any]],
+    decrement_id: ObjectId,
+) -> list[str]:
+    documents_by_id = {document["_id"]: document for document in documents}
+    short_items_names = []
+    for item_id in quantities_by_item_id:
+        document = documents_by_id.get(item_id)
+        if document is None:
+            short_items_names.append(str(item_id))
+        elif decrement_id not in document.get(DECREMENT_IDS_FIELD, []):
+            short_items_names.append(document["name"])
+    return short_items_names
+
+
+@instrument_repository
+class PyMongoItemRepository:
+    def __init__(
+        self,
+        mongo_connection: MongoConnection,
+        read_options: MongoReadOptions | None = None,
+    ):
+        database = mongo_connection.get_database()
+        self.mongo_connection = mongo_connection
+        self.collection = database["items"]
+        # Plain reads may be routed away from the primary; writes and the
+        # reads that follow them always use self.collection.
+        self.read_collection = (
+            database.get_collection(
+                "items", **read_options.to_collection_options()
+            )
+            if read_options
+            else self.collection
+        )
+
+    @staticmethod
+    def _build_item(document: dict[str, Any]) -> Item:
+        return Item(
+            id=document["_id"],
+            name=document["name"],
+            inventory_quantity=document["inventory_quantity"],
+            low_stock_threshold=document.get("low_stock_threshold", 0),
+        )
+
+    def find_item_by_name(self, item_name: str) -> Item | None:
+        document = self.read_collection.find_one(
+            {"name": item_name}, ITEM_PROJECTION
+        )
+        if document:
+            return self._build_item(document)
+        return None
+
+    def find_items_by_names(self, items_names: list[str]) -> list[Item]:
+        documents = self.read_collection.find(
+            {"name": {"$in": items_names}}, ITEM_PROJECTION
+        )
+        return [self._build_item(document) for document in documents]
+
+    def get_all(self) -> list[Item]:
+        documents = self.read_collection.find({}, ITEM_PROJECTION)
+        return [self._build_item(document) for document in documents]
+
+    def iter_items(self, batch_size: int) -> Iterator[Item]:
+        documents = (
+            self.read_collection.find({}, ITEM_PROJECTION)
+            .sort("name", ASCENDING)
+            .batch_size(batch_size)
+        )
+        for document in documents:
+            yield self._build_item(document)
+
+    def find_low_stock_items(self) -> list[Item]:
+        documents = self.read_collection.find(
+            LOW_STOCK_QUERY, ITEM_PROJECTION
+        ).sort("name", ASCENDING)
+        return [self._build_item(document) for document in documents]
+
+    def remove_item_by_name(self, item_name: str) -> None:
+        self.collection.delete_many(
+            {"name": item_name},
+            session=self.mongo_connection.get_current_session(),
+        )
+
+    def save(self, item: Item) -> None:
+        self.collection.replace_one(
+            {"_id": item.id},
+            {
+                "_id": item.id,
+                "name": item.name,
+                **build_stock_fields(item),
+            },
+            upsert=True,
+            session=self.mongo_connection.get_current_session(),
+        )
+
+    def save_all(self, items: list[Item]) -> SaveAllItemsResult:
+        if not items:
+            return SaveAllItemsResult(inserted_count=0, modified_count=0)
+
+        result = self.collection.bulk_write(
+            build_save_all_writes(items),
+            ordered=False,
+            session=self.mongo_connection.get_current_session(),
+        )
+        return SaveAllItemsResult(
+            inserted_count=result.upserted_count,
+            modified_count=result.modified_count,
+        )
+
+    def increment_inventory_quantities(
+        self, quantity_deltas_by_item_id: dict[ObjectId, int]
+    ) -> dict[ObjectId, int]:
+        if not quantity_deltas_by_item_id:
+            return {}
+
+        self.collection.bulk_write(
+            build_increment_writes(quantity_deltas_by_item_id),
+            ordered=False,
+            session=self.mongo_connection.get_current_session(),
+        )
+
+        documents = self.collection.find(
+            {"_id": {"$in": list(quantity_deltas_by_item_id)}},
+            {"inventory_quantity": True},
+            session=self.mongo_connection.get_current_session(),
+        )
+        return {doc["_id"]: doc["inventory_quantity"] for doc in documents}
+
+    def decrement_inventory_quantities(
+        self, quantities_by_item_id: dict[ObjectId, int]
+    ) -> dict[ObjectId, int]:
+        if not quantities_by_item_id:
+            return {}
+
+        # One guarded bulk write and one read, then one write that either
+        # drops the decrement id or gives the stock back when an item is
+        # short.
+        session = self.mongo_connection.get_current_session()
+        decrement_id = ObjectId()
+        self.collection.bulk_write(
+            build_decrement_writes(quantities_by_item_id, decrement_id),
+            ordered=False,
+            session=session,
+        )
+        documents = list(
+            self.collection.find(
+                {"_id": {"$in": list(quantities_by_item_id)}},
+                DECREMENT_PROJECTION,
+                session=session,
+            )
+        )
+        short_items_names = find_short_items_names(
+            quantities_by_item_id, documents, decrement_id
+        )
+        if short_items_names:
+            self.collection.bulk_write(
+                build_release_writes(quantities_by_item_id, decrement_id),
+                ordered=False,
+                session=session,
+            )
+            raise InsufficientInventoryError(short_items_names)
+        self.collection.update_many(
+            *build_decrement_cleanup(quantities_by_item_id, decrement_id),
+            session=session,
+        )
+        return {doc["_id"]: doc["inventory_quantity"] for doc in documents}
@@ -0,0 +1,216 @@
+from datetime import datetime
+from typing import Any
+
+from bson import ObjectId
+from pymongo.collection import Collection
+from pymongo.errors import DuplicateKeyError
+
+from src.adapters.outbound.repositories.mongo.archive import (
+    ORDERS_ARCHIVE_COLLECTION_NAME,
+    build_archive_writes,
+    build_orders_to_archive_query,
+)
+from src.adapters.outbound.repositories.mongo.cancellation import (
+    build_cancel_orders_update,
+    build_not_cancelled_query,
+    build_undo_cancel_orders_update,
+)
+from src.adapters.outbound.repositories.mongo.connection import MongoConnection
+from src.adapters.outbound.repositories.mongo.documents.order import (
+    ORDER_SCHEMA_VERSION,
+)
+from src.adapters.outbound.repositories.mongo.hydration import (
+    build_order_from_hydrated_document,
+    build_order_hydration_pipeline,
+)
+from src.adapters.outbound.repositories.mongo.metrics import (
+    instrument_repository,
+)
+from src.adapters.outbound.repositories.mongo.pagination import (
+    OLDEST_FIRST,
+    build_order_page_query,
+)
+from src.adapters.outbound.repositories.mongo.settings import (
+    MongoReadOptions,
+)
+from src.domain.entities.order import Order
+from src.domain.exceptions import (
+    OrderAlreadyExistsError,
+    OrdersAlreadyCancelledError,
+)
+from src.domain.ports.outbound.repositories.order import (
+    OrderCursor,
+    OrderFilter,
+)
+
+
+@instrument_repository
+class PyMongoOrderRepository:
+    def __init__(
+        self,
+        mongo_connection: MongoConnection,
+        read_options: MongoReadOptions | None = None,
+    ):
+        database = mongo_connection.get_database()
+        self.mongo_connection = mongo_connection
+        self.collection = database["orders"]
+        self.archive_collection = database[ORDERS_ARCHIVE_COLLECTION_NAME]
+        collection_options = (
+            read_options.to_collection_options() if read_options else {}
+        )
+        self.read_collection = database.get_collection(
+            "orders", **collection_options
+        )
+        self.read_archive_collection = database.get_collection(
+            ORDERS_ARCHIVE_COLLECTION_NAME, **collection_options
+        )
+
+    @staticmethod
+    def _find_order_in(
+        collection: Collection, match_filter: dict[str, Any]
+    ) -> None | Order:
+        document = next(
+            collection.aggregate(build_order_hydration_pipeline(match_filter)),
+            None,
+        )
+        if document:
+            return build_order_from_hydrated_document(document)
+        return None
+
+    def _find_order(self, match_filter: dict[str, Any]) -> None | Order:
+        return self._find_order_in(self.read_collection, match_filter)
+
+    def find_order_by_id(self, order_id: ObjectId) -> None | Order:
+        return self._find_order({"_id": order_id}) or self._find_order_in(
+            self.read_archive_collection, {"_id": order_id}
+        )
+
+    def find_order_by_external_id(
+        self, brand: str, external_id: int
+    ) -> None | Order:
+        return self._find_order({"brand": brand, "external_id": external_id})
+
+    def _find_orders(self, match_filter: dict[str, Any]) -> list[Order]:
+        return [
+            build_order_from_hydrated_document(document)
+            for document in self.read_collection.aggregate(
+                build_order_hydration_pipeline(match_filter)
+            )
+        ]
+
+    def find_orders_by_ids(self, order_ids: list[ObjectId]) -> list[Order]:
+        return self._find_orders({"_id": {"$in": order_ids}})
+
+    def find_orders_by_external_ids(
+        self, brand: str | None, external_ids: list[int]
+    ) -> list[Order]:
+        return self._find_orders(
+            {"brand": brand, "external_id": {"$in": external_ids}}
+        )
+
+    def find_orders(
+        self,
+        order_filter: OrderFilter,
+        limit: int,
+        after: OrderCursor | None = None,
+        before: OrderCursor | None = None,
+    ) -> list[Order]:
+        query, sort = build_order_page_query(order_filter, after, before)
+        orders = [
+            build_order_from_hydrated_document(document)
+            for document in self.read_collection.aggregate(
+                build_order_hydration_pipeline(query, sort, limit)
+            )
+        ]
+        if before is not None:
+            orders.reverse()
+        return orders
+
+    def save(self, order: Order) -> None:
+        try:
+            self.collection.replace_one(
+                {"_id": order.id},
+                self._build_document(order),
+                upsert=True,
+                session=self.mongo_connection.get_current_session(),
+            )
+        except DuplicateKeyError as error:
+            raise OrderAlreadyExistsError(
+                order.brand,  # type: ignore
+                order.external_id,  # type: ignore
+            ) from error
+
+    def cancel_orders(
+        self, order_ids: list[ObjectId], cancelled_at: datetime
+    ) -> None:
+        session = self.mongo_connection.get_current_session()
+        cancellation_id = ObjectId()
+        result = self.collection.update_many(
+            *build_cancel_orders_update(
+                order_ids, cancelled_at, cancellation_id
+            ),
+            session=session,
+        )
+        if result.modified_count == len(order_ids):
+            return
+        cancelled_order_ids = [
+            document["_id"]
+            for document in self.collection.find(
+                build_not_cancelled_query(order_ids, cancellation_id),
+                {"_id": True},
+                session=session,
+            )
+        ]
+        self.collection.update_many(
+            *build_undo_cancel_orders_update(order_ids, cancellation_id),
+            session=session,
+        )
+        raise OrdersAlreadyCancelledError(cancelled_order_ids)
+
+    def archive_orders(self, order_filter: OrderFilter, limit: int) -> int:
+        session = self.mongo_connection.get_current_session()
+        documents = list(
+            self.collection.find(
+                build_orders_to_archive_query(order_filter),
+                sort=list(OLDEST_FIRST.items()),
+                limit=limit,
+                session=session,
+            )
+        )
+        if not documents:
+            return 0
+        replacements, deletions = build_archive_writes(documents)
+        self.archive_collection.bulk_write(
+            replacements, ordered=False, session=session
+        )
+        self.collection.bulk_write(deletions, ordered=False, session=session)
+        return len(documents)
+
+    @staticmethod
+    def _build_document(order: Order) -> dict[str, Any]:
+        document = {
+            "_id": order.id,
+            "external_id": order.external_id,
+            "brand": order.brand,
+            "external_created_at": order.external_created_at,
+            "created_at": order.created_at,
+            "updated_at": order.updated_at,
+            "is_cancelled": order.is_cancelled,
+            "client": order.client.id if order.client else None,
+            "schema_version": ORDER_SCHEMA_VERSION,
+            "lines": [
+                {
+                    "item_id": order_item.item.id,
+                    "item_name": order_item.item.name,
+                    "quantity": order_item.quantity,
+                }
+                for order_item in order.order_items
+            ],
+        }
+        # Same shape as the mongoengine documents, which leave unset
+        # fields out.
+        return {
+            field: value
+            for field, value in document.items()
+            if value is not None
+        }
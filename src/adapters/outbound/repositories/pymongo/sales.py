@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from datetime import date, datetime, time
+from typing import Any
+
+from pymongo import UpdateOne
+
+from src.adapters.outbound.repositories.mongo.connection import MongoConnection
+from src.adapters.outbound.repositories.mongo.metrics import (
+    instrument_repository,
+)
+from src.adapters.outbound.repositories.mongo.settings import (
+    MongoReadOptions,
+)
+from src.domain.entities.sales import DailyItemSales
+
+DAILY_ITEM_SALES_SORT = [("day", 1), ("item_name", 1)]
+
+
+def to_day_datetime(day: date) -> datetime:
+    return datetime.combine(day, time())
+
+
+def build_daily_sales_query(first_day: date, last_day: date) -> dict:
+    return {
+        "day": {
+            "$gte": to_day_datetime(first_day),
+            "$lte": to_day_datetime(last_day),
+        }
+    }
+
+
+def build_increment_operations(
+    daily_sales_deltas: list[DailyItemSales],
+) -> list[UpdateOne]:
+    # The upsert keys on the (day, item) unique index, so concurrent first
+    # sales of an item on a day end up in a single document.
+    return [
+        UpdateOne(
+            {
+                "day": to_day_datetime(daily_sales_delta.day),
+                "item": daily_sales_delta.item_id,
+            },
+            {
+                "$inc": {"quantity": daily_sales_delta.quantity},
+                "$set": {"item_name": daily_sales_delta.item_name},
+            },
+            upsert=True,
+        )
+        for daily_sales_delta in daily_sales_deltas
+    ]
+
+
+def build_daily_sales(document: dict[str, Any]) -> DailyItemSales:
+    return DailyItemSales(
+        day=document["day"].date(),
+        item_id=document["item"],
+        item_name=document["item_name"],
+        quantity=document["quantity"],
+    )
+
+
+@instrument_repository
+class PyMongoSalesRepository:
+    def __init__(
+        self,
+        mongo_connection: MongoConnection,
+        read_options: MongoReadOptions | None = None,
+    ):
+        database = mongo_connection.get_database()
+        self.mongo_connection = mongo_connection
+        self.collection = database["daily_item_sales"]
+        self.read_collection = (
+            database.get_collection(
+                "daily_item_sales", **read_options.to_collection_options()
+            )
+            if read_options
+            else self.collection
+        )
+
+    def increment_daily_sales(
+        self, daily_sales_deltas: list[DailyItemSales]
+    ) -> None:
+        if not daily_sales_deltas:
+            return
+
+        self.collection.bulk_write(
+            build_increment_operations(daily_sales_deltas),
+            ordered=False,
+            session=self.mongo_connection.get_current_session(),
+        )
+
+    def find_daily_sales(
+        self, first_day: date, last_day: date
+    ) -> list[DailyItemSales]:
+        documents = self.read_collection.find(
+            build_daily_sales_query(first_day, last_day)
+        ).sort(DAILY_ITEM_SALES_SORT)
+        return [build_daily_sales(document) for document in documents]
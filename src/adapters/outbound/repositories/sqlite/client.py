@@ -0,0 +1,42 @@
+from bson import ObjectId
+from pydantic_mongo import ObjectIdField
+
+from src.adapters.outbound.repositories.sqlite.connection import (
+    SQLiteConnection,
+)
+from src.domain.entities.client import Client
+
+FIND_CLIENT_BY_NAME = "SELECT id, name FROM clients WHERE name = ?"
+SAVE_CLIENT = (
+    "INSERT INTO clients (id, name) VALUES (?, ?) "
+    "ON CONFLICT (id) DO UPDATE SET name = excluded.name"
+)
+INSERT_CLIENT_IF_MISSING = (
+    "INSERT INTO clients (id, name) VALUES (?, ?) "
+    "ON CONFLICT (name) DO NOTHING"
+)
+
+
+class SQLiteClientRepository:
+    def __init__(self, sqlite_connection: SQLiteConnection):
+        self.connection = sqlite_connection
+
+    def find_client_by_name(self, client_name: str) -> Client | None:
+        row = self.connection.fetch_one(FIND_CLIENT_BY_NAME, (client_name,))
+        if row:
+            return Client(id=ObjectIdField(row[0]), name=row[1])
+        return None
+
+    def save(self, client: Client) -> None:
+        with self.connection.transaction() as connection:
+            connection.execute(SAVE_CLIENT, (str(client.id), client.name))
+
+    def get_or_create_by_name(self, client_name: str) -> Client:
+        with self.connection.transaction() as connection:
+            connection.execute(
+                INSERT_CLIENT_IF_MISSING, (str(ObjectId()), client_name)
+            )
+            row = connection.execute(
+                FIND_CLIENT_BY_NAME, (client_name,)
+            ).fetchone()
+        return Client(id=ObjectIdField(row[0]), name=row[1])
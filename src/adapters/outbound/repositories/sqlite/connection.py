@@ -0,0 +1,60 @@
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from src.adapters.outbound.repositories.sqlite.schema import ensure_schema
+
+
+class SQLiteConnection:
+    def __init__(self, database_path: str, cached_statements: int = 128):
+        self.database_path = database_path
+        # The bot runs its handlers on worker threads, so the connection is
+        # shared between them and every statement runs under this lock.
+        self.lock = threading.RLock()
+        self.connection = sqlite3.connect(
+            database_path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=cached_statements,
+        )
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        with self.transaction():
+            ensure_schema(self.connection)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        with self.lock:
+            # A transaction opened by the same thread is joined, not nested.
+            if self.connection.in_transaction:
+                yield self.connection
+                return
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.connection
+            except BaseException:
+                self.connection.rollback()
+                raise
+            self.connection.commit()
+
+    def fetch_one(
+        self, statement: str, parameters: tuple[Any, ...] = ()
+    ) -> tuple[Any, ...] | None:
+        with self.lock:
+            return self.connection.execute(statement, parameters).fetchone()
+
+    def fetch_all(
+        self, statement: str, parameters: tuple[Any, ...] = ()
+    ) -> list[tuple[Any, ...]]:
+        with self.lock:
+            return self.connection.execute(statement, parameters).fetchall()
+
+    def get_journal_mode(self) -> str:
+        return self.fetch_one("PRAGMA journal_mode")[0]  # type: ignore
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
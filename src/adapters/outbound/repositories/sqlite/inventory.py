@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from typing import Any
+
+from pydantic_mongo import ObjectIdField
+
+from src.adapters.outbound.repositories.sqlite.connection import (
+    SQLiteConnection,
+)
+from src.adapters.outbound.repositories.sqlite.order import format_datetime
+from src.domain.entities.inventory import (
+    InventoryMovement,
+    InventorySnapshot,
+    InventorySnapshotItem,
+)
+
+INSERT_MOVEMENT = (
+    "INSERT INTO inventory_movements (id, item_id, item_name, reason, "
+    "quantity_delta, inventory_quantity, order_id, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+SELECT_MOVEMENTS = (
+    "SELECT id, item_id, item_name, reason, quantity_delta, "
+    "inventory_quantity, order_id, created_at FROM inventory_movements"
+)
+FIND_MOVEMENTS_UNTIL = (
+    f"{SELECT_MOVEMENTS} WHERE created_at <= ? ORDER BY created_at, id"
+)
+FIND_MOVEMENTS_BETWEEN = (
+    f"{SELECT_MOVEMENTS} WHERE created_at > ? AND created_at <= ? "
+    "ORDER BY created_at, id"
+)
+INSERT_SNAPSHOT = (
+    "INSERT INTO inventory_snapshots (id, taken_at, items) VALUES (?, ?, ?)"
+)
+FIND_LATEST_SNAPSHOT = (
+    "SELECT id, taken_at, items FROM inventory_snapshots "
+    "WHERE taken_at <= ? ORDER BY taken_at DESC LIMIT 1"
+)
+
+
+def build_movement(row: tuple[Any, ...]) -> InventoryMovement:
+    return InventoryMovement(
+        id=ObjectIdField(row[0]),
+        item_id=ObjectIdField(row[1]),
+        item_name=row[2],
+        reason=row[3],
+        quantity_delta=row[4],
+        inventory_quantity=row[5],
+        order_id=ObjectIdField(row[6]) if row[6] else None,
+        created_at=datetime.fromisoformat(row[7]),
+    )
+
+
+def build_snapshot(row: tuple[Any, ...]) -> InventorySnapshot:
+    return InventorySnapshot(
+        id=ObjectIdField(row[0]),
+        taken_at=datetime.fromisoformat(row[1]),
+        items=[
+            InventorySnapshotItem(
+                item_id=ObjectIdField(item_id),
+                item_name=item_name,
+                inventory_quantity=inventory_quantity,
+            )
+            for item_id, item_name, inventory_quantity in json.loads(row[2])
+        ],
+    )
+
+
+class SQLiteInventoryLedgerRepository:
+    def __init__(self, sqlite_connection: SQLiteConnection):
+        self.connection = sqlite_connection
+
+    def append_movements(self, movements: list[InventoryMovement]) -> None:
+        if not movements:
+            return
+
+        with self.connection.transaction() as connection:
+            connection.executemany(
+                INSERT_MOVEMENT,
+                [
+                    (
+                        str(movement.id),
+                        str(movement.item_id),
+                        movement.item_name,
+                        movement.reason.value,
+                        movement.quantity_delta,
+                        movement.inventory_quantity,
+                        str(movement.order_id) if movement.order_id else None,
+                        format_datetime(movement.created_at),
+                    )
+                    for movement in movements
+                ],
+            )
+
+    def find_movements(
+        self, created_after: datetime | None, created_until: datetime
+    ) -> list[InventoryMovement]:
+        if created_after is None:
+            rows = self.connection.fetch_all(
+                FIND_MOVEMENTS_UNTIL, (format_datetime(created_until),)
+            )
+        else:
+            rows = self.connection.fetch_all(
+                FIND_MOVEMENTS_BETWEEN,
+                (
+                    format_datetime(created_after),
+                    format_datetime(created_until),
+                ),
+            )
+        return [build_movement(row) for row in rows]
+
+    def save_snapshot(self, snapshot: InventorySnapshot) -> None:
+        items = [
+            [str(item.item_id), item.item_name, item.inventory_quantity]
+            for item in snapshot.items
+        ]
+        with self.connection.transaction() as connection:
+            connection.execute(
+                INSERT_SNAPSHOT,
+                (
+                    str(snapshot.id),
+                    format_datetime(snapshot.taken_at),
+                    json.dumps(items),
+                ),
+            )
+
+    def find_latest_snapshot(
+        self, taken_until: datetime
+    ) -> InventorySnapshot | None:
+        row = self.connection.fetch_one(
+            FIND_LATEST_SNAPSHOT, (format_datetime(taken_until),)
+        )
+        return build_snapshot(row) if row else None
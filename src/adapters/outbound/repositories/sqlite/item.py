@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterator
+from typing import Any
+
+from bson import ObjectId
+from pydantic_mongo import ObjectIdField
+
+from src.adapters.outbound.repositories.sqlite.connection import (
+    SQLiteConnection,
+)
+from src.domain.entities.item import Item
+from src.domain.exceptions import (
+    InsufficientInventoryError,
+    ItemAlreadyExistsError,
+)
+from src.domain.ports.outbound.repositories.item import SaveAllItemsResult
+
+# Lists are bound as a single JSON parameter, so every statement keeps the
+# same text and stays in the connection's prepared statement cache.
+ITEM_COLUMNS = "id, name, inventory_quantity, low_stock_threshold"
+FIND_ITEM_BY_NAME = f"SELECT {ITEM_COLUMNS} FROM items WHERE name = ?"
+FIND_ITEMS_BY_NAMES = (
+    f"SELECT {ITEM_COLUMNS} FROM items "
+    "WHERE name IN (SELECT value FROM json_each(?))"
+)
+FIND_ITEMS_BY_IDS = (
+    "SELECT id, inventory_quantity FROM items "
+    "WHERE id IN (SELECT value FROM json_each(?))"
+)
+GET_ALL_ITEMS = f"SELECT {ITEM_COLUMNS} FROM items"
+ITER_ITEMS_AFTER_NAME = f"{GET_ALL_ITEMS} WHERE name > ? ORDER BY name LIMIT ?"
+# Matches the items_low_stock partial index condition word for word.
+FIND_LOW_STOCK_ITEMS = (
+    f"{GET_ALL_ITEMS} WHERE inventory_quantity <= low_stock_threshold "
+    "ORDER BY name"
+)
+REMOVE_ITEM_BY_NAME = "DELETE FROM items WHERE name = ?"
+SAVE_ITEM = (
+    f"INSERT INTO items ({ITEM_COLUMNS}) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (id) DO UPDATE SET "
+    "name = excluded.name, inventory_quantity = excluded.inventory_quantity, "
+    "low_stock_threshold = excluded.low_stock_threshold"
+)
+COUNT_ITEMS_BY_NAMES = (
+    "SELECT COUNT(*) FROM items WHERE name IN (SELECT value FROM json_each(?))"
+)
+UPSERT_ITEM_BY_NAME = (
+    f"INSERT INTO items ({ITEM_COLUMNS}) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (name) DO UPDATE SET "
+    "inventory_quantity = excluded.inventory_quantity, "
+    "low_stock_threshold = excluded.low_stock_threshold "
+    "WHERE inventory_quantity != excluded.inventory_quantity "
+    "OR low_stock_threshold != excluded.low_stock_threshold"
+)
+INCREMENT_INVENTORY_QUANTITY = (
+    "UPDATE items SET inventory_quantity = inventory_quantity + ? "
+    "WHERE id = ?"
+)
+# Takes {item id: quantity} and decrements only the items with enough
+# stock, returning the ones it went through.
+DECREMENT_INVENTORY_QUANTITIES = (
+    "UPDATE items "
+    "SET inventory_quantity = inventory_quantity - json_each.value "
+    "FROM json_each(?) "
+    "WHERE items.id = json_each.key "
+    "AND items.inventory_quantity >= json_each.value "
+    "RETURNING items.id, items.inventory_quantity"
+)
+FIND_ITEMS_NAMES_BY_IDS = (
+    "SELECT id, name FROM items WHERE id IN (SELECT value FROM json_each(?))"
+)
+
+
+def build_item(row: tuple[Any, ...]) -> Item:
+    return Item(
+        id=ObjectIdField(row[0]),
+        name=row[1],
+        inventory_quantity=row[2],
+        low_stock_threshold=row[3],
+    )
+
+
+def build_item_parameters(item: Item) -> tuple[Any, ...]:
+    return (
+        str(item.id),
+        item.name,
+        item.inventory_quantity,
+        item.low_stock_threshold,
+    )
+
+
+class SQLiteItemRepository:
+    def __init__(self, sqlite_connection: SQLiteConnection):
+        self.connection = sqlite_connection
+
+    def find_item_by_name(self, item_name: str) -> Item | None:
+        row = self.connection.fetch_one(FIND_ITEM_BY_NAME, (item_name,))
+        return build_item(row) if row else None
+
+    def find_items_by_names(self, items_names: list[str]) -> list[Item]:
+        rows = self.connection.fetch_all(
+            FIND_ITEMS_BY_NAMES, (json.dumps(items_names),)
+        )
+        return [build_item(row) for row in rows]
+
+    def get_all(self) -> list[Item]:
+        return [
+            build_item(row) for row in self.connection.fetch_all(GET_ALL_ITEMS)
+        ]
+
+    def iter_items(self, batch_size: int) -> Iterator[Item]:
+        # Each batch seeks past the last name on the unique index, so the
+        # connection lock is never held while the caller consumes items.
+        last_name = ""
+        while rows := self.connection.fetch_all(
+            ITER_ITEMS_AFTER_NAME, (last_name, batch_size)
+        ):
+            for row in rows:
+                yield build_item(row)
+            last_name = rows[-1][1]
+
+    def find_low_stock_items(self) -> list[Item]:
+        return [
+            build_item(row)
+            for row in self.connection.fetch_all(FIND_LOW_STOCK_ITEMS)
+        ]
+
+    def remove_item_by_name(self, item_name: str) -> None:
+        with self.connection.transaction() as connection:
+            connection.execute(REMOVE_ITEM_BY_NAME, (item_name,))
+
+    def save(self, item: Item) -> None:
+        try:
+            with self.connection.transaction() as connection:
+                connection.execute(SAVE_ITEM, build_item_parameters(item))
+        except sqlite3.IntegrityError as error:
+            raise ItemAlreadyExistsError(item.name) from error
+
+    def save_all(self, items: list[Item]) -> SaveAllItemsResult:
+        if not items:
+            return SaveAllItemsResult(inserted_count=0, modified_count=0)
+
+        items_by_name = {item.name: item for item in items}
+        with self.connection.transaction() as connection:
+            (existing_count,) = connection.execute(
+                COUNT_ITEMS_BY_NAMES, (json.dumps(list(items_by_name)),)
+            ).fetchone()
+            # Unchanged rows are skipped by the upsert's WHERE clause, so the
+            # row count only covers inserted and modified items.
+            changed_count = connection.executemany(
+                UPSERT_ITEM_BY_NAME,
+                map(build_item_parameters, items_by_name.values()),
+            ).rowcount
+        inserted_count = len(items_by_name) - existing_count
+        return SaveAllItemsResult(
+            inserted_count=inserted_count,
+            modified_count=changed_count - inserted_count,
+        )
+
+    def increment_inventory_quantities(
+        self, quantity_deltas_by_item_id: dict[ObjectId, int]
+    ) -> dict[ObjectId, int]:
+        if not quantity_deltas_by_item_id:
+            return {}
+
+        with self.connection.transaction() as connection:
+            connection.executemany(
+                INCREMENT_INVENTORY_QUANTITY,
+                [
+                    (quantity_delta, str(item_id))
+                    for item_id, quantity_delta in (
+                        quantity_deltas_by_item_id.items()
+                    )
+                ],
+            )
+            rows = connection.execute(
+                FIND_ITEMS_BY_IDS,
+                (
+                    json.dumps(
+                        [
+                            str(item_id)
+                            for item_id in quantity_deltas_by_item_id
+                        ]
+                    ),
+                ),
+            ).fetchall()
+        return {ObjectId(row[0]): row[1] for row in rows}
+
+    def decrement_inventory_quantities(
+        self, quantities_by_item_id: dict[ObjectId, int]
+    ) -> dict[ObjectId, int]:
+        if not quantities_by_item_id:
+            return {}
+
+        with self.connection.transaction() as connection:
+            rows = connection.execute(
+                DECREMENT_INVENTORY_QUANTITIES,
+                (
+                    json.dumps(
+                        {
+                            str(item_id): quantity
+                            for item_id, quantity in (
+                                quantities_by_item_id.items()
+                            )
+                        }
+                    ),
+                ),
+            ).fetchall()
+            inventory_quantities_by_item_id = {
+                ObjectId(row[0]): row[1] for row in rows
+            }
+            short_item_ids = [
+                str(item_id)
+                for item_id in quantities_by_item_id
+                if item_id not in inventory_quantities_by_item_id
+            ]
+            if short_item_ids:
+                names_by_id = dict(
+                    connection.execute(
+                        FIND_ITEMS_NAMES_BY_IDS, (json.dumps(short_item_ids),)
+                    ).fetchall()
+                )
+                # Raising rolls the whole update back.
+                raise InsufficientInventoryError(
+                    [
+                        names_by_id.get(item_id, item_id)
+                        for item_id in short_item_ids
+                    ]
+                )
+        return inventory_quantities_by_item_id
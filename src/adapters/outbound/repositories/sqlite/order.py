@@ -0,0 +1,431 @@
+import json
+import sqlite3
+import zlib
+from datetime import datetime
+from typing import Any
+
+from bson import ObjectId
+from pydantic_mongo import ObjectIdField
+
+from src.adapters.outbound.repositories.datetimes import to_naive_utc
+from src.adapters.outbound.repositories.sqlite.connection import (
+    SQLiteConnection,
+)
+from src.domain.entities.client import Client
+from src.domain.entities.item import Item
+from src.domain.entities.order import Order, OrderItem
+from src.domain.exceptions import (
+    OrderAlreadyExistsError,
+    OrdersAlreadyCancelledError,
+)
+from src.domain.ports.outbound.repositories.order import (
+    OrderCursor,
+    OrderFilter,
+)
+
+ORDER_COLUMNS = (
+    "orders.id, orders.external_id, orders.brand, clients.id, clients.name, "
+    "orders.external_created_at, orders.created_at, orders.updated_at, "
+    "orders.is_cancelled"
+)
+SELECT_ORDERS = (
+    f"SELECT {ORDER_COLUMNS} FROM orders "
+    "LEFT JOIN clients ON clients.id = orders.client_id"
+)
+FIND_ORDER_BY_ID = f"{SELECT_ORDERS} WHERE orders.id = ?"
+FIND_ORDER_BY_EXTERNAL_ID = (
+    f"{SELECT_ORDERS} WHERE orders.brand = ? AND orders.external_id = ?"
+)
+FIND_ORDERS_BY_IDS = (
+    f"{SELECT_ORDERS} WHERE orders.id IN (SELECT value FROM json_each(?))"
+)
+# Manual and legacy orders have no brand, hence IS rather than =.
+FIND_ORDERS_BY_EXTERNAL_IDS = (
+    f"{SELECT_ORDERS} WHERE orders.brand IS ? "
+    "AND orders.external_id IN (SELECT value FROM json_each(?))"
+)
+CANCEL_ORDERS = (
+    "UPDATE orders SET is_cancelled = 1, updated_at = ? "
+    "WHERE id IN (SELECT value FROM json_each(?)) AND is_cancelled = 0 "
+    "RETURNING id"
+)
+# Like the Mongo lookups: items are read as they are now, and lines of items
+# removed from the catalog are skipped by the inner join.
+FIND_ORDER_LINES = (
+    "SELECT order_lines.order_id, order_lines.quantity, items.id, "
+    "items.name, items.inventory_quantity FROM order_lines "
+    "JOIN items ON items.id = order_lines.item_id "
+    "WHERE order_lines.order_id IN (SELECT value FROM json_each(?)) "
+    "ORDER BY order_lines.order_id, order_lines.position"
+)
+ORDER_FILTER_CONDITIONS = {
+    "created_from": "orders.created_at >= ?",
+    "created_until": "orders.created_at < ?",
+    "client_id": "orders.client_id = ?",
+    "is_cancelled": "orders.is_cancelled = ?",
+}
+SAVE_ORDER = (
+    "INSERT INTO orders (id, external_id, brand, client_id, "
+    "external_created_at, created_at, updated_at, is_cancelled) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (id) DO UPDATE SET "
+    "external_id = excluded.external_id, brand = excluded.brand, "
+    "client_id = excluded.client_id, "
+    "external_created_at = excluded.external_created_at, "
+    "created_at = excluded.created_at, updated_at = excluded.updated_at, "
+    "is_cancelled = excluded.is_cancelled"
+)
+DELETE_ORDER_LINES = "DELETE FROM order_lines WHERE order_id = ?"
+FIND_ORDERS_TO_ARCHIVE = (
+    "SELECT id, external_id, brand, client_id, external_created_at, "
+    "created_at, updated_at, is_cancelled FROM orders"
+)
+FIND_ORDER_LINES_TO_ARCHIVE = (
+    "SELECT order_id, item_id, item_name, quantity FROM order_lines "
+    "WHERE order_id IN (SELECT value FROM json_each(?)) "
+    "ORDER BY order_id, position"
+)
+ARCHIVE_ORDER = (
+    "INSERT INTO orders_archive (id, document) VALUES (?, ?) "
+    "ON CONFLICT (id) DO UPDATE SET document = excluded.document"
+)
+# Lines go with the order through ON DELETE CASCADE.
+DELETE_ORDER = "DELETE FROM orders WHERE id = ?"
+FIND_ARCHIVED_ORDER = "SELECT document FROM orders_archive WHERE id = ?"
+FIND_ARCHIVED_ORDER_CLIENT = "SELECT id, name FROM clients WHERE id = ?"
+FIND_ARCHIVED_ORDER_ITEMS = (
+    "SELECT id, name, inventory_quantity FROM items "
+    "WHERE id IN (SELECT value FROM json_each(?))"
+)
+INSERT_ORDER_LINE = (
+    "INSERT INTO order_lines (order_id, position, item_id, item_name, "
+    "quantity) VALUES (?, ?, ?, ?, ?)"
+)
+
+
+def format_datetime(value: datetime) -> str:
+    # Fixed width, so that the text order of the column is the time order.
+    return to_naive_utc(value).isoformat(timespec="microseconds")
+
+
+def build_order_filter_conditions(
+    order_filter: OrderFilter,
+) -> tuple[list[str], list[Any]]:
+    # Only the conditions in use are written out, so the planner can seek
+    # on an index; the few statement variants all fit the statement cache.
+    conditions = []
+    parameters: list[Any] = []
+    for field, condition in ORDER_FILTER_CONDITIONS.items():
+        value = getattr(order_filter, field)
+        if value is None:
+            continue
+        conditions.append(condition)
+        if isinstance(value, datetime):
+            parameters.append(format_datetime(value))
+        else:
+            parameters.append(value if isinstance(value, bool) else str(value))
+    return conditions, parameters
+
+
+def build_order_page_statement(
+    order_filter: OrderFilter,
+    after: OrderCursor | None = None,
+    before: OrderCursor | None = None,
+) -> tuple[str, list[Any]]:
+    conditions, parameters = build_order_filter_conditions(order_filter)
+    order_by = "DESC"
+    cursor = after or before
+    if cursor is not None:
+        operator = "<" if after is not None else ">"
+        conditions.append(f"(orders.created_at, orders.id) {operator} (?, ?)")
+        parameters += [
+            format_datetime(cursor.created_at),
+            str(cursor.order_id),
+        ]
+        order_by = "DESC" if after is not None else "ASC"
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    return (
+        f"{SELECT_ORDERS}{where} "
+        f"ORDER BY orders.created_at {order_by}, orders.id {order_by} LIMIT ?",
+        parameters,
+    )
+
+
+def build_orders_to_archive_statement(
+    order_filter: OrderFilter,
+) -> tuple[str, list[Any]]:
+    conditions, parameters = build_order_filter_conditions(order_filter)
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    return (
+        f"{FIND_ORDERS_TO_ARCHIVE}{where} "
+        "ORDER BY orders.created_at, orders.id LIMIT ?",
+        parameters,
+    )
+
+
+def build_archive_document(
+    row: tuple[Any, ...], line_rows: list[tuple[Any, ...]]
+) -> bytes:
+    document = {
+        "external_id": row[1],
+        "brand": row[2],
+        "client_id": row[3],
+        "external_created_at": row[4],
+        "created_at": row[5],
+        "updated_at": row[6],
+        "is_cancelled": bool(row[7]),
+        "lines": [
+            {
+                "item_id": line_row[1],
+                "item_name": line_row[2],
+                "quantity": line_row[3],
+            }
+            for line_row in line_rows
+        ],
+    }
+    return zlib.compress(json.dumps(document).encode())
+
+
+class SQLiteOrderRepository:
+    def __init__(self, sqlite_connection: SQLiteConnection):
+        self.connection = sqlite_connection
+
+    def _build_orders(self, rows: list[tuple[Any, ...]]) -> list[Order]:
+        order_items_by_order_id: dict[str, list[OrderItem]] = {
+            row[0]: [] for row in rows
+        }
+        line_rows = self.connection.fetch_all(
+            FIND_ORDER_LINES, (json.dumps(list(order_items_by_order_id)),)
+        )
+        for line_row in line_rows:
+            order_items_by_order_id[line_row[0]].append(
+                OrderItem(
+                    quantity=line_row[1],
+                    item=Item(
+                        id=ObjectIdField(line_row[2]),
+                        name=line_row[3],
+                        inventory_quantity=line_row[4],
+                    ),
+                )
+            )
+        return [
+            Order(
+                id=ObjectIdField(row[0]),
+                external_id=row[1],
+                brand=row[2],
+                client=(
+                    Client(id=ObjectIdField(row[3]), name=row[4])
+                    if row[3]
+                    else None
+                ),
+                external_created_at=row[5],
+                created_at=datetime.fromisoformat(row[6]),
+                updated_at=datetime.fromisoformat(row[7]),
+                is_cancelled=bool(row[8]),
+                order_items=order_items_by_order_id[row[0]],
+            )
+            for row in rows
+        ]
+
+    def _find_order(
+        self, statement: str, parameters: tuple[Any, ...]
+    ) -> None | Order:
+        with self.connection.lock:
+            row = self.connection.fetch_one(statement, parameters)
+            if row is None:
+                return None
+            return self._build_orders([row])[0]
+
+    def _find_archived_order(self, order_id: ObjectId) -> None | Order:
+        with self.connection.lock:
+            row = self.connection.fetch_one(
+                FIND_ARCHIVED_ORDER, (str(order_id),)
+            )
+            if row is None:
+                return None
+            document = json.loads(zlib.decompress(row[0]))
+            client_row = (
+                self.connection.fetch_one(
+                    FIND_ARCHIVED_ORDER_CLIENT, (document["client_id"],)
+                )
+                if document["client_id"]
+                else None
+            )
+            item_rows = self.connection.fetch_all(
+                FIND_ARCHIVED_ORDER_ITEMS,
+                (json.dumps([line["item_id"] for line in document["lines"]]),),
+            )
+        items_by_id = {
+            item_row[0]: Item(
+                id=ObjectIdField(item_row[0]),
+                name=item_row[1],
+                inventory_quantity=item_row[2],
+            )
+            for item_row in item_rows
+        }
+        return Order(
+            id=ObjectIdField(order_id),
+            external_id=document["external_id"],
+            brand=document["brand"],
+            client=(
+                Client(id=ObjectIdField(client_row[0]), name=client_row[1])
+                if client_row
+                else None
+            ),
+            external_created_at=document["external_created_at"],
+            created_at=datetime.fromisoformat(document["created_at"]),
+            updated_at=datetime.fromisoformat(document["updated_at"]),
+            is_cancelled=document["is_cancelled"],
+            order_items=[
+                OrderItem(
+                    quantity=line["quantity"],
+                    item=items_by_id[line["item_id"]],
+                )
+                for line in document["lines"]
+                if line["item_id"] in items_by_id
+            ],
+        )
+
+    def find_order_by_id(self, order_id: ObjectId) -> None | Order:
+        return self._find_order(
+            FIND_ORDER_BY_ID, (str(order_id),)
+        ) or self._find_archived_order(order_id)
+
+    def find_order_by_external_id(
+        self, brand: str, external_id: int
+    ) -> None | Order:
+        return self._find_order(
+            FIND_ORDER_BY_EXTERNAL_ID, (brand, external_id)
+        )
+
+    def _find_orders(
+        self, statement: str, parameters: tuple[Any, ...]
+    ) -> list[Order]:
+        with self.connection.lock:
+            rows = self.connection.fetch_all(statement, parameters)
+            return self._build_orders(rows)
+
+    def find_orders_by_ids(self, order_ids: list[ObjectId]) -> list[Order]:
+        return self._find_orders(
+            FIND_ORDERS_BY_IDS,
+            (json.dumps([str(order_id) for order_id in order_ids]),),
+        )
+
+    def find_orders_by_external_ids(
+        self, brand: str | None, external_ids: list[int]
+    ) -> list[Order]:
+        return self._find_orders(
+            FIND_ORDERS_BY_EXTERNAL_IDS, (brand, json.dumps(external_ids))
+        )
+
+    def find_orders(
+        self,
+        order_filter: OrderFilter,
+        limit: int,
+        after: OrderCursor | None = None,
+        before: OrderCursor | None = None,
+    ) -> list[Order]:
+        statement, parameters = build_order_page_statement(
+            order_filter, after, before
+        )
+        with self.connection.lock:
+            rows = self.connection.fetch_all(statement, (*parameters, limit))
+            orders = self._build_orders(rows)
+        if before is not None:
+            orders.reverse()
+        return orders
+
+    def save(self, order: Order) -> None:
+        order_id = str(order.id)
+        try:
+            with self.connection.transaction() as connection:
+                connection.execute(
+                    SAVE_ORDER,
+                    (
+                        order_id,
+                        order.external_id,
+                        order.brand,
+                        str(order.client.id) if order.client else None,
+                        order.external_created_at,
+                        format_datetime(order.created_at),
+                        format_datetime(order.updated_at),
+                        order.is_cancelled,
+                    ),
+                )
+                connection.execute(DELETE_ORDER_LINES, (order_id,))
+                connection.executemany(
+                    INSERT_ORDER_LINE,
+                    [
+                        (
+                            order_id,
+                            position,
+                            str(order_item.item.id),
+                            order_item.item.name,
+                            order_item.quantity,
+                        )
+                        for position, order_item in enumerate(
+                            order.order_items
+                        )
+                    ],
+                )
+        except sqlite3.IntegrityError as error:
+            raise OrderAlreadyExistsError(
+                order.brand,  # type: ignore
+                order.external_id,  # type: ignore
+            ) from error
+
+    def cancel_orders(
+        self, order_ids: list[ObjectId], cancelled_at: datetime
+    ) -> None:
+        order_id_strings = [str(order_id) for order_id in order_ids]
+        # Raising inside the transaction rolls back the orders it did set.
+        with self.connection.transaction() as connection:
+            cancelled_order_ids = {
+                row[0]
+                for row in connection.execute(
+                    CANCEL_ORDERS,
+                    (
+                        format_datetime(cancelled_at),
+                        json.dumps(order_id_strings),
+                    ),
+                )
+            }
+            if len(cancelled_order_ids) != len(set(order_id_strings)):
+                raise OrdersAlreadyCancelledError(
+                    [
+                        order_id
+                        for order_id, order_id_string in zip(
+                            order_ids, order_id_strings, strict=True
+                        )
+                        if order_id_string not in cancelled_order_ids
+                    ]
+                )
+
+    def archive_orders(self, order_filter: OrderFilter, limit: int) -> int:
+        statement, parameters = build_orders_to_archive_statement(order_filter)
+        with self.connection.transaction() as connection:
+            rows = connection.execute(
+                statement, (*parameters, limit)
+            ).fetchall()
+            line_rows_by_order_id: dict[str, list[tuple[Any, ...]]] = {
+                row[0]: [] for row in rows
+            }
+            for line_row in connection.execute(
+                FIND_ORDER_LINES_TO_ARCHIVE,
+                (json.dumps(list(line_rows_by_order_id)),),
+            ):
+                line_rows_by_order_id[line_row[0]].append(line_row)
+            connection.executemany(
+                ARCHIVE_ORDER,
+                [
+                    (
+                        row[0],
+                        build_archive_document(
+                            row, line_rows_by_order_id[row[0]]
+                        ),
+                    )
+                    for row in rows
+                ],
+            )
+            connection.executemany(DELETE_ORDER, [(row[0],) for row in rows])
+        return len(rows)
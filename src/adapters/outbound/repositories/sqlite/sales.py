@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Any
+
+from pydantic_mongo import ObjectIdField
+
+from src.adapters.outbound.repositories.sqlite.connection import (
+    SQLiteConnection,
+)
+from src.domain.entities.sales import DailyItemSales
+
+INCREMENT_DAILY_SALES = (
+    "INSERT INTO daily_item_sales (day, item_id, item_name, quantity) "
+    "VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (day, item_id) DO UPDATE SET "
+    "item_name = excluded.item_name, "
+    "quantity = quantity + excluded.quantity"
+)
+FIND_DAILY_SALES = (
+    "SELECT day, item_id, item_name, quantity FROM daily_item_sales "
+    "WHERE day BETWEEN ? AND ? ORDER BY day, item_name"
+)
+
+
+def build_daily_sales(row: tuple[Any, ...]) -> DailyItemSales:
+    return DailyItemSales(
+        day=date.fromisoformat(row[0]),
+        item_id=ObjectIdField(row[1]),
+        item_name=row[2],
+        quantity=row[3],
+    )
+
+
+class SQLiteSalesRepository:
+    def __init__(self, sqlite_connection: SQLiteConnection):
+        self.connection = sqlite_connection
+
+    def increment_daily_sales(
+        self, daily_sales_deltas: list[DailyItemSales]
+    ) -> None:
+        if not daily_sales_deltas:
+            return
+
+        with self.connection.transaction() as connection:
+            connection.executemany(
+                INCREMENT_DAILY_SALES,
+                [
+                    (
+                        daily_sales_delta.day.isoformat(),
+                        str(daily_sales_delta.item_id),
+                        daily_sales_delta.item_name,
+                        daily_sales_delta.quantity,
+                    )
+                    for daily_sales_delta in daily_sales_deltas
+                ],
+            )
+
+    def find_daily_sales(
+        self, first_day: date, last_day: date
+    ) -> list[DailyItemSales]:
+        rows = self.connection.fetch_all(
+            FIND_DAILY_SALES, (first_day.isoformat(), last_day.isoformat())
+        )
+        return [build_daily_sales(row) for row in rows]
@@ -0,0 +1,139 @@
+import sqlite3
+
+SCHEMA: list[str] = [
+    """
+    CREATE TABLE IF NOT EXISTS items (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL UNIQUE,
+        inventory_quantity INTEGER NOT NULL,
+        low_stock_threshold INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS clients (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL UNIQUE
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS orders (
+        id TEXT PRIMARY KEY,
+        external_id INTEGER,
+        brand TEXT,
+        client_id TEXT,
+        external_created_at TEXT,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        is_cancelled INTEGER NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS orders_external_id ON orders (external_id)",
+    # Goomer numbers orders per brand; manual and legacy orders have no brand
+    # and are left out of the index.
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS orders_brand_external_id_unique
+    ON orders (brand, external_id) WHERE brand IS NOT NULL
+    """,
+    # Order history pages seek on (created_at, id); the id tie-break keeps
+    # the keyset stable for orders created in the same instant.
+    "DROP INDEX IF EXISTS orders_created_at",
+    """
+    CREATE INDEX IF NOT EXISTS orders_created_at_id
+    ON orders (created_at DESC, id DESC)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS orders_client_created_at_id
+    ON orders (client_id, created_at DESC, id DESC)
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS order_lines (
+        order_id TEXT NOT NULL REFERENCES orders (id) ON DELETE CASCADE,
+        position INTEGER NOT NULL,
+        item_id TEXT NOT NULL,
+        item_name TEXT NOT NULL,
+        quantity INTEGER NOT NULL,
+        PRIMARY KEY (order_id, position)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS order_lines_item_id ON order_lines (item_id)",
+    # One rollup row per (day, item); reports read a range of days.
+    """
+    CREATE TABLE IF NOT EXISTS daily_item_sales (
+        day TEXT NOT NULL,
+        item_id TEXT NOT NULL,
+        item_name TEXT NOT NULL,
+        quantity INTEGER NOT NULL,
+        PRIMARY KEY (day, item_id)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS inventory_movements (
+        id TEXT PRIMARY KEY,
+        item_id TEXT NOT NULL,
+        item_name TEXT NOT NULL,
+        reason TEXT NOT NULL,
+        quantity_delta INTEGER NOT NULL,
+        inventory_quantity INTEGER,
+        order_id TEXT,
+        created_at TEXT NOT NULL
+    )
+    """,
+    # Stock is rebuilt from the latest snapshot plus the movements after it,
+    # read in (created_at, id) order.
+    """
+    CREATE INDEX IF NOT EXISTS inventory_movements_created_at_id
+    ON inventory_movements (created_at, id)
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS inventory_snapshots (
+        id TEXT PRIMARY KEY,
+        taken_at TEXT NOT NULL,
+        items TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS inventory_snapshots_taken_at
+    ON inventory_snapshots (taken_at)
+    """,
+    # Archived orders are only read by id, so each one is kept as a single
+    # compressed JSON document, lines included.
+    """
+    CREATE TABLE IF NOT EXISTS orders_archive (
+        id TEXT PRIMARY KEY,
+        document BLOB NOT NULL
+    )
+    """,
+]
+
+# Columns added after their table was first created, as (table, column,
+# definition); databases created before them get them on connect.
+ADDED_COLUMNS: list[tuple[str, str, str]] = [
+    ("items", "low_stock_threshold", "INTEGER NOT NULL DEFAULT 0"),
+]
+
+# Indexes over added columns, created once the columns exist.
+ADDED_COLUMNS_SCHEMA: list[str] = [
+    # Only the items at or below their threshold are indexed, so listing
+    # them reads those rows and not the catalog.
+    """
+    CREATE INDEX IF NOT EXISTS items_low_stock ON items (name)
+    WHERE inventory_quantity <= low_stock_threshold
+    """,
+]
+
+
+def ensure_schema(connection: sqlite3.Connection) -> None:
+    for statement in SCHEMA:
+        connection.execute(statement)
+    for table_name, column_name, definition in ADDED_COLUMNS:
+        column_names = {
+            row[1]
+            for row in connection.execute(f"PRAGMA table_info({table_name})")
+        }
+        if column_name not in column_names:
+            connection.execute(
+                f"ALTER TABLE {table_name} "
+                f"ADD COLUMN {column_name} {definition}"
+            )
+    for statement in ADDED_COLUMNS_SCHEMA:
+        connection.execute(statement)
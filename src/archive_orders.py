@@ -0,0 +1,57 @@
+import argparse
+import os
+import time
+from datetime import UTC, datetime, timedelta
+
+from src.domain.ports.inbound.orders.dtos import ArchiveOrdersInputDTO
+from src.domain.use_cases.archive_orders import ArchiveOrdersUseCase
+from src.main import build_repositories
+
+
+def archive_orders(
+    use_case: ArchiveOrdersUseCase,
+    input_dto: ArchiveOrdersInputDTO,
+    pause_seconds: float = 0,
+) -> int:
+    # Batches are archived until none is left, pausing in between so the
+    # bot keeps serving while this runs.
+    archived_count = 0
+    while batch_count := use_case.execute(input_dto).archived_count:
+        archived_count += batch_count
+        time.sleep(pause_seconds)
+    return archived_count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Move old and cancelled orders to the archive."
+    )
+    parser.add_argument(
+        "--age-days",
+        type=int,
+        default=int(os.getenv("ORDER_ARCHIVE_AGE_DAYS", "180")),
+    )
+    parser.add_argument(
+        "--cancelled-age-days",
+        type=int,
+        default=int(os.getenv("CANCELLED_ORDER_ARCHIVE_AGE_DAYS", "30")),
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--pause-seconds", type=float, default=0)
+    args = parser.parse_args()
+
+    repositories = build_repositories(
+        os.getenv("REPOSITORY_BACKEND", "mongoengine")
+    )
+    now = datetime.now(UTC)
+    archived_count = archive_orders(
+        ArchiveOrdersUseCase(repositories.order_repository),
+        ArchiveOrdersInputDTO(
+            created_before=now - timedelta(days=args.age_days),
+            cancelled_created_before=now
+            - timedelta(days=args.cancelled_age_days),
+            batch_size=args.batch_size,
+        ),
+        pause_seconds=args.pause_seconds,
+    )
+    print(f"Archived {archived_count} orders")
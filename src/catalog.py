@@ -0,0 +1,91 @@
+import argparse
+import os
+import sys
+from contextlib import nullcontext
+
+from src.adapters.inbound.files.catalog import (
+    CatalogFormat,
+    detect_catalog_format,
+    read_catalog_rows,
+    write_catalog,
+)
+from src.domain.unit_of_work import UnitOfWork
+from src.domain.use_cases.export_items import ExportItemsUseCase
+from src.domain.use_cases.import_items import ImportItemsUseCase
+from src.main import Repositories, build_repositories
+
+
+def import_catalog(
+    repositories: Repositories,
+    path: str,
+    catalog_format: CatalogFormat,
+    chunk_size: int,
+) -> None:
+    use_case = ImportItemsUseCase(
+        repositories.item_repository,
+        UnitOfWork(
+            repositories.item_repository,
+            transaction=repositories.transaction,
+            ledger_repository=repositories.ledger_repository,
+        ),
+    )
+    with open(path, newline="", encoding="utf-8") as file:
+        output_dto = use_case.execute(
+            read_catalog_rows(file, catalog_format), chunk_size
+        )
+    for error in output_dto.errors:
+        print(f"Line {error.line_number}: {error.message}", file=sys.stderr)
+    print(
+        f"Inserted {output_dto.inserted_count}, "
+        f"updated {output_dto.updated_count}, "
+        f"unchanged {output_dto.unchanged_count}, "
+        f"invalid {len(output_dto.errors)} items"
+    )
+
+
+def export_catalog(
+    repositories: Repositories,
+    path: str,
+    catalog_format: CatalogFormat,
+    batch_size: int,
+) -> None:
+    use_case = ExportItemsUseCase(repositories.read_only_item_repository)
+    with (
+        nullcontext(sys.stdout)
+        if path == "-"
+        else open(path, "w", newline="", encoding="utf-8")
+    ) as file:
+        written_count = write_catalog(
+            use_case.execute(batch_size), file, catalog_format
+        )
+    print(f"Exported {written_count} items", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Import or export the item catalog as CSV or NDJSON."
+    )
+    parser.add_argument("command", choices=["import", "export"])
+    parser.add_argument("path", help="File path, or - to export to stdout")
+    parser.add_argument(
+        "--format", choices=[str(value) for value in CatalogFormat]
+    )
+    parser.add_argument("--chunk-size", type=int, default=500)
+    args = parser.parse_args()
+
+    catalog_format = (
+        CatalogFormat(args.format)
+        if args.format
+        else detect_catalog_format(args.path)
+    )
+    repositories = build_repositories(
+        os.getenv("REPOSITORY_BACKEND", "mongoengine")
+    )
+    if args.command == "import":
+        import_catalog(
+            repositories, args.path, catalog_format, args.chunk_size
+        )
+    else:
+        export_catalog(
+            repositories, args.path, catalog_format, args.chunk_size
+        )
@@ -0,0 +1,77 @@
+from datetime import UTC, datetime
+from enum import StrEnum
+
+from pydantic import BaseModel, Field
+from pydantic_mongo import ObjectIdField
+
+from src.domain.entities.entity import Entity
+
+
+class InventoryMovementReason(StrEnum):
+    ORDER = "order"
+    CANCEL = "cancel"
+    SET = "set"
+    ADD = "add"
+    REMOVE = "remove"
+
+
+class InventoryMovement(Entity):
+    item_id: ObjectIdField
+    item_name: str
+    reason: InventoryMovementReason
+    quantity_delta: int
+    # Set, add and remove fix the stock to a known quantity, so replaying
+    # them does not depend on what the use case read beforehand.
+    inventory_quantity: int | None = None
+    order_id: ObjectIdField | None = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+
+
+class InventorySnapshotItem(BaseModel):
+    item_id: ObjectIdField
+    item_name: str
+    inventory_quantity: int
+
+
+class InventorySnapshot(Entity):
+    taken_at: datetime
+    items: list[InventorySnapshotItem]
+
+    @classmethod
+    def rebuild(
+        cls,
+        previous_snapshot: "InventorySnapshot | None",
+        movements: list[InventoryMovement],
+        taken_at: datetime,
+    ) -> "InventorySnapshot":
+        # Without a snapshot the whole ledger is replayed from nothing.
+        base_snapshot = previous_snapshot or cls(taken_at=taken_at, items=[])
+        return base_snapshot.apply_movements(movements, taken_at)
+
+    def apply_movements(
+        self, movements: list[InventoryMovement], taken_at: datetime
+    ) -> "InventorySnapshot":
+        items_by_id = {item.item_id: item.model_copy() for item in self.items}
+        for movement in movements:
+            if movement.reason == InventoryMovementReason.REMOVE:
+                items_by_id.pop(movement.item_id, None)
+                continue
+            item = items_by_id.setdefault(
+                movement.item_id,
+                InventorySnapshotItem(
+                    item_id=movement.item_id,
+                    item_name=movement.item_name,
+                    inventory_quantity=0,
+                ),
+            )
+            item.item_name = movement.item_name
+            if movement.inventory_quantity is None:
+                item.inventory_quantity += movement.quantity_delta
+            else:
+                item.inventory_quantity = movement.inventory_quantity
+        return InventorySnapshot(
+            taken_at=taken_at,
+            items=sorted(
+                items_by_id.values(), key=lambda item: item.item_name
+            ),
+        )
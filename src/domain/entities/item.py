@@ -4,6 +4,8 @@ from src.domain.entities.entity import Entity
 class Item(Entity):
     name: str
     inventory_quantity: int
+    # The item is low on stock once its quantity is down to this value.
+    low_stock_threshold: int = 0
 
     def decrease_inventory_quantity(self, quantity: int):
         self.inventory_quantity -= quantity
@@ -13,3 +15,9 @@ class Item(Entity):
 
     def set_inventory_quantity(self, quantity: int):
         self.inventory_quantity = quantity
+
+    def set_low_stock_threshold(self, threshold: int):
+        self.low_stock_threshold = threshold
+
+    def is_low_on_stock(self) -> bool:
+        return self.inventory_quantity <= self.low_stock_threshold
@@ -1,10 +1,15 @@
-from datetime import datetime
+from datetime import date, datetime
 
 from pydantic import BaseModel
 
 from src.domain.entities.client import Client
 from src.domain.entities.entity import Entity
+from src.domain.entities.inventory import (
+    InventoryMovement,
+    InventoryMovementReason,
+)
 from src.domain.entities.item import Item
+from src.domain.entities.sales import DailyItemSales, get_sales_day
 
 
 class OrderItem(BaseModel):
@@ -14,6 +19,7 @@ class OrderItem(BaseModel):
 
 class Order(Entity):
     external_id: int | None
+    brand: str | None = None
     external_created_at: str | None
     created_at: datetime
     updated_at: datetime
@@ -21,6 +27,37 @@ class Order(Entity):
     client: Client | None
     order_items: list[OrderItem]
 
-    def cancel(self):
+    def cancel(self, cancelled_at: datetime | None = None):
         self.is_cancelled = True
-        self.updated_at = datetime.now()
+        self.updated_at = cancelled_at or datetime.now()
+
+    def get_sales_day(self) -> date:
+        return get_sales_day(self.created_at)
+
+    def build_daily_sales(self) -> list[DailyItemSales]:
+        sales_day = self.get_sales_day()
+        return [
+            DailyItemSales(
+                day=sales_day,
+                item_id=order_item.item.id,
+                item_name=order_item.item.name,
+                quantity=order_item.quantity,
+            )
+            for order_item in self.order_items
+        ]
+
+    def build_inventory_movements(
+        self, reason: InventoryMovementReason
+    ) -> list[InventoryMovement]:
+        # Orders take stock out; cancelling one puts it back.
+        sign = 1 if reason == InventoryMovementReason.CANCEL else -1
+        return [
+            InventoryMovement(
+                item_id=order_item.item.id,
+                item_name=order_item.item.name,
+                reason=reason,
+                quantity_delta=sign * order_item.quantity,
+                order_id=self.id,
+            )
+            for order_item in self.order_items
+        ]
@@ -0,0 +1,22 @@
+from datetime import UTC, date, datetime
+from zoneinfo import ZoneInfo
+
+from pydantic import BaseModel
+from pydantic_mongo import ObjectIdField
+
+# Sales are booked on the restaurant's calendar day, not on the UTC one.
+SALES_TIMEZONE = ZoneInfo("America/Sao_Paulo")
+
+
+class DailyItemSales(BaseModel):
+    day: date
+    item_id: ObjectIdField
+    item_name: str
+    quantity: int
+
+
+def get_sales_day(created_at: datetime) -> date:
+    # Orders read back from a repository carry naive UTC datetimes.
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=UTC)
+    return created_at.astimezone(SALES_TIMEZONE).date()
@@ -19,6 +19,13 @@ class ItemsNotFoundByNameError(DomainException):
         self.items_names = items_names
 
 
+class InsufficientInventoryError(DomainException):
+    items_names: list[str]
+
+    def __init__(self, items_names: list[str]):
+        self.items_names = items_names
+
+
 class ItemAlreadyExistsError(DomainException):
     item_name: str
 
@@ -26,8 +33,24 @@ class ItemAlreadyExistsError(DomainException):
         self.item_name = item_name
 
 
+class OrderAlreadyExistsError(DomainException):
+    brand: str
+    external_order_id: int
+
+    def __init__(self, brand: str, external_order_id: int):
+        self.brand = brand
+        self.external_order_id = external_order_id
+
+
 class OrderNotFoundError(DomainException):
     order_id: ObjectId
 
     def __init__(self, order_id: ObjectId):
         self.order_id = order_id
+
+
+class OrdersAlreadyCancelledError(DomainException):
+    order_ids: list[ObjectId]
+
+    def __init__(self, order_ids: list[ObjectId]):
+        self.order_ids = order_ids
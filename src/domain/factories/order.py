@@ -18,6 +18,7 @@ class OrderFactory:
         now = datetime.now(ZoneInfo("America/Sao_Paulo"))
         return Order(
             external_id=input_dto.external_order_id,
+            brand=input_dto.brand,
             external_created_at=input_dto.external_created_at,
             created_at=now,
             updated_at=now,
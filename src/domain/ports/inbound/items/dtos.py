@@ -1,4 +1,9 @@
-from pydantic import BaseModel
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import BaseModel, Field, StringConstraints, field_validator
+
+from src.domain.text import clean_text
 
 
 class AddItemInputDTO(BaseModel):
@@ -44,3 +49,65 @@ class ItemOutputDTO(BaseModel):
 
 class ListItemsOutputDTO(BaseModel):
     items: list[ItemOutputDTO]
+
+
+class CatalogItemOutputDTO(BaseModel):
+    item_name: str
+    inventory_quantity: int
+    low_stock_threshold: int
+
+
+class ListLowStockItemsOutputDTO(BaseModel):
+    items: list[CatalogItemOutputDTO]
+
+
+class TakeInventorySnapshotInputDTO(BaseModel):
+    taken_at: datetime
+
+
+class TakeInventorySnapshotOutputDTO(BaseModel):
+    taken_at: datetime
+    items_count: int
+    movements_count: int
+
+
+class GetInventoryAtInputDTO(BaseModel):
+    at: datetime
+
+
+class GetInventoryAtOutputDTO(BaseModel):
+    at: datetime
+    items: list[ItemOutputDTO]
+
+
+class ImportItemRowInputDTO(BaseModel):
+    item_name: Annotated[
+        str, StringConstraints(strip_whitespace=True, min_length=1)
+    ]
+    inventory_quantity: int
+    # Left as it is when the file has no threshold for the item.
+    low_stock_threshold: int | None = Field(default=None, ge=0)
+
+    # Names are cleaned like the ones typed in the bot, so a row updates
+    # the item whatever its casing or accents.
+    @field_validator("item_name", mode="before")
+    @classmethod
+    def clean_item_name(cls, value):
+        return clean_text(value) if isinstance(value, str) else value
+
+    @field_validator("low_stock_threshold", mode="before")
+    @classmethod
+    def empty_threshold_to_none(cls, value):
+        return None if value == "" else value
+
+
+class ImportItemsErrorOutputDTO(BaseModel):
+    line_number: int
+    message: str
+
+
+class ImportItemsOutputDTO(BaseModel):
+    inserted_count: int = 0
+    updated_count: int = 0
+    unchanged_count: int = 0
+    errors: list[ImportItemsErrorOutputDTO] = Field(default_factory=list)
@@ -1,13 +1,21 @@
-from typing import Protocol
+from collections.abc import Iterable, Iterator
+from typing import Any, Protocol
 
 from src.domain.ports.inbound.items.dtos import (
     AddItemInputDTO,
     AddItemOutputDTO,
+    CatalogItemOutputDTO,
+    GetInventoryAtInputDTO,
+    GetInventoryAtOutputDTO,
+    ImportItemsOutputDTO,
     ListItemsOutputDTO,
+    ListLowStockItemsOutputDTO,
     RemoveItemInputDTO,
     RemoveItemOutputDTO,
     SetInventoryQuantityInputDTO,
     SetInventoryQuantityOutputDTO,
+    TakeInventorySnapshotInputDTO,
+    TakeInventorySnapshotOutputDTO,
 )
 
 
@@ -29,3 +37,31 @@ class SetInventoryQuantityPort(Protocol):
     def execute(
         self, input_dto: SetInventoryQuantityInputDTO
     ) -> SetInventoryQuantityOutputDTO: ...
+
+
+class TakeInventorySnapshotPort(Protocol):
+    def execute(
+        self, input_dto: TakeInventorySnapshotInputDTO
+    ) -> TakeInventorySnapshotOutputDTO: ...
+
+
+class GetInventoryAtPort(Protocol):
+    def execute(
+        self, input_dto: GetInventoryAtInputDTO
+    ) -> GetInventoryAtOutputDTO: ...
+
+
+class ImportItemsPort(Protocol):
+    def execute(
+        self, rows: Iterable[tuple[int, Any]], chunk_size: int = 500
+    ) -> ImportItemsOutputDTO: ...
+
+
+class ExportItemsPort(Protocol):
+    def execute(
+        self, batch_size: int = 500
+    ) -> Iterator[CatalogItemOutputDTO]: ...
+
+
+class ListLowStockItemsPort(Protocol):
+    def execute(self) -> ListLowStockItemsOutputDTO: ...
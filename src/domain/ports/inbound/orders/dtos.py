@@ -1,6 +1,10 @@
-from pydantic import BaseModel
+from datetime import datetime
+
+from pydantic import BaseModel, Field
 from pydantic_mongo import ObjectIdField
 
+from src.domain.ports.outbound.repositories.order import OrderCursor
+
 
 class OrderItemInputDTO(BaseModel):
     item_name: str
@@ -10,6 +14,7 @@ class OrderItemInputDTO(BaseModel):
 class CreateGoomerOrderInputDTO(BaseModel):
     client_name: str
     external_order_id: int
+    brand: str | None = None
     external_created_at: str
     items: list[OrderItemInputDTO]
 
@@ -25,6 +30,7 @@ class CreateGoomerOrderOutputDTO(BaseModel):
     client_name: str
     external_order_id: int
     order_items: list[CreateOrderItemOutputDTO]
+    is_duplicate: bool = False
 
 
 class CreateManualOrderInputDTO(BaseModel):
@@ -54,3 +60,57 @@ class CancelOrderOutputDTO(BaseModel):
     is_cancelled: bool
     created_at: str
     updated_at: str
+
+
+class CancelOrdersInputDTO(BaseModel):
+    order_ids: list[ObjectIdField] = Field(default_factory=list)
+    # Goomer numbers orders per brand.
+    brand: str | None = None
+    external_order_ids: list[int] = Field(default_factory=list)
+
+
+class CancelOrdersOutputDTO(BaseModel):
+    cancelled_orders: list[CancelOrderOutputDTO]
+    already_cancelled_order_ids: list[ObjectIdField]
+    not_found_order_ids: list[ObjectIdField]
+    not_found_external_order_ids: list[int]
+
+
+class ListOrdersInputDTO(BaseModel):
+    created_from: datetime | None = None
+    created_until: datetime | None = None
+    client_name: str | None = None
+    is_cancelled: bool | None = None
+    page_size: int = Field(default=5, ge=1, le=50)
+    after: OrderCursor | None = None
+    before: OrderCursor | None = None
+
+
+class ListOrdersItemOutputDTO(BaseModel):
+    item_name: str
+    quantity: int
+
+
+class ListOrdersOrderOutputDTO(BaseModel):
+    order_id: ObjectIdField
+    external_order_id: int | None
+    client_name: str | None
+    is_cancelled: bool
+    created_at: datetime
+    order_items: list[ListOrdersItemOutputDTO]
+
+
+class ListOrdersOutputDTO(BaseModel):
+    orders: list[ListOrdersOrderOutputDTO]
+    next_cursor: OrderCursor | None = None
+    previous_cursor: OrderCursor | None = None
+
+
+class ArchiveOrdersInputDTO(BaseModel):
+    created_before: datetime
+    cancelled_created_before: datetime | None = None
+    batch_size: int = Field(default=500, ge=1)
+
+
+class ArchiveOrdersOutputDTO(BaseModel):
+    archived_count: int
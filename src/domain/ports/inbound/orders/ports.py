@@ -1,12 +1,18 @@
 from typing import Protocol
 
 from src.domain.ports.inbound.orders.dtos import (
+    ArchiveOrdersInputDTO,
+    ArchiveOrdersOutputDTO,
     CancelOrderInputDTO,
     CancelOrderOutputDTO,
+    CancelOrdersInputDTO,
+    CancelOrdersOutputDTO,
     CreateGoomerOrderInputDTO,
     CreateGoomerOrderOutputDTO,
     CreateManualOrderInputDTO,
     CreateManualOrderOutputDTO,
+    ListOrdersInputDTO,
+    ListOrdersOutputDTO,
 )
 
 
@@ -26,3 +32,21 @@ class CancelOrderPort(Protocol):
     def execute(
         self, input_dto: CancelOrderInputDTO
     ) -> CancelOrderOutputDTO: ...
+
+
+class CancelOrdersPort(Protocol):
+    def execute(
+        self, input_dto: CancelOrdersInputDTO
+    ) -> CancelOrdersOutputDTO: ...
+
+
+class ListOrdersPort(Protocol):
+    def execute(
+        self, input_dto: ListOrdersInputDTO
+    ) -> ListOrdersOutputDTO: ...
+
+
+class ArchiveOrdersPort(Protocol):
+    def execute(
+        self, input_dto: ArchiveOrdersInputDTO
+    ) -> ArchiveOrdersOutputDTO: ...
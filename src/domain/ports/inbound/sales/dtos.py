@@ -0,0 +1,26 @@
+from datetime import date
+
+from pydantic import BaseModel, model_validator
+
+
+class SalesReportInputDTO(BaseModel):
+    first_day: date
+    last_day: date
+
+    @model_validator(mode="after")
+    def check_period(self) -> "SalesReportInputDTO":
+        if self.last_day < self.first_day:
+            raise ValueError("last_day must not be before first_day")
+        return self
+
+
+class SalesReportItemOutputDTO(BaseModel):
+    item_name: str
+    quantity: int
+
+
+class SalesReportOutputDTO(BaseModel):
+    first_day: date
+    last_day: date
+    items: list[SalesReportItemOutputDTO]
+    total_quantity: int
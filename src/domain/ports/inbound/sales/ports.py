@@ -0,0 +1,12 @@
+from typing import Protocol
+
+from src.domain.ports.inbound.sales.dtos import (
+    SalesReportInputDTO,
+    SalesReportOutputDTO,
+)
+
+
+class SalesReportPort(Protocol):
+    def execute(
+        self, input_dto: SalesReportInputDTO
+    ) -> SalesReportOutputDTO: ...
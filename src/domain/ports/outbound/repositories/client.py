@@ -6,3 +6,4 @@ from src.domain.entities.client import Client
 class ClientRepositoryInterface(Protocol):
     def find_client_by_name(self, client_name: str) -> Client | None: ...
     def save(self, client: Client) -> None: ...
+    def get_or_create_by_name(self, client_name: str) -> Client: ...
@@ -0,0 +1,18 @@
+from datetime import datetime
+from typing import Protocol
+
+from src.domain.entities.inventory import InventoryMovement, InventorySnapshot
+
+
+class InventoryLedgerRepositoryInterface(Protocol):
+    def append_movements(self, movements: list[InventoryMovement]) -> None: ...
+
+    def find_movements(
+        self, created_after: datetime | None, created_until: datetime
+    ) -> list[InventoryMovement]: ...
+
+    def save_snapshot(self, snapshot: InventorySnapshot) -> None: ...
+
+    def find_latest_snapshot(
+        self, taken_until: datetime
+    ) -> InventorySnapshot | None: ...
@@ -1,8 +1,17 @@
-from typing import Protocol
+from collections.abc import Iterator
+from typing import Protocol, runtime_checkable
+
+from bson import ObjectId
+from pydantic import BaseModel
 
 from src.domain.entities.item import Item
 
 
+class SaveAllItemsResult(BaseModel):
+    inserted_count: int
+    modified_count: int
+
+
 class ItemRepositoryInterface(Protocol):
     def find_item_by_name(self, item_name: str) -> Item | None: ...
 
@@ -10,8 +19,31 @@ class ItemRepositoryInterface(Protocol):
 
     def get_all(self) -> list[Item]: ...
 
+    # Streams the catalog by name, holding at most `batch_size` items.
+    def iter_items(self, batch_size: int) -> Iterator[Item]: ...
+
+    # Reads only the items at or below their low stock threshold, by name.
+    def find_low_stock_items(self) -> list[Item]: ...
+
     def remove_item_by_name(self, item_name: str) -> None: ...
 
     def save(self, item: Item) -> None: ...
 
-    def save_all(self, items: list[Item]) -> None: ...
+    def save_all(self, items: list[Item]) -> SaveAllItemsResult: ...
+
+    def increment_inventory_quantities(
+        self, quantity_deltas_by_item_id: dict[ObjectId, int]
+    ) -> dict[ObjectId, int]: ...
+
+    # Decrements every item only if each has enough stock, otherwise none
+    # and raises InsufficientInventoryError with the short items.
+    def decrement_inventory_quantities(
+        self, quantities_by_item_id: dict[ObjectId, int]
+    ) -> dict[ObjectId, int]: ...
+
+
+# Implemented by item repositories that cache what they write, so a unit of
+# work that failed can drop what its aborted writes left in the cache.
+@runtime_checkable
+class ItemCacheInterface(Protocol):
+    def invalidate(self) -> None: ...
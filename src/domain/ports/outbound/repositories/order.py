@@ -1,11 +1,59 @@
+from datetime import datetime
 from typing import Protocol
 
 from bson import ObjectId
+from pydantic import BaseModel
+from pydantic_mongo import ObjectIdField
 
 from src.domain.entities.order import Order
 
 
+class OrderFilter(BaseModel):
+    created_from: datetime | None = None
+    created_until: datetime | None = None
+    client_id: ObjectIdField | None = None
+    is_cancelled: bool | None = None
+
+
+class OrderCursor(BaseModel):
+    created_at: datetime
+    order_id: ObjectIdField
+
+
 class OrderRepositoryInterface(Protocol):
+    # Archived orders are found here too.
     def find_order_by_id(self, order_id: ObjectId) -> None | Order: ...
 
+    def find_order_by_external_id(
+        self, brand: str, external_id: int
+    ) -> None | Order: ...
+
+    # Newest first by (created_at, id). With a cursor, returns the `limit`
+    # orders right after (older) or right before (newer) it.
+    def find_orders(
+        self,
+        order_filter: OrderFilter,
+        limit: int,
+        after: OrderCursor | None = None,
+        before: OrderCursor | None = None,
+    ) -> list[Order]: ...
+
+    # Hot orders only, in no particular order; ids not found are left out.
+    def find_orders_by_ids(self, order_ids: list[ObjectId]) -> list[Order]: ...
+
+    def find_orders_by_external_ids(
+        self, brand: str | None, external_ids: list[int]
+    ) -> list[Order]: ...
+
     def save(self, order: Order) -> None: ...
+
+    # Marks the orders cancelled with a single write, all or none: if any
+    # of them is gone or was cancelled meanwhile, raises
+    # OrdersAlreadyCancelledError and leaves every order as it was.
+    def cancel_orders(
+        self, order_ids: list[ObjectId], cancelled_at: datetime
+    ) -> None: ...
+
+    # Moves up to `limit` orders matching the filter out of the hot store
+    # into the archive, returning how many were archived.
+    def archive_orders(self, order_filter: OrderFilter, limit: int) -> int: ...
@@ -0,0 +1,14 @@
+from datetime import date
+from typing import Protocol
+
+from src.domain.entities.sales import DailyItemSales
+
+
+class SalesRepositoryInterface(Protocol):
+    def increment_daily_sales(
+        self, daily_sales_deltas: list[DailyItemSales]
+    ) -> None: ...
+
+    def find_daily_sales(
+        self, first_day: date, last_day: date
+    ) -> list[DailyItemSales]: ...
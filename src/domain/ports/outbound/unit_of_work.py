@@ -0,0 +1,40 @@
+from typing import Protocol
+
+from bson import ObjectId
+
+from src.domain.entities.inventory import InventoryMovement
+from src.domain.entities.item import Item
+from src.domain.entities.order import Order
+from src.domain.entities.sales import DailyItemSales
+
+
+class UnitOfWorkInterface(Protocol):
+    def register_new_order(self, order: Order) -> None: ...
+
+    def register_dirty_order(self, order: Order) -> None: ...
+
+    def register_cancelled_orders(self, orders: list[Order]) -> None: ...
+
+    def register_new_items(self, items: list[Item]) -> None: ...
+
+    def register_dirty_items(self, items: list[Item]) -> None: ...
+
+    def register_removed_items(self, items: list[Item]) -> None: ...
+
+    def register_inventory_deltas(
+        self,
+        quantity_deltas_by_item_id: dict[ObjectId, int],
+        strict: bool = False,
+    ) -> None: ...
+
+    def register_daily_sales_deltas(
+        self, daily_sales_deltas: list[DailyItemSales]
+    ) -> None: ...
+
+    def register_inventory_movements(
+        self, movements: list[InventoryMovement]
+    ) -> None: ...
+
+    def commit(self) -> dict[ObjectId, int]: ...
+
+    def rollback(self) -> None: ...
@@ -0,0 +1,32 @@
+import re
+import unicodedata
+
+
+def _remove_accents(input_str: str) -> str:
+    # Normaliza a string para 'NFKD' que separará letras de seus acentos
+    # Filtra para manter apenas caracteres que não são acentos
+    nfkd_form = unicodedata.normalize("NFKD", input_str)
+    return "".join([c for c in nfkd_form if not unicodedata.combining(c)])
+
+
+def _adjust_commas(input_str: str) -> str:
+    # Substitui vírgula seguida de espaço por vírgula sem espaço
+    return re.sub(r",\s+", ",", input_str)
+
+
+def _remove_asterisks(input_str: str) -> str:
+    # Remove asteriscos
+    return input_str.replace("*", "")
+
+
+def _remove_multiple_spaces(input_str: str) -> str:
+    # Substitui qualquer sequência de espaços em branco por um único espaço
+    return re.sub(r"\s+", " ", input_str).strip()
+
+
+def clean_text(input_str: str) -> str:
+    return _adjust_commas(
+        _remove_accents(
+            _remove_asterisks(_remove_multiple_spaces(input_str.strip()))
+        )
+    ).lower()
@@ -0,0 +1,250 @@
+from collections.abc import Callable
+from contextlib import (
+    AbstractContextManager,
+    nullcontext,
+)
+from datetime import date, datetime
+
+from bson import ObjectId
+
+from src.domain.entities.inventory import InventoryMovement
+from src.domain.entities.item import Item
+from src.domain.entities.order import Order
+from src.domain.entities.sales import DailyItemSales
+from src.domain.ports.outbound.repositories.inventory import (
+    InventoryLedgerRepositoryInterface,
+)
+from src.domain.ports.outbound.repositories.item import (
+    ItemCacheInterface,
+    ItemRepositoryInterface,
+)
+from src.domain.ports.outbound.repositories.order import (
+    OrderRepositoryInterface,
+)
+from src.domain.ports.outbound.repositories.sales import (
+    SalesRepositoryInterface,
+)
+
+
+class PendingWrites:
+    def __init__(self):
+        self.new_orders: dict[ObjectId, Order] = {}
+        self.dirty_orders: dict[ObjectId, Order] = {}
+        self.cancelled_orders: dict[ObjectId, Order] = {}
+        self.new_items: dict[ObjectId, Item] = {}
+        self.dirty_items: dict[ObjectId, Item] = {}
+        self.removed_items: dict[ObjectId, Item] = {}
+        self.quantity_deltas_by_item_id: dict[ObjectId, int] = {}
+        self.reserved_quantities_by_item_id: dict[ObjectId, int] = {}
+        self.daily_sales_deltas: dict[
+            tuple[date, ObjectId], DailyItemSales
+        ] = {}
+        self.inventory_movements: list[InventoryMovement] = []
+
+    def register_new_order(self, order: Order) -> None:
+        self.new_orders[order.id] = order
+
+    def register_dirty_order(self, order: Order) -> None:
+        if order.id not in self.new_orders:
+            self.dirty_orders[order.id] = order
+
+    def register_cancelled_orders(self, orders: list[Order]) -> None:
+        # Written as a single cancellation instead of one save per order.
+        for order in orders:
+            self.cancelled_orders[order.id] = order
+
+    def register_new_items(self, items: list[Item]) -> None:
+        for item in items:
+            self.new_items[item.id] = item
+
+    def register_dirty_items(self, items: list[Item]) -> None:
+        for item in items:
+            self.dirty_items[item.id] = item
+
+    def register_removed_items(self, items: list[Item]) -> None:
+        for item in items:
+            self.removed_items[item.id] = item
+
+    def register_inventory_deltas(
+        self,
+        quantity_deltas_by_item_id: dict[ObjectId, int],
+        strict: bool = False,
+    ) -> None:
+        # Strict decrements are reserved: they are applied only if every
+        # item still has enough stock when the unit of work commits.
+        for item_id, quantity_delta in quantity_deltas_by_item_id.items():
+            if strict and quantity_delta < 0:
+                self.reserved_quantities_by_item_id[item_id] = (
+                    self.reserved_quantities_by_item_id.get(item_id, 0)
+                    - quantity_delta
+                )
+            else:
+                self.quantity_deltas_by_item_id[item_id] = (
+                    self.quantity_deltas_by_item_id.get(item_id, 0)
+                    + quantity_delta
+                )
+
+    def register_daily_sales_deltas(
+        self, daily_sales_deltas: list[DailyItemSales]
+    ) -> None:
+        for daily_sales_delta in daily_sales_deltas:
+            key = (daily_sales_delta.day, daily_sales_delta.item_id)
+            pending_delta = self.daily_sales_deltas.get(key)
+            if pending_delta is None:
+                self.daily_sales_deltas[key] = daily_sales_delta.model_copy()
+            else:
+                pending_delta.quantity += daily_sales_delta.quantity
+
+    def register_inventory_movements(
+        self, movements: list[InventoryMovement]
+    ) -> None:
+        self.inventory_movements.extend(movements)
+
+    def get_daily_sales_deltas(self) -> list[DailyItemSales]:
+        return [
+            daily_sales_delta
+            for daily_sales_delta in self.daily_sales_deltas.values()
+            if daily_sales_delta.quantity
+        ]
+
+    def get_orders(self) -> list[Order]:
+        # New orders go first, so a duplicate Goomer order fails on its
+        # unique index before any stock is moved.
+        return [*self.new_orders.values(), *self.dirty_orders.values()]
+
+    def get_cancelled_at(self) -> datetime:
+        # One write sets one updated_at; the orders of a bulk cancel are
+        # all cancelled at the same instant anyway.
+        return max(
+            order.updated_at for order in self.cancelled_orders.values()
+        )
+
+    def clear(self) -> None:
+        self.new_orders.clear()
+        self.dirty_orders.clear()
+        self.cancelled_orders.clear()
+        self.new_items.clear()
+        self.dirty_items.clear()
+        self.removed_items.clear()
+        self.quantity_deltas_by_item_id.clear()
+        self.reserved_quantities_by_item_id.clear()
+        self.daily_sales_deltas.clear()
+        self.inventory_movements.clear()
+
+
+class UnitOfWork(PendingWrites):
+    def __init__(
+        self,
+        item_repository: ItemRepositoryInterface,
+        order_repository: OrderRepositoryInterface | None = None,
+        transaction: Callable[[], AbstractContextManager] = nullcontext,
+        sales_repository: SalesRepositoryInterface | None = None,
+        ledger_repository: InventoryLedgerRepositoryInterface | None = None,
+    ):
+        super().__init__()
+        self.item_repository = item_repository
+        # Item use cases register no orders and may leave it out.
+        self.order_repository = order_repository
+        self.transaction = transaction
+        # Without a sales repository the daily rollups are not maintained,
+        # and without a ledger repository the movements are not recorded.
+        self.sales_repository = sales_repository
+        self.ledger_repository = ledger_repository
+
+    def commit(self) -> dict[ObjectId, int]:
+        try:
+            with self.transaction():
+                # Reserved stock is taken first, so a short item fails the
+                # commit before anything else is written.
+                inventory_quantities_by_item_id = (
+                    self._reserve_inventory_quantities()
+                )
+                try:
+                    self._write_orders()
+                except Exception:
+                    self._release_inventory_quantities()
+                    raise
+                inventory_quantities_by_item_id.update(self._write_stock())
+                return inventory_quantities_by_item_id
+        except Exception:
+            self._invalidate_item_cache()
+            raise
+        finally:
+            self.clear()
+
+    # Without a transaction nothing is undone once the orders are written:
+    # the reserved stock stays with them, and a later failure leaves the
+    # daily sales, items, stock increments or movements behind unwritten.
+    # Daily sales are repaired with `make rebuild-daily-sales`; the stock
+    # of a cancellation that failed there has to be set again by hand.
+    def _write_orders(self) -> None:
+        # Cancelling goes first, so an order cancelled meanwhile fails the
+        # commit before its stock is given back twice.
+        self._cancel_orders()
+        for order in self.get_orders():
+            self.order_repository.save(order)  # type: ignore
+
+    def _write_stock(self) -> dict[ObjectId, int]:
+        self._write_daily_sales()
+        self._write_items()
+        inventory_quantities_by_item_id = (
+            self._increment_inventory_quantities()
+        )
+        self._write_inventory_movements()
+        return inventory_quantities_by_item_id
+
+    def _invalidate_item_cache(self) -> None:
+        # A cache written through by an aborted transaction holds writes
+        # that never happened, and one written by a failed non transactional
+        # write may have missed the ones that did.
+        if isinstance(self.item_repository, ItemCacheInterface):
+            self.item_repository.invalidate()
+
+    def _cancel_orders(self) -> None:
+        if self.cancelled_orders:
+            self.order_repository.cancel_orders(  # type: ignore
+                list(self.cancelled_orders), self.get_cancelled_at()
+            )
+
+    def _reserve_inventory_quantities(self) -> dict[ObjectId, int]:
+        if not self.reserved_quantities_by_item_id:
+            return {}
+        return self.item_repository.decrement_inventory_quantities(
+            dict(self.reserved_quantities_by_item_id)
+        )
+
+    def _release_inventory_quantities(self) -> None:
+        # Without a transaction to abort, the reserved stock is given back.
+        if self.reserved_quantities_by_item_id:
+            self.item_repository.increment_inventory_quantities(
+                dict(self.reserved_quantities_by_item_id)
+            )
+
+    def _write_items(self) -> None:
+        # New items are upserted with the dirty ones, in one bulk write.
+        items = [*self.new_items.values(), *self.dirty_items.values()]
+        if items:
+            self.item_repository.save_all(items)
+        for item in self.removed_items.values():
+            self.item_repository.remove_item_by_name(item.name)
+
+    def _increment_inventory_quantities(self) -> dict[ObjectId, int]:
+        if not self.quantity_deltas_by_item_id:
+            return {}
+        return self.item_repository.increment_inventory_quantities(
+            dict(self.quantity_deltas_by_item_id)
+        )
+
+    def _write_inventory_movements(self) -> None:
+        if self.ledger_repository and self.inventory_movements:
+            self.ledger_repository.append_movements(
+                list(self.inventory_movements)
+            )
+
+    def _write_daily_sales(self) -> None:
+        daily_sales_deltas = self.get_daily_sales_deltas()
+        if self.sales_repository and daily_sales_deltas:
+            self.sales_repository.increment_daily_sales(daily_sales_deltas)
+
+    def rollback(self) -> None:
+        self.clear()
@@ -1,15 +1,40 @@
+from src.domain.entities.inventory import (
+    InventoryMovement,
+    InventoryMovementReason,
+)
 from src.domain.entities.item import Item
 from src.domain.exceptions import ItemAlreadyExistsError
 from src.domain.ports.inbound.items.dtos import (
     AddItemInputDTO,
     AddItemOutputDTO,
 )
-from src.domain.ports.outbound.repositories.item import ItemRepositoryInterface
+from src.domain.ports.outbound.repositories.item import (
+    ItemRepositoryInterface,
+)
+from src.domain.ports.outbound.unit_of_work import (
+    UnitOfWorkInterface,
+)
+from src.domain.unit_of_work import UnitOfWork
 
 
 class AddItemUseCase:
-    def __init__(self, item_repository: ItemRepositoryInterface):
+    def __init__(
+        self,
+        item_repository: ItemRepositoryInterface,
+        unit_of_work: UnitOfWorkInterface | None = None,
+    ):
         self.item_repository = item_repository
+        self.unit_of_work = unit_of_work or UnitOfWork(item_repository)
+
+    @staticmethod
+    def _build_inventory_movement(item: Item) -> InventoryMovement:
+        return InventoryMovement(
+            item_id=item.id,
+            item_name=item.name,
+            reason=InventoryMovementReason.ADD,
+            quantity_delta=item.inventory_quantity,
+            inventory_quantity=item.inventory_quantity,
+        )
 
     def execute(self, input_dto: AddItemInputDTO) -> AddItemOutputDTO:
         existing_item = self.item_repository.find_item_by_name(
@@ -22,7 +47,11 @@ class AddItemUseCase:
             name=input_dto.item_name,
             inventory_quantity=input_dto.inventory_quantity,
         )
-        self.item_repository.save(new_item)
+        self.unit_of_work.register_new_items([new_item])
+        self.unit_of_work.register_inventory_movements(
+            [self._build_inventory_movement(new_item)]
+        )
+        self.unit_of_work.commit()
 
         return AddItemOutputDTO(
             item_name=new_item.name,
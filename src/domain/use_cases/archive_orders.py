@@ -0,0 +1,42 @@
+from src.domain.ports.inbound.orders.dtos import (
+    ArchiveOrdersInputDTO,
+    ArchiveOrdersOutputDTO,
+)
+from src.domain.ports.outbound.repositories.order import (
+    OrderFilter,
+    OrderRepositoryInterface,
+)
+
+
+class ArchiveOrdersUseCase:
+    def __init__(self, order_repository: OrderRepositoryInterface):
+        self.order_repository = order_repository
+
+    @staticmethod
+    def _build_order_filters(
+        input_dto: ArchiveOrdersInputDTO,
+    ) -> list[OrderFilter]:
+        # Cancelled orders no longer move stock or sales, so they may leave
+        # the hot store sooner than the others.
+        order_filters = [OrderFilter(created_until=input_dto.created_before)]
+        if input_dto.cancelled_created_before is not None:
+            order_filters.append(
+                OrderFilter(
+                    created_until=input_dto.cancelled_created_before,
+                    is_cancelled=True,
+                )
+            )
+        return order_filters
+
+    def execute(
+        self, input_dto: ArchiveOrdersInputDTO
+    ) -> ArchiveOrdersOutputDTO:
+        # Archives one batch per filter; callers repeat until nothing is
+        # left, so no single call holds the database for long.
+        archived_count = sum(
+            self.order_repository.archive_orders(
+                order_filter, input_dto.batch_size
+            )
+            for order_filter in self._build_order_filters(input_dto)
+        )
+        return ArchiveOrdersOutputDTO(archived_count=archived_count)
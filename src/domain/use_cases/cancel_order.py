@@ -1,15 +1,26 @@
 from datetime import datetime
 
+from bson import ObjectId
+
+from src.domain.entities.inventory import InventoryMovementReason
+from src.domain.entities.order import Order
+from src.domain.entities.sales import DailyItemSales
 from src.domain.exceptions import OrderNotFoundError
 from src.domain.ports.inbound.orders.dtos import (
     CancelOrderInputDTO,
     CancelOrderItemOutputDTO,
     CancelOrderOutputDTO,
 )
-from src.domain.ports.outbound.repositories.item import ItemRepositoryInterface
+from src.domain.ports.outbound.repositories.item import (
+    ItemRepositoryInterface,
+)
 from src.domain.ports.outbound.repositories.order import (
     OrderRepositoryInterface,
 )
+from src.domain.ports.outbound.unit_of_work import (
+    UnitOfWorkInterface,
+)
+from src.domain.unit_of_work import UnitOfWork
 
 
 class CancelOrderUseCase:
@@ -17,25 +28,44 @@ class CancelOrderUseCase:
         self,
         order_repository: OrderRepositoryInterface,
         item_repository: ItemRepositoryInterface,
+        unit_of_work: UnitOfWorkInterface | None = None,
     ):
         self.order_repository = order_repository
         self.item_repository = item_repository
+        self.unit_of_work = unit_of_work or UnitOfWork(
+            item_repository, order_repository
+        )
 
-    def execute(self, input_dto: CancelOrderInputDTO) -> CancelOrderOutputDTO:
-        order = self.order_repository.find_order_by_id(input_dto.order_id)
-        if not order:
-            raise OrderNotFoundError(input_dto.order_id)
-
-        items_to_save = []
+    @staticmethod
+    def _build_quantity_deltas(order: Order) -> dict[ObjectId, int]:
+        quantity_deltas_by_item_id: dict[ObjectId, int] = {}
         for order_item in order.order_items:
-            item = order_item.item
-            item.increase_inventory_quantity(order_item.quantity)
-            items_to_save.append(item)
-        self.item_repository.save_all(items_to_save)
+            item_id = order_item.item.id
+            quantity_deltas_by_item_id[item_id] = (
+                quantity_deltas_by_item_id.get(item_id, 0)
+                + order_item.quantity
+            )
+        return quantity_deltas_by_item_id
 
-        order.cancel()
-        self.order_repository.save(order)
+    @staticmethod
+    def _build_daily_sales_deltas(order: Order) -> list[DailyItemSales]:
+        # Cancelled orders are taken back out of the day they were sold on.
+        return [
+            daily_sales.model_copy(update={"quantity": -daily_sales.quantity})
+            for daily_sales in order.build_daily_sales()
+        ]
+
+    @staticmethod
+    def _set_inventory_quantities(
+        order: Order, inventory_quantities_by_item_id: dict[ObjectId, int]
+    ):
+        for order_item in order.order_items:
+            order_item.item.set_inventory_quantity(
+                inventory_quantities_by_item_id[order_item.item.id]
+            )
 
+    @staticmethod
+    def _build_output_dto(order: Order) -> CancelOrderOutputDTO:
         order_items_output_dtos = []
         for order_item in order.order_items:
             order_items_output_dtos.append(
@@ -59,3 +89,27 @@ class CancelOrderUseCase:
             ),
             order_items=order_items_output_dtos,
         )
+
+    def execute(self, input_dto: CancelOrderInputDTO) -> CancelOrderOutputDTO:
+        # Only hot orders are looked up, like the bulk cancel does. Saving
+        # an archived order would write it back into the hot collection.
+        orders = self.order_repository.find_orders_by_ids([input_dto.order_id])
+        if not orders:
+            raise OrderNotFoundError(input_dto.order_id)
+        order = orders[0]
+
+        order.cancel()
+        self.unit_of_work.register_dirty_order(order)
+        self.unit_of_work.register_inventory_deltas(
+            self._build_quantity_deltas(order)
+        )
+        self.unit_of_work.register_daily_sales_deltas(
+            self._build_daily_sales_deltas(order)
+        )
+        self.unit_of_work.register_inventory_movements(
+            order.build_inventory_movements(InventoryMovementReason.CANCEL)
+        )
+        inventory_quantities_by_item_id = self.unit_of_work.commit()
+        self._set_inventory_quantities(order, inventory_quantities_by_item_id)
+
+        return self._build_output_dto(order)
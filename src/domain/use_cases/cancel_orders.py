@@ -0,0 +1,134 @@
+from datetime import datetime
+
+from bson import ObjectId
+
+from src.domain.entities.inventory import InventoryMovementReason
+from src.domain.entities.order import Order
+from src.domain.ports.inbound.orders.dtos import (
+    CancelOrdersInputDTO,
+    CancelOrdersOutputDTO,
+)
+from src.domain.ports.outbound.repositories.item import (
+    ItemRepositoryInterface,
+)
+from src.domain.ports.outbound.repositories.order import (
+    OrderRepositoryInterface,
+)
+from src.domain.ports.outbound.unit_of_work import (
+    UnitOfWorkInterface,
+)
+from src.domain.unit_of_work import UnitOfWork
+from src.domain.use_cases.cancel_order import CancelOrderUseCase
+
+
+class CancelOrdersUseCase:
+    def __init__(
+        self,
+        order_repository: OrderRepositoryInterface,
+        item_repository: ItemRepositoryInterface,
+        unit_of_work: UnitOfWorkInterface | None = None,
+    ):
+        self.order_repository = order_repository
+        self.item_repository = item_repository
+        self.unit_of_work = unit_of_work or UnitOfWork(
+            item_repository, order_repository
+        )
+
+    @staticmethod
+    def _register_cancellations(
+        orders: list[Order],
+        unit_of_work: UnitOfWorkInterface,
+    ) -> list[Order]:
+        # Already cancelled orders are skipped, so running the same bulk
+        # cancel again gives no stock back. The stock of every order is
+        # added up and given back with a single increment.
+        cancelled_at = datetime.now()
+        orders_to_cancel = [
+            order for order in orders if not order.is_cancelled
+        ]
+        for order in orders_to_cancel:
+            order.cancel(cancelled_at)
+            unit_of_work.register_inventory_deltas(
+                CancelOrderUseCase._build_quantity_deltas(order)
+            )
+            unit_of_work.register_daily_sales_deltas(
+                CancelOrderUseCase._build_daily_sales_deltas(order)
+            )
+            unit_of_work.register_inventory_movements(
+                order.build_inventory_movements(InventoryMovementReason.CANCEL)
+            )
+        unit_of_work.register_cancelled_orders(orders_to_cancel)
+        return orders_to_cancel
+
+    @staticmethod
+    def _build_output_dto(
+        input_dto: CancelOrdersInputDTO,
+        orders: list[Order],
+        cancelled_orders: list[Order],
+    ) -> CancelOrdersOutputDTO:
+        found_order_ids = {order.id for order in orders}
+        found_external_order_ids = {
+            order.external_id
+            for order in orders
+            if order.brand == input_dto.brand
+        }
+        return CancelOrdersOutputDTO(
+            cancelled_orders=[
+                CancelOrderUseCase._build_output_dto(order)
+                for order in cancelled_orders
+            ],
+            already_cancelled_order_ids=[
+                order.id for order in orders if order not in cancelled_orders
+            ],
+            not_found_order_ids=[
+                order_id
+                for order_id in input_dto.order_ids
+                if order_id not in found_order_ids
+            ],
+            not_found_external_order_ids=[
+                external_order_id
+                for external_order_id in input_dto.external_order_ids
+                if external_order_id not in found_external_order_ids
+            ],
+        )
+
+    @staticmethod
+    def _merge_orders(*orders_lists: list[Order]) -> list[Order]:
+        # An order listed by id and by Goomer number is cancelled once.
+        return list(
+            {
+                order.id: order for orders in orders_lists for order in orders
+            }.values()
+        )
+
+    def _find_orders(self, input_dto: CancelOrdersInputDTO) -> list[Order]:
+        order_ids: list[ObjectId] = [*input_dto.order_ids]
+        orders_by_ids = (
+            self.order_repository.find_orders_by_ids(order_ids)
+            if order_ids
+            else []
+        )
+        orders_by_external_ids = (
+            self.order_repository.find_orders_by_external_ids(
+                input_dto.brand, input_dto.external_order_ids
+            )
+            if input_dto.external_order_ids
+            else []
+        )
+        return self._merge_orders(orders_by_ids, orders_by_external_ids)
+
+    def execute(
+        self, input_dto: CancelOrdersInputDTO
+    ) -> CancelOrdersOutputDTO:
+        orders = self._find_orders(input_dto)
+        cancelled_orders = self._register_cancellations(
+            orders, self.unit_of_work
+        )
+        if cancelled_orders:
+            inventory_quantities_by_item_id = self.unit_of_work.commit()
+            for order in cancelled_orders:
+                CancelOrderUseCase._set_inventory_quantities(
+                    order, inventory_quantities_by_item_id
+                )
+
+        return self._build_output_dto(input_dto, orders, cancelled_orders)
@@ -1,20 +1,33 @@
+from bson import ObjectId
+
 from src.domain.entities.client import Client
+from src.domain.entities.inventory import InventoryMovementReason
 from src.domain.entities.item import Item
-from src.domain.entities.order import OrderItem
-from src.domain.exceptions import ItemsNotFoundByNameError
+from src.domain.entities.order import Order, OrderItem
+from src.domain.exceptions import (
+    ItemsNotFoundByNameError,
+    OrderAlreadyExistsError,
+)
 from src.domain.factories.order import OrderFactory
 from src.domain.ports.inbound.orders.dtos import (
     CreateGoomerOrderInputDTO,
     CreateGoomerOrderOutputDTO,
     CreateOrderItemOutputDTO,
+    OrderItemInputDTO,
 )
 from src.domain.ports.outbound.repositories.client import (
     ClientRepositoryInterface,
 )
-from src.domain.ports.outbound.repositories.item import ItemRepositoryInterface
+from src.domain.ports.outbound.repositories.item import (
+    ItemRepositoryInterface,
+)
 from src.domain.ports.outbound.repositories.order import (
     OrderRepositoryInterface,
 )
+from src.domain.ports.outbound.unit_of_work import (
+    UnitOfWorkInterface,
+)
+from src.domain.unit_of_work import UnitOfWork
 
 
 class CreateGoomerOrderUseCase:
@@ -23,10 +36,17 @@ class CreateGoomerOrderUseCase:
         client_repository: ClientRepositoryInterface,
         item_repository: ItemRepositoryInterface,
         order_repository: OrderRepositoryInterface,
+        unit_of_work: UnitOfWorkInterface | None = None,
+        strict_stock: bool = False,
     ):
         self.client_repository = client_repository
         self.item_repository = item_repository
         self.order_repository = order_repository
+        self.unit_of_work = unit_of_work or UnitOfWork(
+            item_repository, order_repository
+        )
+        # Strict stock rejects an order that would oversell any item.
+        self.strict_stock = strict_stock
 
     @staticmethod
     def _validate_no_missing_items(
@@ -40,15 +60,79 @@ class CreateGoomerOrderUseCase:
             missing_item_names = set(items_names_from_dto) - found_item_names
             raise ItemsNotFoundByNameError(list(missing_item_names))
 
+    @staticmethod
+    def _build_order_items(
+        items_input: list[OrderItemInputDTO], items_from_repository: list[Item]
+    ) -> tuple[list[OrderItem], dict[ObjectId, int]]:
+        item_map_by_name = {item.name: item for item in items_from_repository}
+
+        order_items = []
+        quantity_deltas_by_item_id: dict[ObjectId, int] = {}
+        for item_input in items_input:
+            item = item_map_by_name[item_input.item_name]
+            quantity_deltas_by_item_id[item.id] = (
+                quantity_deltas_by_item_id.get(item.id, 0)
+                - item_input.quantity
+            )
+            order_item = OrderItem(item=item, quantity=item_input.quantity)
+            order_items.append(order_item)
+        return order_items, quantity_deltas_by_item_id
+
+    @staticmethod
+    def _set_inventory_quantities(
+        items: list[Item], inventory_quantities_by_item_id: dict[ObjectId, int]
+    ):
+        for item in items:
+            item.set_inventory_quantity(
+                inventory_quantities_by_item_id[item.id]
+            )
+
+    @staticmethod
+    def _build_output_dto(
+        order: Order, client: Client
+    ) -> CreateGoomerOrderOutputDTO:
+        return CreateGoomerOrderOutputDTO(
+            order_id=order.id,
+            client_name=client.name,
+            external_order_id=order.external_id,  # type: ignore
+            order_items=[
+                CreateOrderItemOutputDTO(
+                    item_name=order_item.item.name,
+                    quantity=order_item.quantity,
+                    inventory_quantity=order_item.item.inventory_quantity,
+                )
+                for order_item in order.order_items
+            ],
+        )
+
+    @staticmethod
+    def _build_duplicate_output_dto(
+        order: Order, input_dto: CreateGoomerOrderInputDTO
+    ) -> CreateGoomerOrderOutputDTO:
+        client = order.client or Client(name=input_dto.client_name)
+        output_dto = CreateGoomerOrderUseCase._build_output_dto(order, client)
+        output_dto.is_duplicate = True
+        return output_dto
+
+    def _find_duplicate_order(
+        self, input_dto: CreateGoomerOrderInputDTO
+    ) -> Order | None:
+        if input_dto.brand is None:
+            return None
+        return self.order_repository.find_order_by_external_id(
+            input_dto.brand, input_dto.external_order_id
+        )
+
     def execute(
         self, input_dto: CreateGoomerOrderInputDTO
     ) -> CreateGoomerOrderOutputDTO:
-        client = self.client_repository.find_client_by_name(
+        duplicate_order = self._find_duplicate_order(input_dto)
+        if duplicate_order:
+            return self._build_duplicate_output_dto(duplicate_order, input_dto)
+
+        client = self.client_repository.get_or_create_by_name(
             input_dto.client_name
         )
-        if not client:
-            client = Client(name=input_dto.client_name)
-            self.client_repository.save(client)
 
         items_names_from_dto = [
             item_input.item_name for item_input in input_dto.items
@@ -61,32 +145,37 @@ class CreateGoomerOrderUseCase:
             items_names_from_dto, items_from_repository
         )
 
-        item_map_by_name = {item.name: item for item in items_from_repository}
-
-        order_items = []
-        for item_input in input_dto.items:
-            item = item_map_by_name[item_input.item_name]
-            item.decrease_inventory_quantity(item_input.quantity)
-            order_item = OrderItem(item=item, quantity=item_input.quantity)
-            order_items.append(order_item)
+        order_items, quantity_deltas_by_item_id = self._build_order_items(
+            input_dto.items, items_from_repository
+        )
 
         order = OrderFactory.build_from_goomer_order(
             input_dto, client, order_items
         )
 
-        self.item_repository.save_all(items_from_repository)
-        self.order_repository.save(order)
+        # The order is flushed before touching stock, so a copy pasted at
+        # the same time fails on the unique index without decrementing it
+        # (strictly reserved stock is taken first and given back).
+        self.unit_of_work.register_new_order(order)
+        self.unit_of_work.register_inventory_deltas(
+            quantity_deltas_by_item_id, strict=self.strict_stock
+        )
+        self.unit_of_work.register_daily_sales_deltas(
+            order.build_daily_sales()
+        )
+        self.unit_of_work.register_inventory_movements(
+            order.build_inventory_movements(InventoryMovementReason.ORDER)
+        )
+        try:
+            inventory_quantities_by_item_id = self.unit_of_work.commit()
+        except OrderAlreadyExistsError:
+            duplicate_order = self._find_duplicate_order(input_dto)
+            if not duplicate_order:
+                raise
+            return self._build_duplicate_output_dto(duplicate_order, input_dto)
 
-        return CreateGoomerOrderOutputDTO(
-            order_id=order.id,
-            client_name=client.name,
-            external_order_id=order.external_id,  # type: ignore
-            order_items=[
-                CreateOrderItemOutputDTO(
-                    item_name=order_item.item.name,
-                    quantity=order_item.quantity,
-                    inventory_quantity=order_item.item.inventory_quantity,
-                )
-                for order_item in order.order_items
-            ],
+        self._set_inventory_quantities(
+            items_from_repository, inventory_quantities_by_item_id
         )
+
+        return self._build_output_dto(order, client)
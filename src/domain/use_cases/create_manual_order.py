@@ -1,16 +1,26 @@
+from bson import ObjectId
+
+from src.domain.entities.inventory import InventoryMovementReason
 from src.domain.entities.item import Item
-from src.domain.entities.order import OrderItem
+from src.domain.entities.order import Order, OrderItem
 from src.domain.exceptions import ItemsNotFoundByNameError
 from src.domain.factories.order import OrderFactory
 from src.domain.ports.inbound.orders.dtos import (
     CreateManualOrderInputDTO,
     CreateManualOrderOutputDTO,
     CreateOrderItemOutputDTO,
+    OrderItemInputDTO,
+)
+from src.domain.ports.outbound.repositories.item import (
+    ItemRepositoryInterface,
 )
-from src.domain.ports.outbound.repositories.item import ItemRepositoryInterface
 from src.domain.ports.outbound.repositories.order import (
     OrderRepositoryInterface,
 )
+from src.domain.ports.outbound.unit_of_work import (
+    UnitOfWorkInterface,
+)
+from src.domain.unit_of_work import UnitOfWork
 
 
 class CreateManualOrderUseCase:
@@ -18,9 +28,16 @@ class CreateManualOrderUseCase:
         self,
         item_repository: ItemRepositoryInterface,
         order_repository: OrderRepositoryInterface,
+        unit_of_work: UnitOfWorkInterface | None = None,
+        strict_stock: bool = False,
     ):
         self.item_repository = item_repository
         self.order_repository = order_repository
+        self.unit_of_work = unit_of_work or UnitOfWork(
+            item_repository, order_repository
+        )
+        # Strict stock rejects an order that would oversell any item.
+        self.strict_stock = strict_stock
 
     @staticmethod
     def _validate_no_missing_items(
@@ -34,34 +51,35 @@ class CreateManualOrderUseCase:
             missing_item_names = set(items_names_from_dto) - found_item_names
             raise ItemsNotFoundByNameError(list(missing_item_names))
 
-    def execute(
-        self, input_dto: CreateManualOrderInputDTO
-    ) -> CreateManualOrderOutputDTO:
-        items_names_from_dto = [
-            item_input.item_name for item_input in input_dto.items
-        ]
-        items_from_repository = self.item_repository.find_items_by_names(
-            items_names_from_dto
-        )
-
-        self._validate_no_missing_items(
-            items_names_from_dto, items_from_repository
-        )
-
+    @staticmethod
+    def _build_order_items(
+        items_input: list[OrderItemInputDTO], items_from_repository: list[Item]
+    ) -> tuple[list[OrderItem], dict[ObjectId, int]]:
         item_map_by_name = {item.name: item for item in items_from_repository}
 
         order_items = []
-        for item_input in input_dto.items:
+        quantity_deltas_by_item_id: dict[ObjectId, int] = {}
+        for item_input in items_input:
             item = item_map_by_name[item_input.item_name]
-            item.decrease_inventory_quantity(item_input.quantity)
+            quantity_deltas_by_item_id[item.id] = (
+                quantity_deltas_by_item_id.get(item.id, 0)
+                - item_input.quantity
+            )
             order_item = OrderItem(item=item, quantity=item_input.quantity)
             order_items.append(order_item)
+        return order_items, quantity_deltas_by_item_id
 
-        order = OrderFactory.build_from_manual_order(order_items)
-
-        self.item_repository.save_all(items_from_repository)
-        self.order_repository.save(order)
+    @staticmethod
+    def _set_inventory_quantities(
+        items: list[Item], inventory_quantities_by_item_id: dict[ObjectId, int]
+    ):
+        for item in items:
+            item.set_inventory_quantity(
+                inventory_quantities_by_item_id[item.id]
+            )
 
+    @staticmethod
+    def _build_output_dto(order: Order) -> CreateManualOrderOutputDTO:
         return CreateManualOrderOutputDTO(
             order_id=order.id,
             order_items=[
@@ -73,3 +91,40 @@ class CreateManualOrderUseCase:
                 for order_item in order.order_items
             ],
         )
+
+    def execute(
+        self, input_dto: CreateManualOrderInputDTO
+    ) -> CreateManualOrderOutputDTO:
+        items_names_from_dto = [
+            item_input.item_name for item_input in input_dto.items
+        ]
+        items_from_repository = self.item_repository.find_items_by_names(
+            items_names_from_dto
+        )
+
+        self._validate_no_missing_items(
+            items_names_from_dto, items_from_repository
+        )
+
+        order_items, quantity_deltas_by_item_id = self._build_order_items(
+            input_dto.items, items_from_repository
+        )
+
+        order = OrderFactory.build_from_manual_order(order_items)
+
+        self.unit_of_work.register_new_order(order)
+        self.unit_of_work.register_inventory_deltas(
+            quantity_deltas_by_item_id, strict=self.strict_stock
+        )
+        self.unit_of_work.register_daily_sales_deltas(
+            order.build_daily_sales()
+        )
+        self.unit_of_work.register_inventory_movements(
+            order.build_inventory_movements(InventoryMovementReason.ORDER)
+        )
+        inventory_quantities_by_item_id = self.unit_of_work.commit()
+        self._set_inventory_quantities(
+            items_from_repository, inventory_quantities_by_item_id
+        )
+
+        return self._build_output_dto(order)
@@ -0,0 +1,19 @@
+from collections.abc import Iterator
+
+from src.domain.ports.inbound.items.dtos import CatalogItemOutputDTO
+from src.domain.ports.outbound.repositories.item import (
+    ItemRepositoryInterface,
+)
+
+
+class ExportItemsUseCase:
+    def __init__(self, item_repository: ItemRepositoryInterface):
+        self.item_repository = item_repository
+
+    def execute(self, batch_size: int = 500) -> Iterator[CatalogItemOutputDTO]:
+        for item in self.item_repository.iter_items(batch_size):
+            yield CatalogItemOutputDTO(
+                item_name=item.name,
+                inventory_quantity=item.inventory_quantity,
+                low_stock_threshold=item.low_stock_threshold,
+            )
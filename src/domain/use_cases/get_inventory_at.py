@@ -0,0 +1,45 @@
+from src.domain.entities.inventory import InventorySnapshot
+from src.domain.ports.inbound.items.dtos import (
+    GetInventoryAtInputDTO,
+    GetInventoryAtOutputDTO,
+    ItemOutputDTO,
+)
+from src.domain.ports.outbound.repositories.inventory import (
+    InventoryLedgerRepositoryInterface,
+)
+
+
+class GetInventoryAtUseCase:
+    def __init__(self, ledger_repository: InventoryLedgerRepositoryInterface):
+        self.ledger_repository = ledger_repository
+
+    @staticmethod
+    def _build_output_dto(
+        snapshot: InventorySnapshot,
+    ) -> GetInventoryAtOutputDTO:
+        return GetInventoryAtOutputDTO(
+            at=snapshot.taken_at,
+            items=[
+                ItemOutputDTO(
+                    item_name=item.item_name,
+                    inventory_quantity=item.inventory_quantity,
+                )
+                for item in snapshot.items
+            ],
+        )
+
+    def execute(
+        self, input_dto: GetInventoryAtInputDTO
+    ) -> GetInventoryAtOutputDTO:
+        previous_snapshot = self.ledger_repository.find_latest_snapshot(
+            input_dto.at
+        )
+        movements = self.ledger_repository.find_movements(
+            previous_snapshot.taken_at if previous_snapshot else None,
+            input_dto.at,
+        )
+        snapshot = InventorySnapshot.rebuild(
+            previous_snapshot, movements, input_dto.at
+        )
+
+        return self._build_output_dto(snapshot)
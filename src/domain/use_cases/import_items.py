@@ -0,0 +1,168 @@
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+
+from src.domain.entities.inventory import (
+    InventoryMovement,
+    InventoryMovementReason,
+)
+from src.domain.entities.item import Item
+from src.domain.ports.inbound.items.dtos import (
+    ImportItemRowInputDTO,
+    ImportItemsErrorOutputDTO,
+    ImportItemsOutputDTO,
+)
+from src.domain.ports.outbound.repositories.item import (
+    ItemRepositoryInterface,
+)
+from src.domain.ports.outbound.unit_of_work import (
+    UnitOfWorkInterface,
+)
+from src.domain.unit_of_work import UnitOfWork
+
+# A raw row is its line number in the file and the fields read from it.
+RawItemRow = tuple[int, Any]
+
+ITEM_ROWS_ADAPTER = TypeAdapter(list[ImportItemRowInputDTO])
+
+
+def iter_chunks(
+    rows: Iterable[RawItemRow], chunk_size: int
+) -> Iterator[list[RawItemRow]]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def validate_chunk(
+    chunk: list[RawItemRow], output_dto: ImportItemsOutputDTO
+) -> list[ImportItemRowInputDTO]:
+    # The whole chunk is validated in one call; only when it fails are the
+    # invalid rows reported and the rest validated again without them.
+    try:
+        return ITEM_ROWS_ADAPTER.validate_python([row for _, row in chunk])
+    except ValidationError as error:
+        invalid_indexes = set()
+        for row_error in error.errors():
+            index = row_error["loc"][0]
+            invalid_indexes.add(index)
+            field = ".".join(str(part) for part in row_error["loc"][1:])
+            output_dto.errors.append(
+                ImportItemsErrorOutputDTO(
+                    line_number=chunk[index][0],  # type: ignore
+                    message=f"{field}: {row_error['msg']}"
+                    if field
+                    else row_error["msg"],
+                )
+            )
+    return ITEM_ROWS_ADAPTER.validate_python(
+        [
+            row
+            for index, (_, row) in enumerate(chunk)
+            if index not in invalid_indexes
+        ]
+    )
+
+
+def build_import_movement(
+    item: Item, reason: InventoryMovementReason, quantity_delta: int
+) -> InventoryMovement:
+    return InventoryMovement(
+        item_id=item.id,
+        item_name=item.name,
+        reason=reason,
+        quantity_delta=quantity_delta,
+        inventory_quantity=item.inventory_quantity,
+    )
+
+
+def is_item_row_unchanged(item: Item, item_row: ImportItemRowInputDTO) -> bool:
+    return item.inventory_quantity == item_row.inventory_quantity and (
+        item_row.low_stock_threshold in (None, item.low_stock_threshold)
+    )
+
+
+def update_item(
+    item: Item, item_row: ImportItemRowInputDTO
+) -> InventoryMovement | None:
+    quantity_delta = item_row.inventory_quantity - item.inventory_quantity
+    item.set_inventory_quantity(item_row.inventory_quantity)
+    if item_row.low_stock_threshold is not None:
+        item.set_low_stock_threshold(item_row.low_stock_threshold)
+    # A new threshold alone does not move any stock.
+    if not quantity_delta:
+        return None
+    return build_import_movement(
+        item, InventoryMovementReason.SET, quantity_delta
+    )
+
+
+def apply_item_rows(
+    item_rows: list[ImportItemRowInputDTO],
+    items_by_name: dict[str, Item],
+    output_dto: ImportItemsOutputDTO,
+) -> tuple[list[Item], list[InventoryMovement]]:
+    # Rows repeating a name within a chunk are applied in file order, so
+    # the last one wins.
+    item_rows_by_name = {
+        item_row.item_name: item_row for item_row in item_rows
+    }
+    changed_items = []
+    movements = []
+    for item_name, item_row in item_rows_by_name.items():
+        item = items_by_name.get(item_name)
+        movement: InventoryMovement | None
+        if item is None:
+            item = Item(
+                name=item_name,
+                inventory_quantity=item_row.inventory_quantity,
+                low_stock_threshold=item_row.low_stock_threshold or 0,
+            )
+            movement = build_import_movement(
+                item, InventoryMovementReason.ADD, item.inventory_quantity
+            )
+            output_dto.inserted_count += 1
+        elif is_item_row_unchanged(item, item_row):
+            output_dto.unchanged_count += 1
+            continue
+        else:
+            movement = update_item(item, item_row)
+            output_dto.updated_count += 1
+        changed_items.append(item)
+        if movement is not None:
+            movements.append(movement)
+    return changed_items, movements
+
+
+class ImportItemsUseCase:
+    def __init__(
+        self,
+        item_repository: ItemRepositoryInterface,
+        unit_of_work: UnitOfWorkInterface | None = None,
+    ):
+        self.item_repository = item_repository
+        self.unit_of_work = unit_of_work or UnitOfWork(item_repository)
+
+    def execute(
+        self, rows: Iterable[RawItemRow], chunk_size: int = 500
+    ) -> ImportItemsOutputDTO:
+        # Rows are pulled from the file one chunk at a time: each chunk is
+        # one read of the existing items and one bulk upsert, and nothing
+        # else of the file is held in memory.
+        output_dto = ImportItemsOutputDTO()
+        for chunk in iter_chunks(rows, chunk_size):
+            item_rows = validate_chunk(chunk, output_dto)
+            if not item_rows:
+                continue
+            items = self.item_repository.find_items_by_names(
+                list({item_row.item_name for item_row in item_rows})
+            )
+            changed_items, movements = apply_item_rows(
+                item_rows, {item.name: item for item in items}, output_dto
+            )
+            self.unit_of_work.register_dirty_items(changed_items)
+            self.unit_of_work.register_inventory_movements(movements)
+            self.unit_of_work.commit()
+        return output_dto
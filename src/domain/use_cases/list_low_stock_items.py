@@ -0,0 +1,31 @@
+from src.domain.entities.item import Item
+from src.domain.ports.inbound.items.dtos import (
+    CatalogItemOutputDTO,
+    ListLowStockItemsOutputDTO,
+)
+from src.domain.ports.outbound.repositories.item import (
+    ItemRepositoryInterface,
+)
+
+
+class ListLowStockItemsUseCase:
+    def __init__(self, item_repository: ItemRepositoryInterface):
+        self.item_repository = item_repository
+
+    @staticmethod
+    def _build_output_dto(items: list[Item]) -> ListLowStockItemsOutputDTO:
+        return ListLowStockItemsOutputDTO(
+            items=[
+                CatalogItemOutputDTO(
+                    item_name=item.name,
+                    inventory_quantity=item.inventory_quantity,
+                    low_stock_threshold=item.low_stock_threshold,
+                )
+                for item in items
+            ]
+        )
+
+    def execute(self) -> ListLowStockItemsOutputDTO:
+        items = self.item_repository.find_low_stock_items()
+
+        return self._build_output_dto(items)
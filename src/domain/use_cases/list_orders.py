@@ -0,0 +1,106 @@
+from pydantic_mongo import ObjectIdField
+
+from src.domain.entities.order import Order
+from src.domain.ports.inbound.orders.dtos import (
+    ListOrdersInputDTO,
+    ListOrdersItemOutputDTO,
+    ListOrdersOrderOutputDTO,
+    ListOrdersOutputDTO,
+)
+from src.domain.ports.outbound.repositories.client import (
+    ClientRepositoryInterface,
+)
+from src.domain.ports.outbound.repositories.order import (
+    OrderCursor,
+    OrderFilter,
+    OrderRepositoryInterface,
+)
+
+
+class ListOrdersUseCase:
+    def __init__(
+        self,
+        order_repository: OrderRepositoryInterface,
+        client_repository: ClientRepositoryInterface,
+    ):
+        self.order_repository = order_repository
+        self.client_repository = client_repository
+
+    @staticmethod
+    def _build_order_filter(
+        input_dto: ListOrdersInputDTO, client_id: ObjectIdField | None
+    ) -> OrderFilter:
+        return OrderFilter(
+            created_from=input_dto.created_from,
+            created_until=input_dto.created_until,
+            client_id=client_id,
+            is_cancelled=input_dto.is_cancelled,
+        )
+
+    @staticmethod
+    def _build_cursor(order: Order) -> OrderCursor:
+        return OrderCursor(created_at=order.created_at, order_id=order.id)
+
+    @staticmethod
+    def _build_output_dto(
+        input_dto: ListOrdersInputDTO, orders: list[Order]
+    ) -> ListOrdersOutputDTO:
+        # One extra order is read to tell whether there is a page beyond
+        # this one, in the direction the user is paging.
+        page_size = input_dto.page_size
+        has_more = len(orders) > page_size
+        if input_dto.before is not None:
+            orders = orders[-page_size:]
+            has_newer, has_older = has_more, True
+        else:
+            orders = orders[:page_size]
+            has_newer, has_older = input_dto.after is not None, has_more
+
+        return ListOrdersOutputDTO(
+            orders=[
+                ListOrdersOrderOutputDTO(
+                    order_id=order.id,
+                    external_order_id=order.external_id,
+                    client_name=order.client.name if order.client else None,
+                    is_cancelled=order.is_cancelled,
+                    created_at=order.created_at,
+                    order_items=[
+                        ListOrdersItemOutputDTO(
+                            item_name=order_item.item.name,
+                            quantity=order_item.quantity,
+                        )
+                        for order_item in order.order_items
+                    ],
+                )
+                for order in orders
+            ],
+            next_cursor=(
+                ListOrdersUseCase._build_cursor(orders[-1])
+                if orders and has_older
+                else None
+            ),
+            previous_cursor=(
+                ListOrdersUseCase._build_cursor(orders[0])
+                if orders and has_newer
+                else None
+            ),
+        )
+
+    def execute(self, input_dto: ListOrdersInputDTO) -> ListOrdersOutputDTO:
+        client_id = None
+        if input_dto.client_name is not None:
+            client = self.client_repository.find_client_by_name(
+                input_dto.client_name
+            )
+            if client is None:
+                return ListOrdersOutputDTO(orders=[])
+            client_id = client.id
+
+        orders = self.order_repository.find_orders(
+            self._build_order_filter(input_dto, client_id),
+            input_dto.page_size + 1,
+            after=input_dto.after,
+            before=input_dto.before,
+        )
+
+        return self._build_output_dto(input_dto, orders)
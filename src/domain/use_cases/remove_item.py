@@ -1,14 +1,40 @@
+from src.domain.entities.inventory import (
+    InventoryMovement,
+    InventoryMovementReason,
+)
+from src.domain.entities.item import Item
 from src.domain.exceptions import ItemNotFoundByNameError
 from src.domain.ports.inbound.items.dtos import (
     RemoveItemInputDTO,
     RemoveItemOutputDTO,
 )
-from src.domain.ports.outbound.repositories.item import ItemRepositoryInterface
+from src.domain.ports.outbound.repositories.item import (
+    ItemRepositoryInterface,
+)
+from src.domain.ports.outbound.unit_of_work import (
+    UnitOfWorkInterface,
+)
+from src.domain.unit_of_work import UnitOfWork
 
 
 class RemoveItemUseCase:
-    def __init__(self, item_repository: ItemRepositoryInterface):
+    def __init__(
+        self,
+        item_repository: ItemRepositoryInterface,
+        unit_of_work: UnitOfWorkInterface | None = None,
+    ):
         self.item_repository = item_repository
+        self.unit_of_work = unit_of_work or UnitOfWork(item_repository)
+
+    @staticmethod
+    def _build_inventory_movement(item: Item) -> InventoryMovement:
+        return InventoryMovement(
+            item_id=item.id,
+            item_name=item.name,
+            reason=InventoryMovementReason.REMOVE,
+            quantity_delta=-item.inventory_quantity,
+            inventory_quantity=0,
+        )
 
     def execute(self, input_dto: RemoveItemInputDTO) -> RemoveItemOutputDTO:
         existing_item = self.item_repository.find_item_by_name(
@@ -17,7 +43,11 @@ class RemoveItemUseCase:
         if not existing_item:
             raise ItemNotFoundByNameError(input_dto.item_name)
 
-        self.item_repository.remove_item_by_name(existing_item.name)
+        self.unit_of_work.register_removed_items([existing_item])
+        self.unit_of_work.register_inventory_movements(
+            [self._build_inventory_movement(existing_item)]
+        )
+        self.unit_of_work.commit()
         return RemoveItemOutputDTO(
             item_name=existing_item.name,
         )
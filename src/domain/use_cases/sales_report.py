@@ -0,0 +1,50 @@
+from bson import ObjectId
+
+from src.domain.entities.sales import DailyItemSales
+from src.domain.ports.inbound.sales.dtos import (
+    SalesReportInputDTO,
+    SalesReportItemOutputDTO,
+    SalesReportOutputDTO,
+)
+from src.domain.ports.outbound.repositories.sales import (
+    SalesRepositoryInterface,
+)
+
+
+class SalesReportUseCase:
+    def __init__(self, sales_repository: SalesRepositoryInterface):
+        self.sales_repository = sales_repository
+
+    @staticmethod
+    def _build_output_dto(
+        input_dto: SalesReportInputDTO, daily_sales: list[DailyItemSales]
+    ) -> SalesReportOutputDTO:
+        # Rollups come sorted by day, so the latest name of a renamed item
+        # wins.
+        items_by_id: dict[ObjectId, SalesReportItemOutputDTO] = {}
+        for item_daily_sales in daily_sales:
+            item = items_by_id.setdefault(
+                item_daily_sales.item_id,
+                SalesReportItemOutputDTO(item_name="", quantity=0),
+            )
+            item.item_name = item_daily_sales.item_name
+            item.quantity += item_daily_sales.quantity
+
+        # Items whose orders were all cancelled add up to zero.
+        items = sorted(
+            (item for item in items_by_id.values() if item.quantity),
+            key=lambda item: (-item.quantity, item.item_name),
+        )
+        return SalesReportOutputDTO(
+            first_day=input_dto.first_day,
+            last_day=input_dto.last_day,
+            items=items,
+            total_quantity=sum(item.quantity for item in items),
+        )
+
+    def execute(self, input_dto: SalesReportInputDTO) -> SalesReportOutputDTO:
+        daily_sales = self.sales_repository.find_daily_sales(
+            input_dto.first_day, input_dto.last_day
+        )
+
+        return self._build_output_dto(input_dto, daily_sales)
@@ -1,3 +1,7 @@
+from src.domain.entities.inventory import (
+    InventoryMovement,
+    InventoryMovementReason,
+)
 from src.domain.entities.item import Item
 from src.domain.exceptions import ItemsNotFoundByNameError
 from src.domain.ports.inbound.items.dtos import (
@@ -5,12 +9,23 @@ from src.domain.ports.inbound.items.dtos import (
     SetInventoryQuantityItemOutputDTO,
     SetInventoryQuantityOutputDTO,
 )
-from src.domain.ports.outbound.repositories.item import ItemRepositoryInterface
+from src.domain.ports.outbound.repositories.item import (
+    ItemRepositoryInterface,
+)
+from src.domain.ports.outbound.unit_of_work import (
+    UnitOfWorkInterface,
+)
+from src.domain.unit_of_work import UnitOfWork
 
 
 class SetInventoryQuantitiesUseCase:
-    def __init__(self, item_repository: ItemRepositoryInterface):
+    def __init__(
+        self,
+        item_repository: ItemRepositoryInterface,
+        unit_of_work: UnitOfWorkInterface | None = None,
+    ):
         self.item_repository = item_repository
+        self.unit_of_work = unit_of_work or UnitOfWork(item_repository)
 
     def execute(
         self, input_dto: SetInventoryQuantityInputDTO
@@ -26,21 +41,49 @@ class SetInventoryQuantitiesUseCase:
             items_names_from_dto, items_from_repository
         )
 
+        inventory_movements = self._set_inventory_quantities(
+            input_dto, items_from_repository
+        )
+
+        self.unit_of_work.register_dirty_items(items_from_repository)
+        self.unit_of_work.register_inventory_movements(inventory_movements)
+        self.unit_of_work.commit()
+
+        return self._build_output_dto(items_from_repository)
+
+    @staticmethod
+    def _set_inventory_quantities(
+        input_dto: SetInventoryQuantityInputDTO,
+        items_from_repository: list[Item],
+    ) -> list[InventoryMovement]:
         item_map_by_name = {item.name: item for item in items_from_repository}
 
+        inventory_movements = []
         for item_input in input_dto.items:
             item = item_map_by_name[item_input.item_name]
+            inventory_movements.append(
+                InventoryMovement(
+                    item_id=item.id,
+                    item_name=item.name,
+                    reason=InventoryMovementReason.SET,
+                    quantity_delta=(
+                        item_input.inventory_quantity - item.inventory_quantity
+                    ),
+                    inventory_quantity=item_input.inventory_quantity,
+                )
+            )
             item.set_inventory_quantity(item_input.inventory_quantity)
+        return inventory_movements
 
-        self.item_repository.save_all(items_from_repository)
-
+    @staticmethod
+    def _build_output_dto(items: list[Item]) -> SetInventoryQuantityOutputDTO:
         return SetInventoryQuantityOutputDTO(
             items=[
                 SetInventoryQuantityItemOutputDTO(
                     item_name=item.name,
                     inventory_quantity=item.inventory_quantity,
                 )
-                for item in items_from_repository
+                for item in items
             ]
         )
 
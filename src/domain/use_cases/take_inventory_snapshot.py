@@ -0,0 +1,36 @@
+from src.domain.entities.inventory import InventorySnapshot
+from src.domain.ports.inbound.items.dtos import (
+    TakeInventorySnapshotInputDTO,
+    TakeInventorySnapshotOutputDTO,
+)
+from src.domain.ports.outbound.repositories.inventory import (
+    InventoryLedgerRepositoryInterface,
+)
+
+
+class TakeInventorySnapshotUseCase:
+    def __init__(self, ledger_repository: InventoryLedgerRepositoryInterface):
+        self.ledger_repository = ledger_repository
+
+    def execute(
+        self, input_dto: TakeInventorySnapshotInputDTO
+    ) -> TakeInventorySnapshotOutputDTO:
+        # Each snapshot folds the movements since the previous one, so
+        # rebuilding the stock never reads more than one period of ledger.
+        previous_snapshot = self.ledger_repository.find_latest_snapshot(
+            input_dto.taken_at
+        )
+        movements = self.ledger_repository.find_movements(
+            previous_snapshot.taken_at if previous_snapshot else None,
+            input_dto.taken_at,
+        )
+        snapshot = InventorySnapshot.rebuild(
+            previous_snapshot, movements, input_dto.taken_at
+        )
+        self.ledger_repository.save_snapshot(snapshot)
+
+        return TakeInventorySnapshotOutputDTO(
+            taken_at=snapshot.taken_at,
+            items_count=len(snapshot.items),
+            movements_count=len(movements),
+        )
@@ -0,0 +1,57 @@
+import argparse
+import os
+from datetime import UTC, datetime, timedelta
+
+from src.domain.ports.inbound.items.dtos import (
+    GetInventoryAtInputDTO,
+    TakeInventorySnapshotInputDTO,
+)
+from src.domain.use_cases.get_inventory_at import GetInventoryAtUseCase
+from src.domain.use_cases.take_inventory_snapshot import (
+    TakeInventorySnapshotUseCase,
+)
+from src.main import build_repositories
+
+
+def take_snapshot(repositories, lag_minutes: int) -> None:
+    # Run periodically (cron or a scheduler add-on). The cut trails the
+    # clock so that movements still being committed land before it.
+    taken_at = datetime.now(UTC) - timedelta(minutes=lag_minutes)
+    output_dto = TakeInventorySnapshotUseCase(
+        repositories.ledger_repository
+    ).execute(TakeInventorySnapshotInputDTO(taken_at=taken_at))
+    print(
+        f"Snapshot at {output_dto.taken_at.isoformat()}: "
+        f"{output_dto.items_count} items, "
+        f"{output_dto.movements_count} movements folded"
+    )
+
+
+def print_inventory_at(repositories, at: datetime) -> None:
+    output_dto = GetInventoryAtUseCase(repositories.ledger_repository).execute(
+        GetInventoryAtInputDTO(at=at)
+    )
+    print(f"Inventory at {output_dto.at.isoformat()}:")
+    for item in output_dto.items:
+        print(f"{item.item_name}: {item.inventory_quantity}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Snapshot or query the inventory ledger."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    snapshot_parser = subparsers.add_parser("snapshot")
+    snapshot_parser.add_argument("--lag-minutes", type=int, default=5)
+    at_parser = subparsers.add_parser("at")
+    at_parser.add_argument("at", type=datetime.fromisoformat)
+    args = parser.parse_args()
+
+    repositories = build_repositories(
+        os.getenv("REPOSITORY_BACKEND", "mongoengine")
+    )
+    if args.command == "snapshot":
+        take_snapshot(repositories, args.lag_minutes)
+    else:
+        at = args.at if args.at.tzinfo else args.at.replace(tzinfo=UTC)
+        print_inventory_at(repositories, at)
@@ -1,29 +1,282 @@
 import os
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from typing import NamedTuple
 
 from src.adapters.inbound.telegram_bot.application import run_application
 from src.adapters.inbound.telegram_bot.bot import TelegramBotCommandHandler
+from src.adapters.outbound.repositories.cache.client import (
+    CachedClientRepository,
+)
+from src.adapters.outbound.repositories.cache.item import (
+    CachedItemRepository,
+)
+from src.adapters.outbound.repositories.memory.client import (
+    MemoryClientRepository,
+)
+from src.adapters.outbound.repositories.memory.database import MemoryDatabase
+from src.adapters.outbound.repositories.memory.inventory import (
+    MemoryInventoryLedgerRepository,
+)
+from src.adapters.outbound.repositories.memory.item import (
+    MemoryItemRepository,
+)
+from src.adapters.outbound.repositories.memory.order import (
+    MemoryOrderRepository,
+)
+from src.adapters.outbound.repositories.memory.sales import (
+    MemorySalesRepository,
+)
 from src.adapters.outbound.repositories.mongo.client import (
     MongoClientRepository,
 )
 from src.adapters.outbound.repositories.mongo.connection import (
     MongoConnection,
 )
+from src.adapters.outbound.repositories.mongo.inventory import (
+    MongoInventoryLedgerRepository,
+)
 from src.adapters.outbound.repositories.mongo.item import MongoItemRepository
+from src.adapters.outbound.repositories.mongo.metrics import (
+    COMMAND_METRICS_REGISTRY,
+)
 from src.adapters.outbound.repositories.mongo.order import MongoOrderRepository
+from src.adapters.outbound.repositories.mongo.sales import MongoSalesRepository
+from src.adapters.outbound.repositories.mongo.settings import (
+    MongoConnectionSettings,
+    MongoReadOptions,
+)
+from src.adapters.outbound.repositories.pymongo.client import (
+    PyMongoClientRepository,
+)
+from src.adapters.outbound.repositories.pymongo.inventory import (
+    PyMongoInventoryLedgerRepository,
+)
+from src.adapters.outbound.repositories.pymongo.item import (
+    PyMongoItemRepository,
+)
+from src.adapters.outbound.repositories.pymongo.order import (
+    PyMongoOrderRepository,
+)
+from src.adapters.outbound.repositories.pymongo.sales import (
+    PyMongoSalesRepository,
+)
+from src.adapters.outbound.repositories.sqlite.client import (
+    SQLiteClientRepository,
+)
+from src.adapters.outbound.repositories.sqlite.connection import (
+    SQLiteConnection,
+)
+from src.adapters.outbound.repositories.sqlite.inventory import (
+    SQLiteInventoryLedgerRepository,
+)
+from src.adapters.outbound.repositories.sqlite.item import (
+    SQLiteItemRepository,
+)
+from src.adapters.outbound.repositories.sqlite.order import (
+    SQLiteOrderRepository,
+)
+from src.adapters.outbound.repositories.sqlite.sales import (
+    SQLiteSalesRepository,
+)
+from src.domain.ports.outbound.repositories.client import (
+    ClientRepositoryInterface,
+)
+from src.domain.ports.outbound.repositories.inventory import (
+    InventoryLedgerRepositoryInterface,
+)
+from src.domain.ports.outbound.repositories.item import ItemRepositoryInterface
+from src.domain.ports.outbound.repositories.order import (
+    OrderRepositoryInterface,
+)
+from src.domain.ports.outbound.repositories.sales import (
+    SalesRepositoryInterface,
+)
+from src.domain.unit_of_work import UnitOfWork
+
+
+class Repositories(NamedTuple):
+    item_repository: ItemRepositoryInterface
+    order_repository: OrderRepositoryInterface
+    client_repository: ClientRepositoryInterface
+    sales_repository: SalesRepositoryInterface
+    ledger_repository: InventoryLedgerRepositoryInterface
+    read_only_item_repository: ItemRepositoryInterface
+    read_only_order_repository: OrderRepositoryInterface
+    read_only_sales_repository: SalesRepositoryInterface
+    transaction: Callable[[], AbstractContextManager] = nullcontext
+
+
+def build_backend_repositories(
+    repository_backend: str,
+    connection: MongoConnection,
+    read_options: MongoReadOptions | None = None,
+) -> tuple[
+    ItemRepositoryInterface,
+    OrderRepositoryInterface,
+    ClientRepositoryInterface,
+    SalesRepositoryInterface,
+    InventoryLedgerRepositoryInterface,
+]:
+    match repository_backend:
+        case "mongoengine":
+            return (
+                MongoItemRepository(connection, read_options),
+                MongoOrderRepository(connection, read_options),
+                MongoClientRepository(connection, read_options),
+                MongoSalesRepository(connection, read_options),
+                MongoInventoryLedgerRepository(connection, read_options),
+            )
+        case "pymongo":
+            return (
+                PyMongoItemRepository(connection, read_options),
+                PyMongoOrderRepository(connection, read_options),
+                PyMongoClientRepository(connection, read_options),
+                PyMongoSalesRepository(connection, read_options),
+                PyMongoInventoryLedgerRepository(connection, read_options),
+            )
+        case _:
+            raise ValueError(
+                f"Unknown repository backend {repository_backend}"
+            )
+
+
+def build_memory_repositories() -> Repositories:
+    # Everything already lives in process memory, so there is nothing to
+    # cache and no secondary to read from.
+    memory_database = MemoryDatabase()
+    item_repository = MemoryItemRepository(memory_database)
+    order_repository = MemoryOrderRepository(memory_database)
+    sales_repository = MemorySalesRepository(memory_database)
+    return Repositories(
+        item_repository=item_repository,
+        order_repository=order_repository,
+        client_repository=MemoryClientRepository(memory_database),
+        sales_repository=sales_repository,
+        ledger_repository=MemoryInventoryLedgerRepository(memory_database),
+        read_only_item_repository=item_repository,
+        read_only_order_repository=order_repository,
+        read_only_sales_repository=sales_repository,
+        # Holding the lock keeps other handlers from seeing half of a unit
+        # of work; there is nothing to roll back to.
+        transaction=lambda: memory_database.lock,
+    )
+
+
+def build_sqlite_repositories(database_path: str) -> Repositories:
+    # A local database file has no network round trip to save and no
+    # replicas, so it is used directly like the memory backend.
+    connection = SQLiteConnection(database_path)
+    item_repository = SQLiteItemRepository(connection)
+    order_repository = SQLiteOrderRepository(connection)
+    sales_repository = SQLiteSalesRepository(connection)
+    return Repositories(
+        item_repository=item_repository,
+        order_repository=order_repository,
+        client_repository=SQLiteClientRepository(connection),
+        sales_repository=sales_repository,
+        ledger_repository=SQLiteInventoryLedgerRepository(connection),
+        read_only_item_repository=item_repository,
+        read_only_order_repository=order_repository,
+        read_only_sales_repository=sales_repository,
+        transaction=connection.transaction,
+    )
+
+
+def build_repositories(repository_backend: str) -> Repositories:
+    if repository_backend == "memory":
+        return build_memory_repositories()
+    if repository_backend == "sqlite":
+        return build_sqlite_repositories(
+            os.getenv("SQLITE_DATABASE_PATH", "inventory_manager.db")
+        )
 
-if __name__ == "__main__":
     connection = MongoConnection(
-        os.getenv("MONGO_CONNECTION_STRING", "mongodb://localhost:27017")
+        os.getenv("MONGO_CONNECTION_STRING", "mongodb://localhost:27017"),
+        MongoConnectionSettings.from_env(),
     )
     connection.connect()
 
-    item_repository = MongoItemRepository(connection)
-    order_repository = MongoOrderRepository(connection)
-    client_repository = MongoClientRepository(connection)
+    (
+        item_repository,
+        order_repository,
+        client_repository,
+        sales_repository,
+        ledger_repository,
+    ) = build_backend_repositories(repository_backend, connection)
+    # Read-only flows (listing, reports, history) may read from secondaries
+    # with bounded staleness; everything else stays on the primary.
+    (
+        read_only_item_repository,
+        read_only_order_repository,
+        _,
+        read_only_sales_repository,
+        _,
+    ) = build_backend_repositories(
+        repository_backend, connection, MongoReadOptions.from_env()
+    )
+
+    item_cache_max_size = int(os.getenv("ITEM_CACHE_MAX_SIZE", "1000"))
+    item_cache_ttl_seconds = float(os.getenv("ITEM_CACHE_TTL_SECONDS", "300"))
+    if item_cache_max_size > 0 and item_cache_ttl_seconds > 0:
+        item_repository = CachedItemRepository(
+            item_repository,
+            max_size=item_cache_max_size,
+            ttl_seconds=item_cache_ttl_seconds,
+        )
+        # The cached catalog is fresher than a secondary and needs no
+        # round trip at all.
+        read_only_item_repository = item_repository
 
-    telegram_bot = TelegramBotCommandHandler(
+    client_cache_max_size = int(os.getenv("CLIENT_CACHE_MAX_SIZE", "1000"))
+    if client_cache_max_size > 0:
+        client_repository = CachedClientRepository(
+            client_repository, max_size=client_cache_max_size
+        )
+
+    return Repositories(
         item_repository=item_repository,
         order_repository=order_repository,
         client_repository=client_repository,
+        sales_repository=sales_repository,
+        ledger_repository=ledger_repository,
+        read_only_item_repository=read_only_item_repository,
+        read_only_order_repository=read_only_order_repository,
+        read_only_sales_repository=read_only_sales_repository,
+        transaction=connection.transaction,
+    )
+
+
+if __name__ == "__main__":
+    repositories = build_repositories(
+        os.getenv("REPOSITORY_BACKEND", "mongoengine")
+    )
+
+    telegram_bot = TelegramBotCommandHandler(
+        item_repository=repositories.item_repository,
+        order_repository=repositories.order_repository,
+        client_repository=repositories.client_repository,
+        sales_repository=repositories.sales_repository,
+        ledger_repository=repositories.ledger_repository,
+        read_only_item_repository=repositories.read_only_item_repository,
+        read_only_order_repository=repositories.read_only_order_repository,
+        read_only_sales_repository=repositories.read_only_sales_repository,
+        unit_of_work_factory=lambda: UnitOfWork(
+            repositories.item_repository,
+            repositories.order_repository,
+            repositories.transaction,
+            repositories.sales_repository,
+            repositories.ledger_repository,
+        ),
+        strict_stock=os.getenv("STRICT_STOCK", "false").lower() == "true",
+        low_stock_alert_chat_id=os.getenv("LOW_STOCK_ALERT_CHAT_ID"),
+        low_stock_alert_delay_seconds=float(
+            os.getenv("LOW_STOCK_ALERT_DELAY_SECONDS", "60")
+        ),
     )
     run_application(telegram_bot_command_handler=telegram_bot)
+
+    command_metrics_path = os.getenv("MONGO_COMMAND_METRICS_PATH")
+    if command_metrics_path:
+        with open(command_metrics_path, "w") as command_metrics_file:
+            command_metrics_file.write(COMMAND_METRICS_REGISTRY.render())
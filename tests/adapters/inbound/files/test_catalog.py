@@ -0,0 +1,88 @@
+import io
+
+import pytest
+
+from src.adapters.inbound.files.catalog import (
+    CatalogFormat,
+    detect_catalog_format,
+    read_catalog_rows,
+    write_catalog,
+)
+from src.domain.ports.inbound.items.dtos import CatalogItemOutputDTO
+
+ITEMS = [
+    CatalogItemOutputDTO(
+        item_name="marmita de feijão",
+        inventory_quantity=3,
+        low_stock_threshold=5,
+    ),
+    CatalogItemOutputDTO(
+        item_name="suco", inventory_quantity=0, low_stock_threshold=0
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "path, expected_format",
+    [
+        ("catalogo.csv", CatalogFormat.CSV),
+        ("catalogo.ndjson", CatalogFormat.NDJSON),
+        ("CATALOGO.JSONL", CatalogFormat.NDJSON),
+        ("-", CatalogFormat.CSV),
+    ],
+)
+def test_detect_catalog_format(path, expected_format):
+    # Act
+    catalog_format = detect_catalog_format(path)
+
+    # Assert
+    assert catalog_format == expected_format
+
+
+def test_read_csv_rows_with_line_numbers():
+    # Arrange
+    file = io.StringIO(
+        'item_name,inventory_quantity\nmarmita,3\n"suco\nde uva",2\n'
+    )
+
+    # Act
+    rows = list(read_catalog_rows(file, CatalogFormat.CSV))
+
+    # Assert
+    assert rows == [
+        (2, {"item_name": "marmita", "inventory_quantity": "3"}),
+        (4, {"item_name": "suco\nde uva", "inventory_quantity": "2"}),
+    ]
+
+
+def test_read_ndjson_rows_skips_blank_lines_and_keeps_bad_lines():
+    # Arrange
+    file = io.StringIO(
+        '{"item_name": "marmita", "inventory_quantity": 3}\n'
+        "\n"
+        "{not json\n"
+    )
+
+    # Act
+    rows = list(read_catalog_rows(file, CatalogFormat.NDJSON))
+
+    # Assert
+    assert rows == [
+        (1, {"item_name": "marmita", "inventory_quantity": 3}),
+        (3, None),
+    ]
+
+
+@pytest.mark.parametrize("catalog_format", list(CatalogFormat))
+def test_written_catalog_reads_back(catalog_format):
+    # Arrange
+    file = io.StringIO()
+
+    # Act
+    written_count = write_catalog(iter(ITEMS), file, catalog_format)
+    file.seek(0)
+    rows = [row for _, row in read_catalog_rows(file, catalog_format)]
+
+    # Assert
+    assert written_count == 2
+    assert [CatalogItemOutputDTO.model_validate(row) for row in rows] == ITEMS
@@ -0,0 +1,95 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.adapters.inbound.telegram_bot.alerts import LowStockAlerter
+from src.domain.ports.inbound.items.dtos import (
+    CatalogItemOutputDTO,
+    ListLowStockItemsOutputDTO,
+)
+
+
+def build_output_dto(*items_names):
+    return ListLowStockItemsOutputDTO(
+        items=[
+            CatalogItemOutputDTO(
+                item_name=item_name,
+                inventory_quantity=-1,
+                low_stock_threshold=2,
+            )
+            for item_name in items_names
+        ]
+    )
+
+
+class TestLowStockAlerter:
+    @pytest.fixture
+    def use_case(self):
+        return Mock()
+
+    @pytest.fixture
+    def alerter(self, use_case):
+        return LowStockAlerter(use_case, chat_id=123, delay_seconds=0)
+
+    @pytest.fixture
+    def application(self):
+        application = Mock()
+        application.bot = AsyncMock()
+        return application
+
+    def test_schedule_keeps_a_single_pending_digest(
+        self, alerter, application
+    ):
+        # Act
+        alerter.schedule(application)
+        alerter.schedule(application)
+
+        # Assert
+        application.create_task.assert_called_once()
+        application.create_task.call_args[0][0].close()
+
+    def test_send_digest_alerts_only_newly_low_items(
+        self, alerter, use_case, application
+    ):
+        # Arrange
+        use_case.execute.side_effect = [
+            build_output_dto("marmita de carne"),
+            build_output_dto("marmita de carne", "suco"),
+            build_output_dto("suco"),
+        ]
+
+        # Act
+        for _ in range(3):
+            asyncio.run(alerter.send_digest(application.bot))
+
+        # Assert
+        messages = [
+            call.args[1]
+            for call in application.bot.send_message.call_args_list
+        ]
+        assert messages == [
+            "Marmitas com estoque baixo:\n\n"
+            "  \\- Marmita de carne: \\-1 \\(mínimo 2\\)\n",
+            "Marmitas com estoque baixo:\n\n"
+            "  \\- Suco: \\-1 \\(mínimo 2\\)\n",
+        ]
+        assert application.bot.send_message.call_args.args[0] == 123
+        assert alerter.alerted_items_names == {"suco"}
+
+    def test_schedule_after_the_digest_read_the_stock(
+        self, alerter, use_case, application
+    ):
+        # Arrange
+        use_case.execute.return_value = build_output_dto()
+        alerter.schedule(application)
+        digest = application.create_task.call_args[0][0]
+
+        # Act
+        asyncio.run(digest)
+        alerter.schedule(application)
+
+        # Assert
+        assert application.create_task.call_count == 2
+        application.bot.send_message.assert_not_called()
+        application.create_task.call_args[0][0].close()
@@ -0,0 +1,56 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.adapters.inbound.telegram_bot.bot import TelegramBotCommandHandler
+
+
+class TestTelegramBotCommandHandler:
+    @pytest.fixture
+    def command_handler(self):
+        command_handler = TelegramBotCommandHandler(
+            Mock(), Mock(), Mock(), Mock()
+        )
+        command_handler.telegram_bot_controller = Mock()
+        return command_handler
+
+    def test_slow_use_case_does_not_block_other_handlers(
+        self, command_handler
+    ):
+        # Arrange
+        item_added = threading.Event()
+        controller = command_handler.telegram_bot_controller
+        # Listing waits for the item to be added, which only happens if the
+        # event loop runs the other handler while the listing is pending.
+        controller.list_items.side_effect = lambda use_case: (
+            "Itens" if item_added.wait(timeout=5) else "Bloqueado"
+        )
+
+        def add_item(raw_input, use_case):
+            item_added.set()
+            return "Item adicionado"
+
+        controller.add_item.side_effect = add_item
+        list_message = Mock(reply_text=AsyncMock())
+        update = Mock()
+        update.message.text = "marmita de frango, 10"
+        update.message.reply_text = AsyncMock()
+
+        async def handle_both():
+            await asyncio.gather(
+                command_handler.handle_list_items(list_message),
+                command_handler.handle_add_item(update, Mock()),
+            )
+
+        # Act
+        asyncio.run(handle_both())
+
+        # Assert
+        list_message.reply_text.assert_awaited_once_with(
+            "Itens", parse_mode="MarkdownV2"
+        )
+        update.message.reply_text.assert_awaited_once_with(
+            "Item adicionado", parse_mode="MarkdownV2"
+        )
@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import date, datetime
+from unittest.mock import Mock
 
 import pytest
 
@@ -8,15 +9,21 @@ from src.adapters.outbound.repositories.mongo.client import (
 )
 from src.adapters.outbound.repositories.mongo.item import MongoItemRepository
 from src.adapters.outbound.repositories.mongo.order import MongoOrderRepository
+from src.adapters.outbound.repositories.mongo.sales import MongoSalesRepository
 from src.domain.entities.client import Client
 from src.domain.entities.item import Item
 from src.domain.entities.order import Order, OrderItem
+from src.domain.entities.sales import DailyItemSales
+from src.domain.exceptions import OrdersAlreadyCancelledError
 from src.domain.use_cases.add_item import AddItemUseCase
 from src.domain.use_cases.cancel_order import CancelOrderUseCase
+from src.domain.use_cases.cancel_orders import CancelOrdersUseCase
 from src.domain.use_cases.create_goomer_order import CreateGoomerOrderUseCase
 from src.domain.use_cases.create_manual_order import CreateManualOrderUseCase
 from src.domain.use_cases.list_items import ListItemsUseCase
+from src.domain.use_cases.list_orders import ListOrdersUseCase
 from src.domain.use_cases.remove_item import RemoveItemUseCase
+from src.domain.use_cases.sales_report import SalesReportUseCase
 from src.domain.use_cases.set_inventory_quantities import (
     SetInventoryQuantitiesUseCase,
 )
@@ -218,6 +225,40 @@ class TestTelegramBotController:
         assert "\\- *Quantidade no Pedido:* 2" in output_message
         assert "\\- *Novo Estoque:* 98\n\n" in output_message
 
+    def test_create_order_controller_with_duplicate_order(
+        self, controller, mongo_connection
+    ):
+        # Arrange
+        order_repository = MongoOrderRepository(mongo_connection)
+        item_repository = MongoItemRepository(mongo_connection)
+        item_repository.save(
+            Item(
+                name=(
+                    "pure de batata doce,hamburguer de frango e mix de legumes"
+                ),
+                inventory_quantity=100,
+            )
+        )
+        client_repository = MongoClientRepository(mongo_connection)
+        use_case = CreateGoomerOrderUseCase(
+            client_repository, item_repository, order_repository
+        )
+        controller.create_goomer_order(CREATE_ORDER_TYPE_1_INPUT, use_case)
+
+        # Act
+        output_message = controller.create_goomer_order(
+            CREATE_ORDER_TYPE_1_INPUT, use_case
+        )
+
+        # Assert
+        assert "Pedido já registrado anteriormente\\!\n\n" in output_message
+        assert "\\- *Novo Estoque:* 98\n\n" in output_message
+        saved_order = order_repository.find_order_by_external_id(
+            "nome da marca", 4
+        )
+        assert saved_order is not None
+        assert saved_order.brand == "nome da marca"
+
     @pytest.mark.parametrize(
         "raw_input",
         [CREATE_ORDER_TYPE_1_INPUT, CREATE_ORDER_TYPE_2_INPUT],
@@ -307,6 +348,39 @@ class TestTelegramBotController:
             "frango e mix de legumes não encontrada\\."
         )
 
+    def test_create_manual_order_controller_with_strict_stock(
+        self, controller, mongo_connection
+    ):
+        # Arrange
+        raw_input = "2 marmita de frango\n1 marmita de carne"
+        item_repository = MongoItemRepository(mongo_connection)
+        item_repository.save(
+            Item(name="marmita de frango", inventory_quantity=1)
+        )
+        item_repository.save(
+            Item(name="marmita de carne", inventory_quantity=5)
+        )
+        use_case = CreateManualOrderUseCase(
+            item_repository,
+            MongoOrderRepository(mongo_connection),
+            strict_stock=True,
+        )
+
+        # Act
+        output_message = controller.create_manual_order(raw_input, use_case)
+
+        # Assert
+        assert output_message == (
+            "Erro: Estoque insuficiente de Marmita de frango\\. "
+            "Nenhum item foi baixado\\."
+        )
+        assert [
+            item.inventory_quantity
+            for item in item_repository.find_items_by_names(
+                ["marmita de frango", "marmita de carne"]
+            )
+        ] == [1, 5]
+
     def test_cancel_order_controller_with_success(
         self, controller, mongo_connection
     ):
@@ -365,3 +439,229 @@ class TestTelegramBotController:
         assert output_message == (
             "Erro: Pedido 60c0c5c7e3b9c3b3b2b8f2c5 " "não encontrado\\."
         )
+
+    def test_cancel_orders_controller_with_success(
+        self, controller, mongo_connection
+    ):
+        # Arrange
+        item_repository = MongoItemRepository(mongo_connection)
+        test_item = Item(name="marmita de carne", inventory_quantity=5)
+        item_repository.save(test_item)
+
+        order_repository = MongoOrderRepository(mongo_connection)
+        test_orders = [
+            Order(
+                external_id=external_id,
+                brand=brand,
+                client=None,
+                order_items=[OrderItem(quantity=1, item=test_item)],
+                external_created_at="17:54",
+                created_at=datetime(2023, 6, 7, 10, 0, 0),
+                updated_at=datetime(2023, 6, 7, 10, 0, 0),
+                is_cancelled=False,
+            )
+            for external_id, brand in ((2, "marmitas da maria"), (3, None))
+        ]
+        for test_order in test_orders:
+            order_repository.save(test_order)
+
+        raw_input = f"{test_orders[1].id}\n#2, #4\nMarca Marmitas da Maria"
+
+        # Act
+        output_message = controller.cancel_orders(
+            raw_input, CancelOrdersUseCase(order_repository, item_repository)
+        )
+
+        # Assert
+        assert "2 pedido\\(s\\) cancelado\\(s\\)" in output_message
+        assert f"*ID do Pedido:* {test_orders[0].id}\n" in output_message
+        assert "*Pedido Goomer:* \\#2\n" in output_message
+        assert "1x Marmita de carne \\(estoque: 7\\)" in output_message
+        assert "*Não encontrados:* \\#4\n" in output_message
+        assert (
+            item_repository.find_item_by_name(
+                "marmita de carne"
+            ).inventory_quantity
+            == 7
+        )
+
+    def test_cancel_orders_controller_with_order_cancelled_meanwhile(
+        self, controller
+    ):
+        # Arrange
+        order = Order(
+            external_id=None,
+            client=None,
+            order_items=[],
+            external_created_at="17:54",
+            created_at=datetime(2023, 6, 7, 10, 0, 0),
+            updated_at=datetime(2023, 6, 7, 10, 0, 0),
+            is_cancelled=False,
+        )
+        order_repository = Mock()
+        order_repository.find_orders_by_ids.return_value = [order]
+        order_repository.cancel_orders.side_effect = (
+            OrdersAlreadyCancelledError([order.id])
+        )
+        item_repository = Mock()
+
+        # Act
+        output_message = controller.cancel_orders(
+            str(order.id),
+            CancelOrdersUseCase(order_repository, item_repository),
+        )
+
+        # Assert
+        assert output_message == (
+            f"Erro: Pedidos {order.id} já foram cancelados\\. "
+            "Nenhum pedido foi cancelado\\."
+        )
+        item_repository.increment_inventory_quantities.assert_not_called()
+
+    def test_cancel_orders_controller_without_ids(self, controller):
+        # Act
+        output_message = controller.cancel_orders("marca teste", Mock())
+
+        # Assert
+        assert output_message == "Erro: Ocorreu um erro inesperado\\."
+
+    def test_list_orders_controller_with_success(
+        self, controller, mongo_connection
+    ):
+        # Arrange
+        item_repository = MongoItemRepository(mongo_connection)
+        test_item = Item(name="marmita de carne", inventory_quantity=5)
+        item_repository.save(test_item)
+
+        client_repository = MongoClientRepository(mongo_connection)
+        test_client = Client(name="joana")
+        client_repository.save(test_client)
+
+        order_repository = MongoOrderRepository(mongo_connection)
+        for hour in range(7):
+            order_repository.save(
+                Order(
+                    external_id=hour,
+                    client=test_client,
+                    order_items=[OrderItem(quantity=2, item=test_item)],
+                    external_created_at="17:54",
+                    created_at=datetime(2023, 6, 7, 10 + hour, 0, 0),
+                    updated_at=datetime(2023, 6, 7, 10 + hour, 0, 0),
+                    is_cancelled=False,
+                )
+            )
+        raw_input = "de 07/06/2023\nAté 07/06/2023\ncliente Joana"
+        use_case = ListOrdersUseCase(order_repository, client_repository)
+
+        # Act
+        first_page = controller.list_orders(raw_input, use_case)
+        second_page = controller.list_orders(
+            raw_input, use_case, after=first_page.next_cursor
+        )
+
+        # Assert
+        assert "Histórico de Pedidos:\n\n" in first_page.message
+        assert "*Data:* 07/06/2023 às 13:00\n" in first_page.message
+        assert "*Pedido Goomer:* \\#6\n" in first_page.message
+        assert "*Cliente:* Joana\n" in first_page.message
+        assert "  \\- 2x Marmita de carne\n" in first_page.message
+        assert first_page.message.count("*ID do Pedido:*") == 5
+        assert first_page.previous_cursor is None
+        assert second_page.message.count("*ID do Pedido:*") == 2
+        assert "*Pedido Goomer:* \\#0\n" in second_page.message
+        assert second_page.next_cursor is None
+        assert second_page.previous_cursor is not None
+
+    def test_list_orders_controller_with_no_orders(
+        self, controller, mongo_connection
+    ):
+        # Arrange
+        use_case = ListOrdersUseCase(
+            MongoOrderRepository(mongo_connection),
+            MongoClientRepository(mongo_connection),
+        )
+
+        # Act
+        page = controller.list_orders("cancelados sim", use_case)
+
+        # Assert
+        assert page.message == "Nenhum pedido encontrado\\."
+        assert page.next_cursor is None
+
+    def test_list_orders_controller_with_error(
+        self, controller, mongo_connection
+    ):
+        # Arrange
+        use_case = ListOrdersUseCase(
+            MongoOrderRepository(mongo_connection),
+            MongoClientRepository(mongo_connection),
+        )
+
+        # Act
+        output_message = controller.list_orders("mes junho", use_case)
+
+        # Assert
+        assert output_message == "Erro: Ocorreu um erro inesperado\\."
+
+    def test_sales_report_controller_with_success(
+        self, controller, mongo_connection
+    ):
+        # Arrange
+        sales_repository = MongoSalesRepository(mongo_connection)
+        meat_item = Item(name="marmita de carne", inventory_quantity=0)
+        chicken_item = Item(name="marmita de frango", inventory_quantity=0)
+        sales_repository.increment_daily_sales(
+            [
+                DailyItemSales(
+                    day=date(2024, 6, day),
+                    item_id=item.id,
+                    item_name=item.name,
+                    quantity=quantity,
+                )
+                for day, item, quantity in [
+                    (3, meat_item, 2),
+                    (4, chicken_item, 4),
+                    (5, meat_item, 1),
+                    (9, meat_item, 8),
+                ]
+            ]
+        )
+        raw_input = "de 03/06/2024\nAté 07/06/2024"
+        use_case = SalesReportUseCase(sales_repository)
+
+        # Act
+        output_message = controller.sales_report(raw_input, use_case)
+
+        # Assert
+        assert output_message == (
+            "Vendas de 03/06/2024 a 07/06/2024:\n\n"
+            "  \\- 4x Marmita de frango\n"
+            "  \\- 3x Marmita de carne\n"
+            "\n*Total:* 7 marmitas"
+        )
+
+    def test_sales_report_controller_with_no_sales(
+        self, controller, mongo_connection
+    ):
+        # Arrange
+        use_case = SalesReportUseCase(MongoSalesRepository(mongo_connection))
+
+        # Act
+        output_message = controller.sales_report(
+            "de 03/06/2024\nate 03/06/2024", use_case
+        )
+
+        # Assert
+        assert output_message == "Nenhuma venda em 03/06/2024\\."
+
+    def test_sales_report_controller_with_error(
+        self, controller, mongo_connection
+    ):
+        # Arrange
+        use_case = SalesReportUseCase(MongoSalesRepository(mongo_connection))
+
+        # Act
+        output_message = controller.sales_report("ano passado", use_case)
+
+        # Assert
+        assert output_message == "Erro: Ocorreu um erro inesperado\\."
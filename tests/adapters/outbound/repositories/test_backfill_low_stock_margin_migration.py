@@ -0,0 +1,38 @@
+from src.adapters.outbound.repositories.mongo.documents.item import (
+    ItemDocument,
+)
+from src.adapters.outbound.repositories.mongo.item import MongoItemRepository
+from src.adapters.outbound.repositories.mongo.migrations import (
+    backfill_low_stock_margin,
+)
+
+
+class TestBackfillLowStockMarginMigration:
+    def test_backfill_low_stock_margin_fixes_missing_and_stale_margins(
+        self, mongo_connection
+    ):
+        # Arrange
+        item_repository = MongoItemRepository(mongo_connection)
+        ItemDocument._get_collection().insert_many(
+            [
+                {"name": "suco", "inventory_quantity": 0},
+                {"name": "marmita de carne", "inventory_quantity": 5},
+                {
+                    "name": "marmita de frango",
+                    "inventory_quantity": 2,
+                    "low_stock_threshold": 3,
+                    "low_stock_margin": 4,
+                },
+            ]
+        )
+
+        # Act
+        first_count = backfill_low_stock_margin.backfill_low_stock_margin()
+        second_count = backfill_low_stock_margin.backfill_low_stock_margin()
+
+        # Assert
+        assert (first_count, second_count) == (3, 0)
+        assert [
+            (item.name, item.low_stock_threshold)
+            for item in item_repository.find_low_stock_items()
+        ] == [("marmita de frango", 3), ("suco", 0)]
@@ -0,0 +1,82 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.adapters.outbound.repositories.cache.client import (
+    CachedClientRepository,
+)
+from src.domain.entities.client import Client
+
+
+class TestCachedClientRepository:
+    @pytest.fixture
+    def client_repository(self):
+        return Mock()
+
+    @pytest.fixture
+    def repository(self, client_repository):
+        return CachedClientRepository(client_repository, max_size=2)
+
+    def test_get_or_create_by_name_is_served_from_memory(
+        self, repository, client_repository
+    ):
+        # Arrange
+        client = Client(name="Tirulipa")
+        client_repository.get_or_create_by_name.return_value = client
+        repository.get_or_create_by_name("Tirulipa")
+
+        # Act
+        cached_client = repository.get_or_create_by_name("Tirulipa")
+
+        # Assert
+        assert cached_client == client
+        client_repository.get_or_create_by_name.assert_called_once_with(
+            "Tirulipa"
+        )
+        assert repository.statistics.hits == 1
+        assert repository.statistics.misses == 1
+
+    def test_least_recently_seen_client_is_evicted(
+        self, repository, client_repository
+    ):
+        # Arrange
+        client_repository.get_or_create_by_name.side_effect = (
+            lambda client_name: Client(name=client_name)
+        )
+        repository.get_or_create_by_name("Tirulipa")
+        repository.get_or_create_by_name("Maria")
+        repository.get_or_create_by_name("Tirulipa")
+
+        # Act
+        repository.get_or_create_by_name("Carlos")
+        repository.get_or_create_by_name("Maria")
+
+        # Assert
+        assert client_repository.get_or_create_by_name.call_count == 4
+        assert repository.statistics.evictions == 2
+        assert repository.statistics.size == 2
+
+    def test_save_writes_through(self, repository, client_repository):
+        # Arrange
+        client = Client(name="Tirulipa")
+
+        # Act
+        repository.save(client)
+
+        # Assert
+        client_repository.save.assert_called_once_with(client)
+        assert repository.find_client_by_name("Tirulipa") == client
+        client_repository.find_client_by_name.assert_not_called()
+
+    def test_find_client_by_name_does_not_cache_missing_clients(
+        self, repository, client_repository
+    ):
+        # Arrange
+        client_repository.find_client_by_name.return_value = None
+
+        # Act
+        repository.find_client_by_name("Tirulipa")
+        repository.find_client_by_name("Tirulipa")
+
+        # Assert
+        assert client_repository.find_client_by_name.call_count == 2
@@ -0,0 +1,330 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.adapters.outbound.repositories.cache.item import (
+    CachedItemRepository,
+)
+from src.adapters.outbound.repositories.cache.lru import TTLLRUCache
+from src.domain.entities.item import Item
+from src.domain.exceptions import InsufficientInventoryError
+from src.domain.ports.outbound.repositories.item import SaveAllItemsResult
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLLRUCache:
+    def test_put_evicts_least_recently_used_entry(self):
+        # Arrange
+        cache: TTLLRUCache[str, int] = TTLLRUCache(2, 60)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+
+        # Act
+        cache.put("c", 3)
+
+        # Assert
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert cache.evictions == 1
+
+    def test_get_expired_entry(self):
+        # Arrange
+        clock = FakeClock()
+        cache: TTLLRUCache[str, int] = TTLLRUCache(2, 60, clock)
+        cache.put("a", 1)
+
+        # Act
+        clock.now = 60
+
+        # Assert
+        assert cache.get("a") is None
+        assert cache.values() == []
+        assert len(cache) == 0
+        assert cache.evictions == 1
+
+
+class TestCachedItemRepository:
+    @pytest.fixture
+    def item_repository(self):
+        return Mock()
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def repository(self, item_repository, clock):
+        return CachedItemRepository(
+            item_repository, max_size=10, ttl_seconds=60, clock=clock
+        )
+
+    @pytest.fixture
+    def item_1(self):
+        return Item(name="Marmita de Frango", inventory_quantity=10)
+
+    @pytest.fixture
+    def item_2(self):
+        return Item(name="Marmita de Carne", inventory_quantity=5)
+
+    def test_get_all_is_served_from_memory(
+        self, repository, item_repository, item_1, item_2
+    ):
+        # Arrange
+        item_repository.get_all.return_value = [item_1, item_2]
+        repository.get_all()
+
+        # Act
+        items = repository.get_all()
+
+        # Assert
+        assert items == [item_1, item_2]
+        item_repository.get_all.assert_called_once()
+        assert repository.statistics.hits == 1
+        assert repository.statistics.misses == 1
+        assert repository.statistics.size == 2
+
+    def test_get_all_reloads_after_ttl(
+        self, repository, item_repository, clock, item_1
+    ):
+        # Arrange
+        item_repository.get_all.return_value = [item_1]
+        repository.get_all()
+
+        # Act
+        clock.now = 60
+        repository.get_all()
+
+        # Assert
+        assert item_repository.get_all.call_count == 2
+
+    def test_loaded_catalog_resolves_unknown_names_without_repository(
+        self, repository, item_repository, item_1
+    ):
+        # Arrange
+        item_repository.get_all.return_value = [item_1]
+        repository.get_all()
+
+        # Act
+        items = repository.find_items_by_names(
+            ["Marmita de Frango", "Marmita Vegana"]
+        )
+
+        # Assert
+        assert items == [item_1]
+        item_repository.find_items_by_names.assert_not_called()
+
+    def test_find_items_by_names_only_fetches_missing_names(
+        self, repository, item_repository, item_1, item_2
+    ):
+        # Arrange
+        item_repository.find_items_by_names.return_value = [item_1]
+        repository.find_items_by_names(["Marmita de Frango"])
+        item_repository.find_items_by_names.return_value = [item_2]
+
+        # Act
+        items = repository.find_items_by_names(
+            ["Marmita de Carne", "Marmita de Frango"]
+        )
+
+        # Assert
+        assert items == [item_2, item_1]
+        item_repository.find_items_by_names.assert_called_with(
+            ["Marmita de Carne"]
+        )
+        assert repository.find_item_by_name("Marmita de Carne") == item_2
+        assert item_repository.find_items_by_names.call_count == 2
+
+    def test_returned_items_are_copies(
+        self, repository, item_repository, item_1
+    ):
+        # Arrange
+        item_repository.get_all.return_value = [item_1]
+        repository.get_all()
+
+        # Act
+        repository.get_all()[0].set_inventory_quantity(0)
+        item_1.set_inventory_quantity(0)
+
+        # Assert
+        assert repository.get_all()[0].inventory_quantity == 10
+
+    def test_save_writes_through(self, repository, item_repository, item_1):
+        # Act
+        repository.save(item_1)
+
+        # Assert
+        item_repository.save.assert_called_once_with(item_1)
+        assert repository.find_item_by_name("Marmita de Frango") == item_1
+        item_repository.find_items_by_names.assert_not_called()
+
+    def test_save_all_updates_cached_quantities(
+        self, repository, item_repository, item_1
+    ):
+        # Arrange
+        item_repository.get_all.return_value = [item_1]
+        item_repository.save_all.return_value = SaveAllItemsResult(
+            inserted_count=1, modified_count=1
+        )
+        repository.get_all()
+        new_item = Item(name="Marmita Vegana", inventory_quantity=3)
+
+        # Act
+        result = repository.save_all(
+            [
+                Item(name="Marmita de Frango", inventory_quantity=20),
+                new_item,
+            ]
+        )
+
+        # Assert
+        assert result.modified_count == 1
+        items = repository.get_all()
+        assert [(item.id, item.inventory_quantity) for item in items] == [
+            (item_1.id, 20),
+            (new_item.id, 3),
+        ]
+        item_repository.get_all.assert_called_once()
+
+    def test_iter_items_bypasses_cache(
+        self, repository, item_repository, item_1
+    ):
+        # Arrange
+        item_repository.iter_items.return_value = iter([item_1])
+
+        # Act
+        items = list(repository.iter_items(100))
+
+        # Assert
+        assert items == [item_1]
+        item_repository.iter_items.assert_called_once_with(100)
+        assert repository.statistics.size == 0
+
+    def test_find_low_stock_items_reads_the_repository(
+        self, repository, item_repository, item_1
+    ):
+        # Arrange
+        item_repository.find_low_stock_items.return_value = [item_1]
+
+        # Act
+        items = repository.find_low_stock_items()
+
+        # Assert
+        assert items == [item_1]
+        item_repository.find_low_stock_items.assert_called_once_with()
+
+    def test_remove_item_by_name(self, repository, item_repository, item_1):
+        # Arrange
+        item_repository.get_all.return_value = [item_1]
+        repository.get_all()
+
+        # Act
+        repository.remove_item_by_name("Marmita de Frango")
+
+        # Assert
+        item_repository.remove_item_by_name.assert_called_once_with(
+            "Marmita de Frango"
+        )
+        assert repository.get_all() == []
+        assert repository.find_item_by_name("Marmita de Frango") is None
+
+    def test_increment_inventory_quantities_updates_cached_items(
+        self, repository, item_repository, item_1
+    ):
+        # Arrange
+        item_repository.get_all.return_value = [item_1]
+        item_repository.increment_inventory_quantities.return_value = {
+            item_1.id: 7
+        }
+        repository.get_all()
+
+        # Act
+        result = repository.increment_inventory_quantities({item_1.id: -3})
+
+        # Assert
+        assert result == {item_1.id: 7}
+        item = repository.find_item_by_name("Marmita de Frango")
+        assert item.inventory_quantity == 7
+
+    def test_decrement_inventory_quantities_updates_cached_items(
+        self, repository, item_repository, item_1
+    ):
+        # Arrange
+        item_repository.get_all.return_value = [item_1]
+        item_repository.decrement_inventory_quantities.return_value = {
+            item_1.id: 7
+        }
+        repository.get_all()
+
+        # Act
+        result = repository.decrement_inventory_quantities({item_1.id: 3})
+
+        # Assert
+        assert result == {item_1.id: 7}
+        item = repository.find_item_by_name("Marmita de Frango")
+        assert item.inventory_quantity == 7
+
+    def test_short_decrement_leaves_cached_items(
+        self, repository, item_repository, item_1
+    ):
+        # Arrange
+        item_repository.get_all.return_value = [item_1]
+        item_repository.decrement_inventory_quantities.side_effect = (
+            InsufficientInventoryError(["marmita de frango"])
+        )
+        repository.get_all()
+
+        # Act
+        with pytest.raises(InsufficientInventoryError):
+            repository.decrement_inventory_quantities({item_1.id: 30})
+
+        # Assert
+        item = repository.find_item_by_name("Marmita de Frango")
+        assert item.inventory_quantity == 10
+
+    def test_invalidate_drops_the_cached_catalog(
+        self, repository, item_repository, item_1
+    ):
+        # Arrange
+        item_repository.get_all.return_value = [item_1]
+        item_repository.decrement_inventory_quantities.return_value = {
+            item_1.id: 7
+        }
+        repository.get_all()
+        repository.decrement_inventory_quantities({item_1.id: 3})
+
+        # Act
+        repository.invalidate()
+
+        # Assert
+        assert repository.get_all() == [item_1]
+        assert item_repository.get_all.call_count == 2
+        assert repository.statistics.size == 1
+
+    def test_catalog_larger_than_cache_is_not_served_from_memory(
+        self, item_repository, clock
+    ):
+        # Arrange
+        repository = CachedItemRepository(
+            item_repository, max_size=1, ttl_seconds=60, clock=clock
+        )
+        item_repository.get_all.return_value = [
+            Item(name="Marmita de Frango", inventory_quantity=10),
+            Item(name="Marmita de Carne", inventory_quantity=5),
+        ]
+
+        # Act
+        repository.get_all()
+        repository.get_all()
+
+        # Assert
+        assert item_repository.get_all.call_count == 2
+        assert repository.statistics.misses == 2
@@ -6,13 +6,16 @@ from src.adapters.outbound.repositories.mongo.client import (
 from src.adapters.outbound.repositories.mongo.documents.client import (
     ClientDocument,
 )
+from src.adapters.outbound.repositories.pymongo.client import (
+    PyMongoClientRepository,
+)
 from src.domain.entities.client import Client
 
 
 class TestMongoClientRepository:
-    @pytest.fixture
-    def repository(self, mongo_connection):
-        return MongoClientRepository(mongo_connection)
+    @pytest.fixture(params=[MongoClientRepository, PyMongoClientRepository])
+    def repository(self, request, mongo_connection):
+        return request.param(mongo_connection)
 
     def test_save_client(self, repository, mongo_connection):
         # Arrange
@@ -37,3 +40,27 @@ class TestMongoClientRepository:
         # Assert
         assert found_client.name == "Carlos Magno"
         assert ClientDocument.objects.count() == 1
+
+    def test_get_or_create_by_name_creates_client(
+        self, repository, mongo_command_counter
+    ):
+        # Act
+        client = repository.get_or_create_by_name("Maria Joaquina")
+
+        # Assert
+        assert mongo_command_counter.commands == [
+            ("clients", "find_one_and_update")
+        ]
+        saved_client = ClientDocument.objects().first()
+        assert client == Client(id=saved_client.id, name="Maria Joaquina")
+
+    def test_get_or_create_by_name_returns_existing_client(self, repository):
+        # Arrange
+        existing_client = ClientDocument(name="Carlos Magno").save()
+
+        # Act
+        client = repository.get_or_create_by_name("Carlos Magno")
+
+        # Assert
+        assert client.id == existing_client.id
+        assert ClientDocument.objects.count() == 1
@@ -0,0 +1,52 @@
+from datetime import datetime
+
+from bson import ObjectId
+
+from src.adapters.outbound.repositories.mongo.documents.client import (
+    ClientDocument,
+)
+from src.adapters.outbound.repositories.mongo.documents.order import (
+    OrderDocument,
+)
+from src.adapters.outbound.repositories.mongo.migrations import (
+    dedupe_clients,
+)
+
+
+class TestDedupeClientsMigration:
+    def test_dedupe_clients_merges_clients_with_the_same_name(
+        self, mongo_connection
+    ):
+        # Arrange
+        clients_collection = ClientDocument._get_collection()
+        clients_collection.drop_index("name_unique")
+        kept_client_id, duplicated_client_id = ObjectId(), ObjectId()
+        clients_collection.insert_many(
+            [
+                {"_id": kept_client_id, "name": "Joana"},
+                {"_id": duplicated_client_id, "name": "Joana"},
+                {"_id": ObjectId(), "name": "Carlos"},
+            ]
+        )
+        OrderDocument._get_collection().insert_one(
+            {
+                "external_id": 1,
+                "client": duplicated_client_id,
+                "external_created_at": "17:54",
+                "created_at": datetime(2023, 6, 7, 10, 0, 0),
+                "updated_at": datetime(2023, 6, 7, 10, 0, 0),
+                "is_cancelled": False,
+            }
+        )
+
+        # Act
+        removed_clients_count = dedupe_clients.dedupe_clients()
+
+        # Assert
+        assert removed_clients_count == 1
+        assert clients_collection.count_documents({}) == 2
+        assert (
+            OrderDocument._get_collection().find_one()["client"]
+            == kept_client_id
+        )
+        assert "name_unique" in clients_collection.index_information()
@@ -0,0 +1,108 @@
+from datetime import datetime
+
+from src.adapters.outbound.repositories.mongo.documents.client import (
+    ClientDocument,
+)
+from src.adapters.outbound.repositories.mongo.documents.item import (
+    ItemDocument,
+)
+from src.adapters.outbound.repositories.mongo.documents.order import (
+    ORDER_SCHEMA_VERSION,
+    OrderDocument,
+)
+from src.adapters.outbound.repositories.mongo.documents.order_item import (
+    OrderItemDocument,
+)
+from src.adapters.outbound.repositories.mongo.documents.order_line import (
+    OrderLineDocument,
+)
+from src.adapters.outbound.repositories.mongo.migrations import (
+    embed_order_items,
+)
+from src.adapters.outbound.repositories.mongo.order import MongoOrderRepository
+
+
+class TestEmbedOrderItemsMigration:
+    @staticmethod
+    def _save_legacy_order(client, order_items):
+        return OrderDocument(
+            external_id=1,
+            client=client,
+            order_items=order_items,
+            external_created_at="17:54",
+            created_at=datetime(2023, 6, 7, 10, 0, 0),
+            updated_at=datetime(2023, 6, 7, 10, 0, 0),
+            is_cancelled=False,
+        ).save()
+
+    def test_migrate_orders_embeds_order_items(self, mongo_connection):
+        # Arrange
+        client = ClientDocument(name="Joana").save()
+        meat_item = ItemDocument(
+            name="Marmita de Carne", inventory_quantity=5
+        ).save()
+        chicken_item = ItemDocument(
+            name="Marmita de Frango", inventory_quantity=3
+        ).save()
+        first_order = self._save_legacy_order(
+            client,
+            [
+                OrderItemDocument(quantity=1, item=meat_item).save(),
+                OrderItemDocument(quantity=2, item=chicken_item).save(),
+            ],
+        )
+        second_order = self._save_legacy_order(
+            client, [OrderItemDocument(quantity=4, item=meat_item).save()]
+        )
+
+        # Act
+        migrated_orders_count = embed_order_items.migrate_orders(batch_size=1)
+
+        # Assert
+        assert migrated_orders_count == 2
+        assert OrderItemDocument.objects.count() == 0
+
+        first_order.reload()
+        assert first_order.schema_version == ORDER_SCHEMA_VERSION
+        assert first_order.order_items == []
+        assert [
+            (line.item_id, line.item_name, line.quantity)
+            for line in first_order.lines
+        ] == [
+            (meat_item.id, "Marmita de Carne", 1),
+            (chicken_item.id, "Marmita de Frango", 2),
+        ]
+
+        found_order = MongoOrderRepository(mongo_connection).find_order_by_id(
+            second_order.id
+        )
+        assert found_order.client.name == "Joana"
+        assert len(found_order.order_items) == 1
+        assert found_order.order_items[0].quantity == 4
+        assert found_order.order_items[0].item.id == meat_item.id
+        assert found_order.order_items[0].item.inventory_quantity == 5
+
+    def test_migrate_orders_skips_version_2_orders(self, mongo_connection):
+        # Arrange
+        item = ItemDocument(name="Marmita Vegana", inventory_quantity=5).save()
+        order = OrderDocument(
+            schema_version=ORDER_SCHEMA_VERSION,
+            lines=[
+                OrderLineDocument(
+                    item_id=item.id, item_name=item.name, quantity=2
+                )
+            ],
+            created_at=datetime(2023, 6, 7, 10, 0, 0),
+            updated_at=datetime(2023, 6, 7, 10, 0, 0),
+        ).save()
+        orphan_order_item = OrderItemDocument(quantity=3, item=item).save()
+
+        # Act
+        migrated_orders_count = embed_order_items.migrate_orders()
+
+        # Assert
+        assert migrated_orders_count == 0
+        order.reload()
+        assert len(order.lines) == 1
+        assert order.lines[0].quantity == 2
+        assert OrderItemDocument.objects(id=orphan_order_item.id).count() == 0
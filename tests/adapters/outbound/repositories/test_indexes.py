@@ -0,0 +1,194 @@
+from unittest.mock import MagicMock
+
+import pytest
+from mongoengine.connection import get_db
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import DuplicateKeyError
+
+from src.adapters.outbound.repositories.mongo.documents.item import (
+    ItemDocument,
+)
+from src.adapters.outbound.repositories.mongo.indexes import (
+    COLLECTION_OPTIONS,
+    INDEXES,
+    REPOSITORY_QUERIES,
+    SUPERSEDED_INDEXES,
+    DuplicateIndexKeysError,
+    ensure_collections,
+    ensure_indexes,
+    ensure_low_stock_margins,
+    find_collection_scans,
+)
+from src.adapters.outbound.repositories.mongo.item import MongoItemRepository
+
+
+def _build_explain_output(winning_plan: dict) -> dict:
+    return {"queryPlanner": {"winningPlan": winning_plan}}
+
+
+class TestIndexes:
+    def test_connect_creates_indexes(self, mongo_connection):
+        # Arrange
+        database = get_db()
+
+        # Assert
+        for collection_name, index_models in INDEXES.items():
+            index_information = database[collection_name].index_information()
+            for index_model in index_models:
+                assert index_model.document["name"] in index_information
+
+    def test_ensure_indexes_is_idempotent(self, mongo_connection):
+        # Arrange
+        database = get_db()
+        index_names_before = {
+            collection_name: set(database[collection_name].index_information())
+            for collection_name in INDEXES
+        }
+
+        # Act
+        ensure_indexes(database)
+
+        # Assert
+        for collection_name in INDEXES:
+            assert (
+                set(database[collection_name].index_information())
+                == index_names_before[collection_name]
+            )
+
+    def test_ensure_indexes_drops_superseded_indexes(self, mongo_connection):
+        # Arrange
+        database = get_db()
+        database["clients"].drop_index("name_unique")
+        database["clients"].create_index([("name", ASCENDING)], name="name")
+        database["orders"].create_index(
+            [("created_at", DESCENDING)], name="created_at"
+        )
+
+        # Act
+        ensure_indexes(database)
+
+        # Assert
+        for collection_name, index_names in SUPERSEDED_INDEXES.items():
+            index_information = database[collection_name].index_information()
+            assert not set(index_names) & set(index_information)
+        assert "name_unique" in database["clients"].index_information()
+
+    def test_ensure_indexes_with_duplicated_client_names(
+        self, mongo_connection
+    ):
+        # Arrange
+        database = get_db()
+        clients = database["clients"]
+        clients.drop_index("name_unique")
+        clients.insert_many([{"name": "Joana"}, {"name": "Joana"}])
+
+        # Act & Assert
+        with pytest.raises(
+            DuplicateIndexKeysError, match="make dedupe-clients"
+        ) as exc_info:
+            ensure_indexes(database)
+        assert exc_info.value.collection_name == "clients"
+
+    def test_ensure_collections_creates_missing_collections(self):
+        # Arrange
+        database = MagicMock()
+        database.list_collection_names.return_value = ["orders"]
+
+        # Act
+        ensure_collections(database)
+
+        # Assert
+        database.create_collection.assert_called_once_with(
+            "orders_archive", **COLLECTION_OPTIONS["orders_archive"]
+        )
+
+    def test_ensure_collections_keeps_existing_collections(self):
+        # Arrange
+        database = MagicMock()
+        database.list_collection_names.return_value = list(COLLECTION_OPTIONS)
+
+        # Act
+        ensure_collections(database)
+
+        # Assert
+        database.create_collection.assert_not_called()
+
+    def test_item_name_is_unique(self, mongo_connection):
+        # Arrange
+        ItemDocument(name="Marmita de Carne", inventory_quantity=1).save()
+
+        # Act & Assert
+        with pytest.raises(DuplicateKeyError):
+            ItemDocument._get_collection().insert_one(
+                {"name": "Marmita de Carne", "inventory_quantity": 2}
+            )
+
+    def test_ensure_low_stock_margins_fills_only_missing_margins(
+        self, mongo_connection
+    ):
+        # Arrange
+        item_repository = MongoItemRepository(mongo_connection)
+        items = ItemDocument._get_collection()
+        items.insert_many(
+            [
+                {"name": "marmita de carne", "inventory_quantity": 10},
+                {
+                    "name": "suco",
+                    "inventory_quantity": 4,
+                    "low_stock_threshold": 3,
+                    "low_stock_margin": 4,
+                },
+            ]
+        )
+        carne_id = items.find_one({"name": "marmita de carne"})["_id"]
+
+        # Act
+        ensure_low_stock_margins(get_db())
+        item_repository.increment_inventory_quantities({carne_id: -3})
+
+        # Assert
+        assert items.find_one({"_id": carne_id})["low_stock_margin"] == 7
+        assert items.find_one({"name": "suco"})["low_stock_margin"] == 4
+        assert item_repository.find_low_stock_items() == []
+
+    def test_find_collection_scans_with_index_scans(self):
+        # Arrange
+        database = MagicMock()
+        explain = database.__getitem__.return_value.find.return_value.explain
+        explain.return_value = _build_explain_output(
+            {
+                "stage": "FETCH",
+                "inputStage": {"stage": "IXSCAN", "indexName": "name"},
+            }
+        )
+
+        # Act
+        collection_scans = find_collection_scans(database)
+
+        # Assert
+        assert collection_scans == []
+        assert database.__getitem__.call_count == len(REPOSITORY_QUERIES)
+
+    def test_find_collection_scans_reports_nested_collection_scans(self):
+        # Arrange
+        database = MagicMock()
+        explain = database.__getitem__.return_value.find.return_value.explain
+        explain.return_value = _build_explain_output(
+            {
+                "stage": "SUBPLAN",
+                "inputStage": {
+                    "stage": "OR",
+                    "inputStages": [
+                        {"stage": "IXSCAN"},
+                        {"stage": "COLLSCAN"},
+                    ],
+                },
+            }
+        )
+
+        # Act
+        collection_scans = find_collection_scans(database)
+
+        # Assert
+        assert len(collection_scans) == len(REPOSITORY_QUERIES)
+        assert collection_scans[0].startswith("items: ")
@@ -1,16 +1,27 @@
+from unittest.mock import Mock
+
+import mongomock
 import pytest
+from pymongo.read_preferences import Primary
 
 from src.adapters.outbound.repositories.mongo.documents.item import (
     ItemDocument,
 )
 from src.adapters.outbound.repositories.mongo.item import MongoItemRepository
+from src.adapters.outbound.repositories.mongo.settings import (
+    MongoReadOptions,
+)
+from src.adapters.outbound.repositories.pymongo.item import (
+    PyMongoItemRepository,
+)
 from src.domain.entities.item import Item
+from src.domain.exceptions import InsufficientInventoryError
 
 
 class TestMongoItemRepository:
-    @pytest.fixture
-    def repository(self, mongo_connection):
-        return MongoItemRepository(mongo_connection)
+    @pytest.fixture(params=[MongoItemRepository, PyMongoItemRepository])
+    def repository(self, request, mongo_connection):
+        return request.param(mongo_connection)
 
     def test_save_item(self, repository):
         # Arrange
@@ -82,6 +93,31 @@ class TestMongoItemRepository:
         # Assert
         assert ItemDocument.objects.count() == 0
 
+    def test_save_and_remove_item_join_the_current_session(
+        self, repository, mongo_connection, monkeypatch
+    ):
+        # Arrange
+        session = Mock()
+        monkeypatch.setattr(
+            mongo_connection, "get_current_session", lambda: session
+        )
+        replace_one = Mock()
+        delete_many = Mock()
+        monkeypatch.setattr(
+            mongomock.collection.Collection, "replace_one", replace_one
+        )
+        monkeypatch.setattr(
+            mongomock.collection.Collection, "delete_many", delete_many
+        )
+
+        # Act
+        repository.save(Item(name="Marmita de Frango", inventory_quantity=1))
+        repository.remove_item_by_name("Marmita de Frango")
+
+        # Assert
+        assert replace_one.call_args.kwargs["session"] is session
+        assert delete_many.call_args.kwargs["session"] is session
+
     def test_save_all_items(self, repository):
         # Arrange
         test_items = [
@@ -90,12 +126,168 @@ class TestMongoItemRepository:
         ]
 
         # Act
-        repository.save_all(test_items)
+        result = repository.save_all(test_items)
 
         # Assert
+        assert result.inserted_count == 2
+        assert result.modified_count == 0
         saved_items = ItemDocument.objects()
         assert saved_items.count() == 2
+        assert saved_items[0].id == test_items[0].id
         assert saved_items[0].name == "Marmita de Frango"
         assert saved_items[0].inventory_quantity == 2
+        assert saved_items[1].id == test_items[1].id
         assert saved_items[1].name == "Marmita Vegana"
         assert saved_items[1].inventory_quantity == 6
+
+    def test_save_all_items_updates_existing_items_by_name(self, repository):
+        # Arrange
+        existing_item = ItemDocument(
+            name="Marmita de Frango", inventory_quantity=10
+        ).save()
+        test_items = [
+            Item(name="Marmita de Frango", inventory_quantity=3),
+            Item(name="Marmita Vegana", inventory_quantity=6),
+        ]
+
+        # Act
+        result = repository.save_all(test_items)
+
+        # Assert
+        assert result.inserted_count == 1
+        assert result.modified_count == 1
+        assert ItemDocument.objects.count() == 2
+        existing_item.reload()
+        assert existing_item.inventory_quantity == 3
+
+    def test_save_all_items_uses_a_single_command(
+        self, repository, mongo_command_counter
+    ):
+        # Arrange
+        ItemDocument(name="Marmita 0", inventory_quantity=1).save()
+        test_items = [
+            Item(name=f"Marmita {index}", inventory_quantity=index)
+            for index in range(20)
+        ]
+        mongo_command_counter.reset()
+
+        # Act
+        result = repository.save_all(test_items)
+
+        # Assert
+        assert result.inserted_count == 19
+        assert result.modified_count == 1
+        assert mongo_command_counter.commands == [("items", "bulk_write")]
+
+    def test_save_all_items_with_no_items(
+        self, repository, mongo_command_counter
+    ):
+        # Act
+        result = repository.save_all([])
+
+        # Assert
+        assert result.inserted_count == 0
+        assert result.modified_count == 0
+        assert mongo_command_counter.count == 0
+
+    def test_decrement_inventory_quantities_round_trips(
+        self, repository, mongo_command_counter
+    ):
+        # Arrange
+        chicken_item = ItemDocument(
+            name="Marmita de Frango", inventory_quantity=10
+        ).save()
+        vegan_item = ItemDocument(
+            name="Marmita Vegana", inventory_quantity=1
+        ).save()
+        mongo_command_counter.reset()
+
+        # Act
+        repository.decrement_inventory_quantities({chicken_item.id: 2})
+        decrement_commands = list(mongo_command_counter.commands)
+        mongo_command_counter.reset()
+        with pytest.raises(InsufficientInventoryError):
+            repository.decrement_inventory_quantities(
+                {chicken_item.id: 2, vegan_item.id: 2}
+            )
+
+        # Assert
+        assert decrement_commands == [
+            ("items", "bulk_write"),
+            ("items", "find"),
+            ("items", "update_many"),
+        ]
+        assert mongo_command_counter.commands == [
+            ("items", "bulk_write"),
+            ("items", "find"),
+            ("items", "bulk_write"),
+        ]
+        chicken_item.reload()
+        vegan_item.reload()
+        assert chicken_item.inventory_quantity == 8
+        assert vegan_item.inventory_quantity == 1
+        assert chicken_item.pending_decrement_ids == []
+        assert vegan_item.pending_decrement_ids == []
+
+    def test_increment_inventory_quantities(self, repository):
+        # Arrange
+        chicken_item = ItemDocument(
+            name="Marmita de Frango", inventory_quantity=10
+        ).save()
+        vegan_item = ItemDocument(
+            name="Marmita Vegana", inventory_quantity=1
+        ).save()
+        untouched_item = ItemDocument(
+            name="Marmita de Carne", inventory_quantity=7
+        ).save()
+
+        # Act
+        inventory_quantities = repository.increment_inventory_quantities(
+            {chicken_item.id: -3, vegan_item.id: 4}
+        )
+
+        # Assert
+        assert inventory_quantities == {
+            chicken_item.id: 7,
+            vegan_item.id: 5,
+        }
+        chicken_item.reload()
+        vegan_item.reload()
+        untouched_item.reload()
+        assert chicken_item.inventory_quantity == 7
+        assert vegan_item.inventory_quantity == 5
+        assert untouched_item.inventory_quantity == 7
+
+    def test_increment_inventory_quantities_with_no_deltas(self, repository):
+        # Act
+        inventory_quantities = repository.increment_inventory_quantities({})
+
+        # Assert
+        assert inventory_quantities == {}
+
+    def test_read_only_repository_routes_reads(
+        self, repository, mongo_connection
+    ):
+        # Arrange
+        read_options = MongoReadOptions(read_preference="secondary")
+        read_only_repository = type(repository)(mongo_connection, read_options)
+        repository.save(Item(name="Marmita de Frango", inventory_quantity=10))
+
+        # Act
+        items = read_only_repository.get_all()
+
+        # Assert
+        assert [item.name for item in items] == ["Marmita de Frango"]
+        if isinstance(read_only_repository, PyMongoItemRepository):
+            assert (
+                read_only_repository.read_collection.read_preference
+                == read_options.build_read_preference()
+            )
+            assert read_only_repository.collection.read_preference == (
+                Primary()
+            )
+        else:
+            assert (
+                read_only_repository._read_objects()._read_preference
+                == read_options.build_read_preference()
+            )
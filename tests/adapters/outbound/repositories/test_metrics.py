@@ -0,0 +1,196 @@
+from unittest.mock import Mock
+
+import mongomock
+import pytest
+
+from src.adapters.outbound.repositories.mongo.metrics import (
+    CommandMetricsListener,
+    CommandMetricsRegistry,
+    current_repository_method,
+    instrument_repository,
+)
+from src.adapters.outbound.repositories.pymongo.item import (
+    PyMongoItemRepository,
+)
+from src.domain.entities.item import Item
+
+
+def build_started_event(command, request_id=1):
+    return Mock(
+        command=command,
+        command_name=next(iter(command)),
+        connection_id=("localhost", 27017),
+        request_id=request_id,
+    )
+
+
+def build_finished_event(duration_micros, request_id=1):
+    return Mock(
+        connection_id=("localhost", 27017),
+        request_id=request_id,
+        duration_micros=duration_micros,
+    )
+
+
+@instrument_repository
+class FakeRepository:
+    def find(self):
+        return current_repository_method.get()
+
+    def iter_labels(self):
+        yield current_repository_method.get()
+        yield current_repository_method.get()
+
+    def _private(self):
+        return current_repository_method.get()
+
+
+class TestCommandMetricsListener:
+    @pytest.fixture
+    def registry(self):
+        return CommandMetricsRegistry()
+
+    @pytest.fixture
+    def listener(self, registry):
+        return CommandMetricsListener(registry)
+
+    def test_records_commands_per_collection_operation_and_method(
+        self, listener, registry
+    ):
+        # Arrange
+        token = current_repository_method.set("Repository.find")
+
+        # Act
+        for request_id, duration_micros in ((1, 800), (2, 30000)):
+            listener.started(
+                build_started_event({"find": "items"}, request_id)
+            )
+            listener.succeeded(
+                build_finished_event(duration_micros, request_id)
+            )
+        listener.started(build_started_event({"insert": "orders"}, 3))
+        listener.failed(build_finished_event(1500, 3))
+        current_repository_method.reset(token)
+
+        # Assert
+        find_metrics, insert_metrics = registry.collect()
+        assert (
+            find_metrics.collection,
+            find_metrics.operation,
+            find_metrics.repository_method,
+        ) == ("items", "find", "Repository.find")
+        assert find_metrics.count == 2
+        assert find_metrics.total_duration_ms == 30.8
+        assert find_metrics.bucket_counts[0] == 1
+        assert find_metrics.bucket_counts[5] == 1
+        assert (insert_metrics.count, insert_metrics.failures) == (1, 1)
+
+    def test_get_more_and_database_commands(self, listener, registry):
+        # Act
+        listener.started(
+            build_started_event({"getMore": 123, "collection": "orders"}, 1)
+        )
+        listener.succeeded(build_finished_event(100, 1))
+        listener.started(build_started_event({"ping": 1}, 2))
+        listener.succeeded(build_finished_event(100, 2))
+
+        # Assert
+        assert [
+            (metrics.collection, metrics.operation, metrics.repository_method)
+            for metrics in registry.collect()
+        ] == [("-", "ping", "-"), ("orders", "getMore", "-")]
+
+    def test_finished_event_without_started_event_is_ignored(
+        self, listener, registry
+    ):
+        # Act
+        listener.succeeded(build_finished_event(100))
+
+        # Assert
+        assert registry.collect() == []
+
+
+class TestCommandMetricsRegistry:
+    def test_render_cumulative_histogram(self):
+        # Arrange
+        registry = CommandMetricsRegistry()
+        labels = ("items", "find", "Repository.find")
+        registry.observe(labels, 0.5, succeeded=True)
+        registry.observe(labels, 3000, succeeded=False)
+
+        # Act
+        output = registry.render()
+
+        # Assert
+        prefix = (
+            'collection="items",operation="find",'
+            'repository_method="Repository.find"'
+        )
+        assert (
+            f'mongo_command_duration_ms_bucket{{{prefix},le="1"}} 1'
+        ) in output
+        assert (
+            f'mongo_command_duration_ms_bucket{{{prefix},le="2500"}} 1'
+        ) in output
+        assert (
+            f'mongo_command_duration_ms_bucket{{{prefix},le="+Inf"}} 2'
+        ) in output
+        assert f"mongo_command_duration_ms_sum{{{prefix}}} 3000.500" in output
+        assert f"mongo_command_duration_ms_count{{{prefix}}} 2" in output
+        assert f"mongo_command_failures_total{{{prefix}}} 1" in output
+
+    def test_reset(self):
+        # Arrange
+        registry = CommandMetricsRegistry()
+        registry.observe(("items", "find", "-"), 1, succeeded=True)
+
+        # Act
+        registry.reset()
+
+        # Assert
+        assert registry.collect() == []
+
+
+class TestInstrumentRepository:
+    def test_labels_public_methods(self):
+        # Arrange
+        repository = FakeRepository()
+
+        # Act
+        labels = [
+            repository.find(),
+            *repository.iter_labels(),
+            repository._private(),
+        ]
+
+        # Assert
+        assert labels == [
+            "FakeRepository.find",
+            "FakeRepository.iter_labels",
+            "FakeRepository.iter_labels",
+            "-",
+        ]
+        assert current_repository_method.get() == "-"
+
+    def test_repository_commands_carry_the_method_label(
+        self, mongo_connection, monkeypatch
+    ):
+        # Arrange
+        labels = []
+        find = mongomock.collection.Collection.find
+
+        def recording_find(collection, *args, **kwargs):
+            labels.append(current_repository_method.get())
+            return find(collection, *args, **kwargs)
+
+        monkeypatch.setattr(
+            mongomock.collection.Collection, "find", recording_find
+        )
+        repository = PyMongoItemRepository(mongo_connection)
+        repository.save(Item(name="marmita", inventory_quantity=1))
+
+        # Act
+        repository.find_item_by_name("marmita")
+
+        # Assert
+        assert labels == ["PyMongoItemRepository.find_item_by_name"]
@@ -1,6 +1,8 @@
+import sys
 from datetime import datetime
 
 import pytest
+from bson import ObjectId
 from freezegun import freeze_time
 
 from src.adapters.outbound.repositories.mongo.documents.client import (
@@ -10,21 +12,32 @@ from src.adapters.outbound.repositories.mongo.documents.item import (
     ItemDocument,
 )
 from src.adapters.outbound.repositories.mongo.documents.order import (
+    ORDER_SCHEMA_VERSION,
     OrderDocument,
 )
 from src.adapters.outbound.repositories.mongo.documents.order_item import (
     OrderItemDocument,
 )
+from src.adapters.outbound.repositories.mongo.documents.order_line import (
+    OrderLineDocument,
+)
 from src.adapters.outbound.repositories.mongo.order import MongoOrderRepository
+from src.adapters.outbound.repositories.pymongo.order import (
+    PyMongoOrderRepository,
+)
 from src.domain.entities.client import Client
 from src.domain.entities.item import Item
 from src.domain.entities.order import Order, OrderItem
+from src.domain.exceptions import (
+    OrderAlreadyExistsError,
+    OrdersAlreadyCancelledError,
+)
 
 
 class TestMongoOrderRepository:
-    @pytest.fixture
-    def repository(self, mongo_connection):
-        return MongoOrderRepository(mongo_connection)
+    @pytest.fixture(params=[MongoOrderRepository, PyMongoOrderRepository])
+    def repository(self, request, mongo_connection):
+        return request.param(mongo_connection)
 
     @freeze_time("2023-06-07 10:00:00")
     def test_save_order(self, repository, mongo_connection):
@@ -63,15 +76,121 @@ class TestMongoOrderRepository:
         assert saved_order.external_created_at == "17:54"
         assert saved_order.created_at == datetime(2023, 6, 7, 10, 0, 0)
         assert saved_order.updated_at == datetime(2023, 6, 7, 10, 0, 0)
-        assert len(saved_order.order_items) == 1
-        assert saved_order.order_items[0].quantity == 2
-        assert saved_order.order_items[0].item.id == test_item.id
-        assert saved_order.order_items[0].item.name == "Marmita de Frango"
-        assert saved_order.order_items[0].item.inventory_quantity == 10
+        assert saved_order.schema_version == ORDER_SCHEMA_VERSION
+        assert len(saved_order.lines) == 1
+        assert saved_order.lines[0].quantity == 2
+        assert saved_order.lines[0].item_id == test_item.id
+        assert saved_order.lines[0].item_name == "Marmita de Frango"
+        assert saved_order.order_items == []
+        assert OrderDocument.objects.count() == 1
+        assert OrderItemDocument.objects.count() == 0
+
+    def test_save_order_uses_a_single_command(
+        self, repository, mongo_command_counter
+    ):
+        # Arrange
+        test_client = Client(name="Carlos")
+        test_order = Order(
+            external_id=1,
+            client=test_client,
+            order_items=[
+                OrderItem(
+                    quantity=1,
+                    item=Item(name=f"Marmita {index}", inventory_quantity=1),
+                )
+                for index in range(30)
+            ],
+            external_created_at="17:54",
+            created_at=datetime(2023, 6, 7, 10, 0, 0),
+            updated_at=datetime(2023, 6, 7, 10, 0, 0),
+            is_cancelled=False,
+        )
+
+        # Act
+        repository.save(test_order)
+
+        # Assert
+        assert mongo_command_counter.commands == [("orders", "replace_one")]
+        saved_order = OrderDocument._get_collection().find_one()
+        assert saved_order["_id"] == test_order.id
+        assert saved_order["client"] == test_client.id
+        assert len(saved_order["lines"]) == 30
+
+    def test_save_existing_order_replaces_it(self, repository):
+        # Arrange
+        test_item = Item(name="Marmita de Frango", inventory_quantity=10)
+        test_order = Order(
+            external_id=None,
+            client=None,
+            order_items=[OrderItem(quantity=2, item=test_item)],
+            external_created_at=None,
+            created_at=datetime(2023, 6, 7, 10, 0, 0),
+            updated_at=datetime(2023, 6, 7, 10, 0, 0),
+            is_cancelled=False,
+        )
+        repository.save(test_order)
+        test_order.cancel()
+
+        # Act
+        repository.save(test_order)
+
+        # Assert
         assert OrderDocument.objects.count() == 1
+        saved_order = OrderDocument.objects.first()
+        assert saved_order.is_cancelled
+        assert saved_order.client is None
+        assert len(saved_order.lines) == 1
 
     @freeze_time("2023-06-07 10:00:00")
     def test_find_order_by_id(self, repository, mongo_connection):
+        # Arrange
+        test_client = ClientDocument(name="Joana").save()
+        test_item = ItemDocument(
+            name="Marmita de Carne", inventory_quantity=5
+        ).save()
+        removed_item_id = ObjectId()
+        test_order = OrderDocument(
+            external_id=2,
+            client=test_client,
+            schema_version=ORDER_SCHEMA_VERSION,
+            lines=[
+                OrderLineDocument(
+                    item_id=test_item.id,
+                    item_name=test_item.name,
+                    quantity=1,
+                ),
+                OrderLineDocument(
+                    item_id=removed_item_id,
+                    item_name="Marmita Removida",
+                    quantity=3,
+                ),
+            ],
+            external_created_at="17:54",
+            created_at=datetime(2023, 6, 7, 10, 0, 0),
+            updated_at=datetime(2023, 6, 7, 10, 0, 0),
+            is_cancelled=False,
+        ).save()
+
+        # Act
+        found_order = repository.find_order_by_id(test_order.id)
+
+        # Assert
+        assert found_order is not None
+        assert found_order.id == test_order.id
+        assert found_order.external_id == 2
+        assert found_order.client.id == test_client.id
+        assert found_order.client.name == "Joana"
+        assert found_order.external_created_at == "17:54"
+        assert found_order.created_at == datetime(2023, 6, 7, 10, 0, 0)
+        assert found_order.updated_at == datetime(2023, 6, 7, 10, 0, 0)
+        assert len(found_order.order_items) == 1
+        assert found_order.order_items[0].quantity == 1
+        assert found_order.order_items[0].item.id == test_item.id
+        assert found_order.order_items[0].item.name == "Marmita de Carne"
+        assert found_order.order_items[0].item.inventory_quantity == 5
+
+    @freeze_time("2023-06-07 10:00:00")
+    def test_find_legacy_order_by_id(self, repository, mongo_connection):
         # Arrange
         test_client = ClientDocument(name="Joana").save()
         test_item = ItemDocument(
@@ -106,3 +225,158 @@ class TestMongoOrderRepository:
         assert found_order.order_items[0].item.name == "Marmita de Carne"
         assert found_order.order_items[0].item.inventory_quantity == 5
         assert OrderDocument.objects.count() == 1
+
+    def test_find_order_by_id_uses_a_single_command(
+        self, repository, mongo_command_counter
+    ):
+        # Arrange
+        test_client = ClientDocument(name="Joana").save()
+        test_items = [
+            ItemDocument(name=f"Marmita {index}", inventory_quantity=index)
+            for index in range(30)
+        ]
+        for test_item in test_items:
+            test_item.save()
+        test_order = OrderDocument(
+            client=test_client,
+            schema_version=ORDER_SCHEMA_VERSION,
+            lines=[
+                OrderLineDocument(
+                    item_id=test_item.id, item_name=test_item.name, quantity=1
+                )
+                for test_item in test_items
+            ],
+            created_at=datetime(2023, 6, 7, 10, 0, 0),
+            updated_at=datetime(2023, 6, 7, 10, 0, 0),
+        ).save()
+        mongo_command_counter.reset()
+
+        # Act
+        found_order = repository.find_order_by_id(test_order.id)
+
+        # Assert
+        assert len(found_order.order_items) == 30
+        assert found_order.order_items[29].item.inventory_quantity == 29
+        assert mongo_command_counter.commands == [("orders", "aggregate")]
+
+    def test_find_legacy_order_by_id_uses_a_single_command(
+        self, repository, mongo_command_counter
+    ):
+        # Arrange
+        test_client = ClientDocument(name="Joana").save()
+        test_order_items = []
+        for index in range(10):
+            test_item = ItemDocument(
+                name=f"Marmita {index}", inventory_quantity=index
+            ).save()
+            test_order_items.append(
+                OrderItemDocument(quantity=2, item=test_item).save()
+            )
+        test_order = OrderDocument(
+            client=test_client,
+            order_items=test_order_items,
+            created_at=datetime(2023, 6, 7, 10, 0, 0),
+            updated_at=datetime(2023, 6, 7, 10, 0, 0),
+        ).save()
+        mongo_command_counter.reset()
+
+        # Act
+        found_order = repository.find_order_by_id(test_order.id)
+
+        # Assert
+        assert found_order.client.name == "Joana"
+        assert len(found_order.order_items) == 10
+        assert [
+            order_item.item.name for order_item in found_order.order_items
+        ] == [f"Marmita {index}" for index in range(10)]
+        assert mongo_command_counter.commands == [("orders", "aggregate")]
+
+    def test_find_order_by_id_not_found(self, repository):
+        # Act
+        found_order = repository.find_order_by_id(ObjectId())
+
+        # Assert
+        assert found_order is None
+
+    @staticmethod
+    def _build_goomer_order(brand: str | None, external_id: int | None):
+        return Order(
+            external_id=external_id,
+            brand=brand,
+            client=None,
+            order_items=[],
+            external_created_at="17:54",
+            created_at=datetime(2023, 6, 7, 10, 0, 0),
+            updated_at=datetime(2023, 6, 7, 10, 0, 0),
+            is_cancelled=False,
+        )
+
+    def test_find_order_by_external_id(
+        self, repository, mongo_command_counter
+    ):
+        # Arrange
+        test_order = self._build_goomer_order("marca", 4)
+        repository.save(test_order)
+        repository.save(self._build_goomer_order("outra marca", 4))
+        mongo_command_counter.reset()
+
+        # Act
+        found_order = repository.find_order_by_external_id("marca", 4)
+
+        # Assert
+        assert found_order.id == test_order.id
+        assert found_order.brand == "marca"
+        assert repository.find_order_by_external_id("marca", 5) is None
+        assert mongo_command_counter.commands[0] == ("orders", "aggregate")
+
+    def test_save_duplicate_goomer_order_raises_error(self, repository):
+        # Arrange
+        repository.save(self._build_goomer_order("marca", 4))
+
+        # Act & Assert
+        with pytest.raises(OrderAlreadyExistsError) as exc_info:
+            repository.save(self._build_goomer_order("marca", 4))
+        assert exc_info.value.brand == "marca"
+        assert exc_info.value.external_order_id == 4
+        assert OrderDocument.objects.count() == 1
+
+    def test_save_orders_without_brand_are_not_unique(self, repository):
+        # Act
+        repository.save(self._build_goomer_order(None, 4))
+        repository.save(self._build_goomer_order(None, 4))
+        repository.save(self._build_goomer_order(None, None))
+        repository.save(self._build_goomer_order(None, None))
+
+        # Assert
+        assert OrderDocument.objects.count() == 4
+
+    def test_undo_cancel_orders_only_touches_the_given_orders(
+        self, repository, monkeypatch
+    ):
+        # Arrange
+        cancellation_id = ObjectId()
+        monkeypatch.setattr(
+            sys.modules[type(repository).__module__],
+            "ObjectId",
+            lambda: cancellation_id,
+        )
+        order = self._build_goomer_order(None, 1)
+        cancelled_order = self._build_goomer_order(None, 2)
+        cancelled_order.cancel()
+        other_order = self._build_goomer_order(None, 3)
+        other_order.cancel()
+        for each_order in (order, cancelled_order, other_order):
+            repository.save(each_order)
+        OrderDocument.objects(id=other_order.id).update_one(
+            set__last_cancellation_id=cancellation_id
+        )
+
+        # Act
+        with pytest.raises(OrdersAlreadyCancelledError):
+            repository.cancel_orders(
+                [order.id, cancelled_order.id], datetime(2023, 6, 8)
+            )
+
+        # Assert
+        assert not repository.find_order_by_id(order.id).is_cancelled
+        assert repository.find_order_by_id(other_order.id).is_cancelled
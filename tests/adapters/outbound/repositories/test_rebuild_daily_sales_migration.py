@@ -0,0 +1,70 @@
+from datetime import date, datetime
+
+from bson import ObjectId
+
+from src.adapters.outbound.repositories.mongo.migrations import (
+    rebuild_daily_sales,
+)
+from src.adapters.outbound.repositories.mongo.order import MongoOrderRepository
+from src.adapters.outbound.repositories.mongo.sales import MongoSalesRepository
+from src.domain.entities.item import Item
+from src.domain.entities.order import Order, OrderItem
+from src.domain.entities.sales import DailyItemSales
+from src.domain.ports.outbound.repositories.order import OrderFilter
+
+
+def build_order(
+    item: Item, quantity: int, created_at: datetime, is_cancelled=False
+) -> Order:
+    return Order(
+        external_id=None,
+        client=None,
+        order_items=[OrderItem(item=item, quantity=quantity)],
+        external_created_at=None,
+        created_at=created_at,
+        updated_at=created_at,
+        is_cancelled=is_cancelled,
+    )
+
+
+class TestRebuildDailySalesMigration:
+    def test_rebuild_daily_sales_from_orders(self, mongo_connection):
+        # Arrange
+        order_repository = MongoOrderRepository(mongo_connection)
+        sales_repository = MongoSalesRepository(mongo_connection)
+        item = Item(name="marmita de carne", inventory_quantity=0)
+        for order in [
+            build_order(item, 2, datetime(2024, 6, 3, 15)),
+            build_order(item, 3, datetime(2024, 6, 3, 18)),
+            # 01:00 UTC is still the previous day in São Paulo.
+            build_order(item, 4, datetime(2024, 6, 4, 1)),
+            build_order(item, 5, datetime(2024, 6, 4, 15), is_cancelled=True),
+        ]:
+            order_repository.save(order)
+        stale_daily_sales = DailyItemSales(
+            day=date(2024, 6, 10),
+            item_id=ObjectId(),
+            item_name="marmita vegana",
+            quantity=7,
+        )
+        sales_repository.increment_daily_sales([stale_daily_sales])
+        # The first order was archived and still counts.
+        order_repository.archive_orders(
+            OrderFilter(created_until=datetime(2024, 6, 3, 16)), 10
+        )
+
+        # Act
+        rollups_count = rebuild_daily_sales.rebuild_daily_sales(batch_size=1)
+
+        # Assert
+        assert rollups_count == 1
+        assert sales_repository.find_daily_sales(
+            date(2024, 6, 1), date(2024, 6, 30)
+        ) == [
+            DailyItemSales(
+                day=date(2024, 6, 3),
+                item_id=item.id,
+                item_name=item.name,
+                quantity=9,
+            )
+        ]
@@ -0,0 +1,1387 @@
+import threading
+import time
+from datetime import UTC, date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import mongomock
+import pytest
+from bson import ObjectId
+
+from src.adapters.outbound.repositories.memory.client import (
+    MemoryClientRepository,
+)
+from src.adapters.outbound.repositories.memory.database import MemoryDatabase
+from src.adapters.outbound.repositories.memory.inventory import (
+    MemoryInventoryLedgerRepository,
+)
+from src.adapters.outbound.repositories.memory.item import (
+    MemoryItemRepository,
+)
+from src.adapters.outbound.repositories.memory.order import (
+    MemoryOrderRepository,
+)
+from src.adapters.outbound.repositories.memory.sales import (
+    MemorySalesRepository,
+)
+from src.adapters.outbound.repositories.mongo.client import (
+    MongoClientRepository,
+)
+from src.adapters.outbound.repositories.mongo.inventory import (
+    MongoInventoryLedgerRepository,
+)
+from src.adapters.outbound.repositories.mongo.item import MongoItemRepository
+from src.adapters.outbound.repositories.mongo.order import MongoOrderRepository
+from src.adapters.outbound.repositories.mongo.sales import MongoSalesRepository
+from src.adapters.outbound.repositories.pymongo.client import (
+    PyMongoClientRepository,
+)
+from src.adapters.outbound.repositories.pymongo.inventory import (
+    PyMongoInventoryLedgerRepository,
+)
+from src.adapters.outbound.repositories.pymongo.item import (
+    PyMongoItemRepository,
+)
+from src.adapters.outbound.repositories.pymongo.order import (
+    PyMongoOrderRepository,
+)
+from src.adapters.outbound.repositories.pymongo.sales import (
+    PyMongoSalesRepository,
+)
+from src.adapters.outbound.repositories.sqlite.client import (
+    SQLiteClientRepository,
+)
+from src.adapters.outbound.repositories.sqlite.connection import (
+    SQLiteConnection,
+)
+from src.adapters.outbound.repositories.sqlite.inventory import (
+    SQLiteInventoryLedgerRepository,
+)
+from src.adapters.outbound.repositories.sqlite.item import (
+    SQLiteItemRepository,
+)
+from src.adapters.outbound.repositories.sqlite.order import (
+    SQLiteOrderRepository,
+)
+from src.adapters.outbound.repositories.sqlite.sales import (
+    SQLiteSalesRepository,
+)
+from src.domain.entities.client import Client
+from src.domain.entities.inventory import (
+    InventoryMovement,
+    InventoryMovementReason,
+    InventorySnapshot,
+    InventorySnapshotItem,
+)
+from src.domain.entities.item import Item
+from src.domain.entities.order import Order, OrderItem
+from src.domain.entities.sales import DailyItemSales
+from src.domain.exceptions import (
+    InsufficientInventoryError,
+    OrderAlreadyExistsError,
+    OrderNotFoundError,
+    OrdersAlreadyCancelledError,
+)
+from src.domain.ports.inbound.items.dtos import (
+    AddItemInputDTO,
+    CatalogItemOutputDTO,
+    GetInventoryAtInputDTO,
+    ItemOutputDTO,
+    RemoveItemInputDTO,
+    SetInventoryQuantityInputDTO,
+    SetInventoryQuantityItemInputDTO,
+    TakeInventorySnapshotInputDTO,
+)
+from src.domain.ports.inbound.orders.dtos import (
+    CancelOrderInputDTO,
+    CancelOrdersInputDTO,
+    CreateManualOrderInputDTO,
+    OrderItemInputDTO,
+)
+from src.domain.ports.outbound.repositories.order import (
+    OrderCursor,
+    OrderFilter,
+)
+from src.domain.unit_of_work import UnitOfWork
+from src.domain.use_cases.add_item import AddItemUseCase
+from src.domain.use_cases.cancel_order import CancelOrderUseCase
+from src.domain.use_cases.cancel_orders import CancelOrdersUseCase
+from src.domain.use_cases.create_manual_order import CreateManualOrderUseCase
+from src.domain.use_cases.export_items import ExportItemsUseCase
+from src.domain.use_cases.get_inventory_at import GetInventoryAtUseCase
+from src.domain.use_cases.import_items import ImportItemsUseCase
+from src.domain.use_cases.remove_item import RemoveItemUseCase
+from src.domain.use_cases.set_inventory_quantities import (
+    SetInventoryQuantitiesUseCase,
+)
+from src.domain.use_cases.take_inventory_snapshot import (
+    TakeInventorySnapshotUseCase,
+)
+
+# Behaviour every backend must share, written against the repository
+# protocols only.
+
+
+@pytest.fixture(params=["mongoengine", "pymongo", "memory", "sqlite"])
+def repositories(request):
+    match request.param:
+        case "mongoengine":
+            connection = request.getfixturevalue("mongo_connection")
+            return (
+                MongoItemRepository(connection),
+                MongoOrderRepository(connection),
+                MongoClientRepository(connection),
+                MongoSalesRepository(connection),
+                MongoInventoryLedgerRepository(connection),
+            )
+        case "pymongo":
+            connection = request.getfixturevalue("mongo_connection")
+            return (
+                PyMongoItemRepository(connection),
+                PyMongoOrderRepository(connection),
+                PyMongoClientRepository(connection),
+                PyMongoSalesRepository(connection),
+                PyMongoInventoryLedgerRepository(connection),
+            )
+        case "memory":
+            memory_database = MemoryDatabase()
+            return (
+                MemoryItemRepository(memory_database),
+                MemoryOrderRepository(memory_database),
+                MemoryClientRepository(memory_database),
+                MemorySalesRepository(memory_database),
+                MemoryInventoryLedgerRepository(memory_database),
+            )
+        case "sqlite":
+            sqlite_connection = SQLiteConnection(":memory:")
+            request.addfinalizer(sqlite_connection.close)
+            return (
+                SQLiteItemRepository(sqlite_connection),
+                SQLiteOrderRepository(sqlite_connection),
+                SQLiteClientRepository(sqlite_connection),
+                SQLiteSalesRepository(sqlite_connection),
+                SQLiteInventoryLedgerRepository(sqlite_connection),
+            )
+
+
+@pytest.fixture
+def item_repository(repositories):
+    return repositories[0]
+
+
+@pytest.fixture
+def order_repository(repositories):
+    return repositories[1]
+
+
+@pytest.fixture
+def client_repository(repositories):
+    return repositories[2]
+
+
+@pytest.fixture
+def sales_repository(repositories):
+    return repositories[3]
+
+
+@pytest.fixture
+def ledger_repository(repositories):
+    return repositories[4]
+
+
+def build_order(
+    client: Client | None,
+    order_items: list[OrderItem],
+    brand: str | None = None,
+    external_id: int | None = None,
+    created_at: datetime = datetime(2023, 6, 7, 10, 0, 0),
+) -> Order:
+    return Order(
+        external_id=external_id,
+        brand=brand,
+        client=client,
+        order_items=order_items,
+        external_created_at="17:54",
+        created_at=created_at,
+        updated_at=created_at,
+        is_cancelled=False,
+    )
+
+
+def build_cursor(order: Order) -> OrderCursor:
+    return OrderCursor(created_at=order.created_at, order_id=order.id)
+
+
+class TestItemRepositoryContract:
+    def test_save_and_find_item_by_name(self, item_repository):
+        # Arrange
+        test_item = Item(name="Marmita de Frango", inventory_quantity=10)
+
+        # Act
+        item_repository.save(test_item)
+        found_item = item_repository.find_item_by_name("Marmita de Frango")
+
+        # Assert
+        assert found_item == test_item
+        assert item_repository.find_item_by_name("Marmita Vegana") is None
+
+    def test_found_items_are_copies(self, item_repository):
+        # Arrange
+        test_item = Item(name="Marmita de Frango", inventory_quantity=10)
+        item_repository.save(test_item)
+
+        # Act
+        test_item.set_inventory_quantity(0)
+        item_repository.get_all()[0].set_inventory_quantity(0)
+
+        # Assert
+        found_item = item_repository.find_item_by_name("Marmita de Frango")
+        assert found_item.inventory_quantity == 10
+
+    def test_iter_items_streams_catalog_by_name(self, item_repository):
+        # Arrange
+        items = [
+            Item(name=f"Marmita {number}", inventory_quantity=number)
+            for number in (3, 1, 4, 5, 2)
+        ]
+        for item in items:
+            item_repository.save(item)
+
+        # Act
+        streamed_items = list(item_repository.iter_items(2))
+
+        # Assert
+        assert streamed_items == sorted(items, key=lambda item: item.name)
+
+    def test_save_existing_item_replaces_it(self, item_repository):
+        # Arrange
+        test_item = Item(name="Marmita de Frango", inventory_quantity=10)
+        item_repository.save(test_item)
+
+        # Act
+        test_item.set_inventory_quantity(3)
+        item_repository.save(test_item)
+
+        # Assert
+        assert item_repository.get_all() == [test_item]
+
+    def test_find_items_by_names_and_get_all(self, item_repository):
+        # Arrange
+        item_1 = Item(name="Marmita de Frango", inventory_quantity=10)
+        item_2 = Item(name="Marmita de Carne", inventory_quantity=5)
+        item_repository.save(item_1)
+        item_repository.save(item_2)
+
+        # Act
+        found_items = item_repository.find_items_by_names(
+            ["Marmita de Carne", "Marmita Vegana"]
+        )
+        all_items = item_repository.get_all()
+
+        # Assert
+        assert found_items == [item_2]
+        assert sorted(all_items, key=lambda item: item.name) == [
+            item_2,
+            item_1,
+        ]
+
+    def test_remove_item_by_name(self, item_repository):
+        # Arrange
+        item_repository.save(
+            Item(name="Marmita de Frango", inventory_quantity=10)
+        )
+
+        # Act
+        item_repository.remove_item_by_name("Marmita de Frango")
+
+        # Assert
+        assert item_repository.get_all() == []
+
+    def test_save_all_upserts_by_name(self, item_repository):
+        # Arrange
+        existing_item = Item(name="Marmita de Frango", inventory_quantity=10)
+        item_repository.save(existing_item)
+        new_item = Item(name="Marmita de Carne", inventory_quantity=5)
+
+        # Act
+        result = item_repository.save_all(
+            [Item(name="Marmita de Frango", inventory_quantity=7), new_item]
+        )
+
+        # Assert
+        assert result.inserted_count == 1
+        assert result.modified_count == 1
+        found_item = item_repository.find_item_by_name("Marmita de Frango")
+        assert found_item.id == existing_item.id
+        assert found_item.inventory_quantity == 7
+        assert item_repository.find_item_by_name("Marmita de Carne") == (
+            new_item
+        )
+
+    def test_save_all_with_no_items(self, item_repository):
+        # Act
+        result = item_repository.save_all([])
+
+        # Assert
+        assert result.inserted_count == 0
+        assert result.modified_count == 0
+
+    def test_increment_inventory_quantities(self, item_repository):
+        # Arrange
+        item_1 = Item(name="Marmita de Frango", inventory_quantity=10)
+        item_2 = Item(name="Marmita de Carne", inventory_quantity=5)
+        item_repository.save(item_1)
+        item_repository.save(item_2)
+
+        # Act
+        result = item_repository.increment_inventory_quantities(
+            {item_1.id: -3, item_2.id: 2, ObjectId(): 1}
+        )
+
+        # Assert
+        assert result == {item_1.id: 7, item_2.id: 7}
+        assert item_repository.find_item_by_name(
+            "Marmita de Frango"
+        ).inventory_quantity == (7)
+
+    def test_decrement_inventory_quantities(self, item_repository):
+        # Arrange
+        item_1 = Item(name="Marmita de Frango", inventory_quantity=10)
+        item_2 = Item(name="Marmita de Carne", inventory_quantity=2)
+        item_repository.save(item_1)
+        item_repository.save(item_2)
+
+        # Act
+        result = item_repository.decrement_inventory_quantities(
+            {item_1.id: 3, item_2.id: 2}
+        )
+
+        # Assert
+        assert result == {item_1.id: 7, item_2.id: 0}
+
+    def test_overlapping_decrements_of_an_item_both_apply(
+        self, item_repository, monkeypatch
+    ):
+        # Arrange
+        item = Item(name="Marmita de Frango", inventory_quantity=10)
+        item_repository.save(item)
+        other_results = []
+        find = mongomock.collection.Collection.find
+
+        def find_after_other_decrement(collection, *args, **kwargs):
+            # The Mongo backends read their decrement back after writing
+            # it; the other order's decrement lands in between. The other
+            # backends run one decrement at a time.
+            if not other_results:
+                other_results.append(None)
+                other_results[0] = (
+                    item_repository.decrement_inventory_quantities(
+                        {item.id: 3}
+                    )
+                )
+            return find(collection, *args, **kwargs)
+
+        monkeypatch.setattr(
+            mongomock.collection.Collection, "find", find_after_other_decrement
+        )
+
+        # Act
+        result = item_repository.decrement_inventory_quantities({item.id: 3})
+        if not other_results:
+            other_results.append(
+                item_repository.decrement_inventory_quantities({item.id: 3})
+            )
+
+        # Assert
+        assert result[item.id] in (4, 7)
+        assert other_results[0][item.id] in (4, 7)
+        assert (
+            item_repository.find_item_by_name(
+                "Marmita de Frango"
+            ).inventory_quantity
+            == 4
+        )
+
+    def test_decrement_inventory_quantities_rejects_short_items(
+        self, item_repository
+    ):
+        # Arrange
+        item_1 = Item(name="Marmita de Frango", inventory_quantity=10)
+        item_2 = Item(name="Marmita de Carne", inventory_quantity=1)
+        item_3 = Item(name="Marmita Vegana", inventory_quantity=0)
+        for item in (item_1, item_2, item_3):
+            item_repository.save(item)
+
+        # Act
+        with pytest.raises(InsufficientInventoryError) as error:
+            item_repository.decrement_inventory_quantities(
+                {item_1.id: 3, item_2.id: 2, item_3.id: 1}
+            )
+        result = item_repository.decrement_inventory_quantities(
+            {item_1.id: 10}
+        )
+
+        # Assert
+        assert sorted(error.value.items_names) == [
+            "Marmita Vegana",
+            "Marmita de Carne",
+        ]
+        assert result == {item_1.id: 0}
+        assert {
+            item.name: item.inventory_quantity
+            for item in item_repository.find_items_by_names(
+                ["Marmita de Carne", "Marmita Vegana"]
+            )
+        } == {"Marmita de Carne": 1, "Marmita Vegana": 0}
+
+    def test_find_low_stock_items_follows_every_write(self, item_repository):
+        # Arrange
+        frango = Item(
+            name="Marmita de Frango",
+            inventory_quantity=10,
+            low_stock_threshold=3,
+        )
+        carne = Item(
+            name="Marmita de Carne",
+            inventory_quantity=2,
+            low_stock_threshold=2,
+        )
+        vegana = Item(name="Marmita Vegana", inventory_quantity=0)
+        suco = Item(name="Suco", inventory_quantity=4, low_stock_threshold=3)
+        for item in (frango, carne, vegana, suco):
+            item_repository.save(item)
+
+        # Act
+        item_repository.increment_inventory_quantities(
+            {frango.id: -7, carne.id: 1}
+        )
+        with pytest.raises(InsufficientInventoryError):
+            item_repository.decrement_inventory_quantities(
+                {suco.id: 2, vegana.id: 1}
+            )
+        item_repository.save_all(
+            [
+                Item(
+                    name="Marmita Vegana",
+                    inventory_quantity=6,
+                    low_stock_threshold=6,
+                )
+            ]
+        )
+        low_stock_items = item_repository.find_low_stock_items()
+
+        # Assert
+        assert [
+            (item.name, item.inventory_quantity, item.low_stock_threshold)
+            for item in low_stock_items
+        ] == [("Marmita Vegana", 6, 6), ("Marmita de Frango", 3, 3)]
+
+    def test_find_low_stock_items_drops_removed_items(self, item_repository):
+        # Arrange
+        frango = Item(
+            name="Marmita de Frango",
+            inventory_quantity=5,
+            low_stock_threshold=3,
+        )
+        carne = Item(
+            name="Marmita de Carne",
+            inventory_quantity=5,
+            low_stock_threshold=3,
+        )
+        item_repository.save(frango)
+        item_repository.save(carne)
+        item_repository.decrement_inventory_quantities(
+            {frango.id: 2, carne.id: 3}
+        )
+
+        # Act
+        item_repository.remove_item_by_name(carne.name)
+
+        # Assert
+        assert [
+            item.name for item in item_repository.find_low_stock_items()
+        ] == ["Marmita de Frango"]
+
+
+class TestClientRepositoryContract:
+    def test_save_and_find_client_by_name(self, client_repository):
+        # Arrange
+        test_client = Client(name="Maria Joaquina")
+
+        # Act
+        client_repository.save(test_client)
+
+        # Assert
+        assert client_repository.find_client_by_name("Maria Joaquina") == (
+            test_client
+        )
+        assert client_repository.find_client_by_name("Carlos") is None
+
+    def test_get_or_create_by_name(self, client_repository):
+        # Arrange
+        existing_client = Client(name="Carlos")
+        client_repository.save(existing_client)
+
+        # Act
+        found_client = client_repository.get_or_create_by_name("Carlos")
+        created_client = client_repository.get_or_create_by_name("Joana")
+
+        # Assert
+        assert found_client == existing_client
+        assert created_client.name == "Joana"
+        assert client_repository.find_client_by_name("Joana") == (
+            created_client
+        )
+
+
+class TestOrderRepositoryContract:
+    def test_save_and_find_order_by_id(
+        self, order_repository, item_repository, client_repository
+    ):
+        # Arrange
+        test_client = Client(name="Carlos")
+        client_repository.save(test_client)
+        test_item = Item(name="Marmita de Frango", inventory_quantity=10)
+        item_repository.save(test_item)
+        test_order = build_order(
+            test_client, [OrderItem(item=test_item, quantity=2)]
+        )
+
+        # Act
+        order_repository.save(test_order)
+        item_repository.increment_inventory_quantities({test_item.id: -2})
+        found_order = order_repository.find_order_by_id(test_order.id)
+
+        # Assert
+        assert found_order.id == test_order.id
+        assert found_order.client == test_client
+        assert found_order.external_created_at == "17:54"
+        assert found_order.created_at == datetime(2023, 6, 7, 10, 0, 0)
+        assert not found_order.is_cancelled
+        assert len(found_order.order_items) == 1
+        assert found_order.order_items[0].quantity == 2
+        assert found_order.order_items[0].item.id == test_item.id
+        assert found_order.order_items[0].item.inventory_quantity == 8
+        assert order_repository.find_order_by_id(ObjectId()) is None
+
+    def test_find_order_skips_removed_items(
+        self, order_repository, item_repository
+    ):
+        # Arrange
+        item_1 = Item(name="Marmita de Frango", inventory_quantity=10)
+        item_2 = Item(name="Marmita de Carne", inventory_quantity=5)
+        item_repository.save(item_1)
+        item_repository.save(item_2)
+        test_order = build_order(
+            None,
+            [
+                OrderItem(item=item_1, quantity=1),
+                OrderItem(item=item_2, quantity=2),
+            ],
+        )
+        order_repository.save(test_order)
+
+        # Act
+        item_repository.remove_item_by_name("Marmita de Frango")
+        found_order = order_repository.find_order_by_id(test_order.id)
+
+        # Assert
+        assert found_order.client is None
+        assert [
+            order_item.item.name for order_item in found_order.order_items
+        ] == ["Marmita de Carne"]
+
+    def test_save_existing_order_replaces_it(
+        self, order_repository, item_repository
+    ):
+        # Arrange
+        test_item = Item(name="Marmita de Frango", inventory_quantity=10)
+        item_repository.save(test_item)
+        test_order = build_order(None, [OrderItem(item=test_item, quantity=1)])
+        order_repository.save(test_order)
+
+        # Act
+        test_order.cancel()
+        order_repository.save(test_order)
+
+        # Assert
+        assert order_repository.find_order_by_id(test_order.id).is_cancelled
+
+    def test_find_order_by_external_id(self, order_repository):
+        # Arrange
+        test_order = build_order(None, [], brand="marca", external_id=4)
+        order_repository.save(test_order)
+        order_repository.save(
+            build_order(None, [], brand="outra marca", external_id=4)
+        )
+
+        # Act
+        found_order = order_repository.find_order_by_external_id("marca", 4)
+
+        # Assert
+        assert found_order.id == test_order.id
+        assert found_order.brand == "marca"
+        assert order_repository.find_order_by_external_id("marca", 5) is None
+
+    def test_save_duplicate_goomer_order_raises_error(self, order_repository):
+        # Arrange
+        order_repository.save(
+            build_order(None, [], brand="marca", external_id=4)
+        )
+
+        # Act & Assert
+        with pytest.raises(OrderAlreadyExistsError):
+            order_repository.save(
+                build_order(None, [], brand="marca", external_id=4)
+            )
+        order_repository.save(build_order(None, [], external_id=4))
+        order_repository.save(build_order(None, [], external_id=4))
+
+    def test_find_orders_by_ids_and_external_ids(self, order_repository):
+        # Arrange
+        branded_order = build_order(None, [], brand="marca", external_id=4)
+        other_brand_order = build_order(
+            None, [], brand="outra marca", external_id=5
+        )
+        unbranded_order = build_order(None, [], external_id=5)
+        for order in (branded_order, other_brand_order, unbranded_order):
+            order_repository.save(order)
+
+        # Act
+        orders_by_ids = order_repository.find_orders_by_ids(
+            [branded_order.id, unbranded_order.id, ObjectId()]
+        )
+        orders_by_external_ids = order_repository.find_orders_by_external_ids(
+            "marca", [4, 5]
+        )
+        unbranded_orders = order_repository.find_orders_by_external_ids(
+            None, [5]
+        )
+
+        # Assert
+        assert {order.id for order in orders_by_ids} == {
+            branded_order.id,
+            unbranded_order.id,
+        }
+        assert [order.id for order in orders_by_external_ids] == [
+            branded_order.id
+        ]
+        assert [order.id for order in unbranded_orders] == [unbranded_order.id]
+
+    def test_cancel_orders(self, order_repository):
+        # Arrange
+        orders = [build_order(None, []) for _ in range(2)]
+        for order in orders:
+            order_repository.save(order)
+        cancelled_at = datetime(2023, 6, 8, 10, 0, 0)
+
+        # Act
+        order_repository.cancel_orders(
+            [order.id for order in orders], cancelled_at
+        )
+
+        # Assert
+        for order in orders:
+            found_order = order_repository.find_order_by_id(order.id)
+            assert found_order.is_cancelled
+            assert found_order.updated_at == cancelled_at
+
+    def test_cancel_orders_with_a_cancelled_order_cancels_none(
+        self, order_repository
+    ):
+        # Arrange
+        order = build_order(None, [])
+        cancelled_order = build_order(None, [])
+        cancelled_order.cancel()
+        order_repository.save(order)
+        order_repository.save(cancelled_order)
+
+        # Act & Assert
+        with pytest.raises(OrdersAlreadyCancelledError) as error:
+            order_repository.cancel_orders(
+                [order.id, cancelled_order.id], datetime(2023, 6, 8)
+            )
+        assert error.value.order_ids == [cancelled_order.id]
+        assert not order_repository.find_order_by_id(order.id).is_cancelled
+
+
+class TestOrderHistoryContract:
+    @pytest.fixture
+    def orders(self, order_repository, item_repository):
+        test_item = Item(name="Marmita de Frango", inventory_quantity=10)
+        item_repository.save(test_item)
+        start = datetime(2023, 6, 7, 10, 0, 0)
+        # Two orders share a creation time, so ties are broken by id.
+        created_ats = [start + timedelta(hours=hour) for hour in range(6)]
+        created_ats[3] = created_ats[2]
+        orders = [
+            build_order(
+                None,
+                [OrderItem(item=test_item, quantity=1)],
+                created_at=created_at,
+            )
+            for created_at in created_ats
+        ]
+        for order in orders:
+            order_repository.save(order)
+        return sorted(
+            orders,
+            key=lambda order: (order.created_at, order.id),
+            reverse=True,
+        )
+
+    @staticmethod
+    def get_ids(orders: list[Order]) -> list[ObjectId]:
+        return [order.id for order in orders]
+
+    def test_find_orders_pages_newest_first(self, order_repository, orders):
+        # Act
+        first_page = order_repository.find_orders(OrderFilter(), 2)
+        second_page = order_repository.find_orders(
+            OrderFilter(), 2, after=build_cursor(first_page[-1])
+        )
+        third_page = order_repository.find_orders(
+            OrderFilter(), 2, after=build_cursor(second_page[-1])
+        )
+        last_page = order_repository.find_orders(
+            OrderFilter(), 2, after=build_cursor(third_page[-1])
+        )
+
+        # Assert
+        assert self.get_ids(first_page + second_page + third_page) == (
+            self.get_ids(orders)
+        )
+        assert last_page == []
+        assert first_page[0].order_items[0].item.name == "Marmita de Frango"
+
+    def test_find_orders_before_cursor(self, order_repository, orders):
+        # Act
+        previous_page = order_repository.find_orders(
+            OrderFilter(), 2, before=build_cursor(orders[4])
+        )
+
+        # Assert
+        assert self.get_ids(previous_page) == self.get_ids(orders[2:4])
+
+    def test_find_orders_by_date_range(self, order_repository, orders):
+        # Arrange
+        order_filter = OrderFilter(
+            created_from=datetime(2023, 6, 7, 11, 0, 0),
+            created_until=datetime(2023, 6, 7, 14, 0, 0),
+        )
+
+        # Act
+        found_orders = order_repository.find_orders(order_filter, 10)
+
+        # Assert
+        assert self.get_ids(found_orders) == self.get_ids(orders[2:5])
+
+    def test_find_orders_by_client_and_status(
+        self, order_repository, client_repository, orders
+    ):
+        # Arrange
+        test_client = Client(name="Carlos")
+        client_repository.save(test_client)
+        client_order = build_order(
+            test_client, [], created_at=datetime(2023, 6, 8, 10, 0, 0)
+        )
+        client_order.cancel()
+        order_repository.save(client_order)
+
+        # Act
+        client_orders = order_repository.find_orders(
+            OrderFilter(client_id=test_client.id), 10
+        )
+        cancelled_orders = order_repository.find_orders(
+            OrderFilter(is_cancelled=True), 10
+        )
+        open_orders = order_repository.find_orders(
+            OrderFilter(is_cancelled=False), 10
+        )
+
+        # Assert
+        assert self.get_ids(client_orders) == [client_order.id]
+        assert client_orders[0].client == test_client
+        assert self.get_ids(cancelled_orders) == [client_order.id]
+        assert self.get_ids(open_orders) == self.get_ids(orders)
+
+    def test_find_orders_with_timezone_aware_datetimes(self, order_repository):
+        # Arrange
+        sao_paulo = ZoneInfo("America/Sao_Paulo")
+        test_order = build_order(
+            None,
+            [],
+            created_at=datetime(2023, 6, 7, 22, 0, 0, tzinfo=sao_paulo),
+        )
+        order_repository.save(test_order)
+        order_filter = OrderFilter(
+            created_from=datetime(2023, 6, 7, tzinfo=sao_paulo),
+            created_until=datetime(2023, 6, 8, tzinfo=sao_paulo),
+        )
+
+        # Act
+        found_orders = order_repository.find_orders(order_filter, 10)
+
+        # Assert
+        assert self.get_ids(found_orders) == [test_order.id]
+        assert found_orders[0].created_at == datetime(2023, 6, 8, 1, 0, 0)
+
+
+class TestOrderArchiveContract:
+    @pytest.fixture
+    def item(self, item_repository):
+        item = Item(name="Marmita de Frango", inventory_quantity=10)
+        item_repository.save(item)
+        return item
+
+    def test_archive_orders_moves_old_orders_out_of_the_history(
+        self, order_repository, item
+    ):
+        # Arrange
+        start = datetime(2023, 6, 7, 10, 0, 0)
+        orders = [
+            build_order(
+                None,
+                [OrderItem(item=item, quantity=1)],
+                created_at=start + timedelta(days=days),
+            )
+            for days in range(4)
+        ]
+        for order in orders:
+            order_repository.save(order)
+        order_filter = OrderFilter(created_until=start + timedelta(days=3))
+
+        # Act
+        first_count = order_repository.archive_orders(order_filter, 2)
+        second_count = order_repository.archive_orders(order_filter, 2)
+        third_count = order_repository.archive_orders(order_filter, 2)
+
+        # Assert
+        assert (first_count, second_count, third_count) == (2, 1, 0)
+        assert [
+            order.id
+            for order in order_repository.find_orders(OrderFilter(), 10)
+        ] == [orders[3].id]
+        for order in orders:
+            assert order_repository.find_order_by_id(order.id) == order
+
+    def test_archive_orders_with_cancelled_filter_keeps_sold_orders(
+        self, order_repository, item
+    ):
+        # Arrange
+        sold_order = build_order(None, [OrderItem(item=item, quantity=1)])
+        cancelled_order = build_order(None, [OrderItem(item=item, quantity=2)])
+        cancelled_order.cancel()
+        order_repository.save(sold_order)
+        order_repository.save(cancelled_order)
+
+        # Act
+        archived_count = order_repository.archive_orders(
+            OrderFilter(created_until=datetime(2024, 1, 1), is_cancelled=True),
+            10,
+        )
+
+        # Assert
+        assert archived_count == 1
+        assert [
+            order.id
+            for order in order_repository.find_orders(OrderFilter(), 10)
+        ] == [sold_order.id]
+        archived_order = order_repository.find_order_by_id(cancelled_order.id)
+        assert archived_order.is_cancelled
+        assert archived_order.order_items == cancelled_order.order_items
+
+    def test_archived_order_updated_later_is_archived_again(
+        self, order_repository, item
+    ):
+        # Arrange
+        order = build_order(None, [OrderItem(item=item, quantity=1)])
+        order_repository.save(order)
+        order_filter = OrderFilter(created_until=datetime(2024, 1, 1))
+        order_repository.archive_orders(order_filter, 10)
+        archived_order = order_repository.find_order_by_id(order.id)
+        archived_order.cancel()
+        order_repository.save(archived_order)
+
+        # Act
+        archived_count = order_repository.archive_orders(order_filter, 10)
+
+        # Assert
+        assert archived_count == 1
+        assert order_repository.find_orders(OrderFilter(), 10) == []
+        assert order_repository.find_order_by_id(order.id).is_cancelled
+
+    def test_cancelling_an_archived_order_is_rejected_by_both_paths(
+        self, order_repository, item_repository, item
+    ):
+        # Arrange
+        order = build_order(None, [OrderItem(item=item, quantity=1)])
+        order_repository.save(order)
+        order_repository.archive_orders(
+            OrderFilter(created_until=datetime(2024, 1, 1)), 10
+        )
+
+        # Act
+        with pytest.raises(OrderNotFoundError):
+            CancelOrderUseCase(order_repository, item_repository).execute(
+                CancelOrderInputDTO(order_id=order.id)
+            )
+        bulk_output = CancelOrdersUseCase(
+            order_repository, item_repository
+        ).execute(CancelOrdersInputDTO(order_ids=[order.id]))
+
+        # Assert
+        assert bulk_output.not_found_order_ids == [order.id]
+        assert order_repository.find_orders(OrderFilter(), 10) == []
+        assert not order_repository.find_order_by_id(order.id).is_cancelled
+        found_item = item_repository.find_item_by_name(item.name)
+        assert found_item.inventory_quantity == 10
+
+
+class TestBulkCancelContract:
+    def test_cancel_orders_gives_stock_back_once(
+        self, item_repository, order_repository, sales_repository
+    ):
+        # Arrange
+        item = Item(name="marmita de carne", inventory_quantity=10)
+        item_repository.save(item)
+        unit_of_work = UnitOfWork(
+            item_repository,
+            order_repository,
+            sales_repository=sales_repository,
+        )
+        create_use_case = CreateManualOrderUseCase(
+            item_repository, order_repository, unit_of_work
+        )
+        cancel_use_case = CancelOrdersUseCase(
+            order_repository, item_repository, unit_of_work
+        )
+        order_ids = [
+            create_use_case.execute(
+                CreateManualOrderInputDTO(
+                    items=[OrderItemInputDTO(item_name=item.name, quantity=2)]
+                )
+            ).order_id
+            for _ in range(3)
+        ]
+        input_dto = CancelOrdersInputDTO(order_ids=[*order_ids, ObjectId()])
+
+        # Act
+        first_output = cancel_use_case.execute(input_dto)
+        second_output = cancel_use_case.execute(input_dto)
+
+        # Assert
+        assert len(first_output.cancelled_orders) == 3
+        assert [
+            order.order_items[0].inventory_quantity
+            for order in first_output.cancelled_orders
+        ] == [10, 10, 10]
+        assert second_output.cancelled_orders == []
+        assert set(second_output.already_cancelled_order_ids) == set(order_ids)
+        assert second_output.not_found_order_ids == [input_dto.order_ids[-1]]
+        found_item = item_repository.find_item_by_name(item.name)
+        assert found_item.inventory_quantity == 10
+        sales_day = order_repository.find_order_by_id(
+            order_ids[0]
+        ).get_sales_day()
+        assert [
+            daily_sales.quantity
+            for daily_sales in sales_repository.find_daily_sales(
+                sales_day, sales_day
+            )
+        ] in ([], [0])
+
+
+class TestMemoryRepositories:
+    def test_concurrent_increments_are_not_lost(self):
+        # Arrange
+        item_repository = MemoryItemRepository(MemoryDatabase())
+        test_item = Item(name="Marmita de Frango", inventory_quantity=0)
+        item_repository.save(test_item)
+
+        def increment():
+            for _ in range(1000):
+                item_repository.increment_inventory_quantities(
+                    {test_item.id: 1}
+                )
+
+        threads = [threading.Thread(target=increment) for _ in range(8)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        found_item = item_repository.find_item_by_name("Marmita de Frango")
+        assert found_item.inventory_quantity == 8000
+
+
+class TestSalesRepositoryContract:
+    @staticmethod
+    def _build_daily_sales(
+        day: date, item: Item, quantity: int
+    ) -> DailyItemSales:
+        return DailyItemSales(
+            day=day, item_id=item.id, item_name=item.name, quantity=quantity
+        )
+
+    def test_increment_daily_sales_accumulates_per_day_and_item(
+        self, sales_repository
+    ):
+        # Arrange
+        meat_item = Item(name="marmita de carne", inventory_quantity=0)
+        chicken_item = Item(name="marmita de frango", inventory_quantity=0)
+        first_day = date(2024, 6, 3)
+        second_day = date(2024, 6, 4)
+
+        # Act
+        sales_repository.increment_daily_sales(
+            [
+                self._build_daily_sales(first_day, meat_item, 2),
+                self._build_daily_sales(first_day, chicken_item, 1),
+            ]
+        )
+        sales_repository.increment_daily_sales(
+            [
+                self._build_daily_sales(first_day, meat_item, 3),
+                self._build_daily_sales(second_day, meat_item, 4),
+                self._build_daily_sales(first_day, chicken_item, -1),
+            ]
+        )
+        sales_repository.increment_daily_sales([])
+        daily_sales = sales_repository.find_daily_sales(first_day, second_day)
+
+        # Assert
+        assert daily_sales == [
+            self._build_daily_sales(first_day, meat_item, 5),
+            self._build_daily_sales(first_day, chicken_item, 0),
+            self._build_daily_sales(second_day, meat_item, 4),
+        ]
+
+    def test_find_daily_sales_includes_both_ends_of_the_period(
+        self, sales_repository
+    ):
+        # Arrange
+        item = Item(name="marmita de carne", inventory_quantity=0)
+        first_day = date(2024, 6, 3)
+        sales_repository.increment_daily_sales(
+            [
+                self._build_daily_sales(
+                    first_day + timedelta(days=days), item, 1
+                )
+                for days in range(-1, 8)
+            ]
+        )
+
+        # Act
+        daily_sales = sales_repository.find_daily_sales(
+            first_day, first_day + timedelta(days=6)
+        )
+
+        # Assert
+        assert [sales.day for sales in daily_sales] == [
+            first_day + timedelta(days=days) for days in range(7)
+        ]
+
+    def test_orders_and_cancellations_update_daily_sales(
+        self, item_repository, order_repository, sales_repository
+    ):
+        # Arrange
+        item = Item(name="marmita de carne", inventory_quantity=10)
+        item_repository.save(item)
+        unit_of_work = UnitOfWork(
+            item_repository,
+            order_repository,
+            sales_repository=sales_repository,
+        )
+        create_use_case = CreateManualOrderUseCase(
+            item_repository, order_repository, unit_of_work
+        )
+        cancel_use_case = CancelOrderUseCase(
+            order_repository, item_repository, unit_of_work
+        )
+
+        # Act
+        first_order = create_use_case.execute(
+            CreateManualOrderInputDTO(
+                items=[OrderItemInputDTO(item_name=item.name, quantity=2)]
+            )
+        )
+        create_use_case.execute(
+            CreateManualOrderInputDTO(
+                items=[OrderItemInputDTO(item_name=item.name, quantity=3)]
+            )
+        )
+        cancel_use_case.execute(
+            CancelOrderInputDTO(order_id=first_order.order_id)
+        )
+
+        # Assert
+        sales_day = order_repository.find_order_by_id(
+            first_order.order_id
+        ).get_sales_day()
+        assert sales_repository.find_daily_sales(sales_day, sales_day) == [
+            self._build_daily_sales(sales_day, item, 3)
+        ]
+
+
+class TestInventoryLedgerContract:
+    @staticmethod
+    def _build_movement(
+        item: Item, quantity_delta: int, created_at: datetime
+    ) -> InventoryMovement:
+        return InventoryMovement(
+            item_id=item.id,
+            item_name=item.name,
+            reason=InventoryMovementReason.ORDER,
+            quantity_delta=quantity_delta,
+            order_id=ObjectId(),
+            created_at=created_at,
+        )
+
+    def test_find_movements_returns_the_range_in_creation_order(
+        self, ledger_repository
+    ):
+        # Arrange
+        item = Item(name="marmita de carne", inventory_quantity=0)
+        first_moment = datetime(2024, 6, 3, 12, tzinfo=ZoneInfo("UTC"))
+        movements = [
+            self._build_movement(
+                item, -minutes, first_moment + timedelta(minutes=minutes)
+            )
+            for minutes in range(5)
+        ]
+        ledger_repository.append_movements(list(reversed(movements)))
+        ledger_repository.append_movements([])
+
+        # Act
+        tail = ledger_repository.find_movements(
+            movements[1].created_at, movements[3].created_at
+        )
+        head = ledger_repository.find_movements(None, movements[1].created_at)
+
+        # Assert
+        assert [movement.id for movement in tail] == [
+            movement.id for movement in movements[2:4]
+        ]
+        assert [movement.id for movement in head] == [
+            movement.id for movement in movements[:2]
+        ]
+        assert head[1].quantity_delta == -1
+        assert head[1].inventory_quantity is None
+        assert head[1].order_id == movements[1].order_id
+
+    def test_find_latest_snapshot_ignores_later_snapshots(
+        self, ledger_repository
+    ):
+        # Arrange
+        item = Item(name="marmita de carne", inventory_quantity=0)
+        first_moment = datetime(2024, 6, 3, 12, tzinfo=ZoneInfo("UTC"))
+        snapshots = [
+            InventorySnapshot(
+                taken_at=first_moment + timedelta(hours=hours),
+                items=[
+                    InventorySnapshotItem(
+                        item_id=item.id,
+                        item_name=item.name,
+                        inventory_quantity=hours,
+                    )
+                ],
+            )
+            for hours in range(3)
+        ]
+        for snapshot in snapshots:
+            ledger_repository.save_snapshot(snapshot)
+
+        # Act
+        latest_snapshot = ledger_repository.find_latest_snapshot(
+            first_moment + timedelta(hours=1, minutes=30)
+        )
+        missing_snapshot = ledger_repository.find_latest_snapshot(
+            first_moment - timedelta(minutes=1)
+        )
+
+        # Assert
+        assert latest_snapshot.id == snapshots[1].id
+        assert latest_snapshot.items == snapshots[1].items
+        assert missing_snapshot is None
+
+    def test_ledger_replays_the_inventory_of_every_use_case(
+        self, item_repository, order_repository, ledger_repository
+    ):
+        # Arrange
+        def build_unit_of_work():
+            return UnitOfWork(
+                item_repository,
+                order_repository,
+                ledger_repository=ledger_repository,
+            )
+
+        def add_item(item_name, inventory_quantity):
+            AddItemUseCase(item_repository, build_unit_of_work()).execute(
+                AddItemInputDTO(
+                    item_name=item_name, inventory_quantity=inventory_quantity
+                )
+            )
+
+        def create_order(item_name, quantity):
+            return CreateManualOrderUseCase(
+                item_repository, order_repository, build_unit_of_work()
+            ).execute(
+                CreateManualOrderInputDTO(
+                    items=[
+                        OrderItemInputDTO(
+                            item_name=item_name, quantity=quantity
+                        )
+                    ]
+                )
+            )
+
+        # Act
+        add_item("marmita de carne", 10)
+        add_item("marmita de frango", 5)
+        add_item("suco", 3)
+        first_order = create_order("marmita de carne", 2)
+        create_order("marmita de carne", 3)
+        CancelOrderUseCase(
+            order_repository, item_repository, build_unit_of_work()
+        ).execute(CancelOrderInputDTO(order_id=first_order.order_id))
+        snapshot_output = TakeInventorySnapshotUseCase(
+            ledger_repository
+        ).execute(TakeInventorySnapshotInputDTO(taken_at=datetime.now(UTC)))
+        # Mongo keeps milliseconds: a movement written in the same
+        # millisecond as the cut would be stored on it and skipped.
+        time.sleep(0.002)
+        SetInventoryQuantitiesUseCase(
+            item_repository, build_unit_of_work()
+        ).execute(
+            SetInventoryQuantityInputDTO(
+                items=[
+                    SetInventoryQuantityItemInputDTO(
+                        item_name="marmita de frango", inventory_quantity=8
+                    )
+                ]
+            )
+        )
+        RemoveItemUseCase(item_repository, build_unit_of_work()).execute(
+            RemoveItemInputDTO(item_name="suco")
+        )
+        inventory = GetInventoryAtUseCase(ledger_repository).execute(
+            GetInventoryAtInputDTO(at=datetime.now(UTC))
+        )
+
+        # Assert
+        assert snapshot_output.items_count == 3
+        assert snapshot_output.movements_count == 6
+        assert inventory.items == [
+            ItemOutputDTO(item_name="marmita de carne", inventory_quantity=7),
+            ItemOutputDTO(item_name="marmita de frango", inventory_quantity=8),
+        ]
+        assert inventory.items == [
+            ItemOutputDTO(
+                item_name=item.name, inventory_quantity=item.inventory_quantity
+            )
+            for item in sorted(
+                item_repository.get_all(), key=lambda item: item.name
+            )
+        ]
+
+
+class TestCatalogImportContract:
+    def test_import_items_upserts_in_chunks_and_records_movements(
+        self, item_repository, ledger_repository
+    ):
+        # Arrange
+        item_repository.save(
+            Item(name="marmita de carne", inventory_quantity=5)
+        )
+        item_repository.save(Item(name="suco", inventory_quantity=3))
+        use_case = ImportItemsUseCase(
+            item_repository,
+            UnitOfWork(item_repository, ledger_repository=ledger_repository),
+        )
+        rows = [
+            (2, {"item_name": "marmita de carne", "inventory_quantity": "8"}),
+            (3, {"item_name": "suco", "inventory_quantity": "3"}),
+            (4, {"item_name": "", "inventory_quantity": "1"}),
+            (5, {"item_name": "marmita vegana", "inventory_quantity": "x"}),
+            (6, {"item_name": " marmita de frango ", "inventory_quantity": 2}),
+        ]
+
+        # Act
+        output_dto = use_case.execute(iter(rows), chunk_size=2)
+        exported_items = list(ExportItemsUseCase(item_repository).execute(2))
+
+        # Assert
+        assert (
+            output_dto.inserted_count,
+            output_dto.updated_count,
+            output_dto.unchanged_count,
+        ) == (1, 1, 1)
+        assert [error.line_number for error in output_dto.errors] == [4, 5]
+        assert exported_items == [
+            CatalogItemOutputDTO(
+                item_name="marmita de carne",
+                inventory_quantity=8,
+                low_stock_threshold=0,
+            ),
+            CatalogItemOutputDTO(
+                item_name="marmita de frango",
+                inventory_quantity=2,
+                low_stock_threshold=0,
+            ),
+            CatalogItemOutputDTO(
+                item_name="suco", inventory_quantity=3, low_stock_threshold=0
+            ),
+        ]
+        movements = ledger_repository.find_movements(None, datetime.now(UTC))
+        assert [
+            (movement.item_name, movement.reason, movement.quantity_delta)
+            for movement in movements
+        ] == [
+            ("marmita de carne", InventoryMovementReason.SET, 3),
+            ("marmita de frango", InventoryMovementReason.ADD, 2),
+        ]
+
+    def test_import_low_stock_thresholds_without_movements(
+        self, item_repository, ledger_repository
+    ):
+        # Arrange
+        item_repository.save(Item(name="suco", inventory_quantity=3))
+        item_repository.save(
+            Item(name="marmita", inventory_quantity=4, low_stock_threshold=5)
+        )
+        use_case = ImportItemsUseCase(
+            item_repository,
+            UnitOfWork(item_repository, ledger_repository=ledger_repository),
+        )
+        rows = [
+            (
+                2,
+                {
+                    "item_name": "suco",
+                    "inventory_quantity": "3",
+                    "low_stock_threshold": "5",
+                },
+            ),
+            (
+                3,
+                {
+                    "item_name": "marmita",
+                    "inventory_quantity": "4",
+                    "low_stock_threshold": "",
+                },
+            ),
+        ]
+
+        # Act
+        output_dto = use_case.execute(iter(rows))
+
+        # Assert
+        assert (output_dto.updated_count, output_dto.unchanged_count) == (1, 1)
+        assert [
+            (item.name, item.low_stock_threshold)
+            for item in item_repository.find_low_stock_items()
+        ] == [("marmita", 5), ("suco", 5)]
+        assert ledger_repository.find_movements(None, datetime.now(UTC)) == []
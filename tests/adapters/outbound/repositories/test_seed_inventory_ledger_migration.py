@@ -0,0 +1,39 @@
+from datetime import UTC, datetime
+
+from src.adapters.outbound.repositories.mongo.inventory import (
+    MongoInventoryLedgerRepository,
+)
+from src.adapters.outbound.repositories.mongo.item import MongoItemRepository
+from src.adapters.outbound.repositories.mongo.migrations import (
+    seed_inventory_ledger,
+)
+from src.domain.entities.inventory import InventorySnapshot
+from src.domain.entities.item import Item
+
+
+class TestSeedInventoryLedgerMigration:
+    def test_seed_inventory_ledger_records_current_stock_once(
+        self, mongo_connection
+    ):
+        # Arrange
+        item_repository = MongoItemRepository(mongo_connection)
+        ledger_repository = MongoInventoryLedgerRepository(mongo_connection)
+        item_repository.save(
+            Item(name="marmita de carne", inventory_quantity=7)
+        )
+        item_repository.save(Item(name="suco", inventory_quantity=3))
+
+        # Act
+        first_count = seed_inventory_ledger.seed_inventory_ledger()
+        second_count = seed_inventory_ledger.seed_inventory_ledger()
+
+        # Assert
+        assert (first_count, second_count) == (2, 0)
+        now = datetime.now(UTC)
+        snapshot = InventorySnapshot.rebuild(
+            None, ledger_repository.find_movements(None, now), now
+        )
+        assert [
+            (item.item_name, item.inventory_quantity)
+            for item in snapshot.items
+        ] == [("marmita de carne", 7), ("suco", 3)]
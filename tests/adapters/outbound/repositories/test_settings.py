@@ -0,0 +1,130 @@
+from unittest.mock import Mock
+
+import pytest
+from pydantic import ValidationError
+from pymongo import MongoClient
+from pymongo.read_preferences import Primary, SecondaryPreferred
+
+from src.adapters.outbound.repositories.mongo.settings import (
+    MongoConnectionSettings,
+    MongoReadOptions,
+    PoolStatisticsListener,
+)
+
+
+class TestMongoConnectionSettings:
+    def test_from_env(self):
+        # Arrange
+        environ = {
+            "MONGO_MAX_POOL_SIZE": "20",
+            "MONGO_MIN_POOL_SIZE": "2",
+            "MONGO_COMPRESSORS": "zstd, snappy,zlib",
+            "MONGO_ZLIB_COMPRESSION_LEVEL": "6",
+            "MONGO_SOCKET_TIMEOUT_MS": "5000",
+            "MONGO_RETRY_WRITES": "false",
+            "MONGO_READ_PREFERENCE": "secondaryPreferred",
+            "MONGO_CONNECT_TIMEOUT_MS": "",
+            "MONGO_USE_TRANSACTIONS": "true",
+        }
+
+        # Act
+        settings = MongoConnectionSettings.from_env(environ)
+
+        # Assert
+        assert settings.max_pool_size == 20
+        assert settings.min_pool_size == 2
+        assert settings.compressors == ["zstd", "snappy", "zlib"]
+        assert settings.zlib_compression_level == 6
+        assert settings.socket_timeout_ms == 5000
+        assert settings.retry_writes is False
+        assert settings.read_preference == "secondaryPreferred"
+        assert settings.connect_timeout_ms == 20000
+        assert settings.use_transactions is True
+
+    def test_from_env_with_unknown_compressor(self):
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            MongoConnectionSettings.from_env({"MONGO_COMPRESSORS": "lz4"})
+
+    def test_to_client_options(self):
+        # Arrange
+        settings = MongoConnectionSettings(
+            max_pool_size=20, compressors=["zlib"], socket_timeout_ms=5000
+        )
+
+        # Act
+        options = settings.to_client_options()
+
+        # Assert
+        assert options == {
+            "maxPoolSize": 20,
+            "minPoolSize": 0,
+            "compressors": "zlib",
+            "serverSelectionTimeoutMS": 30000,
+            "connectTimeoutMS": 20000,
+            "socketTimeoutMS": 5000,
+            "retryWrites": True,
+            "readPreference": "primary",
+            "appname": "inventory-manager",
+        }
+        client = MongoClient(connect=False, **options)
+        assert client.options.pool_options.max_pool_size == 20
+        assert client.options.pool_options.socket_timeout == 5
+
+
+class TestMongoReadOptions:
+    def test_defaults_to_bounded_staleness_secondary_reads(self):
+        # Act
+        read_options = MongoReadOptions.from_env({})
+
+        # Assert
+        assert read_options.build_read_preference() == SecondaryPreferred(
+            max_staleness=90
+        )
+        assert read_options.build_read_concern().level == "local"
+
+    def test_from_env(self):
+        # Act
+        read_options = MongoReadOptions.from_env(
+            {
+                "MONGO_READ_ONLY_READ_PREFERENCE": "primary",
+                "MONGO_READ_ONLY_MAX_STALENESS_SECONDS": "120",
+                "MONGO_READ_ONLY_READ_CONCERN": "majority",
+            }
+        )
+
+        # Assert
+        assert read_options.build_read_preference() == Primary()
+        assert read_options.build_read_concern().level == "majority"
+
+    def test_max_staleness_below_minimum(self):
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            MongoReadOptions(max_staleness_seconds=10)
+
+
+class TestPoolStatisticsListener:
+    def test_statistics(self):
+        # Arrange
+        listener = PoolStatisticsListener()
+        event = Mock()
+
+        # Act
+        listener.connection_created(event)
+        listener.connection_created(event)
+        listener.connection_checked_out(event)
+        listener.connection_checked_out(event)
+        listener.connection_checked_in(event)
+        listener.connection_check_out_failed(event)
+        listener.connection_closed(event)
+        listener.pool_cleared(event)
+
+        # Assert
+        statistics = listener.statistics
+        assert statistics.connections_created == 2
+        assert statistics.open_connections == 1
+        assert statistics.checkouts == 2
+        assert statistics.connections_checked_out == 1
+        assert statistics.max_connections_checked_out == 2
+        assert statistics.checkout_failures == 1
+        assert statistics.pools_cleared == 1
@@ -0,0 +1,258 @@
+import sqlite3
+import threading
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from src.adapters.outbound.repositories.sqlite import (
+    client,
+    inventory,
+    item,
+    order,
+    sales,
+)
+from src.adapters.outbound.repositories.sqlite.connection import (
+    SQLiteConnection,
+)
+from src.adapters.outbound.repositories.sqlite.item import (
+    SQLiteItemRepository,
+)
+from src.adapters.outbound.repositories.sqlite.order import (
+    SQLiteOrderRepository,
+)
+from src.domain.entities.item import Item
+from src.domain.entities.order import Order, OrderItem
+from src.domain.ports.outbound.repositories.order import (
+    OrderCursor,
+    OrderFilter,
+)
+from src.domain.unit_of_work import UnitOfWork
+
+# GET_ALL_ITEMS is left out on purpose: reading the whole catalog is a scan.
+INDEXED_STATEMENTS = [
+    (item.FIND_ITEM_BY_NAME, ("marmita",)),
+    (item.FIND_ITEMS_BY_NAMES, ('["marmita"]',)),
+    (item.FIND_ITEMS_BY_IDS, ('["id"]',)),
+    (item.ITER_ITEMS_AFTER_NAME, ("marmita", 500)),
+    (item.REMOVE_ITEM_BY_NAME, ("marmita",)),
+    (item.INCREMENT_INVENTORY_QUANTITY, (1, "id")),
+    (item.DECREMENT_INVENTORY_QUANTITIES, ('{"id": 1}',)),
+    (item.FIND_ITEMS_NAMES_BY_IDS, ('["id"]',)),
+    (client.FIND_CLIENT_BY_NAME, ("cliente",)),
+    (order.FIND_ORDER_BY_ID, ("id",)),
+    (order.FIND_ORDER_BY_EXTERNAL_ID, ("marca", 1)),
+    (order.FIND_ORDER_LINES, ('["id"]',)),
+    (order.FIND_ORDERS_BY_IDS, ('["id"]',)),
+    (order.FIND_ORDERS_BY_EXTERNAL_IDS, ("marca", "[1, 2]")),
+    (order.CANCEL_ORDERS, ("2024-06-09", '["id"]')),
+    (order.DELETE_ORDER_LINES, ("id",)),
+    (sales.FIND_DAILY_SALES, ("2024-06-03", "2024-06-09")),
+    (inventory.FIND_MOVEMENTS_UNTIL, ("2024-06-09",)),
+    (inventory.FIND_MOVEMENTS_BETWEEN, ("2024-06-03", "2024-06-09")),
+    (inventory.FIND_LATEST_SNAPSHOT, ("2024-06-09",)),
+    (order.FIND_ORDER_LINES_TO_ARCHIVE, ('["id"]',)),
+    (order.DELETE_ORDER, ("id",)),
+    (order.FIND_ARCHIVED_ORDER, ("id",)),
+    (order.FIND_ARCHIVED_ORDER_CLIENT, ("id",)),
+    (order.FIND_ARCHIVED_ORDER_ITEMS, ('["id"]',)),
+]
+ORDER_PAGE_CURSOR = OrderCursor(
+    created_at=datetime(2023, 6, 7), order_id="6620c8c35e0fe3996cc41e6c"
+)
+INDEXED_STATEMENTS += [
+    (statement, (*parameters, 10))
+    for statement, parameters in (
+        order.build_order_page_statement(
+            OrderFilter(), after=ORDER_PAGE_CURSOR
+        ),
+        order.build_order_page_statement(
+            OrderFilter(client_id="6620c8c35e0fe3996cc41e6d"),
+            before=ORDER_PAGE_CURSOR,
+        ),
+        order.build_order_page_statement(
+            OrderFilter(
+                created_from=datetime(2023, 6, 1),
+                created_until=datetime(2023, 7, 1),
+            )
+        ),
+        order.build_orders_to_archive_statement(
+            OrderFilter(created_until=datetime(2023, 6, 1))
+        ),
+        order.build_orders_to_archive_statement(
+            OrderFilter(created_until=datetime(2023, 6, 1), is_cancelled=True)
+        ),
+    )
+]
+
+
+@pytest.fixture
+def sqlite_connection(tmp_path):
+    sqlite_connection = SQLiteConnection(str(tmp_path / "inventory.db"))
+    yield sqlite_connection
+    sqlite_connection.close()
+
+
+def test_connection_uses_write_ahead_logging(sqlite_connection):
+    # Act
+    journal_mode = sqlite_connection.get_journal_mode()
+
+    # Assert
+    assert journal_mode == "wal"
+
+
+@pytest.mark.parametrize(("statement", "parameters"), INDEXED_STATEMENTS)
+def test_repository_statements_use_indexes(
+    sqlite_connection, statement, parameters
+):
+    # Act
+    query_plan = sqlite_connection.fetch_all(
+        f"EXPLAIN QUERY PLAN {statement}", parameters
+    )
+
+    # Assert
+    table_scans = [
+        detail
+        for *_, detail in query_plan
+        if detail.startswith("SCAN") and "json_each" not in detail
+    ]
+    assert table_scans == []
+
+
+def test_low_stock_items_are_read_from_the_partial_index(sqlite_connection):
+    # Act
+    query_plan = sqlite_connection.fetch_all(
+        f"EXPLAIN QUERY PLAN {item.FIND_LOW_STOCK_ITEMS}"
+    )
+
+    # Assert
+    # The partial index holds only the low stock items, so walking it in
+    # name order reads those rows alone.
+    assert [detail for *_, detail in query_plan] == [
+        "SCAN items USING INDEX items_low_stock"
+    ]
+
+
+def test_added_columns_are_added_to_an_existing_database(tmp_path):
+    # Arrange
+    database_path = str(tmp_path / "inventory.db")
+    connection = sqlite3.connect(database_path)
+    connection.execute(
+        "CREATE TABLE items (id TEXT PRIMARY KEY, name TEXT NOT NULL UNIQUE, "
+        "inventory_quantity INTEGER NOT NULL)"
+    )
+    connection.execute(
+        "INSERT INTO items VALUES ('6620c8c35e0fe3996cc41e6c', 'suco', 0)"
+    )
+    connection.commit()
+    connection.close()
+
+    # Act
+    sqlite_connection = SQLiteConnection(database_path)
+    low_stock_items = SQLiteItemRepository(
+        sqlite_connection
+    ).find_low_stock_items()
+    sqlite_connection.close()
+
+    # Assert
+    assert [
+        (low_stock_item.name, low_stock_item.low_stock_threshold)
+        for low_stock_item in low_stock_items
+    ] == [("suco", 0)]
+
+
+def test_data_survives_reopening_the_database(tmp_path):
+    # Arrange
+    database_path = str(tmp_path / "inventory.db")
+    sqlite_connection = SQLiteConnection(database_path)
+    SQLiteItemRepository(sqlite_connection).save(
+        Item(name="Marmita de Frango", inventory_quantity=10)
+    )
+    sqlite_connection.close()
+
+    # Act
+    reopened_connection = SQLiteConnection(database_path)
+    found_item = SQLiteItemRepository(reopened_connection).find_item_by_name(
+        "Marmita de Frango"
+    )
+    reopened_connection.close()
+
+    # Assert
+    assert found_item.inventory_quantity == 10
+
+
+def test_failed_transaction_is_rolled_back(sqlite_connection):
+    # Arrange
+    item_repository = SQLiteItemRepository(sqlite_connection)
+    test_item = Item(name="Marmita de Frango", inventory_quantity=10)
+    item_repository.save(test_item)
+
+    # Act
+    with (
+        pytest.raises(RuntimeError),
+        sqlite_connection.transaction(),
+    ):
+        item_repository.increment_inventory_quantities({test_item.id: -3})
+        raise RuntimeError
+
+    # Assert
+    found_item = item_repository.find_item_by_name("Marmita de Frango")
+    assert found_item.inventory_quantity == 10
+
+
+def test_concurrent_increments_are_not_lost(sqlite_connection):
+    # Arrange
+    item_repository = SQLiteItemRepository(sqlite_connection)
+    test_item = Item(name="Marmita de Frango", inventory_quantity=0)
+    item_repository.save(test_item)
+
+    def increment():
+        for _ in range(200):
+            item_repository.increment_inventory_quantities({test_item.id: 1})
+
+    threads = [threading.Thread(target=increment) for _ in range(4)]
+
+    # Act
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Assert
+    found_item = item_repository.find_item_by_name("Marmita de Frango")
+    assert found_item.inventory_quantity == 800
+
+
+def test_unit_of_work_commits_or_rolls_back_as_a_unit(sqlite_connection):
+    # Arrange
+    item_repository = SQLiteItemRepository(sqlite_connection)
+    order_repository = SQLiteOrderRepository(sqlite_connection)
+    test_item = Item(name="Marmita de Frango", inventory_quantity=10)
+    item_repository.save(test_item)
+    failing_item_repository = Mock(wraps=item_repository)
+    failing_item_repository.increment_inventory_quantities.side_effect = (
+        RuntimeError
+    )
+    test_order = Order(
+        external_id=None,
+        external_created_at=None,
+        created_at=datetime(2023, 6, 7, 10, 0, 0),
+        updated_at=datetime(2023, 6, 7, 10, 0, 0),
+        is_cancelled=False,
+        client=None,
+        order_items=[OrderItem(item=test_item, quantity=2)],
+    )
+    unit_of_work = UnitOfWork(
+        failing_item_repository,
+        order_repository,
+        sqlite_connection.transaction,
+    )
+
+    # Act
+    unit_of_work.register_new_order(test_order)
+    unit_of_work.register_inventory_deltas({test_item.id: -2})
+    with pytest.raises(RuntimeError):
+        unit_of_work.commit()
+
+    # Assert
+    assert order_repository.find_order_by_id(test_order.id) is None
@@ -1,9 +1,75 @@
+import functools
+
+import mongomock
 import pytest
 
 from src.adapters.outbound.repositories.mongo.connection import (
     MongoMockConnection,
 )
 
+MONGO_COMMAND_METHODS = (
+    "aggregate",
+    "bulk_write",
+    "count_documents",
+    "delete_many",
+    "delete_one",
+    "distinct",
+    "find",
+    "find_one",
+    "find_one_and_delete",
+    "find_one_and_replace",
+    "find_one_and_update",
+    "insert_many",
+    "insert_one",
+    "replace_one",
+    "update_many",
+    "update_one",
+)
+
+
+def _create_indexes(collection, indexes, session=None):
+    # mongomock's create_indexes drops partialFilterExpression, while its
+    # create_index honours it.
+    index_names = []
+    for index in indexes:
+        options = dict(index.document)
+        keys = options.pop("key")
+        index_names.append(
+            collection.create_index(keys.items(), session=session, **options)
+        )
+    return index_names
+
+
+mongomock.collection.Collection.create_indexes = _create_indexes
+
+
+class MongoCommandCounter:
+    def __init__(self):
+        self.commands: list[tuple[str, str]] = []
+        self._depth = 0
+
+    @property
+    def count(self) -> int:
+        return len(self.commands)
+
+    def reset(self):
+        self.commands.clear()
+
+    def wrap(self, method_name: str, method):
+        @functools.wraps(method)
+        def wrapper(collection, *args, **kwargs):
+            # mongomock implements some commands on top of others (find_one
+            # calls find), so only the outermost call is a round trip.
+            if self._depth == 0:
+                self.commands.append((collection.name, method_name))
+            self._depth += 1
+            try:
+                return method(collection, *args, **kwargs)
+            finally:
+                self._depth -= 1
+
+        return wrapper
+
 
 @pytest.fixture(scope="function")
 def mongo_connection():
@@ -13,3 +79,16 @@ def mongo_connection():
     connection.connect()
     yield connection
     connection.close()
+
+
+@pytest.fixture
+def mongo_command_counter(mongo_connection, monkeypatch):
+    counter = MongoCommandCounter()
+    for method_name in MONGO_COMMAND_METHODS:
+        method = getattr(mongomock.collection.Collection, method_name)
+        monkeypatch.setattr(
+            mongomock.collection.Collection,
+            method_name,
+            counter.wrap(method_name, method),
+        )
+    return counter
@@ -0,0 +1,442 @@
+from contextlib import contextmanager
+from datetime import date, datetime
+from unittest.mock import Mock, call
+
+import pytest
+from bson import ObjectId
+
+from src.domain.entities.inventory import InventoryMovementReason
+from src.domain.entities.item import Item
+from src.domain.entities.order import Order, OrderItem
+from src.domain.entities.sales import DailyItemSales
+from src.domain.exceptions import (
+    InsufficientInventoryError,
+    OrderAlreadyExistsError,
+    OrdersAlreadyCancelledError,
+)
+from src.domain.unit_of_work import UnitOfWork
+
+
+def build_order(item: Item, quantity: int) -> Order:
+    return Order(
+        external_id=1234,
+        brand="marca",
+        external_created_at="17:54",
+        created_at=datetime(2023, 6, 7, 10, 0, 0),
+        updated_at=datetime(2023, 6, 7, 10, 0, 0),
+        is_cancelled=False,
+        client=None,
+        order_items=[OrderItem(item=item, quantity=quantity)],
+    )
+
+
+class TestUnitOfWork:
+    @pytest.fixture
+    def repositories(self):
+        return Mock()
+
+    @pytest.fixture
+    def unit_of_work(self, repositories):
+        return UnitOfWork(
+            repositories.item_repository, repositories.order_repository
+        )
+
+    def test_commit_flushes_orders_before_stock(
+        self, repositories, unit_of_work
+    ):
+        # Arrange
+        item = Item(name="Marmita de Frango", inventory_quantity=10)
+        new_order = build_order(item, 2)
+        dirty_order = build_order(item, 3)
+        item_repository = repositories.item_repository
+        item_repository.increment_inventory_quantities.return_value = {
+            item.id: 5
+        }
+
+        # Act
+        unit_of_work.register_new_order(new_order)
+        unit_of_work.register_dirty_order(dirty_order)
+        unit_of_work.register_dirty_items([item])
+        unit_of_work.register_inventory_deltas({item.id: -2})
+        unit_of_work.register_inventory_deltas({item.id: -3})
+        inventory_quantities_by_item_id = unit_of_work.commit()
+
+        # Assert
+        assert inventory_quantities_by_item_id == {item.id: 5}
+        assert repositories.mock_calls == [
+            call.order_repository.save(new_order),
+            call.order_repository.save(dirty_order),
+            call.item_repository.save_all([item]),
+            call.item_repository.increment_inventory_quantities({item.id: -5}),
+        ]
+
+    def test_new_order_marked_dirty_is_saved_once(
+        self, repositories, unit_of_work
+    ):
+        # Arrange
+        order = build_order(Item(name="Marmita", inventory_quantity=1), 1)
+
+        # Act
+        unit_of_work.register_new_order(order)
+        unit_of_work.register_dirty_order(order)
+        inventory_quantities_by_item_id = unit_of_work.commit()
+
+        # Assert
+        assert inventory_quantities_by_item_id == {}
+        assert repositories.mock_calls == [call.order_repository.save(order)]
+
+    def test_commit_cancels_orders_in_one_write_before_stock(
+        self, repositories, unit_of_work
+    ):
+        # Arrange
+        item = Item(name="Marmita de Frango", inventory_quantity=10)
+        orders = [build_order(item, 2), build_order(item, 3)]
+        for order in orders:
+            order.cancel(datetime(2023, 6, 8, 10, 0, 0))
+        item_repository = repositories.item_repository
+        item_repository.increment_inventory_quantities.return_value = {
+            item.id: 15
+        }
+
+        # Act
+        unit_of_work.register_cancelled_orders(orders)
+        unit_of_work.register_inventory_deltas({item.id: 2})
+        unit_of_work.register_inventory_deltas({item.id: 3})
+        inventory_quantities_by_item_id = unit_of_work.commit()
+
+        # Assert
+        assert inventory_quantities_by_item_id == {item.id: 15}
+        assert repositories.mock_calls == [
+            call.order_repository.cancel_orders(
+                [order.id for order in orders], datetime(2023, 6, 8, 10, 0, 0)
+            ),
+            call.item_repository.increment_inventory_quantities({item.id: 5}),
+        ]
+
+    def test_order_cancelled_meanwhile_gives_no_stock_back(
+        self, repositories, unit_of_work
+    ):
+        # Arrange
+        item = Item(name="Marmita de Frango", inventory_quantity=10)
+        order = build_order(item, 2)
+        order.cancel()
+        item_repository = repositories.item_repository
+        order_repository = repositories.order_repository
+        order_repository.cancel_orders.side_effect = (
+            OrdersAlreadyCancelledError([order.id])
+        )
+
+        # Act
+        unit_of_work.register_cancelled_orders([order])
+        unit_of_work.register_inventory_deltas({item.id: 2})
+        with pytest.raises(OrdersAlreadyCancelledError):
+            unit_of_work.commit()
+
+        # Assert
+        item_repository.increment_inventory_quantities.assert_not_called()
+        assert unit_of_work.commit() == {}
+
+    def test_commit_merges_daily_sales_deltas(self, repositories):
+        # Arrange
+        meat_item = Item(name="Marmita de Carne", inventory_quantity=10)
+        chicken_item = Item(name="Marmita de Frango", inventory_quantity=10)
+        order = build_order(meat_item, 2)
+        order.order_items.append(OrderItem(item=chicken_item, quantity=1))
+        unit_of_work = UnitOfWork(
+            repositories.item_repository,
+            repositories.order_repository,
+            sales_repository=repositories.sales_repository,
+        )
+
+        # Act
+        unit_of_work.register_new_order(order)
+        unit_of_work.register_daily_sales_deltas(order.build_daily_sales())
+        unit_of_work.register_daily_sales_deltas(
+            [
+                DailyItemSales(
+                    day=date(2023, 6, 7),
+                    item_id=chicken_item.id,
+                    item_name=chicken_item.name,
+                    quantity=-1,
+                )
+            ]
+        )
+        unit_of_work.commit()
+
+        # Assert
+        assert repositories.mock_calls == [
+            call.order_repository.save(order),
+            call.sales_repository.increment_daily_sales(
+                [
+                    DailyItemSales(
+                        day=date(2023, 6, 7),
+                        item_id=meat_item.id,
+                        item_name=meat_item.name,
+                        quantity=2,
+                    )
+                ]
+            ),
+        ]
+
+    def test_commit_without_sales_repository_skips_daily_sales(
+        self, repositories, unit_of_work
+    ):
+        # Arrange
+        order = build_order(Item(name="Marmita", inventory_quantity=1), 1)
+
+        # Act
+        unit_of_work.register_new_order(order)
+        unit_of_work.register_daily_sales_deltas(order.build_daily_sales())
+        unit_of_work.commit()
+
+        # Assert
+        assert repositories.mock_calls == [call.order_repository.save(order)]
+
+    def test_commit_writes_items_before_inventory_movements(
+        self, repositories
+    ):
+        # Arrange
+        new_item = Item(name="Marmita de Carne", inventory_quantity=10)
+        dirty_item = Item(name="Refrigerante", inventory_quantity=5)
+        removed_item = Item(name="Suco", inventory_quantity=3)
+        order = build_order(new_item, 2)
+        movements = order.build_inventory_movements(
+            InventoryMovementReason.ORDER
+        )
+        unit_of_work = UnitOfWork(
+            repositories.item_repository,
+            ledger_repository=repositories.ledger_repository,
+        )
+        item_repository = repositories.item_repository
+        item_repository.increment_inventory_quantities.return_value = {
+            new_item.id: 8
+        }
+
+        # Act
+        unit_of_work.register_new_items([new_item])
+        unit_of_work.register_dirty_items([dirty_item])
+        unit_of_work.register_removed_items([removed_item])
+        unit_of_work.register_inventory_deltas({new_item.id: -2})
+        unit_of_work.register_inventory_movements(movements)
+        unit_of_work.commit()
+
+        # Assert
+        assert repositories.mock_calls == [
+            call.item_repository.save_all([new_item, dirty_item]),
+            call.item_repository.remove_item_by_name(removed_item.name),
+            call.item_repository.increment_inventory_quantities(
+                {new_item.id: -2}
+            ),
+            call.ledger_repository.append_movements(movements),
+        ]
+
+    def test_commit_without_ledger_repository_skips_movements(
+        self, repositories, unit_of_work
+    ):
+        # Arrange
+        order = build_order(Item(name="Marmita", inventory_quantity=1), 1)
+
+        # Act
+        unit_of_work.register_new_order(order)
+        unit_of_work.register_inventory_movements(
+            order.build_inventory_movements(InventoryMovementReason.ORDER)
+        )
+        unit_of_work.commit()
+
+        # Assert
+        assert repositories.mock_calls == [call.order_repository.save(order)]
+
+    def test_failed_commit_discards_pending_writes(
+        self, repositories, unit_of_work
+    ):
+        # Arrange
+        order = build_order(Item(name="Marmita", inventory_quantity=1), 1)
+        repositories.order_repository.save.side_effect = (
+            OrderAlreadyExistsError("marca", 1234)
+        )
+        unit_of_work.register_new_order(order)
+        unit_of_work.register_inventory_deltas({ObjectId(): -1})
+
+        # Act
+        with pytest.raises(OrderAlreadyExistsError):
+            unit_of_work.commit()
+        unit_of_work.commit()
+
+        # Assert
+        repositories.order_repository.save.assert_called_once_with(order)
+        item_repository = repositories.item_repository
+        item_repository.increment_inventory_quantities.assert_not_called()
+
+    def test_commit_reserves_strict_deltas_before_other_writes(
+        self, repositories, unit_of_work
+    ):
+        # Arrange
+        item = Item(name="Marmita de Frango", inventory_quantity=10)
+        restocked_item = Item(name="Marmita de Carne", inventory_quantity=1)
+        order = build_order(item, 2)
+        item_repository = repositories.item_repository
+        item_repository.decrement_inventory_quantities.return_value = {
+            item.id: 7
+        }
+        item_repository.increment_inventory_quantities.return_value = {
+            restocked_item.id: 2
+        }
+
+        # Act
+        unit_of_work.register_new_order(order)
+        unit_of_work.register_inventory_deltas({item.id: -2}, strict=True)
+        unit_of_work.register_inventory_deltas(
+            {item.id: -1, restocked_item.id: 1}, strict=True
+        )
+        inventory_quantities_by_item_id = unit_of_work.commit()
+
+        # Assert
+        assert inventory_quantities_by_item_id == {
+            item.id: 7,
+            restocked_item.id: 2,
+        }
+        assert repositories.mock_calls == [
+            call.item_repository.decrement_inventory_quantities({item.id: 3}),
+            call.order_repository.save(order),
+            call.item_repository.increment_inventory_quantities(
+                {restocked_item.id: 1}
+            ),
+        ]
+
+    def test_short_reservation_fails_before_any_write(
+        self, repositories, unit_of_work
+    ):
+        # Arrange
+        item = Item(name="Marmita de Frango", inventory_quantity=1)
+        item_repository = repositories.item_repository
+        item_repository.decrement_inventory_quantities.side_effect = (
+            InsufficientInventoryError([item.name])
+        )
+        unit_of_work.register_new_order(build_order(item, 2))
+        unit_of_work.register_inventory_deltas({item.id: -2}, strict=True)
+
+        # Act
+        with pytest.raises(InsufficientInventoryError):
+            unit_of_work.commit()
+
+        # Assert
+        assert repositories.mock_calls == [
+            call.item_repository.decrement_inventory_quantities({item.id: 2}),
+            call.item_repository.invalidate(),
+        ]
+
+    def test_failed_write_gives_back_reserved_stock(
+        self, repositories, unit_of_work
+    ):
+        # Arrange
+        item = Item(name="Marmita de Frango", inventory_quantity=10)
+        repositories.order_repository.save.side_effect = (
+            OrderAlreadyExistsError("marca", 1234)
+        )
+        unit_of_work.register_new_order(build_order(item, 2))
+        unit_of_work.register_inventory_deltas({item.id: -2}, strict=True)
+
+        # Act
+        with pytest.raises(OrderAlreadyExistsError):
+            unit_of_work.commit()
+
+        # Assert
+        item_repository = repositories.item_repository
+        item_repository.increment_inventory_quantities.assert_called_once_with(
+            {item.id: 2}
+        )
+
+    def test_failed_write_after_the_orders_keeps_reserved_stock(
+        self, repositories
+    ):
+        # Arrange
+        item = Item(name="Marmita de Frango", inventory_quantity=10)
+        repositories.sales_repository.increment_daily_sales.side_effect = (
+            RuntimeError("daily sales are down")
+        )
+        unit_of_work = UnitOfWork(
+            repositories.item_repository,
+            repositories.order_repository,
+            sales_repository=repositories.sales_repository,
+        )
+        order = build_order(item, 2)
+        unit_of_work.register_new_order(order)
+        unit_of_work.register_inventory_deltas({item.id: -2}, strict=True)
+        unit_of_work.register_daily_sales_deltas(order.build_daily_sales())
+
+        # Act
+        with pytest.raises(RuntimeError):
+            unit_of_work.commit()
+
+        # Assert
+        repositories.order_repository.save.assert_called_once_with(order)
+        item_repository = repositories.item_repository
+        item_repository.increment_inventory_quantities.assert_not_called()
+
+    def test_failed_commit_invalidates_the_item_cache(
+        self, repositories, unit_of_work
+    ):
+        # Arrange
+        item = Item(name="Marmita de Frango", inventory_quantity=10)
+        repositories.order_repository.save.side_effect = (
+            OrderAlreadyExistsError("marca", 1234)
+        )
+        unit_of_work.register_new_order(build_order(item, 2))
+        unit_of_work.register_inventory_deltas({item.id: -2}, strict=True)
+
+        # Act
+        with pytest.raises(OrderAlreadyExistsError):
+            unit_of_work.commit()
+
+        # Assert
+        repositories.item_repository.invalidate.assert_called_once_with()
+
+    def test_rollback_discards_pending_writes(
+        self, repositories, unit_of_work
+    ):
+        # Arrange
+        unit_of_work.register_new_order(
+            build_order(Item(name="Marmita", inventory_quantity=1), 1)
+        )
+
+        # Act
+        unit_of_work.rollback()
+        unit_of_work.commit()
+
+        # Assert
+        assert repositories.mock_calls == []
+
+    def test_commit_runs_inside_the_transaction(self, repositories):
+        # Arrange
+        events = []
+
+        @contextmanager
+        def transaction():
+            events.append("begin")
+            try:
+                yield
+            except OrderAlreadyExistsError:
+                events.append("abort")
+                raise
+            events.append("commit")
+
+        repositories.order_repository.save.side_effect = [
+            None,
+            OrderAlreadyExistsError("marca", 1234),
+        ]
+        unit_of_work = UnitOfWork(
+            repositories.item_repository,
+            repositories.order_repository,
+            transaction,
+        )
+        order = build_order(Item(name="Marmita", inventory_quantity=1), 1)
+
+        # Act
+        unit_of_work.register_new_order(order)
+        unit_of_work.commit()
+        unit_of_work.register_new_order(order)
+        with pytest.raises(OrderAlreadyExistsError):
+            unit_of_work.commit()
+
+        # Assert
+        assert events == ["begin", "commit", "begin", "abort"]
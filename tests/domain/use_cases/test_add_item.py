@@ -36,8 +36,8 @@ class TestAddItemUseCase:
         assert output_dto.inventory_quantity == inventory_quantity
 
         item_repository.find_item_by_name.assert_called_once_with(item_name)
-        item_repository.save.assert_called_once()
-        saved_item = item_repository.save.call_args[0][0]
+        item_repository.save_all.assert_called_once()
+        (saved_item,) = item_repository.save_all.call_args[0][0]
         assert saved_item.name == item_name
         assert saved_item.inventory_quantity == inventory_quantity
         assert isinstance(saved_item.id, ObjectId)
@@ -61,8 +61,8 @@ class TestAddItemUseCase:
         assert output_dto.inventory_quantity == inventory_quantity
 
         item_repository.find_item_by_name.assert_called_once_with(item_name)
-        item_repository.save.assert_called_once()
-        saved_item = item_repository.save.call_args[0][0]
+        item_repository.save_all.assert_called_once()
+        (saved_item,) = item_repository.save_all.call_args[0][0]
         assert saved_item.name == item_name
         assert saved_item.inventory_quantity == inventory_quantity
         assert isinstance(saved_item.id, ObjectId)
@@ -87,4 +87,4 @@ class TestAddItemUseCase:
 
         assert exc_info.value.item_name == item_name
         item_repository.find_item_by_name.assert_called_once_with(item_name)
-        item_repository.save.assert_not_called()
+        item_repository.save_all.assert_not_called()
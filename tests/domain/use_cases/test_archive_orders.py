@@ -0,0 +1,66 @@
+from datetime import datetime
+from unittest.mock import Mock, call
+
+import pytest
+
+from src.domain.ports.inbound.orders.dtos import (
+    ArchiveOrdersInputDTO,
+    ArchiveOrdersOutputDTO,
+)
+from src.domain.ports.outbound.repositories.order import OrderFilter
+from src.domain.use_cases.archive_orders import (
+    ArchiveOrdersUseCase,
+)
+
+CREATED_BEFORE = datetime(2024, 1, 1)
+CANCELLED_CREATED_BEFORE = datetime(2024, 5, 1)
+
+
+class TestArchiveOrdersUseCase:
+    @pytest.fixture
+    def order_repository(self):
+        return Mock()
+
+    def test_archive_orders_archives_one_batch_per_filter(
+        self, order_repository
+    ):
+        # Arrange
+        order_repository.archive_orders.side_effect = [100, 7]
+        use_case = ArchiveOrdersUseCase(order_repository)
+
+        # Act
+        output_dto = use_case.execute(
+            ArchiveOrdersInputDTO(
+                created_before=CREATED_BEFORE,
+                cancelled_created_before=CANCELLED_CREATED_BEFORE,
+                batch_size=100,
+            )
+        )
+
+        # Assert
+        assert output_dto == ArchiveOrdersOutputDTO(archived_count=107)
+        assert order_repository.archive_orders.call_args_list == [
+            call(OrderFilter(created_until=CREATED_BEFORE), 100),
+            call(
+                OrderFilter(
+                    created_until=CANCELLED_CREATED_BEFORE, is_cancelled=True
+                ),
+                100,
+            ),
+        ]
+
+    def test_archive_orders_without_cancelled_age(self, order_repository):
+        # Arrange
+        order_repository.archive_orders.return_value = 0
+        use_case = ArchiveOrdersUseCase(order_repository)
+
+        # Act
+        output_dto = use_case.execute(
+            ArchiveOrdersInputDTO(created_before=CREATED_BEFORE)
+        )
+
+        # Assert
+        assert output_dto.archived_count == 0
+        order_repository.archive_orders.assert_called_once_with(
+            OrderFilter(created_until=CREATED_BEFORE), 500
+        )
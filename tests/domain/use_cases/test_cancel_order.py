@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 from unittest.mock import Mock
 
 import pytest
@@ -8,6 +8,7 @@ from freezegun import freeze_time
 from src.domain.entities.client import Client
 from src.domain.entities.item import Item
 from src.domain.entities.order import Order, OrderItem
+from src.domain.entities.sales import DailyItemSales
 from src.domain.exceptions import OrderNotFoundError
 from src.domain.ports.inbound.orders.dtos import (
     CancelOrderInputDTO,
@@ -45,18 +46,21 @@ class TestCancelOrderUseCase:
         # Arrange
         order_id = ObjectId()
         item_id = order_item.item.id
-        order_repository.find_order_by_id.return_value = Order(
-            id=order_id,
-            external_id=1234,
-            external_created_at="17:54",
-            created_at=datetime(2023, 6, 7, 10, 0, 0),
-            updated_at=datetime(2023, 6, 7, 10, 0, 0),
-            is_cancelled=False,
-            client=client,
-            order_items=[order_item],
-        )
-
-        item_name = "Marmita de Frango"
+        order_repository.find_orders_by_ids.return_value = [
+            Order(
+                id=order_id,
+                external_id=1234,
+                external_created_at="17:54",
+                created_at=datetime(2023, 6, 7, 10, 0, 0),
+                updated_at=datetime(2023, 6, 7, 10, 0, 0),
+                is_cancelled=False,
+                client=client,
+                order_items=[order_item],
+            )
+        ]
+        item_repository.increment_inventory_quantities.return_value = {
+            item_id: 20
+        }
 
         input_dto = CancelOrderInputDTO(order_id=order_id)
 
@@ -81,7 +85,7 @@ class TestCancelOrderUseCase:
         assert output_dto.order_items[0].quantity == 10
         assert output_dto.order_items[0].inventory_quantity == 20
 
-        order_repository.find_order_by_id.assert_called_once_with(order_id)
+        order_repository.find_orders_by_ids.assert_called_once_with([order_id])
         order_repository.save.assert_called_once()
         saved_order = order_repository.save.call_args[0][0]
         assert saved_order.id == order_id
@@ -92,15 +96,11 @@ class TestCancelOrderUseCase:
         assert saved_order.client == client
         assert saved_order.order_items == [order_item]
 
-        item_repository.save_all.assert_called_once()
-        saved_items = item_repository.save_all.call_args[0][0]
-        assert len(saved_items) == 1
-        saved_item = saved_items[0]
-        assert saved_item.id == item_id
-        assert saved_item.name == item_name
-        assert (
-            saved_item.inventory_quantity == 20
-        )  # initial inventory_quantity was 10
+        item_repository.increment_inventory_quantities.assert_called_once_with(
+            {item_id: 10}
+        )
+        item_repository.save_all.assert_not_called()
+        assert order_item.item.inventory_quantity == 20
 
     def test_cancel_order_use_case_raises_order_not_found(
         self,
@@ -109,7 +109,7 @@ class TestCancelOrderUseCase:
     ):
         # Arrange
         order_id = ObjectId()
-        order_repository.find_order_by_id.return_value = None
+        order_repository.find_orders_by_ids.return_value = []
 
         input_dto = CancelOrderInputDTO(order_id=order_id)
 
@@ -123,4 +123,59 @@ class TestCancelOrderUseCase:
             use_case.execute(input_dto)
         assert exc_info.value.order_id == order_id
 
+        item_repository.increment_inventory_quantities.assert_not_called()
+        order_repository.save.assert_not_called()
+
+    def test_cancel_order_use_case_commits_through_unit_of_work(
+        self,
+        order_repository,
+        item_repository,
+        client,
+        order_item,
+    ):
+        # Arrange
+        order_id = ObjectId()
+        item_id = order_item.item.id
+        order_repository.find_orders_by_ids.return_value = [
+            Order(
+                id=order_id,
+                external_id=1234,
+                external_created_at="17:54",
+                created_at=datetime(2023, 6, 7, 10, 0, 0),
+                updated_at=datetime(2023, 6, 7, 10, 0, 0),
+                is_cancelled=False,
+                client=client,
+                order_items=[order_item],
+            )
+        ]
+        unit_of_work = Mock()
+        unit_of_work.commit.return_value = {item_id: 20}
+
+        use_case = CancelOrderUseCase(
+            order_repository, item_repository, unit_of_work
+        )
+
+        # Act
+        output_dto = use_case.execute(CancelOrderInputDTO(order_id=order_id))
+
+        # Assert
+        assert output_dto.order_items[0].inventory_quantity == 20
+        dirty_order = unit_of_work.register_dirty_order.call_args[0][0]
+        assert dirty_order.id == order_id
+        assert dirty_order.is_cancelled
+        unit_of_work.register_inventory_deltas.assert_called_once_with(
+            {item_id: 10}
+        )
+        unit_of_work.register_daily_sales_deltas.assert_called_once_with(
+            [
+                DailyItemSales(
+                    day=date(2023, 6, 7),
+                    item_id=item_id,
+                    item_name="Marmita de Frango",
+                    quantity=-10,
+                )
+            ]
+        )
+        unit_of_work.commit.assert_called_once()
         order_repository.save.assert_not_called()
+        item_repository.increment_inventory_quantities.assert_not_called()
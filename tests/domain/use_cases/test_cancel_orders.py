@@ -0,0 +1,144 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+from bson import ObjectId
+from freezegun import freeze_time
+
+from src.domain.entities.inventory import InventoryMovementReason
+from src.domain.entities.item import Item
+from src.domain.entities.order import Order, OrderItem
+from src.domain.ports.inbound.orders.dtos import (
+    CancelOrdersInputDTO,
+    CancelOrdersOutputDTO,
+)
+from src.domain.use_cases.cancel_orders import (
+    CancelOrdersUseCase,
+)
+
+
+def build_order(
+    item: Item, quantity: int, external_id: int, is_cancelled: bool = False
+) -> Order:
+    return Order(
+        external_id=external_id,
+        brand="marca",
+        external_created_at="17:54",
+        created_at=datetime(2023, 6, 7, 10, 0, 0),
+        updated_at=datetime(2023, 6, 7, 10, 0, 0),
+        is_cancelled=is_cancelled,
+        client=None,
+        order_items=[OrderItem(item=item, quantity=quantity)],
+    )
+
+
+class TestCancelOrdersUseCase:
+    @pytest.fixture
+    def order_repository(self):
+        return Mock()
+
+    @pytest.fixture
+    def item_repository(self):
+        return Mock()
+
+    @pytest.fixture
+    def item(self):
+        return Item(name="Marmita de Frango", inventory_quantity=10)
+
+    @freeze_time("2023-06-08 10:00:00")
+    def test_cancel_orders_use_case_with_success(
+        self, order_repository, item_repository, item
+    ):
+        # Arrange
+        first_order = build_order(item, 2, external_id=1)
+        second_order = build_order(item, 3, external_id=2)
+        cancelled_order = build_order(
+            item, 4, external_id=3, is_cancelled=True
+        )
+        missing_order_id = ObjectId()
+        order_repository.find_orders_by_ids.return_value = [
+            first_order,
+            cancelled_order,
+        ]
+        order_repository.find_orders_by_external_ids.return_value = [
+            first_order,
+            second_order,
+        ]
+        unit_of_work = Mock()
+        unit_of_work.commit.return_value = {item.id: 15}
+        input_dto = CancelOrdersInputDTO(
+            order_ids=[first_order.id, cancelled_order.id, missing_order_id],
+            brand="marca",
+            external_order_ids=[1, 2, 9],
+        )
+        use_case = CancelOrdersUseCase(
+            order_repository, item_repository, unit_of_work
+        )
+
+        # Act
+        output_dto = use_case.execute(input_dto)
+
+        # Assert
+        assert isinstance(output_dto, CancelOrdersOutputDTO)
+        assert [order.order_id for order in output_dto.cancelled_orders] == [
+            first_order.id,
+            second_order.id,
+        ]
+        assert all(order.is_cancelled for order in output_dto.cancelled_orders)
+        assert output_dto.cancelled_orders[0].updated_at == (
+            "2023-06-08T10:00:00"
+        )
+        assert (
+            output_dto.cancelled_orders[1].order_items[0].inventory_quantity
+            == 15
+        )
+        assert output_dto.already_cancelled_order_ids == [cancelled_order.id]
+        assert output_dto.not_found_order_ids == [missing_order_id]
+        assert output_dto.not_found_external_order_ids == [9]
+
+        order_repository.find_orders_by_external_ids.assert_called_once_with(
+            "marca", [1, 2, 9]
+        )
+        unit_of_work.register_cancelled_orders.assert_called_once_with(
+            [first_order, second_order]
+        )
+        assert [
+            call.args[0]
+            for call in unit_of_work.register_inventory_deltas.call_args_list
+        ] == [{item.id: 2}, {item.id: 3}]
+        register_movements = unit_of_work.register_inventory_movements
+        movements = [
+            movement
+            for call in register_movements.call_args_list
+            for movement in call.args[0]
+        ]
+        assert [movement.reason for movement in movements] == [
+            InventoryMovementReason.CANCEL,
+            InventoryMovementReason.CANCEL,
+        ]
+        unit_of_work.commit.assert_called_once()
+        order_repository.save.assert_not_called()
+
+    def test_cancel_orders_use_case_with_nothing_to_cancel(
+        self, order_repository, item_repository, item
+    ):
+        # Arrange
+        cancelled_order = build_order(
+            item, 4, external_id=3, is_cancelled=True
+        )
+        order_repository.find_orders_by_ids.return_value = [cancelled_order]
+        unit_of_work = Mock()
+        use_case = CancelOrdersUseCase(
+            order_repository, item_repository, unit_of_work
+        )
+
+        # Act
+        output_dto = use_case.execute(
+            CancelOrdersInputDTO(order_ids=[cancelled_order.id])
+        )
+
+        # Assert
+        assert output_dto.cancelled_orders == []
+        assert output_dto.already_cancelled_order_ids == [cancelled_order.id]
+        order_repository.find_orders_by_external_ids.assert_not_called()
+        unit_of_work.commit.assert_not_called()
@@ -1,11 +1,15 @@
+from datetime import datetime
 from unittest.mock import Mock
 
 import pytest
-from bson import ObjectId
 
 from src.domain.entities.client import Client
 from src.domain.entities.item import Item
-from src.domain.exceptions import ItemsNotFoundByNameError
+from src.domain.entities.order import Order, OrderItem
+from src.domain.exceptions import (
+    ItemsNotFoundByNameError,
+    OrderAlreadyExistsError,
+)
 from src.domain.ports.inbound.orders.dtos import (
     CreateGoomerOrderInputDTO,
     CreateGoomerOrderOutputDTO,
@@ -49,8 +53,12 @@ class TestCreateGoomerOrderUseCase:
         item_2,
     ):
         # Arrange
-        client_repository.find_client_by_name.return_value = client
+        client_repository.get_or_create_by_name.return_value = client
         item_repository.find_items_by_names.return_value = [item_1, item_2]
+        item_repository.increment_inventory_quantities.return_value = {
+            item_1.id: 8,
+            item_2.id: 2,
+        }
 
         input_dto = CreateGoomerOrderInputDTO(
             client_name="Tirulipa",
@@ -81,14 +89,17 @@ class TestCreateGoomerOrderUseCase:
         assert output_dto.order_items[1].quantity == 3
         assert output_dto.order_items[1].inventory_quantity == 2
 
-        client_repository.find_client_by_name.assert_called_once_with(
+        client_repository.get_or_create_by_name.assert_called_once_with(
             "Tirulipa"
         )
 
         item_repository.find_items_by_names.assert_called_once_with(
             ["Item 1", "Item 2"]
         )
-        item_repository.save_all.assert_called_once_with([item_1, item_2])
+        item_repository.increment_inventory_quantities.assert_called_once_with(
+            {item_1.id: -2, item_2.id: -3}
+        )
+        item_repository.save_all.assert_not_called()
 
         order_repository.save.assert_called_once()
 
@@ -101,8 +112,11 @@ class TestCreateGoomerOrderUseCase:
         item_1,
     ):
         # Arrange
-        client_repository.find_client_by_name.return_value = client
+        client_repository.get_or_create_by_name.return_value = client
         item_repository.find_items_by_names.return_value = [item_1]
+        item_repository.increment_inventory_quantities.return_value = {
+            item_1.id: -5
+        }
 
         input_dto = CreateGoomerOrderInputDTO(
             client_name="Tirulipa",
@@ -127,19 +141,26 @@ class TestCreateGoomerOrderUseCase:
         assert output_dto.order_items[0].quantity == 15
         assert output_dto.order_items[0].inventory_quantity == -5
 
-        client_repository.find_client_by_name.assert_called_once_with(
+        client_repository.get_or_create_by_name.assert_called_once_with(
             "Tirulipa"
         )
         item_repository.find_items_by_names.assert_called_once_with(["Item 1"])
-        item_repository.save_all.assert_called_once_with([item_1])
+        item_repository.increment_inventory_quantities.assert_called_once_with(
+            {item_1.id: -15}
+        )
         order_repository.save.assert_called_once()
 
     def test_create_order_use_case_creates_client_and_order(
         self, client_repository, item_repository, order_repository, item_1
     ):
         # Arrange
-        client_repository.find_client_by_name.return_value = None
+        client_repository.get_or_create_by_name.return_value = Client(
+            name="Tirulipa Inexistente"
+        )
         item_repository.find_items_by_names.return_value = [item_1]
+        item_repository.increment_inventory_quantities.return_value = {
+            item_1.id: 8
+        }
 
         input_dto = CreateGoomerOrderInputDTO(
             client_name="Tirulipa Inexistente",
@@ -166,23 +187,23 @@ class TestCreateGoomerOrderUseCase:
         assert output_dto.order_items[0].quantity == 2
         assert output_dto.order_items[0].inventory_quantity == 8
 
-        client_repository.find_client_by_name.assert_called_once_with(
+        client_repository.get_or_create_by_name.assert_called_once_with(
             "Tirulipa Inexistente"
         )
 
-        client_repository.save.assert_called_once()
-        saved_client = client_repository.save.call_args[0][0]
-        assert saved_client.name == "Tirulipa Inexistente"
-        assert isinstance(saved_client.id, ObjectId)
+        client_repository.find_client_by_name.assert_not_called()
+        client_repository.save.assert_not_called()
 
-        item_repository.save_all.assert_called_once_with([item_1])
+        item_repository.increment_inventory_quantities.assert_called_once_with(
+            {item_1.id: -2}
+        )
         order_repository.save.assert_called_once()
 
     def test_create_order_use_case_raises_item_not_found(
         self, client_repository, item_repository, order_repository, client
     ):
         # Arrange
-        client_repository.find_client_by_name.return_value = client
+        client_repository.get_or_create_by_name.return_value = client
         item_repository.find_items_by_names.return_value = []
 
         input_dto = CreateGoomerOrderInputDTO(
@@ -202,4 +223,132 @@ class TestCreateGoomerOrderUseCase:
         assert exc_info.value.items_names == ["Item 1"]
 
         item_repository.save.assert_not_called()
+        item_repository.increment_inventory_quantities.assert_not_called()
+        order_repository.save.assert_not_called()
+
+    @pytest.fixture
+    def existing_order(self, client, item_1):
+        return Order(
+            external_id=1234,
+            brand="marca",
+            external_created_at="17:54",
+            created_at=datetime(2023, 6, 7, 10, 0, 0),
+            updated_at=datetime(2023, 6, 7, 10, 0, 0),
+            is_cancelled=False,
+            client=client,
+            order_items=[OrderItem(item=item_1, quantity=2)],
+        )
+
+    @pytest.fixture
+    def branded_input_dto(self):
+        return CreateGoomerOrderInputDTO(
+            client_name="Tirulipa",
+            external_order_id=1234,
+            brand="marca",
+            external_created_at="17:54",
+            items=[OrderItemInputDTO(item_name="Item 1", quantity=2)],
+        )
+
+    def test_create_order_use_case_returns_duplicate_order(
+        self,
+        client_repository,
+        item_repository,
+        order_repository,
+        existing_order,
+        branded_input_dto,
+    ):
+        # Arrange
+        order_repository.find_order_by_external_id.return_value = (
+            existing_order
+        )
+        use_case = CreateGoomerOrderUseCase(
+            client_repository, item_repository, order_repository
+        )
+
+        # Act
+        output_dto = use_case.execute(branded_input_dto)
+
+        # Assert
+        assert output_dto.is_duplicate
+        assert output_dto.order_id == existing_order.id
+        assert output_dto.client_name == "Tirulipa"
+        assert output_dto.order_items[0].inventory_quantity == 10
+        order_repository.find_order_by_external_id.assert_called_once_with(
+            "marca", 1234
+        )
+        client_repository.get_or_create_by_name.assert_not_called()
+        item_repository.find_items_by_names.assert_not_called()
+        item_repository.increment_inventory_quantities.assert_not_called()
         order_repository.save.assert_not_called()
+
+    def test_create_order_use_case_concurrent_duplicate_keeps_stock(
+        self,
+        client_repository,
+        item_repository,
+        order_repository,
+        client,
+        item_1,
+        existing_order,
+        branded_input_dto,
+    ):
+        # Arrange
+        order_repository.find_order_by_external_id.side_effect = [
+            None,
+            existing_order,
+        ]
+        order_repository.save.side_effect = OrderAlreadyExistsError(
+            "marca", 1234
+        )
+        client_repository.get_or_create_by_name.return_value = client
+        item_repository.find_items_by_names.return_value = [item_1]
+        use_case = CreateGoomerOrderUseCase(
+            client_repository, item_repository, order_repository
+        )
+
+        # Act
+        output_dto = use_case.execute(branded_input_dto)
+
+        # Assert
+        assert output_dto.is_duplicate
+        assert output_dto.order_id == existing_order.id
+        order_repository.save.assert_called_once()
+        item_repository.increment_inventory_quantities.assert_not_called()
+
+    def test_create_order_use_case_concurrent_duplicate_gives_back_stock(
+        self,
+        client_repository,
+        item_repository,
+        order_repository,
+        client,
+        item_1,
+        existing_order,
+        branded_input_dto,
+    ):
+        # Arrange
+        order_repository.find_order_by_external_id.side_effect = [
+            None,
+            existing_order,
+        ]
+        order_repository.save.side_effect = OrderAlreadyExistsError(
+            "marca", 1234
+        )
+        client_repository.get_or_create_by_name.return_value = client
+        item_repository.find_items_by_names.return_value = [item_1]
+        use_case = CreateGoomerOrderUseCase(
+            client_repository,
+            item_repository,
+            order_repository,
+            strict_stock=True,
+        )
+
+        # Act
+        output_dto = use_case.execute(branded_input_dto)
+
+        # Assert
+        assert output_dto.is_duplicate
+        reserved_quantities = (
+            item_repository.decrement_inventory_quantities.call_args.args[0]
+        )
+        item_repository.increment_inventory_quantities.assert_called_once_with(
+            reserved_quantities
+        )
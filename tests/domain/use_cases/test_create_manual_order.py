@@ -3,7 +3,10 @@ from unittest.mock import Mock
 import pytest
 
 from src.domain.entities.item import Item
-from src.domain.exceptions import ItemsNotFoundByNameError
+from src.domain.exceptions import (
+    InsufficientInventoryError,
+    ItemsNotFoundByNameError,
+)
 from src.domain.ports.inbound.orders.dtos import (
     CreateManualOrderInputDTO,
     CreateManualOrderOutputDTO,
@@ -38,6 +41,10 @@ class TestCreateManualOrderUseCase:
     ):
         # Arrange
         item_repository.find_items_by_names.return_value = [item_1, item_2]
+        item_repository.increment_inventory_quantities.return_value = {
+            item_1.id: 8,
+            item_2.id: 2,
+        }
 
         input_dto = CreateManualOrderInputDTO(
             items=[
@@ -64,7 +71,9 @@ class TestCreateManualOrderUseCase:
         item_repository.find_items_by_names.assert_called_once_with(
             ["Item 1", "Item 2"]
         )
-        item_repository.save_all.assert_called_once_with([item_1, item_2])
+        item_repository.increment_inventory_quantities.assert_called_once_with(
+            {item_1.id: -2, item_2.id: -3}
+        )
 
         order_repository.save.assert_called_once()
 
@@ -76,6 +85,9 @@ class TestCreateManualOrderUseCase:
     ):
         # Arrange
         item_repository.find_items_by_names.return_value = [item_1]
+        item_repository.increment_inventory_quantities.return_value = {
+            item_1.id: -5
+        }
 
         input_dto = CreateManualOrderInputDTO(
             items=[OrderItemInputDTO(item_name="Item 1", quantity=15)],
@@ -93,9 +105,74 @@ class TestCreateManualOrderUseCase:
         assert output_dto.order_items[0].quantity == 15
         assert output_dto.order_items[0].inventory_quantity == -5
 
-        item_repository.save_all.assert_called_once_with([item_1])
+        item_repository.increment_inventory_quantities.assert_called_once_with(
+            {item_1.id: -15}
+        )
         order_repository.save.assert_called_once()
 
+    def test_create_manual_order_use_case_with_strict_stock(
+        self,
+        item_repository,
+        order_repository,
+        item_1,
+        item_2,
+    ):
+        # Arrange
+        item_repository.find_items_by_names.return_value = [item_1, item_2]
+        item_repository.decrement_inventory_quantities.return_value = {
+            item_1.id: 8,
+            item_2.id: 2,
+        }
+        input_dto = CreateManualOrderInputDTO(
+            items=[
+                OrderItemInputDTO(item_name="Item 1", quantity=2),
+                OrderItemInputDTO(item_name="Item 2", quantity=3),
+            ],
+        )
+        use_case = CreateManualOrderUseCase(
+            item_repository, order_repository, strict_stock=True
+        )
+
+        # Act
+        output_dto = use_case.execute(input_dto)
+
+        # Assert
+        assert [
+            order_item.inventory_quantity
+            for order_item in output_dto.order_items
+        ] == [8, 2]
+        item_repository.decrement_inventory_quantities.assert_called_once_with(
+            {item_1.id: 2, item_2.id: 3}
+        )
+        item_repository.increment_inventory_quantities.assert_not_called()
+        order_repository.save.assert_called_once()
+
+    def test_create_manual_order_use_case_strict_stock_rejects_oversell(
+        self,
+        item_repository,
+        order_repository,
+        item_1,
+    ):
+        # Arrange
+        item_repository.find_items_by_names.return_value = [item_1]
+        item_repository.decrement_inventory_quantities.side_effect = (
+            InsufficientInventoryError(["Item 1"])
+        )
+        input_dto = CreateManualOrderInputDTO(
+            items=[OrderItemInputDTO(item_name="Item 1", quantity=15)],
+        )
+        use_case = CreateManualOrderUseCase(
+            item_repository, order_repository, strict_stock=True
+        )
+
+        # Act & Assert
+        with pytest.raises(InsufficientInventoryError) as exc_info:
+            use_case.execute(input_dto)
+        assert exc_info.value.items_names == ["Item 1"]
+
+        item_repository.increment_inventory_quantities.assert_not_called()
+        order_repository.save.assert_not_called()
+
     def test_create_order_use_case_raises_item_not_found(
         self, item_repository, order_repository
     ):
@@ -114,4 +191,5 @@ class TestCreateManualOrderUseCase:
         assert exc_info.value.items_names == ["Item 1"]
 
         item_repository.save.assert_not_called()
+        item_repository.increment_inventory_quantities.assert_not_called()
         order_repository.save.assert_not_called()
@@ -0,0 +1,30 @@
+from unittest.mock import Mock
+
+from src.domain.entities.item import Item
+from src.domain.ports.inbound.items.dtos import CatalogItemOutputDTO
+from src.domain.use_cases.export_items import (
+    ExportItemsUseCase,
+)
+
+
+class TestExportItemsUseCase:
+    def test_export_items_streams_repository_batches(self):
+        # Arrange
+        item_repository = Mock()
+        item_repository.iter_items.return_value = iter(
+            [Item(name="marmita", inventory_quantity=2, low_stock_threshold=1)]
+        )
+        use_case = ExportItemsUseCase(item_repository)
+
+        # Act
+        items = list(use_case.execute(batch_size=100))
+
+        # Assert
+        assert items == [
+            CatalogItemOutputDTO(
+                item_name="marmita",
+                inventory_quantity=2,
+                low_stock_threshold=1,
+            )
+        ]
+        item_repository.iter_items.assert_called_once_with(100)
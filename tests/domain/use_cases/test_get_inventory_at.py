@@ -0,0 +1,89 @@
+from datetime import UTC, datetime
+from unittest.mock import Mock
+
+import pytest
+from bson import ObjectId
+
+from src.domain.entities.inventory import (
+    InventoryMovement,
+    InventoryMovementReason,
+    InventorySnapshot,
+    InventorySnapshotItem,
+)
+from src.domain.ports.inbound.items.dtos import (
+    GetInventoryAtInputDTO,
+    GetInventoryAtOutputDTO,
+    ItemOutputDTO,
+)
+from src.domain.use_cases.get_inventory_at import (
+    GetInventoryAtUseCase,
+)
+
+MEAT_ITEM_ID = ObjectId()
+JUICE_ITEM_ID = ObjectId()
+PREVIOUS_SNAPSHOT = InventorySnapshot(
+    taken_at=datetime(2024, 6, 3, tzinfo=UTC),
+    items=[
+        InventorySnapshotItem(
+            item_id=MEAT_ITEM_ID,
+            item_name="marmita de carne",
+            inventory_quantity=10,
+        ),
+        InventorySnapshotItem(
+            item_id=JUICE_ITEM_ID, item_name="suco", inventory_quantity=3
+        ),
+    ],
+)
+MOVEMENTS = [
+    InventoryMovement(
+        item_id=MEAT_ITEM_ID,
+        item_name="marmita de carne",
+        reason=InventoryMovementReason.ORDER,
+        quantity_delta=-2,
+        order_id=ObjectId(),
+    ),
+    InventoryMovement(
+        item_id=MEAT_ITEM_ID,
+        item_name="marmita de carne",
+        reason=InventoryMovementReason.CANCEL,
+        quantity_delta=1,
+        order_id=ObjectId(),
+    ),
+    InventoryMovement(
+        item_id=JUICE_ITEM_ID,
+        item_name="suco",
+        reason=InventoryMovementReason.REMOVE,
+        quantity_delta=-3,
+        inventory_quantity=0,
+    ),
+]
+AT = datetime(2024, 6, 4, 15, tzinfo=UTC)
+EXPECTED_OUTPUT_DTO = GetInventoryAtOutputDTO(
+    at=AT,
+    items=[ItemOutputDTO(item_name="marmita de carne", inventory_quantity=9)],
+)
+
+
+class TestGetInventoryAtUseCase:
+    @pytest.fixture
+    def ledger_repository(self):
+        return Mock()
+
+    def test_get_inventory_at_replays_movements_after_snapshot(
+        self, ledger_repository
+    ):
+        # Arrange
+        ledger_repository.find_latest_snapshot.return_value = PREVIOUS_SNAPSHOT
+        ledger_repository.find_movements.return_value = MOVEMENTS
+        use_case = GetInventoryAtUseCase(ledger_repository)
+
+        # Act
+        output_dto = use_case.execute(GetInventoryAtInputDTO(at=AT))
+
+        # Assert
+        assert output_dto == EXPECTED_OUTPUT_DTO
+        ledger_repository.find_latest_snapshot.assert_called_once_with(AT)
+        ledger_repository.find_movements.assert_called_once_with(
+            PREVIOUS_SNAPSHOT.taken_at, AT
+        )
+        ledger_repository.save_snapshot.assert_not_called()
@@ -0,0 +1,195 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.domain.entities.inventory import InventoryMovementReason
+from src.domain.entities.item import Item
+from src.domain.ports.inbound.items.dtos import ImportItemsErrorOutputDTO
+from src.domain.use_cases.import_items import (
+    ImportItemsUseCase,
+)
+
+
+class TestImportItemsUseCase:
+    @pytest.fixture
+    def item_repository(self):
+        return Mock()
+
+    @pytest.fixture
+    def unit_of_work(self):
+        return Mock()
+
+    def test_import_items_commits_one_chunk_at_a_time(
+        self, item_repository, unit_of_work
+    ):
+        # Arrange
+        item_repository.find_items_by_names.side_effect = [
+            [Item(name="marmita de carne", inventory_quantity=5)],
+            [],
+        ]
+        use_case = ImportItemsUseCase(item_repository, unit_of_work)
+        rows = [
+            (2, {"item_name": "marmita de carne", "inventory_quantity": "8"}),
+            (3, {"item_name": "suco", "inventory_quantity": "3"}),
+            (4, {"item_name": "refrigerante", "inventory_quantity": "1"}),
+        ]
+
+        # Act
+        output_dto = use_case.execute(iter(rows), chunk_size=2)
+
+        # Assert
+        assert (output_dto.inserted_count, output_dto.updated_count) == (2, 1)
+        assert unit_of_work.commit.call_count == 2
+        first_items = unit_of_work.register_dirty_items.call_args_list[0][0][0]
+        assert [
+            (item.name, item.inventory_quantity) for item in first_items
+        ] == [
+            ("marmita de carne", 8),
+            ("suco", 3),
+        ]
+        first_movements = (
+            unit_of_work.register_inventory_movements.call_args_list[0][0][0]
+        )
+        assert [
+            (movement.reason, movement.quantity_delta)
+            for movement in first_movements
+        ] == [
+            (InventoryMovementReason.SET, 3),
+            (InventoryMovementReason.ADD, 3),
+        ]
+
+    def test_import_items_reports_invalid_rows_by_line_number(
+        self, item_repository, unit_of_work
+    ):
+        # Arrange
+        item_repository.find_items_by_names.return_value = []
+        use_case = ImportItemsUseCase(item_repository, unit_of_work)
+        rows = [
+            (2, {"item_name": "  ", "inventory_quantity": "1"}),
+            (3, {"item_name": "suco", "inventory_quantity": "muitos"}),
+            (4, None),
+            (5, {"item_name": "marmita", "inventory_quantity": "2"}),
+        ]
+
+        # Act
+        output_dto = use_case.execute(rows)
+
+        # Assert
+        assert output_dto.inserted_count == 1
+        assert [error.line_number for error in output_dto.errors] == [2, 3, 4]
+        assert output_dto.errors[1] == ImportItemsErrorOutputDTO(
+            line_number=3,
+            message="inventory_quantity: Input should be a valid integer, "
+            "unable to parse string as an integer",
+        )
+        item_repository.find_items_by_names.assert_called_once_with(
+            ["marmita"]
+        )
+
+    def test_import_items_last_row_for_a_name_wins(
+        self, item_repository, unit_of_work
+    ):
+        # Arrange
+        item_repository.find_items_by_names.return_value = [
+            Item(name="suco", inventory_quantity=3)
+        ]
+        use_case = ImportItemsUseCase(item_repository, unit_of_work)
+        rows = [
+            (2, {"item_name": "suco", "inventory_quantity": 10}),
+            (3, {"item_name": "suco", "inventory_quantity": 3}),
+        ]
+
+        # Act
+        output_dto = use_case.execute(rows)
+
+        # Assert
+        assert output_dto.unchanged_count == 1
+        unit_of_work.register_dirty_items.assert_called_once_with([])
+        unit_of_work.register_inventory_movements.assert_called_once_with([])
+
+    def test_import_items_matches_names_regardless_of_case_and_accents(
+        self, item_repository, unit_of_work
+    ):
+        # Arrange
+        item_repository.find_items_by_names.return_value = [
+            Item(name="pao de queijo", inventory_quantity=3)
+        ]
+        use_case = ImportItemsUseCase(item_repository, unit_of_work)
+        rows = [
+            (2, {"item_name": " *Pão  de Queijo* ", "inventory_quantity": 7}),
+        ]
+
+        # Act
+        output_dto = use_case.execute(rows)
+
+        # Assert
+        assert (output_dto.inserted_count, output_dto.updated_count) == (0, 1)
+        item_repository.find_items_by_names.assert_called_once_with(
+            ["pao de queijo"]
+        )
+        (changed_items,) = unit_of_work.register_dirty_items.call_args[0]
+        assert [
+            (item.name, item.inventory_quantity) for item in changed_items
+        ] == [("pao de queijo", 7)]
+
+    def test_import_items_sets_low_stock_thresholds(
+        self, item_repository, unit_of_work
+    ):
+        # Arrange
+        item_repository.find_items_by_names.return_value = [
+            Item(name="suco", inventory_quantity=3, low_stock_threshold=1)
+        ]
+        use_case = ImportItemsUseCase(item_repository, unit_of_work)
+        rows = [
+            (
+                2,
+                {
+                    "item_name": "suco",
+                    "inventory_quantity": 3,
+                    "low_stock_threshold": "5",
+                },
+            ),
+            (
+                3,
+                {
+                    "item_name": "marmita",
+                    "inventory_quantity": 2,
+                    "low_stock_threshold": "",
+                },
+            ),
+            (
+                4,
+                {
+                    "item_name": "refrigerante",
+                    "inventory_quantity": 2,
+                    "low_stock_threshold": -1,
+                },
+            ),
+        ]
+
+        # Act
+        output_dto = use_case.execute(rows)
+
+        # Assert
+        assert (output_dto.inserted_count, output_dto.updated_count) == (1, 1)
+        assert [error.line_number for error in output_dto.errors] == [4]
+        (changed_items,) = unit_of_work.register_dirty_items.call_args[0]
+        assert [
+            (item.name, item.low_stock_threshold) for item in changed_items
+        ] == [("suco", 5), ("marmita", 0)]
+        (movements,) = unit_of_work.register_inventory_movements.call_args[0]
+        assert [movement.item_name for movement in movements] == ["marmita"]
+
+    def test_import_items_skips_chunks_without_valid_rows(
+        self, item_repository, unit_of_work
+    ):
+        # Arrange
+        use_case = ImportItemsUseCase(item_repository, unit_of_work)
+
+        # Act
+        output_dto = use_case.execute([(2, {"item_name": "suco"})])
+
+        # Assert
+        assert len(output_dto.errors) == 1
+        item_repository.find_items_by_names.assert_not_called()
+        unit_of_work.commit.assert_not_called()
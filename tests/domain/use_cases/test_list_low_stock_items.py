@@ -0,0 +1,38 @@
+from unittest.mock import Mock
+
+from src.domain.entities.item import Item
+from src.domain.ports.inbound.items.dtos import (
+    CatalogItemOutputDTO,
+    ListLowStockItemsOutputDTO,
+)
+from src.domain.use_cases.list_low_stock_items import (
+    ListLowStockItemsUseCase,
+)
+
+LOW_STOCK_ITEMS = [
+    Item(name="marmita de carne", inventory_quantity=1, low_stock_threshold=2)
+]
+EXPECTED_OUTPUT_DTO = ListLowStockItemsOutputDTO(
+    items=[
+        CatalogItemOutputDTO(
+            item_name="marmita de carne",
+            inventory_quantity=1,
+            low_stock_threshold=2,
+        )
+    ]
+)
+
+
+class TestListLowStockItemsUseCase:
+    def test_list_low_stock_items(self):
+        # Arrange
+        item_repository = Mock()
+        item_repository.find_low_stock_items.return_value = LOW_STOCK_ITEMS
+        use_case = ListLowStockItemsUseCase(item_repository)
+
+        # Act
+        output_dto = use_case.execute()
+
+        # Assert
+        assert output_dto == EXPECTED_OUTPUT_DTO
+        item_repository.get_all.assert_not_called()
@@ -0,0 +1,164 @@
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from src.domain.entities.client import Client
+from src.domain.entities.item import Item
+from src.domain.entities.order import Order, OrderItem
+from src.domain.ports.inbound.orders.dtos import (
+    ListOrdersInputDTO,
+    ListOrdersOutputDTO,
+)
+from src.domain.ports.outbound.repositories.order import (
+    OrderCursor,
+    OrderFilter,
+)
+from src.domain.use_cases.list_orders import (
+    ListOrdersUseCase,
+)
+
+
+def build_orders(count: int, client: Client | None = None) -> list[Order]:
+    item = Item(name="marmita de frango", inventory_quantity=10)
+    newest = datetime(2023, 6, 7, 10, 0, 0)
+    return [
+        Order(
+            external_id=index,
+            external_created_at="17:54",
+            created_at=newest - timedelta(hours=index),
+            updated_at=newest - timedelta(hours=index),
+            is_cancelled=False,
+            client=client,
+            order_items=[OrderItem(item=item, quantity=2)],
+        )
+        for index in range(count)
+    ]
+
+
+def build_cursor(order: Order) -> OrderCursor:
+    return OrderCursor(created_at=order.created_at, order_id=order.id)
+
+
+class TestListOrdersUseCase:
+    @pytest.fixture
+    def order_repository(self):
+        return Mock()
+
+    @pytest.fixture
+    def client_repository(self):
+        return Mock()
+
+    def test_list_orders_first_page(self, order_repository, client_repository):
+        # Arrange
+        client = Client(name="joana")
+        orders = build_orders(3, client)
+        order_repository.find_orders.return_value = orders
+        input_dto = ListOrdersInputDTO(
+            created_from=datetime(2023, 6, 1),
+            is_cancelled=False,
+            page_size=2,
+        )
+        use_case = ListOrdersUseCase(order_repository, client_repository)
+
+        # Act
+        output_dto = use_case.execute(input_dto)
+
+        # Assert
+        assert isinstance(output_dto, ListOrdersOutputDTO)
+        assert [order.order_id for order in output_dto.orders] == [
+            orders[0].id,
+            orders[1].id,
+        ]
+        assert output_dto.orders[0].client_name == "joana"
+        assert output_dto.orders[0].external_order_id == 0
+        assert output_dto.orders[0].order_items[0].item_name == (
+            "marmita de frango"
+        )
+        assert output_dto.orders[0].order_items[0].quantity == 2
+        assert output_dto.next_cursor == build_cursor(orders[1])
+        assert output_dto.previous_cursor is None
+        order_repository.find_orders.assert_called_once_with(
+            OrderFilter(created_from=datetime(2023, 6, 1), is_cancelled=False),
+            3,
+            after=None,
+            before=None,
+        )
+        client_repository.find_client_by_name.assert_not_called()
+
+    def test_list_orders_last_page_after_cursor(
+        self, order_repository, client_repository
+    ):
+        # Arrange
+        orders = build_orders(2)
+        cursor = OrderCursor(
+            created_at=datetime(2023, 6, 8), order_id=orders[0].id
+        )
+        order_repository.find_orders.return_value = orders
+        input_dto = ListOrdersInputDTO(page_size=2, after=cursor)
+        use_case = ListOrdersUseCase(order_repository, client_repository)
+
+        # Act
+        output_dto = use_case.execute(input_dto)
+
+        # Assert
+        assert len(output_dto.orders) == 2
+        assert output_dto.next_cursor is None
+        assert output_dto.previous_cursor == build_cursor(orders[0])
+
+    def test_list_orders_page_before_cursor(
+        self, order_repository, client_repository
+    ):
+        # Arrange
+        orders = build_orders(3)
+        cursor = OrderCursor(
+            created_at=datetime(2023, 6, 1), order_id=orders[0].id
+        )
+        order_repository.find_orders.return_value = orders
+        input_dto = ListOrdersInputDTO(page_size=2, before=cursor)
+        use_case = ListOrdersUseCase(order_repository, client_repository)
+
+        # Act
+        output_dto = use_case.execute(input_dto)
+
+        # Assert
+        assert [order.order_id for order in output_dto.orders] == [
+            orders[1].id,
+            orders[2].id,
+        ]
+        assert output_dto.previous_cursor == build_cursor(orders[1])
+        assert output_dto.next_cursor == build_cursor(orders[2])
+
+    def test_list_orders_by_client(self, order_repository, client_repository):
+        # Arrange
+        client = Client(name="joana")
+        client_repository.find_client_by_name.return_value = client
+        order_repository.find_orders.return_value = []
+        input_dto = ListOrdersInputDTO(client_name="joana")
+        use_case = ListOrdersUseCase(order_repository, client_repository)
+
+        # Act
+        output_dto = use_case.execute(input_dto)
+
+        # Assert
+        assert output_dto.orders == []
+        assert output_dto.next_cursor is None
+        assert output_dto.previous_cursor is None
+        order_repository.find_orders.assert_called_once_with(
+            OrderFilter(client_id=client.id), 6, after=None, before=None
+        )
+
+    def test_list_orders_by_unknown_client(
+        self, order_repository, client_repository
+    ):
+        # Arrange
+        client_repository.find_client_by_name.return_value = None
+        input_dto = ListOrdersInputDTO(client_name="joana")
+        use_case = ListOrdersUseCase(order_repository, client_repository)
+
+        # Act
+        output_dto = use_case.execute(input_dto)
+
+        # Assert
+        assert output_dto.orders == []
+        order_repository.find_orders.assert_not_called()
@@ -0,0 +1,105 @@
+from datetime import date
+from unittest.mock import Mock
+
+import pytest
+from bson import ObjectId
+from pydantic import ValidationError
+
+from src.domain.entities.sales import DailyItemSales
+from src.domain.ports.inbound.sales.dtos import (
+    SalesReportInputDTO,
+    SalesReportItemOutputDTO,
+)
+from src.domain.use_cases.sales_report import (
+    SalesReportUseCase,
+)
+
+MEAT_ITEM_ID = ObjectId()
+CHICKEN_ITEM_ID = ObjectId()
+VEGAN_ITEM_ID = ObjectId()
+
+WEEK_DAILY_SALES = [
+    DailyItemSales(
+        day=date(2024, 6, 3),
+        item_id=MEAT_ITEM_ID,
+        item_name="marmita de carne",
+        quantity=3,
+    ),
+    DailyItemSales(
+        day=date(2024, 6, 3),
+        item_id=VEGAN_ITEM_ID,
+        item_name="marmita vegana",
+        quantity=0,
+    ),
+    DailyItemSales(
+        day=date(2024, 6, 4),
+        item_id=CHICKEN_ITEM_ID,
+        item_name="marmita de frango",
+        quantity=5,
+    ),
+    DailyItemSales(
+        day=date(2024, 6, 5),
+        item_id=MEAT_ITEM_ID,
+        item_name="marmita de carne",
+        quantity=2,
+    ),
+]
+
+
+class TestSalesReportUseCase:
+    @pytest.fixture
+    def sales_repository(self):
+        return Mock()
+
+    @pytest.fixture
+    def use_case(self, sales_repository):
+        return SalesReportUseCase(sales_repository)
+
+    def test_sales_report_use_case_sums_days_per_item(
+        self, sales_repository, use_case
+    ):
+        # Arrange
+        sales_repository.find_daily_sales.return_value = WEEK_DAILY_SALES
+        input_dto = SalesReportInputDTO(
+            first_day=date(2024, 6, 3), last_day=date(2024, 6, 9)
+        )
+
+        # Act
+        output_dto = use_case.execute(input_dto)
+
+        # Assert
+        sales_repository.find_daily_sales.assert_called_once_with(
+            date(2024, 6, 3), date(2024, 6, 9)
+        )
+        assert output_dto.items == [
+            SalesReportItemOutputDTO(item_name="marmita de carne", quantity=5),
+            SalesReportItemOutputDTO(
+                item_name="marmita de frango", quantity=5
+            ),
+        ]
+        assert output_dto.total_quantity == 10
+        assert output_dto.first_day == date(2024, 6, 3)
+        assert output_dto.last_day == date(2024, 6, 9)
+
+    def test_sales_report_use_case_without_sales(
+        self, sales_repository, use_case
+    ):
+        # Arrange
+        sales_repository.find_daily_sales.return_value = []
+        input_dto = SalesReportInputDTO(
+            first_day=date(2024, 6, 3), last_day=date(2024, 6, 3)
+        )
+
+        # Act
+        output_dto = use_case.execute(input_dto)
+
+        # Assert
+        assert output_dto.items == []
+        assert output_dto.total_quantity == 0
+
+    def test_sales_report_input_rejects_reversed_period(self):
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            SalesReportInputDTO(
+                first_day=date(2024, 6, 9), last_day=date(2024, 6, 3)
+            )
@@ -0,0 +1,110 @@
+from datetime import UTC, datetime
+from unittest.mock import Mock
+
+import pytest
+from bson import ObjectId
+
+from src.domain.entities.inventory import (
+    InventoryMovement,
+    InventoryMovementReason,
+    InventorySnapshot,
+    InventorySnapshotItem,
+)
+from src.domain.ports.inbound.items.dtos import (
+    TakeInventorySnapshotInputDTO,
+    TakeInventorySnapshotOutputDTO,
+)
+from src.domain.use_cases.take_inventory_snapshot import (
+    TakeInventorySnapshotUseCase,
+)
+
+MEAT_ITEM_ID = ObjectId()
+CHICKEN_ITEM_ID = ObjectId()
+PREVIOUS_SNAPSHOT = InventorySnapshot(
+    taken_at=datetime(2024, 6, 3, tzinfo=UTC),
+    items=[
+        InventorySnapshotItem(
+            item_id=MEAT_ITEM_ID,
+            item_name="marmita de carne",
+            inventory_quantity=10,
+        ),
+        InventorySnapshotItem(
+            item_id=CHICKEN_ITEM_ID,
+            item_name="marmita de frango",
+            inventory_quantity=5,
+        ),
+    ],
+)
+MOVEMENTS = [
+    InventoryMovement(
+        item_id=MEAT_ITEM_ID,
+        item_name="marmita de carne",
+        reason=InventoryMovementReason.ORDER,
+        quantity_delta=-2,
+    ),
+    InventoryMovement(
+        item_id=CHICKEN_ITEM_ID,
+        item_name="marmita de frango",
+        reason=InventoryMovementReason.SET,
+        quantity_delta=3,
+        inventory_quantity=8,
+    ),
+]
+TAKEN_AT = datetime(2024, 6, 4, tzinfo=UTC)
+
+
+class TestTakeInventorySnapshotUseCase:
+    @pytest.fixture
+    def ledger_repository(self):
+        return Mock()
+
+    def test_take_snapshot_folds_movements_into_previous_snapshot(
+        self, ledger_repository
+    ):
+        # Arrange
+        ledger_repository.find_latest_snapshot.return_value = PREVIOUS_SNAPSHOT
+        ledger_repository.find_movements.return_value = MOVEMENTS
+        use_case = TakeInventorySnapshotUseCase(ledger_repository)
+
+        # Act
+        output_dto = use_case.execute(
+            TakeInventorySnapshotInputDTO(taken_at=TAKEN_AT)
+        )
+
+        # Assert
+        assert output_dto == TakeInventorySnapshotOutputDTO(
+            taken_at=TAKEN_AT, items_count=2, movements_count=2
+        )
+        ledger_repository.find_latest_snapshot.assert_called_once_with(
+            TAKEN_AT
+        )
+        ledger_repository.find_movements.assert_called_once_with(
+            PREVIOUS_SNAPSHOT.taken_at, TAKEN_AT
+        )
+        saved_snapshot = ledger_repository.save_snapshot.call_args[0][0]
+        assert saved_snapshot.taken_at == TAKEN_AT
+        assert [
+            (item.item_name, item.inventory_quantity)
+            for item in saved_snapshot.items
+        ] == [("marmita de carne", 8), ("marmita de frango", 8)]
+
+    def test_take_first_snapshot_replays_the_whole_ledger(
+        self, ledger_repository
+    ):
+        # Arrange
+        ledger_repository.find_latest_snapshot.return_value = None
+        ledger_repository.find_movements.return_value = MOVEMENTS
+        use_case = TakeInventorySnapshotUseCase(ledger_repository)
+
+        # Act
+        use_case.execute(TakeInventorySnapshotInputDTO(taken_at=TAKEN_AT))
+
+        # Assert
+        ledger_repository.find_movements.assert_called_once_with(
+            None, TAKEN_AT
+        )
+        saved_snapshot = ledger_repository.save_snapshot.call_args[0][0]
+        assert [
+            (item.item_name, item.inventory_quantity)
+            for item in saved_snapshot.items
+        ] == [("marmita de carne", -2), ("marmita de frango", 8)]